@@ -0,0 +1,704 @@
+"""
+Benchmarks for PyRPN
+
+Run with: python bench_rpn.py [--quick] [--json results.json] [--compare baseline.json]
+
+Every result is the best time per operation in microseconds, named
+'section/benchmark'. Saved as JSON, the results of two commits can be
+compared: --compare lists the benchmarks that got slower than --threshold
+and exits with status 1 if there is any. Some benchmarks also have a budget
+(see BUDGETS): a run over it exits with status 1 too, with or without
+--compare.
+
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import locale
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import rpn  # noqa: E402
+import rpn_compiler  # noqa: E402
+import rpn_metrics  # noqa: E402
+import rpn_server  # noqa: E402
+import rpn_statistics  # noqa: E402
+import rpn_engine  # noqa: E402
+import rpn_storage  # noqa: E402
+from rpn_locale import PT_BR  # noqa: E402
+
+# the 'before' baselines use the locale module, which needs the pt-BR locale
+try:
+    locale.setlocale(locale.LC_ALL, ("pt-BR", ""))
+    LOCALE_MODULE = locale.localeconv()["decimal_point"] == ","
+except locale.Error:
+    LOCALE_MODULE = False
+
+
+def legacy_chain(length):
+    """Operation chain with a string stack, as the calculator did before
+    NumericStack: every operation parses its operands and formats its result
+    """
+    stack = rpn_engine.Stack()
+    stack.push("1,5")
+    for idx in range(length):
+        stack.push("1,0001" if idx % 2 else "0,5")
+        x_value = stack.pop()
+        y_value = stack.pop()
+        if idx % 2:
+            result = locale.atof(y_value) * locale.atof(x_value)
+        else:
+            result = locale.atof(y_value) + locale.atof(x_value)
+        if result > 999999999999:
+            result = locale.format_string("%.8e", result, grouping=True)
+        else:
+            result = locale.format_string("%.12g", result, grouping=True)
+        stack.push(result)
+    return stack.peek_x()
+
+
+def numeric_chain(length, stack=None):
+    """Same chain on a NumericStack: values stay numbers, X is formatted once.
+    The stack is synced after every operation, as the engine does.
+    """
+    stack = rpn_engine.NumericStack() if stack is None else stack
+    stack.push("1,5")
+    for idx in range(length):
+        stack.push(1.0001 if idx % 2 else 0.5)
+        x_value = stack.pop_value()
+        y_value = stack.pop_value()
+        if idx % 2:
+            stack.push(y_value * x_value)
+        else:
+            stack.push(y_value + x_value)
+        stack.sync()
+    return stack.peek_x()
+
+
+def evaluate_chain(rpn_obj, length):
+    """Same chain through PyRpnEvaluate, display updates included"""
+    for idx in range(length):
+        rpn_obj._stack.push("1,0001" if idx % 2 else "0,5")
+        rpn_obj.btn_operation_two_arg("*" if idx % 2 else "+")
+
+
+def legacy_entry(digits):
+    """Digit entry as the calculator did before EntryBuffer: every key strips
+    and regroups the whole number
+    """
+    x_value = "1"
+    for key in digits:
+        x_value = x_value.replace(".", "") + key
+        for i in range(len(x_value)):
+            if i != 0 and not i % 3:
+                x_value = x_value[: -i - (i // 3 - 1)] + "." + x_value[-i - (i // 3 - 1):]
+    return x_value
+
+
+def buffer_entry(digits):
+    """Same entry on an EntryBuffer, its text read after every key as the
+    display does
+    """
+    entry = rpn_engine.EntryBuffer("1")
+    for key in digits:
+        entry.append(key)
+        text = entry.text
+    return text
+
+
+# benchmark name -> microseconds per operation, filled by report
+RESULTS = {}
+_section = ""
+
+
+def section(name, title):
+    """Start a group of results, named 'name/...'"""
+    global _section
+    _section = name
+    print(title)
+
+
+def report(name, seconds, count):
+    RESULTS[f"{_section}/{name}"] = seconds * 1e6 / count
+    print(f"{name:<40} {seconds * 1e6 / count:10.3f} us/op")
+
+
+def bench_stack(depths=(10, 100000, 1000000), count=100000, repeat=5):
+    section("stack", f"Stack throughput, {count} operations (best of {repeat})")
+    for depth in depths:
+        for stack_class, value in ((rpn_engine.Stack, "1,5"), (rpn_engine.NumericStack, 1.5)):
+            stack = stack_class()
+            for _ in range(depth):
+                stack.push(value)
+
+            def push_pop():
+                for _ in range(count):
+                    stack.push(value)
+                    stack.pop()
+
+            seconds = min(timeit.repeat(push_pop, number=1, repeat=repeat))
+            report(f"{stack_class.__name__} push+pop depth={depth}", seconds, count)
+            seconds = min(timeit.repeat(stack.swap, number=count, repeat=repeat))
+            report(f"{stack_class.__name__} swap depth={depth}", seconds, count)
+
+
+def bench_dispatch(count=20000, repeat=5):
+    section("dispatch", f"Engine keys without display, {count} keys (best of {repeat})")
+    engine = rpn_engine.RpnEngine()
+    stack = engine.stack
+    seconds = min(timeit.repeat(lambda: stack.push(0.5), number=count, repeat=repeat))
+    report("push (included below)", seconds, count)
+    for operation in ("+/-", "1/x", "sqrt", "sin", "tan", "log", "ln"):
+        stack.cls()
+
+        def one_arg():
+            for _ in range(count):
+                stack.push(0.5)
+                engine.btn_operation_one_arg(operation)
+
+        seconds = min(timeit.repeat(one_arg, number=1, repeat=repeat))
+        report(f"push + {operation}", seconds, count)
+    for operation in ("+", "-", "*", "/", "%", "y^x", "mod"):
+        stack.cls()
+        stack.push(1.5)
+
+        def two_arg():
+            for _ in range(count):
+                stack.push(1.0001)
+                engine.btn_operation_two_arg(operation)
+
+        seconds = min(timeit.repeat(two_arg, number=1, repeat=repeat))
+        report(f"push + {operation}", seconds, count)
+
+
+def bench_metrics(count=20000, repeat=5):
+    section("metrics", f"Keys with the counters off and on, {count} keys (best of {repeat})")
+    engine = rpn_engine.RpnEngine()
+    metrics = rpn_metrics.EngineMetrics()
+
+    def keys():
+        for _ in range(count):
+            engine.btn_number("7")
+            engine.btn_operation_one_arg("sqrt")
+
+    for title in ("off", "on"):
+        if title == "on":
+            metrics.attach(engine)
+        seconds = min(timeit.repeat(keys, number=1, repeat=repeat))
+        report(f"digit + sqrt, counters {title}", seconds, count)
+    metrics.detach(engine)
+
+
+def bench_format(count=20000, repeat=5):
+    section("format", f"Number formatting and parsing, {count} numbers (best of {repeat})")
+    engine = rpn_engine.RpnEngine()
+    seconds = min(timeit.repeat(lambda: engine.format_number("1.234.567,891"), number=count, repeat=repeat))
+    report("format_number", seconds, count)
+    seconds = min(timeit.repeat(lambda: rpn_engine.format_result(1234567.891), number=count, repeat=repeat))
+    report("format_result", seconds, count)
+    seconds = min(timeit.repeat(lambda: PT_BR.parse("1.234.567,891"), number=count, repeat=repeat))
+    report("NumberFormat.parse", seconds, count)
+    seconds = min(
+        timeit.repeat(lambda: PT_BR.parse(rpn_engine.format_result(1234567.891)), number=count, repeat=repeat)
+    )
+    report("format_result + parse", seconds, count)
+    if LOCALE_MODULE:
+        seconds = min(
+            timeit.repeat(
+                lambda: locale.format_string("%.12g", 1234567.891, grouping=True), number=count, repeat=repeat
+            )
+        )
+        report("locale.format_string (before)", seconds, count)
+        seconds = min(timeit.repeat(lambda: locale.atof("1.234.567,891"), number=count, repeat=repeat))
+        report("locale.atof (before)", seconds, count)
+
+
+def bench_startup(count=20, repeat=3):
+    """Window built and first display drawn, offscreen"""
+    section("startup", f"Window built and first display drawn, {count} times (best of {repeat})")
+    app = rpn.qtw.QApplication.instance() or rpn.qtw.QApplication([])
+    rpn.load_resources()  # registered once per process
+
+    def start():
+        for _ in range(count):
+            window = rpn.PyRpnWindow()
+            rpn.PyRpn(window, rpn.PyRpnEvaluate(window))
+            window.deleteLater()
+        app.processEvents()
+
+    seconds = min(timeit.repeat(start, number=1, repeat=repeat))
+    report("PyRpnWindow + PyRpn", seconds, count)
+
+
+def bench_stack_modal(depth=1000000, repeat=3):
+    """Stack window opened and drawn on a deep stack, offscreen"""
+    section("stack_modal", f"Stack window on {depth} entries (best of {repeat})")
+    app = rpn.qtw.QApplication.instance() or rpn.qtw.QApplication([])
+    stack = rpn_engine.NumericStack()
+    stack.extend(float(value) for value in range(depth))
+
+    def open_stack():
+        stack_modal = rpn.StackModal(parent=None, stack=stack)
+        stack_modal.show()
+        stack_modal.grab()
+        stack_modal.close()
+        stack_modal.deleteLater()
+        app.processEvents()
+
+    seconds = min(timeit.repeat(open_stack, number=1, repeat=repeat))
+    report("StackModal show + grab", seconds, 1)
+
+
+def bench_keypress(count=1000, repeat=3):
+    """Button click until the display is drawn, offscreen"""
+    section("keypress", f"Key press to display update, {3 * count} keys (best of {repeat})")
+    app = rpn.qtw.QApplication.instance() or rpn.qtw.QApplication([])
+    window = rpn.PyRpnWindow()
+    rpn.PyRpn(window, rpn.PyRpnEvaluate(window))
+    buttons = (window.btn_one, window.btn_enter, window.btn_add)
+
+    def press():
+        for _ in range(count):
+            for button in buttons:
+                button.click()
+                app.processEvents()
+
+    seconds = min(timeit.repeat(press, number=1, repeat=repeat))
+    report("click + update_display", seconds, 3 * count)
+
+
+def bench_chains(length=10000, repeat=5):
+    section("chain", f"Operation chain of {length} operations (best of {repeat})")
+    if LOCALE_MODULE:
+        seconds = min(timeit.repeat(lambda: legacy_chain(length), number=1, repeat=repeat))
+        report("string stack (before)", seconds, length)
+    seconds = min(timeit.repeat(lambda: numeric_chain(length), number=1, repeat=repeat))
+    report("numeric stack (after)", seconds, length)
+
+    app = rpn.qtw.QApplication.instance() or rpn.qtw.QApplication([])  # noqa: F841
+    window = rpn.PyRpnWindow()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rpn_obj = rpn.PyRpnEvaluate(window)
+        rpn_obj._stack.push("1,5")
+        seconds = min(
+            timeit.repeat(
+                lambda: evaluate_chain(rpn_obj, length), number=1, repeat=repeat
+            )
+        )
+    report("PyRpnEvaluate.btn_operation_two_arg", seconds, length)
+
+
+def bench_persistence(length=10000, depth=1000000, repeat=5):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "stack.bin")
+        stack = rpn_storage.MappedStack(path)
+        section("persistence", f"Operation chain of {length} operations, saved after each (best of {repeat})")
+        seconds = min(timeit.repeat(lambda: numeric_chain(length, stack), number=1, repeat=repeat))
+        report("MappedStack", seconds, length)
+        stack.cls()
+        for idx in range(depth):
+            stack.push(float(idx))
+        stack.close()
+        seconds = min(timeit.repeat(lambda: rpn_storage.MappedStack(path).close(), number=1, repeat=repeat))
+        report(f"reopen depth={depth}", seconds, 1)
+
+
+def bench_macro(times=100000, repeat=1):
+    engine = rpn_engine.RpnEngine()
+    engine.start_recording()
+    for _ in range(10):  # 50 keys
+        for key in "1,5":
+            engine.btn_number(key)
+        engine.btn_operation_two_arg("*")
+        engine.btn_operation_one_arg("sin")
+    macro = engine.stop_recording()
+    section("macro", f"Macro of {len(macro)} keys replayed {times} times (best of {repeat})")
+    seconds = min(timeit.repeat(lambda: engine.replay(macro, times), number=1, repeat=repeat))
+    report("replay per key", seconds, times * len(macro))
+
+
+def bench_digit_entry(lengths=(12, 1000), repeat=5):
+    for length in lengths:
+        digits = "7" * length
+        section(f"entry{length}", f"Typing {length} digits (best of {repeat})")
+        seconds = min(timeit.repeat(lambda: legacy_entry(digits), number=1, repeat=repeat))
+        report("regroup on every key (before)", seconds, length)
+        seconds = min(timeit.repeat(lambda: buffer_entry(digits), number=1, repeat=repeat))
+        report("EntryBuffer (after)", seconds, length)
+
+
+def bench_paste(count=1000000, repeat=3):
+    section("paste", f"Paste and import of {count} numbers (best of {repeat})")
+    text = "".join(f"{idx},25\n" for idx in range(count))
+
+    def paste():
+        rpn_engine.RpnEngine().paste(text)
+
+    seconds = min(timeit.repeat(paste, number=1, repeat=repeat))
+    report("RpnEngine.paste", seconds, count)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "numbers.txt")
+        with open(path, "w", encoding="utf-8") as numbers:
+            numbers.write(text)
+        seconds = min(
+            timeit.repeat(lambda: rpn_engine.RpnEngine().import_numbers(path), number=1, repeat=repeat)
+        )
+        report("RpnEngine.import_numbers", seconds, count)
+        stack = rpn_storage.MappedStack(os.path.join(folder, "stack.bin"))
+        engine = rpn_engine.RpnEngine(stack=stack, undo_memory=rpn_engine.UNDO_MEMORY)
+        seconds = min(timeit.repeat(lambda: engine.import_numbers(path), number=1, repeat=repeat))
+        report("import_numbers, saved stack with undo", seconds, count)
+        stack.close()
+
+
+def bench_aggregates(depth=100000, count=10000, repeat=5):
+    section("aggregates", f"Stack aggregates after each key, stack of {depth} (best of {repeat})")
+    stack = rpn_engine.NumericStack()
+    stack.extend(float(idx % 1000) for idx in range(depth))
+    stack.aggregates()
+
+    def running():
+        for idx in range(count):
+            stack.push(float(idx))
+            stack.aggregates()
+            stack.pop_value()
+
+    def recomputed():
+        for idx in range(count // 100):
+            stack.push(float(idx))
+            values = stack._items
+            math.fsum(values), statistics.fmean(values), min(values), max(values), statistics.stdev(values)
+            stack.pop_value()
+
+    seconds = min(timeit.repeat(running, number=1, repeat=repeat))
+    report("push + aggregates + pop", seconds, count)
+    seconds = min(timeit.repeat(recomputed, number=1, repeat=repeat))
+    report("push + recomputed over the stack + pop", seconds, count // 100)
+
+    engine = rpn_engine.RpnEngine(stack=stack)
+
+    def typed():
+        for idx in range(count // 10):
+            for key in "12,5":
+                engine.btn_number(key)
+            engine.btn_enter()
+            stack.aggregates()
+
+    seconds = min(timeit.repeat(typed, number=1, repeat=repeat))
+    report("typed reading + ENTER + aggregates", seconds, count // 10)
+
+
+def bench_statistics(count=1000000, repeat=3):
+    section("statistics", f"Statistics registers, {count} pairs (best of {repeat})")
+    import numpy as np
+
+    x = np.arange(count, dtype=float)
+    y = 2 * x + 1
+    pairs = list(zip(x.tolist(), y.tolist()))
+
+    def one_by_one():
+        registers = rpn_statistics.StatisticsRegisters()
+        for x_value, y_value in pairs:
+            registers.add(x_value, y_value)
+
+    seconds = min(timeit.repeat(one_by_one, number=1, repeat=repeat))
+    report("add (Σ+)", seconds, count)
+    seconds = min(
+        timeit.repeat(lambda: rpn_statistics.StatisticsRegisters().add_arrays(x, y), number=1, repeat=repeat)
+    )
+    report("add_arrays", seconds, count)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "pairs.csv")
+        with open(path, "w", encoding="utf-8") as lines:
+            lines.writelines(f"{x_value:.0f};{y_value:.0f}\n" for x_value, y_value in pairs)
+        seconds = min(
+            timeit.repeat(lambda: rpn_statistics.StatisticsRegisters().feed_file(path), number=1, repeat=repeat)
+        )
+        report("feed_file", seconds, count)
+
+
+def bench_arrays(size=1000000, repeat=3):
+    section("arrays", f"Vector stack entries, {size} elements (best of {repeat})")
+    engine = rpn_engine.RpnEngine()
+    engine.paste_array("\n".join(str(value) for value in range(1, 1001)))
+    vector = engine.stack.peek_value().repeat(size // 1000)
+    engine.stack.cls()
+
+    def operate(*keys):
+        def run():
+            engine.stack.push(vector)
+            for method, operation in keys:
+                method(operation)
+            engine.stack.cls()
+        return run
+
+    for title, keys in (
+        ("sqrt", [(engine.btn_operation_one_arg, "sqrt")]),
+        ("sin (DEG)", [(engine.btn_operation_one_arg, "sin")]),
+        ("* vector", [(engine.stack.push, vector), (engine.btn_operation_two_arg, "*")]),
+    ):
+        seconds = min(timeit.repeat(operate(*keys), number=1, repeat=repeat))
+        report(title, seconds, size)
+
+
+def bench_map(depth=50000, repeat=3):
+    section("map", f"MAP of sin over a stack of {depth} angles (best of {repeat})")
+    engine = rpn_engine.RpnEngine()
+    angles = [float(value % 360) for value in range(depth)]
+
+    def map_stack():
+        engine.stack._replace(list(angles), {}, float, engine.stack._formatter)
+        engine.map_mode = True
+        engine.btn_operation_one_arg("sin")
+
+    def entry_by_entry():
+        values = []
+        for angle in angles:
+            engine.stack.push(angle)
+            engine.btn_operation_one_arg("sin")
+            values.append(engine.stack.pop_value())
+
+    seconds = min(timeit.repeat(map_stack, number=1, repeat=repeat))
+    report("MAP + sin", seconds, depth)
+    seconds = min(timeit.repeat(entry_by_entry, number=1, repeat=repeat))
+    report("sin entry by entry", seconds, depth)
+
+
+def bench_precision(digits=(12, 16, 50, 1000), repeat=3, count=2000):
+    operations = [("two_arg", "+"), ("two_arg", "*"), ("two_arg", "/"), ("one_arg", "sqrt"),
+                  ("one_arg", "ln"), ("one_arg", "sin"), ("one_arg", "tan")]
+    for precision in digits:
+        engine = rpn_engine.RpnEngine(precision=precision)
+        path = "float" if precision <= rpn_engine.FLOAT_DIGITS else "decimal"
+        section(f"precision{precision}", f"Precision {precision} digits ({path}, best of {repeat})")
+        runs = count if path == "float" or precision <= 50 else max(count // 100, 1)
+        for kind, operation in operations:
+
+            def run():
+                for _ in range(runs):
+                    engine.stack.push("1,2345")
+                    engine.stack.push("0,6789")
+                    if kind == "one_arg":
+                        engine.btn_operation_one_arg(operation)
+                    else:
+                        engine.btn_operation_two_arg(operation)
+                    engine.stack.cls()
+
+            seconds = min(timeit.repeat(run, number=1, repeat=repeat))
+            report(f"{operation}", seconds, runs)
+
+
+def bench_programs(count=20000, repeat=5):
+    program = "x 2 y^x 3 * sin 1 + ln"
+    section("programs", f"Program {program!r}, {count} evaluations (best of {repeat})")
+
+    def interpreted():
+        for idx in range(count):
+            rpn_engine.evaluate_program(program, x=float(idx))
+
+    def compiled():
+        for idx in range(count):
+            rpn_compiler.compile_program(program)(float(idx))
+
+    seconds = min(timeit.repeat(interpreted, number=1, repeat=repeat))
+    report("evaluate_program (engine keys)", seconds, count)
+    seconds = min(timeit.repeat(compiled, number=1, repeat=repeat))
+    report("compile_program (cached)", seconds, count)
+    rpn_compiler.compile_program.cache_clear()
+    seconds = min(
+        timeit.repeat(
+            lambda: rpn_compiler.generate_source(program), number=count, repeat=repeat
+        )
+    )
+    report("source generation (cache miss)", seconds, count)
+
+
+def bench_server(sessions=1000, commands=20, pipelined=10000):
+    section("server", f"Calculation service, {sessions} sessions of {commands} commands")
+
+    async def client(path, latencies):
+        reader, writer = await asyncio.open_unix_connection(path)
+        loop = asyncio.get_running_loop()
+        for idx in range(commands):
+            start = loop.time()
+            writer.write(b"%d 2 * sqrt\n" % idx)
+            await reader.readline()
+            latencies.append(loop.time() - start)
+        writer.close()
+
+    async def run(path):
+        server = rpn_server.RpnServer()
+        await server.start(path)
+        latencies = []
+        start = timeit.default_timer()
+        await asyncio.gather(*(client(path, latencies) for _ in range(sessions)))
+        seconds = timeit.default_timer() - start
+        latencies.sort()
+        report("concurrent commands (throughput)", seconds, len(latencies))
+        report("round trip p50", latencies[len(latencies) // 2], 1)
+        report("round trip p99", latencies[len(latencies) * 99 // 100], 1)
+        reader, writer = await asyncio.open_unix_connection(path)
+        start = timeit.default_timer()
+        writer.write(b"1 +\n" * pipelined)
+        for _ in range(pipelined):
+            await reader.readline()
+        report("pipelined commands, one session", timeit.default_timer() - start, pipelined)
+        writer.close()
+        await server.close()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(run(os.path.join(directory, "rpn.sock")))
+
+
+def bench_batch(lines=200000, jobs=(1, 2, 4), repeat=3):
+    cpus = os.cpu_count() or 1
+    section("batch", f"Batch evaluation of {lines} programs on {cpus} CPUs (best of {repeat})")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "programs.txt")
+        with open(path, "w") as programs:
+            programs.writelines(f"{idx} 2 y^x 3 * sin 1 + ln\n" for idx in range(lines))
+        serial = None
+        for count in sorted({*jobs, cpus}):
+
+            def batch():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    rpn_engine.batch_main(["--jobs", str(count), path])
+
+            seconds = min(timeit.repeat(batch, number=1, repeat=repeat))
+            report(f"--jobs {count}", seconds, lines)
+            serial = serial or seconds
+            print(f"{'':<40} {serial / seconds:10.2f} x --jobs 1")
+
+
+# benchmark -> arguments of a short run, for --quick
+BENCHMARKS = {
+    bench_stack: dict(depths=(10, 100000), count=10000, repeat=2),
+    bench_dispatch: dict(count=2000, repeat=2),
+    bench_metrics: dict(count=2000, repeat=2),
+    bench_format: dict(count=2000, repeat=2),
+    bench_startup: dict(count=5, repeat=2),
+    bench_stack_modal: dict(depth=100000, repeat=2),
+    bench_keypress: dict(count=100, repeat=2),
+    bench_chains: dict(length=1000, repeat=2),
+    bench_persistence: dict(length=1000, depth=100000, repeat=2),
+    bench_digit_entry: dict(repeat=2),
+    bench_paste: dict(count=100000, repeat=2),
+    bench_aggregates: dict(depth=10000, count=2000, repeat=2),
+    bench_statistics: dict(count=100000, repeat=2),
+    bench_arrays: dict(size=100000, repeat=2),
+    bench_map: dict(depth=5000, repeat=2),
+    bench_precision: dict(digits=(12, 16, 50), count=200, repeat=1),
+    bench_macro: dict(times=1000),
+    bench_programs: dict(count=2000, repeat=2),
+    bench_server: dict(sessions=100, commands=5, pipelined=1000),
+    bench_batch: dict(lines=20000, jobs=(1, 2), repeat=1),
+}
+
+# benchmark -> most us/op it may take
+BUDGETS = {
+    "startup/PyRpnWindow + PyRpn": 250000.0,  # 250 ms to the first display
+}
+
+
+def compare(results, baseline, threshold=0.25):
+    """Benchmarks slower than in the baseline by more than 'threshold'
+
+    Args:
+        results (dict): name -> us/op
+        baseline (dict): name -> us/op, of an older run
+        threshold (float): accepted slowdown, 0.25 for 25%
+
+    Returns:
+        list: (name, baseline us/op, us/op, ratio), the worst first
+    """
+    regressions = []
+    for name, time in results.items():
+        before = baseline.get(name)
+        if before and time / before > 1 + threshold:
+            regressions.append((name, before, time, time / before))
+    return sorted(regressions, key=lambda regression: -regression[3])
+
+
+def over_budget(results, budgets=BUDGETS):
+    """Benchmarks slower than their budget
+
+    Args:
+        results (dict): name -> us/op
+        budgets (dict): name -> most us/op, see BUDGETS
+
+    Returns:
+        list: (name, budget us/op, us/op), in the order of the results
+    """
+    return [
+        (name, budgets[name], time) for name, time in results.items() if name in budgets and time > budgets[name]
+    ]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyRPN benchmarks")
+    parser.add_argument("--quick", action="store_true", help="short runs, for a smoke test")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="benchmarks to run, e.g. stack dispatch")
+    parser.add_argument("--json", metavar="FILE", help="write the results to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="JSON results of an older run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown reported by --compare (0.25)")
+    args = parser.parse_args(argv)
+
+    RESULTS.clear()
+
+    for benchmark, quick_arguments in BENCHMARKS.items():
+        if args.only and benchmark.__name__.removeprefix("bench_") not in args.only:
+            continue
+        benchmark(**(quick_arguments if args.quick else {}))
+        print()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(
+                {
+                    "version": 1,
+                    "commit": git_commit(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "quick": args.quick,
+                    "results": RESULTS,
+                },
+                output,
+                indent=2,
+            )
+    status = 0
+    for name, budget, time in over_budget(RESULTS):
+        print(f"OVER BUDGET {name}: {time:.3f} us/op (budget {budget:.3f})")
+        status = 1
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            regressions = compare(RESULTS, json.load(baseline)["results"], args.threshold)
+        for name, before, time, ratio in regressions:
+            print(f"SLOWER {name}: {before:.3f} -> {time:.3f} us/op ({ratio:.2f}x)")
+        if regressions:
+            return 1
+        print(f"no benchmark slower than {args.compare} by more than {args.threshold:.0%}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
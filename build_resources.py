@@ -0,0 +1,152 @@
+"""
+Builds the modules PyRPN loads at startup instead of reading files:
+
+    ui_calculator.py: ui/calculator.ui compiled by pyuic6
+    resources_rc.py: the icons and the display font as compiled Qt resources,
+        available under ':/icons/...' and ':/fonts/...'
+
+Run it again after editing the UI in Qt Designer or changing an icon:
+
+    python build_resources.py
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import os
+import re
+import struct
+import subprocess
+import sys
+
+basedir = os.path.dirname(os.path.abspath(__file__))
+
+# files embedded in resources_rc.py, by resource folder
+RESOURCES = {
+    "icons": [
+        "back.svg",
+        "btn_10_exp_x.svg",
+        "btn_e_exp_x.svg",
+        "btn_pi.svg",
+        "btn_raiz_quadrada.svg",
+        "btn_raiz_x.svg",
+        "btn_y_exp_x.svg",
+        "calc.svg",
+        "stack.svg",
+    ],
+    "fonts": ["digital-7 (italic).ttf"],
+}
+
+
+def qt_hash(name):
+    """Hash Qt uses to look up resource names (qt_hash in qresource.cpp)"""
+    value = 0
+    for char in name:
+        value = (value << 4) + ord(char)
+        value ^= (value & 0xF0000000) >> 23
+        value &= 0x0FFFFFFF
+    return value
+
+
+def compile_resources(resources):
+    """Build the data, name and tree blobs of a version 1 Qt resource
+
+    Args:
+        resources (dict): folder name -> list of (file name, bytes)
+
+    Returns:
+        tuple: (tree, names, data) as given to QtCore.qRegisterResourceData
+    """
+    data = bytearray()
+    names = bytearray()
+    name_offsets = {}
+
+    def name_offset(name):
+        if name not in name_offsets:
+            name_offsets[name] = len(names)
+            encoded = name.encode("utf-16-be")
+            names.extend(struct.pack(">HI", len(encoded) // 2, qt_hash(name)))
+            names.extend(encoded)
+        return name_offsets[name]
+
+    # the tree is a breadth first list of nodes, the children of a folder are
+    # consecutive and sorted by hash so Qt can binary search them
+    folders = sorted(resources, key=qt_hash)
+    tree = [struct.pack(">IHII", 0, 0x02, len(folders), 1)]
+    first_child = 1 + len(folders)
+    for folder in folders:
+        tree.append(struct.pack(">IHII", name_offset(folder), 0x02, len(resources[folder]), first_child))
+        first_child += len(resources[folder])
+    for folder in folders:
+        for name, content in sorted(resources[folder], key=lambda item: qt_hash(item[0])):
+            tree.append(struct.pack(">IHHHI", name_offset(name), 0x00, 0, 1, len(data)))
+            data.extend(struct.pack(">I", len(content)))
+            data.extend(content)
+    return b"".join(tree), bytes(names), bytes(data)
+
+
+def build_resources_module(path):
+    resources = {}
+    for folder, files in RESOURCES.items():
+        resources[folder] = []
+        for name in files:
+            with open(os.path.join(basedir, folder, name), "rb") as resource:
+                resources[folder].append((name, resource.read()))
+    tree, names, data = compile_resources(resources)
+    with open(path, "w", encoding="ascii") as module:
+        module.write(
+            "# Qt resources of PyRPN: icons under :/icons and fonts under :/fonts\n"
+            "#\n"
+            "# Generated by build_resources.py, do not edit\n"
+            "\n"
+            "from PyQt6 import QtCore\n"
+            "\n"
+        )
+        for variable, blob in (
+            ("qt_resource_data", data),
+            ("qt_resource_name", names),
+            ("qt_resource_struct", tree),
+        ):
+            module.write(f"{variable} = (\n")
+            for start in range(0, len(blob), 32):
+                module.write(f"    {blob[start:start + 32]!r}\n")
+            module.write(")\n\n")
+        module.write(
+            "\n"
+            "def qInitResources():\n"
+            "    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)\n"
+            "\n"
+            "\n"
+            "def qCleanupResources():\n"
+            "    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)\n"
+            "\n"
+            "\n"
+            "qInitResources()\n"
+        )
+
+
+def build_ui_module(path):
+    """Compile ui/calculator.ui with pyuic6, taking icons from the resources"""
+    source = subprocess.run(
+        [sys.executable, "-m", "PyQt6.uic.pyuic", os.path.join("ui", "calculator.ui")],
+        cwd=basedir,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    source = re.sub(r'QPixmap\("[^"]*icons/([^"]+)"\)', r'QPixmap(":/icons/\1")', source)
+    with open(path, "w", encoding="utf-8") as module:
+        module.write(source)
+
+
+def main():
+    build_ui_module(os.path.join(basedir, "ui_calculator.py"))
+    build_resources_module(os.path.join(basedir, "resources_rc.py"))
+
+
+if __name__ == "__main__":
+    main()
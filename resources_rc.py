@@ -0,0 +1,1229 @@
+# Qt resources of PyRPN: icons under :/icons and fonts under :/fonts
+#
+# Generated by build_resources.py, do not edit
+
+from PyQt6 import QtCore
+
+qt_resource_data = (
+    b'\x00\x00[0\x00\x01\x00\x00\x00\x12\x01\x00\x00\x04\x00 LTSH\xf0\xa6\xa6\xbf\x00\x00\x03\xb4\x00\x00\x00o'
+    b'OS/2g*\xef\xfe\x00\x00\x01\xa8\x00\x00\x00`PCLT\xcd\x96\xeeL\x00\x00Z\xf8\x00\x00\x006'
+    b'VDMXkjs\x05\x00\x00\x04$\x00\x00\x05\xe0cmap\x90[\xd5e\x00\x00\x14\x1c\x00\x00\x02P'
+    b'cvt \x00\x16\x00\x16\x00\x00\x19\\\x00\x00\x00\x04fpgmv*\x0f6\x00\x00\x16l\x00\x00\x02\xe6'
+    b'gasp\x00\x17\x00\t\x00\x00Z\xe8\x00\x00\x00\x10glyfo\xa6\x8b8\x00\x00\x19`\x00\x009\x04'
+    b'hdmx\xaf42\x19\x00\x00\n\x04\x00\x00\n\x18head\xf0 \xef\x90\x00\x00\x01,\x00\x00\x006'
+    b'hhea\x05X\x03\x9a\x00\x00\x01d\x00\x00\x00$hmtx\xbf\x82\x0b\xe7\x00\x00\x02\x08\x00\x00\x01\xac'
+    b'loca\xf5\xdb\x05`\x00\x00Rd\x00\x00\x00\xd8maxp\x02\x8e\x03;\x00\x00\x01\x88\x00\x00\x00 '
+    b'name\xef\x02\xf9\x0f\x00\x00S<\x00\x00\x06\xabpost]Ib1\x00\x00Y\xe8\x00\x00\x00\xfd'
+    b'prepp\x00\nV\x00\x00\x19T\x00\x00\x00\x08\x00\x01\x00\x00\x00\x01\x00\x00ho\xef\x7f_\x0f<\xf5'
+    b'\x00\x19\x04L\x00\x00\x00\x00\xc5\x0bM\xf0\x00\x00\x00\x00\xc9\xaf]\x84\x00\x06\xff\x88\x021\x03H\x00\x02\x00\x0b'
+    b'\x00\x02\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x03 \x00\xc8\x00\x00\x02X\x00\x06\x00\x0e\x021\x00\x01\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00k\x00\x01\x00\x00\x00k\x00T\x00\x0e\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00'
+    b'\x00\x14\x00\x00\x02\x00\x02\xe6\x00\x00\x00\x00\x00\x03\x01\xca\x01\x90\x00\x05\x00\x00\x02\xbc\x02\x8a\x00\x00\x00\x8f\x02\xbc'
+    b'\x02\x8a\x00\x00\x01\xc5\x002\x01\x03\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x01\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00ALTS\x00\x01\x00  0\x03 \x00\xc8\x00\x00\x03\x84\x00\xbb\x00\x00\x00\x01\x00\x00'
+    b'\x00\x00\x02\xbc\x02\xbc\x00\x00\x00 \x00\x00\x02D\x00\x13\x01\xf4\x00\x00\x01\xf4\x00\x00\x01,\x00\x00\x00\xb4\x00\x0e'
+    b'\x01U\x00F\x02\x1c\x00*\x02\x08\x00\x13\x02X\x00:\x020\x00\x13\x00\xb4\x00F\x01^\x00\x18\x01^\x00\x12'
+    b'\x01\xae\x00)\x01\xb8\x002\x00\xb4\x00\x06\x01\xb8\x002\x00\xb4\x00\x0e\x02\x08\x00\x12\x02\x08\x00\x13\x00\xb4\x00\x16'
+    b'\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x005\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x005\x02\x08\x00\x13\x02\x08\x00\x13'
+    b'\x00\xb4\x00\x1d\x00\xb4\x00\x06\x01r\x001\x01\xb8\x00*\x01r\x00!\x02\x08\x00\x0e\x02\x08\x00\x13\x02\x08\x00\x13'
+    b'\x02\x08\x00\x0e\x01\xe0\x00\x13\x02\x08\x00\x0e\x01\xe0\x00\x13\x01\xe0\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x00\xb4\x00\x17'
+    b'\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x18\x02\x08\x00\x13\x02\x12\x00\x13'
+    b'\x02\x08\x00\x13\x02\x08\x00\x13\x02\x07\x00Q\x02\x08\x00\x13\x02\x08\x00(\x02\x08\x00\x14\x02\x08\x00\x12\x02\x08\x00\x13'
+    b'\x02\x08\x00\x12\x016\x00\x14\x02\x06\x00R\x016\x00\x10\x02\x07\x00>\x02\x07\x00\x13\x01\x18\x00T\x02\x08\x00\x13'
+    b'\x02\x08\x00\x0e\x01\xe0\x00\x13\x02\x08\x00\x0e\x01\xe0\x00\x13\x01\xe0\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x00\xb4\x00\x17'
+    b'\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x13\x02\x08\x00\x18\x02\x08\x00\x13\x02\x12\x00\x13'
+    b'\x02\x08\x00\x13\x02\x08\x00\x13\x02\x07\x00Q\x02\x08\x00\x13\x02\x08\x00(\x02\x08\x00\x14\x02\x08\x00\x12\x02\x08\x00\x13'
+    b'\x02\x08\x00\x12\x01\xae\x002\x00\xb4\x00\x16\x01\xae\x00\x10\x02\x1c\x00:\x02N\x00/\x00\xb4\x00B\x00\xb4\x00F'
+    b'\x01T\x00B\x01U\x00F\x01\x86\x00-\x02\x1c\x002\x02D\x002\x02D\x00\x13\x00\x00\x00kK\x01\x01\x01'
+    b'KKKKKKKKKKKKKKKKKKKKKKKKKKKKKKKK'
+    b'KKKKKKKKKKKKKKKKKKKKKKKKKKKKKKKK'
+    b'KKKKKKKKKKKKKKKKKKKKKKKKKKKKKKKK'
+    b'KKKKKKK\x00\x00\x00\x00\x01\x00\x01\x01\x01\x01\x01\x00\x0c\x00\xf8\x08\xff\x00\x08\x00\x07\xff\xfe\x00\t'
+    b'\x00\x08\xff\xfe\x00\n\x00\t\xff\xfe\x00\x0b\x00\t\xff\xfe\x00\x0c\x00\n\xff\xfd\x00\r\x00\x0b\xff\xfd\x00\x0e\x00\x0c'
+    b'\xff\xfd\x00\x0f\x00\r\xff\xfd\x00\x10\x00\x0e\xff\xfd\x00\x11\x00\x0e\xff\xfd\x00\x12\x00\x0f\xff\xfc\x00\x13\x00\x10\xff\xfc'
+    b'\x00\x14\x00\x11\xff\xfc\x00\x15\x00\x12\xff\xfc\x00\x16\x00\x12\xff\xfc\x00\x17\x00\x13\xff\xfc\x00\x18\x00\x14\xff\xfb\x00\x19'
+    b'\x00\x15\xff\xfb\x00\x1a\x00\x16\xff\xfb\x00\x1b\x00\x17\xff\xfb\x00\x1c\x00\x17\xff\xfb\x00\x1d\x00\x18\xff\xfb\x00\x1e\x00\x19'
+    b'\xff\xfa\x00\x1f\x00\x1a\xff\xfa\x00 \x00\x1b\xff\xfa\x00!\x00\x1b\xff\xfa\x00"\x00\x1c\xff\xfa\x00#\x00\x1d\xff\xfa'
+    b"\x00$\x00\x1e\xff\xf9\x00%\x00\x1f\xff\xf9\x00&\x00 \xff\xf9\x00'\x00 \xff\xf9\x00(\x00!\xff\xf9\x00)"
+    b'\x00"\xff\xf9\x00*\x00#\xff\xf8\x00+\x00$\xff\xf8\x00,\x00$\xff\xf8\x00-\x00%\xff\xf8\x00.\x00&'
+    b"\xff\xf8\x00/\x00'\xff\xf8\x000\x00(\xff\xf7\x001\x00)\xff\xf7\x002\x00)\xff\xf7\x003\x00*\xff\xf7"
+    b'\x004\x00+\xff\xf7\x005\x00,\xff\xf6\x006\x00-\xff\xf6\x007\x00-\xff\xf6\x008\x00.\xff\xf6\x009'
+    b'\x00/\xff\xf6\x00:\x000\xff\xf6\x00;\x001\xff\xf5\x00<\x002\xff\xf5\x00=\x002\xff\xf5\x00>\x003'
+    b'\xff\xf5\x00?\x004\xff\xf5\x00@\x005\xff\xf5\x00A\x006\xff\xf4\x00B\x006\xff\xf4\x00C\x007\xff\xf4'
+    b'\x00D\x008\xff\xf4\x00E\x009\xff\xf4\x00F\x00:\xff\xf4\x00G\x00;\xff\xf3\x00H\x00;\xff\xf3\x00I'
+    b'\x00<\xff\xf3\x00J\x00=\xff\xf3\x00K\x00>\xff\xf3\x00L\x00?\xff\xf3\x00M\x00?\xff\xf2\x00N\x00@'
+    b'\xff\xf2\x00O\x00A\xff\xf2\x00P\x00B\xff\xf2\x00Q\x00C\xff\xf2\x00R\x00D\xff\xf2\x00S\x00D\xff\xf1'
+    b'\x00T\x00E\xff\xf1\x00U\x00F\xff\xf1\x00V\x00G\xff\xf1\x00W\x00H\xff\xf1\x00X\x00H\xff\xf1\x00Y'
+    b'\x00I\xff\xf0\x00Z\x00J\xff\xf0\x00[\x00K\xff\xf0\x00\\\x00L\xff\xf0\x00]\x00M\xff\xf0\x00^\x00M'
+    b'\xff\xf0\x00_\x00N\xff\xef\x00`\x00O\xff\xef\x00a\x00P\xff\xef\x00b\x00Q\xff\xef\x00c\x00Q\xff\xef'
+    b'\x00d\x00R\xff\xef\x00e\x00S\xff\xee\x00f\x00T\xff\xee\x00g\x00U\xff\xee\x00h\x00V\xff\xee\x00i'
+    b'\x00V\xff\xee\x00j\x00W\xff\xed\x00k\x00X\xff\xed\x00l\x00Y\xff\xed\x00m\x00Z\xff\xed\x00n\x00Z'
+    b'\xff\xed\x00o\x00[\xff\xed\x00p\x00\\\xff\xec\x00q\x00]\xff\xec\x00r\x00^\xff\xec\x00s\x00_\xff\xec'
+    b'\x00t\x00_\xff\xec\x00u\x00`\xff\xec\x00v\x00a\xff\xeb\x00w\x00b\xff\xeb\x00x\x00c\xff\xeb\x00y'
+    b'\x00c\xff\xeb\x00z\x00d\xff\xeb\x00{\x00e\xff\xeb\x00|\x00f\xff\xea\x00}\x00g\xff\xea\x00~\x00h'
+    b'\xff\xea\x00\x7f\x00h\xff\xea\x00\x80\x00i\xff\xea\x00\x81\x00j\xff\xea\x00\x82\x00k\xff\xe9\x00\x83\x00l\xff\xe9'
+    b'\x00\x84\x00l\xff\xe9\x00\x85\x00m\xff\xe9\x00\x86\x00n\xff\xe9\x00\x87\x00o\xff\xe9\x00\x88\x00p\xff\xe8\x00\x89'
+    b'\x00q\xff\xe8\x00\x8a\x00q\xff\xe8\x00\x8b\x00r\xff\xe8\x00\x8c\x00s\xff\xe8\x00\x8d\x00t\xff\xe8\x00\x8e\x00u'
+    b'\xff\xe7\x00\x8f\x00u\xff\xe7\x00\x90\x00v\xff\xe7\x00\x91\x00w\xff\xe7\x00\x92\x00x\xff\xe7\x00\x93\x00y\xff\xe7'
+    b'\x00\x94\x00z\xff\xe6\x00\x95\x00z\xff\xe6\x00\x96\x00{\xff\xe6\x00\x97\x00|\xff\xe6\x00\x98\x00}\xff\xe6\x00\x99'
+    b'\x00~\xff\xe5\x00\x9a\x00~\xff\xe5\x00\x9b\x00\x7f\xff\xe5\x00\x9c\x00\x80\xff\xe5\x00\x9d\x00\x81\xff\xe5\x00\x9e\x00\x82'
+    b'\xff\xe5\x00\x9f\x00\x83\xff\xe4\x00\xa0\x00\x83\xff\xe4\x00\xa1\x00\x84\xff\xe4\x00\xa2\x00\x85\xff\xe4\x00\xa3\x00\x86\xff\xe4'
+    b'\x00\xa4\x00\x87\xff\xe4\x00\xa5\x00\x87\xff\xe3\x00\xa6\x00\x88\xff\xe3\x00\xa7\x00\x89\xff\xe3\x00\xa8\x00\x8a\xff\xe3\x00\xa9'
+    b'\x00\x8b\xff\xe3\x00\xaa\x00\x8c\xff\xe3\x00\xab\x00\x8c\xff\xe2\x00\xac\x00\x8d\xff\xe2\x00\xad\x00\x8e\xff\xe2\x00\xae\x00\x8f'
+    b'\xff\xe2\x00\xaf\x00\x90\xff\xe2\x00\xb0\x00\x90\xff\xe2\x00\xb1\x00\x91\xff\xe1\x00\xb2\x00\x92\xff\xe1\x00\xb3\x00\x93\xff\xe1'
+    b'\x00\xb4\x00\x94\xff\xe1\x00\xb5\x00\x95\xff\xe1\x00\xb6\x00\x95\xff\xe1\x00\xb7\x00\x96\xff\xe0\x00\xb8\x00\x97\xff\xe0\x00\xb9'
+    b'\x00\x98\xff\xe0\x00\xba\x00\x99\xff\xe0\x00\xbb\x00\x99\xff\xe0\x00\xbc\x00\x9a\xff\xe0\x00\xbd\x00\x9b\xff\xdf\x00\xbe\x00\x9c'
+    b'\xff\xdf\x00\xbf\x00\x9d\xff\xdf\x00\xc0\x00\x9e\xff\xdf\x00\xc1\x00\x9e\xff\xdf\x00\xc2\x00\x9f\xff\xdf\x00\xc3\x00\xa0\xff\xde'
+    b'\x00\xc4\x00\xa1\xff\xde\x00\xc5\x00\xa2\xff\xde\x00\xc6\x00\xa2\xff\xde\x00\xc7\x00\xa3\xff\xde\x00\xc8\x00\xa4\xff\xde\x00\xc9'
+    b'\x00\xa5\xff\xdd\x00\xca\x00\xa6\xff\xdd\x00\xcb\x00\xa7\xff\xdd\x00\xcc\x00\xa7\xff\xdd\x00\xcd\x00\xa8\xff\xdd\x00\xce\x00\xa9'
+    b'\xff\xdc\x00\xcf\x00\xaa\xff\xdc\x00\xd0\x00\xab\xff\xdc\x00\xd1\x00\xab\xff\xdc\x00\xd2\x00\xac\xff\xdc\x00\xd3\x00\xad\xff\xdc'
+    b'\x00\xd4\x00\xae\xff\xdb\x00\xd5\x00\xaf\xff\xdb\x00\xd6\x00\xb0\xff\xdb\x00\xd7\x00\xb0\xff\xdb\x00\xd8\x00\xb1\xff\xdb\x00\xd9'
+    b'\x00\xb2\xff\xdb\x00\xda\x00\xb3\xff\xda\x00\xdb\x00\xb4\xff\xda\x00\xdc\x00\xb4\xff\xda\x00\xdd\x00\xb5\xff\xda\x00\xde\x00\xb6'
+    b'\xff\xda\x00\xdf\x00\xb7\xff\xda\x00\xe0\x00\xb8\xff\xd9\x00\xe1\x00\xb9\xff\xd9\x00\xe2\x00\xb9\xff\xd9\x00\xe3\x00\xba\xff\xd9'
+    b'\x00\xe4\x00\xbb\xff\xd9\x00\xe5\x00\xbc\xff\xd9\x00\xe6\x00\xbd\xff\xd8\x00\xe7\x00\xbd\xff\xd8\x00\xe8\x00\xbe\xff\xd8\x00\xe9'
+    b'\x00\xbf\xff\xd8\x00\xea\x00\xc0\xff\xd8\x00\xeb\x00\xc1\xff\xd8\x00\xec\x00\xc2\xff\xd7\x00\xed\x00\xc2\xff\xd7\x00\xee\x00\xc3'
+    b'\xff\xd7\x00\xef\x00\xc4\xff\xd7\x00\xf0\x00\xc5\xff\xd7\x00\xf1\x00\xc6\xff\xd7\x00\xf2\x00\xc6\xff\xd6\x00\xf3\x00\xc7\xff\xd6'
+    b'\x00\xf4\x00\xc8\xff\xd6\x00\xf5\x00\xc9\xff\xd6\x00\xf6\x00\xca\xff\xd6\x00\xf7\x00\xcb\xff\xd6\x00\xf8\x00\xcb\xff\xd5\x00\xf9'
+    b'\x00\xcc\xff\xd5\x00\xfa\x00\xcd\xff\xd5\x00\xfb\x00\xce\xff\xd5\x00\xfc\x00\xcf\xff\xd5\x00\xfd\x00\xcf\xff\xd4\x00\xfe\x00\xd0'
+    b'\xff\xd4\x00\xff\x00\xd1\xff\xd4\x00\x00\x00\x17\x00\x00\x00p\t\x05\x05\x04\x04\x02\x01\x03\x04\x04\x05\x05\x01\x03\x03\x04'
+    b'\x04\x01\x04\x01\x04\x04\x01\x04\x04\x04\x04\x04\x04\x04\x04\x01\x01\x03\x04\x03\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x01\x04'
+    b'\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x03\x04\x03\x04\x04\x02\x04\x04\x04\x04\x04\x04\x04\x04\x01\x04'
+    b'\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x04\x01\x04\x04\x05\x01\x01\x03\x03\x03\x04\x05\x05\x00\x00\x00'
+    b'\n\x05\x05\x05\x05\x03\x02\x03\x05\x05\x05\x05\x02\x03\x03\x04\x04\x02\x04\x02\x05\x05\x02\x05\x05\x05\x05\x05\x05\x05\x05\x02'
+    b'\x02\x03\x04\x03\x05\x05\x05\x05\x04\x05\x04\x04\x05\x05\x02\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+    b'\x03\x05\x03\x05\x05\x03\x05\x05\x04\x05\x04\x04\x05\x05\x02\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05'
+    b'\x04\x02\x04\x05\x05\x02\x02\x03\x03\x04\x05\x05\x05\x00\x00\x00\x0b\x06\x06\x05\x05\x03\x02\x03\x05\x05\x06\x06\x02\x04\x04\x04'
+    b'\x04\x02\x04\x02\x05\x05\x02\x05\x05\x05\x05\x05\x05\x05\x05\x02\x02\x04\x04\x04\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x02\x05'
+    b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x03\x05\x03\x05\x05\x03\x05\x05\x05\x05\x05\x05\x05\x05\x02\x05'
+    b'\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x05\x04\x02\x04\x05\x06\x02\x02\x03\x03\x04\x05\x06\x06\x00\x00\x00'
+    b'\x0c\x07\x06\x05\x05\x03\x02\x04\x06\x06\x07\x06\x02\x04\x04\x05\x05\x02\x05\x02\x06\x06\x02\x06\x06\x06\x06\x06\x06\x06\x06\x02'
+    b'\x02\x04\x05\x04\x06\x06\x06\x06\x05\x06\x05\x05\x06\x06\x02\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+    b'\x03\x06\x03\x06\x06\x03\x06\x06\x05\x06\x05\x05\x06\x06\x02\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06'
+    b'\x05\x02\x05\x06\x06\x02\x02\x04\x04\x04\x06\x06\x06\x00\x00\x00\r\x07\x07\x06\x06\x04\x02\x04\x06\x06\x07\x07\x02\x04\x04\x05'
+    b'\x05\x02\x05\x02\x06\x06\x02\x06\x06\x06\x06\x06\x06\x06\x06\x02\x02\x04\x05\x04\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x02\x06'
+    b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x04\x06\x04\x06\x06\x03\x06\x06\x06\x06\x06\x06\x06\x06\x02\x06'
+    b'\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x06\x05\x02\x05\x06\x07\x02\x02\x04\x04\x05\x06\x07\x07\x00\x00\x00'
+    b'\x0f\x08\x08\x07\x07\x04\x02\x05\x07\x07\x08\x08\x02\x05\x05\x06\x06\x02\x06\x02\x07\x07\x02\x07\x07\x07\x07\x07\x07\x07\x07\x02'
+    b'\x02\x05\x06\x05\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x02\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07'
+    b'\x04\x07\x04\x07\x07\x04\x07\x07\x07\x07\x07\x07\x07\x07\x02\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07'
+    b'\x06\x02\x06\x07\x08\x02\x02\x05\x05\x05\x07\x08\x08\x00\x00\x00\x10\t\x08\x07\x07\x04\x03\x05\x08\x08\t\x08\x03\x05\x05\x06'
+    b'\x06\x03\x06\x03\x08\x08\x03\x08\x08\x08\x08\x08\x08\x08\x08\x03\x03\x05\x06\x05\x08\x08\x08\x08\x07\x08\x07\x07\x08\x08\x03\x08'
+    b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x05\x08\x05\x08\x08\x04\x08\x08\x07\x08\x07\x07\x08\x08\x03\x08'
+    b'\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x06\x03\x06\x08\t\x03\x03\x05\x05\x06\x08\x08\x08\x00\x00\x00'
+    b'\x11\t\t\x08\x08\x05\x03\x05\x08\x08\t\t\x03\x05\x05\x07\x07\x03\x07\x03\x08\x08\x03\x08\x08\x08\x08\x08\x08\x08\x08\x03'
+    b'\x03\x06\x07\x06\x08\x08\x08\x08\x07\x08\x07\x07\x08\x08\x03\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+    b'\x05\x08\x05\x08\x08\x04\x08\x08\x07\x08\x07\x07\x08\x08\x03\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08\x08'
+    b'\x07\x03\x07\x08\t\x03\x03\x05\x05\x06\x08\t\t\x00\x00\x00\x13\n\n\t\t\x05\x03\x06\t\t\n\n\x03\x06\x06\x07'
+    b'\x08\x03\x08\x03\t\t\x03\t\t\t\t\t\t\t\t\x03\x03\x06\x08\x06\t\t\t\t\x08\t\x08\x08\t\t\x03\t'
+    b'\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\x05\t\x05\t\t\x05\t\t\x08\t\x08\x08\t\t\x03\t'
+    b'\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\t\x07\x03\x07\t\n\x03\x03\x06\x06\x07\t\n\n\x00\x00\x00'
+    b'\x15\x0b\x0b\n\n\x06\x03\x07\n\n\x0b\x0b\x03\x07\x07\x08\x08\x03\x08\x03\n\n\x03\n\n\n\n\n\n\n\n\x03'
+    b'\x03\x07\x08\x07\n\n\n\n\t\n\t\t\n\n\x03\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n'
+    b'\x06\n\x06\n\n\x05\n\n\t\n\t\t\n\n\x03\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n'
+    b'\x08\x03\x08\n\x0b\x03\x03\x06\x07\x07\n\x0b\x0b\x00\x00\x00\x18\r\r\x0b\x0b\x07\x04\x07\x0c\x0b\r\x0c\x04\x08\x08\t'
+    b'\n\x04\n\x04\x0b\x0b\x04\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x04\x04\x08\n\x08\x0b\x0b\x0b\x0b\n\x0b\n\n\x0b\x0b\x04\x0b'
+    b'\x0b\x0b\x0b\x0b\x0b\x0b\x0c\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x07\x0b\x07\x0b\x0b\x06\x0b\x0b\n\x0b\n\n\x0b\x0b\x04\x0b'
+    b'\x0b\x0b\x0b\x0b\x0b\x0b\x0c\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\t\x04\t\x0c\r\x04\x04\x07\x07\t\x0c\r\r\x00\x00\x00'
+    b'\x1b\x0f\x0e\x0c\x0c\x07\x04\x08\r\r\x0f\x0e\x04\t\t\x0b\x0b\x04\x0b\x04\r\r\x04\r\r\r\r\r\r\r\r\x04'
+    b'\x04\t\x0b\t\r\r\r\r\x0c\r\x0c\x0c\r\r\x04\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r'
+    b'\x08\r\x08\r\r\x07\r\r\x0c\r\x0c\x0c\r\r\x04\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r\r'
+    b'\x0b\x04\x0b\r\x0e\x04\x04\x08\x08\n\r\x0e\x0e\x00\x00\x00\x1d\x10\x0f\r\r\x08\x05\t\x0e\x0e\x10\x0f\x05\t\t\x0b'
+    b'\x0c\x05\x0c\x05\x0e\x0e\x05\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x05\x05\n\x0c\n\x0e\x0e\x0e\x0e\r\x0e\r\r\x0e\x0e\x05\x0e'
+    b'\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x08\x0e\x08\x0e\x0e\x07\x0e\x0e\r\x0e\r\r\x0e\x0e\x05\x0e'
+    b'\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0b\x05\x0b\x0e\x10\x05\x05\t\t\n\x0e\x0f\x0f\x00\x00\x00'
+    b' \x11\x11\x0f\x0f\t\x05\n\x10\x0f\x11\x10\x05\n\n\r\r\x05\r\x05\x0f\x0f\x05\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x05'
+    b'\x05\x0b\r\x0b\x0f\x0f\x0f\x0f\x0e\x0f\x0e\x0e\x0f\x0f\x05\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f'
+    b'\t\x0f\t\x0f\x0f\x08\x0f\x0f\x0e\x0f\x0e\x0e\x0f\x0f\x05\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f\x0f'
+    b'\r\x05\r\x10\x11\x05\x05\n\n\x0b\x10\x11\x11\x00\x00\x00!\x12\x11\x0f\x0f\t\x05\n\x10\x10\x12\x11\x05\x0b\x0b\r'
+    b'\r\x05\r\x05\x10\x10\x05\x10\x10\x10\x10\x10\x10\x10\x10\x05\x05\x0b\r\x0b\x10\x10\x10\x10\x0e\x10\x0e\x0e\x10\x10\x05\x10'
+    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\t\x10\t\x10\x10\x08\x10\x10\x0e\x10\x0e\x0e\x10\x10\x05\x10'
+    b'\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\r\x05\r\x10\x12\x05\x05\n\n\x0c\x10\x11\x11\x00\x00\x00'
+    b'%\x14\x14\x11\x11\n\x06\x0b\x12\x11\x14\x13\x06\x0c\x0c\x0e\x0f\x06\x0f\x06\x11\x11\x06\x11\x11\x11\x11\x11\x11\x11\x11\x06'
+    b'\x06\x0c\x0f\x0c\x11\x11\x11\x11\x10\x11\x10\x10\x11\x11\x06\x11\x11\x11\x11\x11\x11\x11\x12\x11\x11\x11\x11\x11\x11\x11\x11\x11'
+    b'\n\x11\n\x11\x11\t\x11\x11\x10\x11\x10\x10\x11\x11\x06\x11\x11\x11\x11\x11\x11\x11\x12\x11\x11\x11\x11\x11\x11\x11\x11\x11'
+    b'\x0e\x06\x0e\x12\x14\x06\x06\x0b\x0b\r\x12\x14\x14\x00\x00\x00*\x17\x16\x13\x13\x0b\x07\r\x15\x14\x17\x15\x07\r\r\x10'
+    b'\x11\x07\x11\x07\x14\x14\x07\x14\x14\x14\x14\x14\x14\x14\x14\x07\x07\x0e\x11\x0e\x14\x14\x14\x14\x12\x14\x12\x12\x14\x14\x07\x14'
+    b'\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x0c\x14\x0c\x14\x14\x0b\x14\x14\x12\x14\x12\x12\x14\x14\x07\x14'
+    b'\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x10\x07\x10\x15\x17\x07\x07\r\r\x0f\x15\x16\x16\x00\x00\x00'
+    b'.\x19\x18\x15\x15\r\x08\x0e\x17\x16\x19\x17\x08\x0f\x0f\x12\x12\x08\x12\x08\x16\x16\x08\x16\x16\x16\x16\x16\x16\x16\x16\x08'
+    b'\x08\x0f\x12\x0f\x16\x16\x16\x16\x14\x16\x14\x14\x16\x16\x08\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16'
+    b'\r\x16\r\x16\x16\x0c\x16\x16\x14\x16\x14\x14\x16\x16\x08\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16\x16'
+    b'\x12\x08\x12\x17\x19\x08\x08\x0e\x0e\x10\x17\x18\x18\x00\x00\x002\x1b\x1a\x17\x17\x0e\x08\x10\x19\x18\x1b\x19\x08\x10\x10\x14'
+    b'\x14\x08\x14\x08\x18\x18\x08\x18\x18\x18\x18\x18\x18\x18\x18\x08\x08\x11\x14\x11\x18\x18\x18\x18\x16\x18\x16\x16\x18\x18\x08\x18'
+    b'\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x0e\x18\x0e\x18\x18\r\x18\x18\x16\x18\x16\x16\x18\x18\x08\x18'
+    b'\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x18\x14\x08\x14\x19\x1b\x08\x08\x0f\x10\x12\x19\x1a\x1a\x00\x00\x00'
+    b'6\x1d\x1c\x19\x19\x0f\t\x11\x1b\x1a\x1d\x1b\t\x11\x11\x15\x16\t\x16\t\x1a\x1a\t\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x1a\t'
+    b'\t\x12\x16\x12\x1a\x1a\x1a\x1a\x18\x1a\x18\x18\x1a\x1a\t\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x19\x1a\x1a\x1a\x1a\x1a\x1a'
+    b'\x0f\x19\x0f\x19\x19\x0e\x1a\x1a\x18\x1a\x18\x18\x1a\x1a\t\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x1a\x19\x1a\x1a\x1a\x1a\x1a\x1a'
+    b'\x15\t\x15\x1b\x1d\t\t\x11\x11\x13\x1b\x1c\x1c\x00\x00\x00: \x1f\x1a\x1a\x10\t\x12\x1c\x1b \x1e\t\x12\x12\x17'
+    b'\x17\t\x17\t\x1b\x1b\t\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x1b\t\t\x14\x17\x14\x1b\x1b\x1b\x1b\x19\x1b\x19\x19\x1b\x1b\t\x1b'
+    b'\x1b\x1b\x1b\x1b\x1b\x1b\x1c\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x10\x1b\x10\x1b\x1b\x0f\x1b\x1b\x19\x1b\x19\x19\x1b\x1b\t\x1b'
+    b'\x1b\x1b\x1b\x1b\x1b\x1b\x1c\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x1b\x17\t\x17\x1c\x1f\t\t\x12\x12\x15\x1c\x1f\x1f\x00\x00\x00'
+    b'C%#\x1e\x1e\x12\x0b\x15! %"\x0b\x15\x15\x1a\x1b\x0b\x1b\x0b  \x0b        \x0b'
+    b'\x0b\x17\x1b\x17    \x1d \x1d\x1d  \x0b                 '
+    b'\x13 \x13  \x11  \x1d \x1d\x1d  \x0b                 '
+    b'\x1a\x0b\x1a!$\x0b\x0b\x15\x15\x18!##\x00\x00\x00K)(""\x14\x0c\x17%#)&\x0c\x18\x18\x1d'
+    b'\x1e\x0c\x1e\x0c##\x0c########\x0c\x0c\x19\x1e\x19####!#!!##\x0c#'
+    b'######$#########\x15#\x15##\x13##!#!!##\x0c#'
+    b'######$#########\x1d\x0c\x1d%(\x0c\x0c\x17\x17\x1b%((\x00\x00\x00'
+    b'\x00\x00\x00\x03\x00\x00\x00\x03\x00\x00\x02\x00\x00\x01\x00\x00\x00\x00\x00\x1c\x00\x03\x00\x01\x00\x00\x01\xb0\x00\x06\x01\x94'
+    b'\x00\x00\x00 \x00\xc5\x00\x03\x00\x04\x00\x05\x00\x06\x00\x07\x00\x08\x00\t\x00\n\x00\x0b\x00\x0c\x00\r\x00\x0e\x00\x0f'
+    b'\x00\x10\x00\x11\x00\x12\x00\x13\x00\x14\x00\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x1b\x00\x1c\x00\x1d\x00\x1e\x00\x1f'
+    b'\x00 \x00!\x00"\x00#\x00$\x00%\x00&\x00\'\x00(\x00)\x00*\x00+\x00,\x00-\x00.\x00/'
+    b'\x000\x001\x002\x003\x004\x005\x006\x007\x008\x009\x00:\x00;\x00<\x00=\x00>\x00?'
+    b'\x00@\x00A\x00B\x00C\x00D\x00E\x00F\x00G\x00H\x00I\x00J\x00K\x00L\x00M\x00N\x00O'
+    b'\x00P\x00Q\x00R\x00S\x00T\x00U\x00V\x00W\x00X\x00Y\x00Z\x00[\x00\\\x00]\x00^\x00_'
+    b'\x00`\x00a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00g\x00\x00\x00\x00\x00\x00\x00j\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00h\x00i\x00e\x00f\x00c\x00d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00b\x00\x04\x00P\x00\x00\x00\x10\x00\x10\x00\x03\x00\x00\x00~'
+    b'\x00\xa9 \x14 \x19 \x1d " 0\xff\xff\x00\x00\x00 \x00\xa9 \x13 \x18 \x1c " 0\xff\xff'
+    b'\xff\xe3\xff\xc1\xe0U\xe0K\xe0I\xe0E\xe02\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x04\x00P\x00\x00\x00\x10\x00\x10\x00\x03\x00\x00\x00~\x00\xa9 \x14 \x19 \x1d " 0\xff\xff\x00\x00'
+    b'\x00 \x00\xa9 \x13 \x18 \x1c " 0\xff\xff\xff\xe3\xff\xc1\xe0U\xe0K\xe0I\xe0E\xe02\x00\x01'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb8\x00\x00,K\xb8\x00\x0bPX\xb1\x01\x01\x8eY\xb8'
+    b'\x01\xff\x85\xb8\x00D\x1d\xb9\x00\x0b\x00\x03_^-\xb8\x00\x01,  EiD\xb0\x01`-\xb8\x00\x02,'
+    b'\xb8\x00\x01*!-\xb8\x00\x03, F\xb0\x03%FRX#Y \x8a \x8aId\x8a F ha'
+    b'd\xb0\x04%F hadRX#e\x8aY/ \xb0\x00SXi \xb0\x00TX!\xb0@Y\x1b'
+    b'i \xb0\x00TX!\xb0@eYY:-\xb8\x00\x04, F\xb0\x04%FRX#\x8aY F '
+    b'jad\xb0\x04%F jadRX#\x8aY/\xfd-\xb8\x00\x05,K \xb0\x03&PXQX'
+    b'\xb0\x80D\x1b\xb0@DY\x1b!! E\xb0\xc0PX\xb0\xc0D\x1b!YY-\xb8\x00\x06,  E'
+    b'iD\xb0\x01`  E}i\x18D\xb0\x01`-\xb8\x00\x07,\xb8\x00\x06*-\xb8\x00\x08,K \xb0'
+    b'\x03&SX\xb0@\x1b\xb0\x00Y\x8a\x8a \xb0\x03&SX#!\xb0\x80\x8a\x8a\x1b\x8a#Y \xb0\x03&'
+    b'SX#!\xb8\x00\xc0\x8a\x8a\x1b\x8a#Y \xb0\x03&SX#!\xb8\x01\x00\x8a\x8a\x1b\x8a#Y \xb0'
+    b'\x03&SX#!\xb8\x01@\x8a\x8a\x1b\x8a#Y \xb8\x00\x03&SX\xb0\x03%E\xb8\x01\x80PX#'
+    b'!\xb8\x01\x80#!\x1b\xb0\x03%E#!#!Y\x1b!YD-\xb8\x00\t,KSXED\x1b!'
+    b'!Y-\xb8\x00\n,K\xb8\x00\x0bPX\xb1\x01\x01\x8eY\xb8\x01\xff\x85\xb8\x00D\x1d\xb9\x00\x0b\x00\x03_'
+    b'^-\xb8\x00\x0b,  EiD\xb0\x01`-\xb8\x00\x0c,\xb8\x00\x0b*!-\xb8\x00\r, F\xb0'
+    b'\x03%FRX#Y \x8a \x8aId\x8a F had\xb0\x04%F hadRX#e'
+    b'\x8aY/ \xb0\x00SXi \xb0\x00TX!\xb0@Y\x1bi \xb0\x00TX!\xb0@eYY:'
+    b'-\xb8\x00\x0e, F\xb0\x04%FRX#\x8aY F jad\xb0\x04%F jadRX'
+    b'#\x8aY/\xfd-\xb8\x00\x0f,K \xb0\x03&PXQX\xb0\x80D\x1b\xb0@DY\x1b!! E'
+    b'\xb0\xc0PX\xb0\xc0D\x1b!YY-\xb8\x00\x10,  EiD\xb0\x01`  E}i\x18D\xb0'
+    b'\x01`-\xb8\x00\x11,\xb8\x00\x10*-\xb8\x00\x12,K \xb0\x03&SX\xb0@\x1b\xb0\x00Y\x8a\x8a '
+    b'\xb0\x03&SX#!\xb0\x80\x8a\x8a\x1b\x8a#Y \xb0\x03&SX#!\xb8\x00\xc0\x8a\x8a\x1b\x8a#Y'
+    b' \xb0\x03&SX#!\xb8\x01\x00\x8a\x8a\x1b\x8a#Y \xb0\x03&SX#!\xb8\x01@\x8a\x8a\x1b\x8a'
+    b'#Y \xb8\x00\x03&SX\xb0\x03%E\xb8\x01\x80PX#!\xb8\x01\x80#!\x1b\xb0\x03%E#!'
+    b'#!Y\x1b!YD-\xb8\x00\x13,KSXED\x1b!!Y-\x00\x00\xb8\x00\n+\xb8\x00\x00+'
+    b'\x00\x16\x00\x16\x00\x04\x00\x13\x00\x00\x021\x02\xd0\x00\x05\x00\x0b\x00\x0f\x00\x17\x007\x00\xba\x00\x13\x00\x00\x00\x03'
+    b'+\xba\x00\x0b\x00\x14\x00\x03+\xb8\x00\x13\x10\xb8\x00\x04\xd0\xb8\x00\x14\x10\xb8\x00\x07\xd0\xba\x00\r\x00\x00\x00\x13'
+    b"\x11\x129\xba\x00\x0e\x00\x14\x00\x0b\x11\x12901)\x01&'7!\x13!'67!\x01\x07\x13\x17\x01"
+    b"\x06\x07'\x137\x16\x17\x01\xa8\xfe\x98'\x06S\x01,8\xfe\xd5M\x0e)\x01g\xfexS:M\x01W\x0e"
+    b")\x168&'\x06\n(\x1e\x020\x1e(\n\xfd\x94\x1e\x02D\x1e\xfd\xc6(\nP\x020P\n(\x00\x00"
+    b'\x00\x03\x00\x0e\x00\x00\x00\xa1\x02\xd0\x00\x04\x00\x0b\x00\x0f\x00\x17\x00\xb8\x00\x07/\xba\x00\x0f\x00\x0c\x00\x03+\xb8'
+    b"\x00\x0f\x10\xb8\x00\x03\xdc01\x13\x17\x07#?\x03\x16\x17\x03\x07\x03#73m\x12\x11P\r\x0e\x15&'"
+    b'\x06\x1c\x16\x11P\x08P\x01^\x14\xaa\x82\x8c\xd2P\n(\xfe\xe8\x14\xfe\x8eP\x00\x00\x02\x00F\x02\x08\x01G'
+    b"\x02\xd1\x00\x04\x00\t\x00\x13\x00\xb8\x00\x03/\xb8\x00\x08/\xb8\x00\x01/\xb8\x00\x06/01\x13\x07'73"
+    b"\x17\x07'73\x96,$\x10P\x91,$\x10P\x020((\xa0\x9f((\xa0\x00\x0c\x00*\x00w\x01\xf2"
+    b'\x02X\x00\x05\x00\x0b\x00\x11\x00\x17\x00\x1d\x00#\x00)\x00/\x005\x00;\x00A\x00G\x00\x83\x00\xb8\x00\x19'
+    b'/\xb8\x00\x1f/\xb8\x00(/\xb8\x00./\xba\x006\x008\x00\x03+\xba\x00B\x00D\x00\x03+\xb8\x00B'
+    b'\x10\xb8\x00\x00\xd0\xb8\x00\x00/\xb8\x00D\x10\xb8\x00\x02\xd0\xb8\x00\x02/\xb8\x006\x10\xb8\x00\x06\xd0\xb8\x00\x06'
+    b'/\xb8\x008\x10\xb8\x00\x08\xd0\xb8\x00\x08/\xb8\x006\x10\xb8\x000\xd0\xb8\x000/\xb8\x008\x10\xb8\x002'
+    b'\xd0\xb8\x002/\xb8\x00B\x10\xb8\x00<\xd0\xb8\x00</\xb8\x00D\x10\xb8\x00>\xd0\xb8\x00>/01\x01'
+    b"\x17\x07#'7\x1f\x01\x07#'7'7\x17\x0f\x01'?\x01\x17\x0f\x01/\x017\x17\x0f\x01'?\x01\x17"
+    b"\x0f\x01'\x037\x17\x0f\x01/\x017\x17\x0f\x01/\x01\x17\x07#'7\x05\x17\x07#'?\x01\x17\x07#'"
+    b"7\x05\x17\x07#'7\x01.$,($,\x18$,($,^,$\x04,$\xa4,$\x04,$"
+    b'\x8a,$\x06,$\xa6,$\x06,$\x1c,$\x06,$\x9a,$\x06,$\x04$,($,\x01h'
+    b'$,($,8$,($,\xfe\xe8$,($,\x01\xe0((((\xa0((((<(('
+    b'(((((((((\xdc((<((<((<((\xfe\xe9((=((<((='
+    b'((\xa1((((\x01((((\xa1((((\x01((((\x00\x00\x00\t\x00\x13\xff\x88\x01\xf5'
+    b'\x03H\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1f\x00$\x00(\x00,\x001\x00M\x00\xb8\x00"/\xb8\x00//\xba'
+    b'\x00\r\x00-\x00\x03+\xba\x00 \x00\x1b\x00\x03+\xba\x00,\x00\x12\x00\x03+\xba\x00\x18\x00&\x00\x03+\xba'
+    b'\x00\x02\x00\x0c\x00\x03+\xba\x00(\x00\x00\x00\x03+\xba\x00\x17\x00/\x00"\x11\x129\xb8\x00\x0c\x10\xb8\x00*'
+    b"\xd001\x01\x17\x07!'7\x05\x17\x03\x06\x07'7\x03!&'73\x03\x0f\x01'\x13\x17'67!"
+    b"\x16\x17\x07'?\x01\x17\x07\x0373\x07\x0373\x0f\x03'7\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e"
+    b")\x16\x15\x13\xfe\xd4'\x06S\xf0\xba\x13B\x12\x1aPM\x0e)\x01?'\x06S\x95\x05,$\x05p\x12P"
+    b'\x12p\x12P\x12\x0e\x05,$\x05\x01\x90((((2\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\x02\x1c\xbe'
+    b'<\x14\x01\x04\n\x1e(\n\n(\x1en2((2\xfe\xc0\xb4\xb4\xfe\xc0\xb4\xb4\x8c2((2\x00\x00\x00'
+    b'\x00\n\x00:\x00\x00\x02\x1e\x02\xd0\x00\x05\x00\x0b\x00\x11\x00\x17\x00\x1d\x00#\x00)\x00/\x005\x00;\x00K'
+    b'\x00\xba\x00.\x00;\x00\x03+\xba\x00\x10\x00\x1d\x00\x03+\xb8\x00\x10\x10\xb8\x00\x01\xd0\xb8\x00;\x10\xb8\x00\x07'
+    b'\xd0\xba\x00\x17\x00\x1d\x00\x10\x11\x129\xba\x00#\x00\x1d\x00\x10\x11\x129\xba\x00)\x00;\x00.\x11\x129\xba'
+    b'\x005\x00;\x00.\x11\x12901\x0172\x17\x03#\x0f\x01"\'\x133\x03#\'673\x0f\x02&'
+    b"'7\x173\x17\x06\x07#?\x02\x16\x17\x07\x13?\x01\x16\x17\x07'#'673\x0f\x02&'7\x173"
+    b"\x17\x06\x07#\x01C\x8f<\x10\xb9-#\x8f<\x10\xb9-F<M\x0e)xd\x06&'\x06\x0c[<M"
+    b"\x0e)xd\x06&'\x06\x0c\x87\x06&'\x06\x0c[<M\x0e)xd\x06&'\x06\x0c[<M\x0e)"
+    b'x\x01\xde\xf2(\xfe\xca\x80\xf2(\x016\x01"\x1e(\nd<P\n(xZ\x1e(\nd<P\n('
+    b'x\xfe><P\n(xZ\x1e(\nd<P\n(xZ\x1e(\n\x00\x00\x00\x08\x00\x13\xff\xa6\x01\xdc'
+    b'\x02\xa8\x00\x05\x00\x0b\x00\x12\x00\x17\x00\x1d\x00"\x00)\x00.\x00G\x00\xb8\x00,/\xba\x00\x1d\x00$\x00\x03'
+    b'+\xba\x00\x11\x00\x0c\x00\x03+\xb8\x00$\x10\xb8\x00\x00\xdc\xb8\x00\x02\xdc\xb8\x00\x11\x10\xb8\x00\x03\xdc\xba\x00\x13'
+    b'\x00\x0c\x00\x11\x11\x129\xb8\x00$\x10\xb8\x00\x19\xd0\xba\x00"\x00$\x00\x1d\x11\x12901\x01\x17\x07!\''
+    b"7\x05\x17\x07#'7\x13!&'7!\x17%\x137\x17\x07\x13#'673\x0f\x02'7\x17?\x01"
+    b"\x16\x17\x0f\x01\x13\x0f\x01'7\x01\x8a$,\xfe\xfc$,\x01;\x12\x172\x1b\x10G\xfez'\x06S\x01@"
+    b"6\xfe9\x1a\x166\x13\xfa\xa0M\x0e)\xdc\xc8\x0bB\x12\x12\xf6\r&'\x06\x14\x16\x11\x05\x166\x01\x01\x90"
+    b'((((2\x14\xe6\x1e\xa0\xfe\xde\n(\x1e<2\x01\x04\x14<\xbe\x01\xf4\x1e(\ndn<\x14\xb4\x8c'
+    b'\x82P\n(\xc8\x14\xfeR2\x14<\n\x00\x01\x00F\x02\x08\x00\xa6\x02\xd0\x00\x04\x00\x0b\x00\xb8\x00\x01/\xb8'
+    b"\x00\x03/01\x13\x07'73\x96,$\x10P\x020((\xa0\x00\x04\x00\x18\x00\x00\x01L\x02\xd0\x00\x05"
+    b"\x00\x0b\x00\x11\x00\x17\x00\x13\x00\xba\x00\x11\x00\r\x00\x03+\xba\x00\x04\x00\x00\x00\x03+01\x01#'73"
+    b"\x17\x01'?\x01\x17\x07\x13\x07#'73'\x0f\x01'?\x01\x01 n$,n$\xfe\xfb\x12\x177\x1b"
+    b'\x15\x83,n$,nm\x15!-\x17\x16\x02\x80(((\xfe\xca\x14\xe62\x1e\xd2\xfez(((\xd2\xd2'
+    b'\x1e2\xe6\x14\x00\x04\x00\x12\x00\x00\x01F\x02\xd0\x00\x05\x00\x0b\x00\x11\x00\x17\x00\x13\x00\xba\x00\x01\x00\x03\x00\x03'
+    b"+\xba\x00\x0e\x00\x10\x00\x03+0173\x17\x07#'\x01\x17\x0f\x01'7\x0373\x17\x07#\x17?\x01"
+    b'\x17\x0f\x01>n$,n$\x01\x05\x12\x177\x1b\x15\x83,n$,nm\x15!-\x17\x16P((('
+    b'\x016\x14\xe62\x1e\xd2\x01\x86(((\xd2\xd2\x1e2\xe6\x14\x00\x00\x00\x01\x00)\x00\xaa\x01\x86\x02&\x00\x17'
+    b'\x00G\x00\xb8\x00\x02/\xb8\x00\x0e/\xba\x00\x00\x00\x0e\x00\x02\x11\x129\xba\x00\x04\x00\x0e\x00\x02\x11\x129\xba'
+    b'\x00\x08\x00\x0e\x00\x02\x11\x129\xba\x00\x0c\x00\x0e\x00\x02\x11\x129\xba\x00\x10\x00\x0e\x00\x02\x11\x129\xba\x00\x14'
+    b"\x00\x0e\x00\x02\x11\x12901\x13?\x01\x17\x077\x17\x0f\x01\x1f\x01\x07'\x0f\x01'7\x07'?\x01/\x01"
+    b'7\xb7\x08,$\x08J5\x14IA\t8B\x08,$\x08J6\x15IA\n9\x01\xaeP((P('
+    b'\x0f7((7\x0f(P((P(\x0f7((7\x0f\x00\x00\x00\x01\x002\x00\xbe\x01\x86\x02\x12\x00\x0f'
+    b'\x00#\x00\xb8\x00\n/\xb8\x00\x02/\xba\x00\x05\x00\x07\x00\x03+\xb8\x00\x05\x10\xb8\x00\x00\xd0\xb8\x00\x07\x10\xb8'
+    b"\x00\x0c\xd001\x13?\x01\x17\x073\x17\x07#\x0f\x01'7#'7\xb8\t,$\tZ$,Z\t,"
+    b'$\tZ$,\x01\x90Z((Z((Z((Z((\x00\x00\x01\x00\x06\xff\x88\x00f\x00P\x00\x04'
+    b"\x00\x0b\x00\xb8\x00\x01/\xb8\x00\x03/01\x17\x07'73V,$\x10PP((\xa0\x00\x00\x01\x002"
+    b"\x01@\x01\x86\x01\x90\x00\x05\x00\x0b\x00\xba\x00\x00\x00\x02\x00\x03+01\x01\x17\x07!'7\x01b$,\xfe"
+    b'\xfc$,\x01\x90((((\x00\x00\x00\x00\x01\x00\x0e\x00\x00\x00f\x00P\x00\x03\x00\x0b\x00\xba\x00\x03\x00\x00'
+    b'\x00\x03+013#73^P\x08PP\x00\x00\x00\x02\x00\x12\x00\x00\x01\xf6\x02\xd0\x00\x05\x00\x0b\x00\x0b'
+    b'\x00\xb8\x00\x01/\xb8\x00\x07/01\x0172\x17\x03#\x0f\x01"\'\x133\x01\x1b\x8f<\x10\xb9-#\x8f'
+    b'<\x10\xb9-\x01\xde\xf2(\xfe\xca\x80\xf2(\x016\x00\x00\x06\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x06\x00\x0c\x00\x11'
+    b'\x00\x17\x00\x1c\x00#\x007\x00\xba\x00\x05\x00\x07\x00\x03+\xba\x00\x17\x00\x1e\x00\x03+\xb8\x00\x05\x10\xb8\x00\x0b'
+    b'\xd0\xba\x00\r\x00\x07\x00\x05\x11\x129\xb8\x00\x1e\x10\xb8\x00\x13\xd0\xba\x00\x1c\x00\x1e\x00\x17\x11\x12901\x01'
+    b"\x17\x03\x06\x07'7\x03!&'73\x05\x137\x17\x07\x01#'67!\x05\x0f\x01'\x13\x05?\x01\x16"
+    b"\x17\x03\x07\x01\xc1\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0\xfe\xbf\x1a\x166\x13\x01&\xefM\x0e)\x01+"
+    b"\xfe\xe8\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16\x01^\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\n\x01\x04\x14"
+    b'<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14\x00\x00\x00\x00\x02\x00\x16\x00\x00\x00\xa1'
+    b"\x02\xd0\x00\x06\x00\r\x00\x0b\x00\xb8\x00\x04/\xb8\x00\t/01\x13\x17\x03\x06\x07'?\x03\x16\x17\x03\x07m"
+    b"\x12\x1c\x0e)\x16\x15\x0e\x15&'\x06\x1c\x16\x01^\x14\xfe\xe8(\nP\xd2\x8c\xd2P\n(\xfe\xe8\x14\x00\x00"
+    b'\x00\x05\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0b\x00\x10\x00\x16\x00\x1d\x00-\x00\xba\x00\x0b\x00\x06\x00\x03+\xba'
+    b'\x00\x16\x00\x18\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xba\x00\x0c\x00\x06\x00\x0b\x11\x129\xb8\x00\x18\x10\xb8\x00\x12'
+    b"\xd001\x01\x17\x07!'7\x01!&'7!\x05\x137\x17\x07\x01#'67!\x03?\x01\x16\x17\x03"
+    b"\x07\x01\x8a$,\xfe\xfc$,\x01\x04\xfe\xb6'\x06S\x01\x0e\xfe\xa1\x1a\x166\x13\x01&\xefM\x0e)\x01+"
+    b"'\x15&'\x06\x1c\x16\x01\x90((((\xfep\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\n\xfe\xde\xd2"
+    b'P\n(\xfe\xe8\x14\x00\x00\x00\x05\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x18\x00\x1f\x00+\x00\xba'
+    b'\x00\x0b\x00\r\x00\x03+\xba\x00\x18\x00\x1a\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd0\xb8'
+    b"\x00\x1a\x10\xb8\x00\x14\xd001\x01\x17\x07!'7\x05\x17\x03\x06\x07'7\x03!&'73\x13#'6"
+    b"7!\x03?\x01\x16\x17\x03\x07\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0"
+    b"8\xefM\x0e)\x01+'\x15&'\x06\x1c\x16\x01\x90((((2\x14\xfe\xe8(\nP\xd2\xfe\xde\n("
+    b'\x1e\x020\x1e(\n\xfe\xde\xd2P\n(\xfe\xe8\x14\x00\x00\x04\x005\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x11'
+    b'\x00\x18\x00\x1d\x00\xb8\x00\x14/\xb8\x00\n/\xba\x00\x00\x00\x02\x00\x03+\xba\x00\x11\x00\n\x00\x14\x11\x1290'
+    b"1\x01\x17\x07!'7\x05\x17\x03\x06\x07'7\x03\x0f\x01'\x13\x05?\x01\x16\x17\x03\x07\x01\x8a$,\xfe\xfc"
+    b"$,\x01;\x12\x1c\x0e)\x16\x15\xe0\x16B\x12\x1d\x01;\x15&'\x06\x1c\x16\x01\x90((((2\x14\xfe"
+    b'\xe8(\nP\xd2\x01h\xdc<\x14\x01"\xfa\xd2P\n(\xfe\xe8\x14\x00\x05\x00\x13\x00\x00\x01\xd3\x02\xd0\x00\x05'
+    b'\x00\x0c\x00\x12\x00\x18\x00\x1d\x00-\x00\xba\x00\x0b\x00\r\x00\x03+\xba\x00\x18\x00\x13\x00\x03+\xba\x00\x00\x00\x02'
+    b"\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd0\xba\x00\x1d\x00\x13\x00\x18\x11\x12901\x01\x17\x07!'7\x05\x17\x03"
+    b"\x06\x07'7\x03!&'73\x13!'67!\x05\x0f\x01'\x13\x01\x8a$,\xfe\xfc$,\x01;\x12"
+    b"\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0V\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a\x01\x90(((("
+    b'2\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\x020\x1e(\nd\xbe<\x14\x01\x04\x00\x06\x00\x13\x00\x00\x01\xd3'
+    b'\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1d\x00"\x007\x00\xba\x00\x0b\x00\r\x00\x03+\xba\x00\x1d\x00\x18\x00\x03'
+    b'+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd0\xba\x00\x13\x00\r\x00\x0b\x11\x129\xba\x00"\x00\x18'
+    b"\x00\x1d\x11\x12901\x01\x17\x07!'7\x05\x17\x03\x06\x07'7\x03!&'73\x05\x137\x17\x07\x01"
+    b"!'67!\x05\x0f\x01'\x13\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S"
+    b'\xf0\xfe\xbf\x1a\x166\x13\x01D\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a\x01\x90((((2\x14\xfe\xe8'
+    b'(\nP\xd2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\x00\x00\x00\x04\x005'
+    b'\x00\x00\x01\xf5\x02\xd0\x00\x06\x00\x0c\x00\x11\x00\x18\x00!\x00\xb8\x00\x04/\xba\x00\x0c\x00\x13\x00\x03+\xb8\x00\x13'
+    b"\x10\xb8\x00\x08\xd0\xba\x00\x11\x00\x13\x00\x0c\x11\x12901\x01\x17\x03\x06\x07'7\x13#'67!\x05\x0f"
+    b"\x01'\x13\x05?\x01\x16\x17\x03\x07\x01\xc1\x12\x1c\x0e)\x16\x15\x0f\xefM\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01"
+    b">\x15&'\x06\x1c\x16\x01^\x14\xfe\xe8(\nP\xd2\x01^\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2P\n("
+    b'\xfe\xe8\x14\x00\x00\x07\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1d\x00"\x00)\x00?\x00\xba'
+    b'\x00\x0b\x00\r\x00\x03+\xba\x00\x1d\x00$\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd0\xba'
+    b'\x00\x13\x00\r\x00\x0b\x11\x129\xb8\x00$\x10\xb8\x00\x19\xd0\xba\x00"\x00$\x00\x1d\x11\x12901\x01\x17\x07'
+    b"!'7\x05\x17\x03\x06\x07'7\x03!&'73\x05\x137\x17\x07\x01#'67!\x05\x0f\x01'\x13"
+    b"\x05?\x01\x16\x17\x03\x07\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0\xfe\xbf"
+    b"\x1a\x166\x13\x01&\xefM\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16\x01\x90(((("
+    b'2\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2'
+    b'P\n(\xfe\xe8\x14\x00\x00\x00\x06\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x18\x00\x1d\x00$\x005'
+    b'\x00\xba\x00\x0b\x00\r\x00\x03+\xba\x00\x18\x00\x1f\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11'
+    b"\xd0\xb8\x00\x1f\x10\xb8\x00\x14\xd0\xba\x00\x1d\x00\x1f\x00\x18\x11\x12901\x01\x17\x07!'7\x05\x17\x03\x06\x07"
+    b"'7\x03!&'73\x13#'67!\x05\x0f\x01'\x13\x05?\x01\x16\x17\x03\x07\x01\x8a$,\xfe\xfc"
+    b"$,\x01;\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf08\xefM\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01>"
+    b"\x15&'\x06\x1c\x16\x01\x90((((2\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\x020\x1e(\nd\xbe"
+    b'<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14\x00\x02\x00\x1d\x00\xa0\x00\x96\x020\x00\x03\x00\x07\x00\x17\xb8\x00\n+'
+    b'\x00\xba\x00\x03\x00\x00\x00\r+\xba\x00\x07\x00\x04\x00\r+017#737#73mP\x08P\x19'
+    b'P\x08P\xa0P\xf0P\x00\x00\x02\x00\x06\xff\x88\x00\x96\x020\x00\x03\x00\x08\x00\x0f\x00\xb8\x00\x05/\xba\x00\x03'
+    b"\x00\x00\x00\x03+01\x13#73\x03\x07'73\x8eP\x08P@,$\x10P\x01\xe0P\xfd\x80(("
+    b'\xa0\x00\x00\x00\x00\x02\x001\x00\x96\x01Q\x02:\x00\x04\x00\t\x00\x1f\x00\xb8\x00\x02/\xb8\x00\x06/\xba\x00\x01'
+    b"\x00\x06\x00\x02\x11\x129\xba\x00\x08\x00\x06\x00\x02\x11\x12901\x13#73\x17\x03\x07#'3\xa1n\xdc"
+    b'(\x1a""(\xb4n\x01r\xc8\'\xfe\xaa\'\xc8\x00\x00\x02\x00*\x00\xef\x01\x8e\x01\xe0\x00\x05\x00\x0b\x00\x13'
+    b"\x00\xba\x00\x06\x00\x08\x00\x03+\xba\x00\x00\x00\x02\x00\x03+01\x01\x17\x07!'7\x1f\x01\x07!'7\x01"
+    b'j$,\xfe\xfc$,\xf4$,\xfe\xfc$,\x01\xe0((((\xa1((((\x00\x00\x00\x00\x02\x00!'
+    b'\x00\x96\x01A\x02:\x00\x04\x00\t\x00\x1f\x00\xb8\x00\x01/\xb8\x00\x07/\xba\x00\x03\x00\x07\x00\x01\x11\x129\xba'
+    b'\x00\x06\x00\x07\x00\x01\x11\x12901\x1373\x17#\x073\x07#\'C"(\xb4n\x02n\xdc(\x1a\x02'
+    b"\x13'\xc8\x14\xc8'\x00\x00\x00\x05\x00\x0e\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\n\x00\x10\x00\x17\x00\x1b\x00#\x00\xba"
+    b'\x00\x1b\x00\x18\x00\x03+\xba\x00\x10\x00\x12\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x12\x10\xb8\x00\x0c\xd00'
+    b"1\x01\x17\x07!'7\x07?\x01\x17\x07\x01#'67!\x03?\x01\x16\x17\x03\x07\x01#73\x01\x8a$"
+    b",\xfe\xfc$,h\x11\x166\r\x01 \xefM\x0e)\x01+'\x15&'\x06\x1c\x16\xfe\x9bP\x08P\x01\x90"
+    b'((((\xf0\xaa\x14<\x82\x01\xe0\x1e(\n\xfe\xde\xd2P\n(\xfe\xe8\x14\xfe\x8eP\x00\x00\x00\n\x00\x13'
+    b'\x00\x00\x01\xf5\x02\xd0\x00\x06\x00\x0c\x00\x11\x00\x17\x00\x1c\x00#\x00)\x00.\x003\x009\x00S\x00\xba\x00\x0c'
+    b'\x00\x07\x00\x03+\xba\x00\x17\x00\x1e\x00\x03+\xba\x00(\x00%\x00\x03+\xba\x009\x004\x00\x03+\xba\x00\r'
+    b'\x00\x07\x00\x0c\x11\x129\xb8\x00\x1e\x10\xb8\x00\x13\xd0\xba\x00\x1c\x00\x1e\x00\x17\x11\x129\xba\x00*\x00%\x00('
+    b"\x11\x129\xba\x003\x004\x009\x11\x12901\x01\x17\x07\x06\x07'7\x03!&'73\x05\x137\x17"
+    b"\x07\x01#'67!\x05\x0f\x01'\x13\x05?\x01\x16\x17\x03\x0f\x02&'73\x07?\x01\x17\x077\x0f\x01"
+    b"'7\x17#'67\x17\x01\xc1\x12\x0c\x0e)\x16\x05\x13\xfe\xd4'\x06S\xf0\xfe\xbf\x1a\x166\x13\x01&\xef"
+    b"M\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16G\x8c'\x06SP\xa1\n\x166\x03\x14\x03"
+    b'B\x12\n\x9fPM\x0e)n\x01^\x14x(\nP2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e('
+    b'\nd\xbe<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14\xd2\x01\n(\x1f\nd\x14<\x1e\xc8\x1e<\x14d\n\x1f'
+    b'(\n\x01\x00\x00\x06\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1e\x00%\x00-\x00\xb8\x00\n'
+    b'/\xb8\x00!/\xba\x00\x12\x00\x19\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x19\x10\xb8\x00\x0e\xd0\xba\x00\x17'
+    b"\x00\x19\x00\x12\x11\x12901\x01\x17\x07!'7\x05\x17\x03\x06\x07'7\x13#'67!\x05\x0f\x01'"
+    b"\x13\x05?\x01\x16\x17\x03\x07\x05\x0f\x01&'\x137\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x0f"
+    b"\xefM\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16\xfe\xb8\x15&'\x06\x1c\x16\x01\x90(("
+    b'((2\x14\xfe\xe8(\nP\xd2\x01^\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14P\xd2P'
+    b"\n(\x01\x18\x14\x00\x00\x00\x00\x07\x00\x0e\x00\x00\x01\xf0\x02\xd0\x00\x05\x00\n\x00\x10\x00\x15\x00\x1b\x00!\x00'"
+    b"\x00/\x00\xba\x00'\x00#\x00\x03+\xba\x00\x0f\x00\x0b\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xba\x00\x06\x00#"
+    b"\x00'\x11\x129\xba\x00\x15\x00\x0b\x00\x0f\x11\x12901\x01\x17\x07!'7\x03\x137\x17\x07\x01#'7"
+    b"!\x17\x05\x0f\x01'\x13\x05?\x01\x17\x0f\x02\x17\x0f\x01'7\x0f\x01!?\x013\x01\x8a$,\xfe\xfc$,"
+    b'q\x1a\x166\x13\x01&\xf0M\x05\x01@$\xfe\xe2\x13B\x12\x1a\x01>\x15!-\x17\x16\x02\x12\x177\x1b\x15'
+    b'\x06,\xfe\xc1\x05S\xef\x01\x90((((\xfe\xb6\x01\x04\x14<\xbe\x02\x1c\x1e2(<\xbe<\x14\x01\x04\xdc'
+    b'\xd2\x1e2\xe6\x14\x14\x14\xe62\x1e\xd2\xfa(2\x1e\x00\x00\x04\x00\x13\x00\x00\x01\xd2\x02\xd0\x00\x05\x00\n\x00\x10'
+    b"\x00\x15\x00'\x00\xba\x00\x05\x00\x00\x00\x03+\xba\x00\x10\x00\x0b\x00\x03+\xba\x00\x06\x00\x00\x00\x05\x11\x129\xba"
+    b"\x00\x15\x00\x0b\x00\x10\x11\x12901)\x01&'7!\x05\x137\x17\x07\x01!'67!\x05\x0f\x01'"
+    b"\x13\x01\x8a\xfe\xb6'\x06S\x01\x0e\xfe\xa1\x1a\x166\x13\x01D\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a\n"
+    b'(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\x00\x00\x06\x00\x0e\x00\x00\x01\xf0\x02\xd0\x00\x04'
+    b"\x00\n\x00\x0f\x00\x15\x00\x1b\x00!\x00'\x00\xba\x00!\x00\x1d\x00\x03+\xba\x00\t\x00\x05\x00\x03+\xba\x00\x00"
+    b"\x00\x1d\x00!\x11\x129\xba\x00\x0f\x00\x05\x00\t\x11\x129017\x137\x17\x07\x01#'7!\x17\x05\x0f"
+    b"\x01'\x13\x05?\x01\x17\x0f\x02\x17\x0f\x01'7\x0f\x01!?\x013\x15\x1a\x166\x13\x01&\xf0M\x05\x01@"
+    b'$\xfe\xe2\x13B\x12\x1a\x01>\x15!-\x17\x16\x02\x12\x177\x1b\x15\x06,\xfe\xc1\x05S\xefF\x01\x04\x14<'
+    b'\xbe\x02\x1c\x1e2(<\xbe<\x14\x01\x04\xdc\xd2\x1e2\xe6\x14\x14\x14\xe62\x1e\xd2\xfa(2\x1e\x00\x05\x00\x13'
+    b'\x00\x00\x01\xd2\x02\xd0\x00\x05\x00\x0b\x00\x10\x00\x16\x00\x1b\x00/\x00\xba\x00\x0b\x00\x06\x00\x03+\xba\x00\x16\x00\x11'
+    b'\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xba\x00\x0c\x00\x06\x00\x0b\x11\x129\xba\x00\x1b\x00\x11\x00\x16\x11\x1290'
+    b"1\x01\x17\x07!'7\x01!&'7!\x05\x137\x17\x07\x01!'67!\x05\x0f\x01'\x13\x01\x8a$"
+    b",\xfe\xfc$,\x01\x04\xfe\xb6'\x06S\x01\x0e\xfe\xa1\x1a\x166\x13\x01D\xfe\xf3M\x0e)\x01I\xfe\xca\x13"
+    b'B\x12\x1a\x01\x90((((\xfep\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\x00'
+    b'\x00\x04\x00\x13\x00\x00\x01\xd2\x02\xd0\x00\x05\x00\x0b\x00\x10\x00\x17\x00!\x00\xb8\x00\x13/\xba\x00\x0b\x00\x06\x00\x03'
+    b"+\xba\x00\x00\x00\x02\x00\x03+\xba\x00\x10\x00\x06\x00\x0b\x11\x12901\x01\x17\x07!'7%!'67"
+    b"!\x05\x0f\x01'\x1b\x01\x0f\x01&'\x137\x01\x8a$,\xfe\xfc$,\x01&\xfe\xf3M\x0e)\x01I\xfe\xca"
+    b"\x13B\x12\x1a,\x15&'\x06\x1c\x16\x01\x90((((\xf0\x1e(\nd\xbe<\x14\x01\x04\xfe\x98\xd2P\n"
+    b'(\x01\x18\x14\x00\x06\x00\x13\x00\x00\x01\xd3\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1d\x00"\x007\x00\xba\x00\x0b'
+    b'\x00\r\x00\x03+\xba\x00\x1d\x00\x18\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd0\xba\x00\x13'
+    b'\x00\r\x00\x0b\x11\x129\xba\x00"\x00\x18\x00\x1d\x11\x12901\x01\x17\x07#\'7\x1f\x01\x03\x06\x07\'7'
+    b"\x03!&'73\x05\x137\x17\x07\x01!'67!\x05\x0f\x01'\x13\x01\x8a$,Z$,\x91\x12\x1c"
+    b"\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0\xfe\xbf\x1a\x166\x13\x01D\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a"
+    b'\x01\x90((((2\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe'
+    b'<\x14\x01\x04\x00\x05\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x13\x00\x1a\x00!\x00\x17\x00\xb8\x00\n/\xb8'
+    b"\x00\x16/\xb8\x00\x0f/\xba\x00\x00\x00\x02\x00\x03+01\x01\x17\x07!'7\x05\x17\x03\x06\x07'?\x03\x16"
+    b"\x17\x03\x07\x05\x0f\x01&'\x13?\x01'\x1367\x17\x07\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16"
+    b"\x15\x0e\x15&'\x06\x1c\x16\xfe\xb8\x15&'\x06\x1c\x16\x01\x12\x1c\x0e)\x16\x15\x01\x90((((2\x14\xfe"
+    b'\xe8(\nP\xd2\x8c\xd2P\n(\xfe\xe8\x14P\xd2P\n(\x01\x18\x14\n\x14\x01\x18(\nP\xd2\x00\x00\x00'
+    b'\x00\x02\x00\x17\x00\n\x00\xa1\x02\xd0\x00\x06\x00\r\x00\x0b\x00\xb8\x00\x02/\xb8\x00\x0b/01\x13?\x01\x16\x17'
+    b"\x03\x0f\x01\x17\x03\x06\x07'79\x15&'\x06\x1c\x16\x01\x12\x1c\x0e)\x16\x15\x01\xae\xd2P\n(\xfe\xe8\x14"
+    b'\n\x14\xfe\xe8(\nP\xd2\x00\x04\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x06\x00\x0c\x00\x11\x00\x18\x00!\x00\xb8\x00\x14'
+    b'/\xba\x00\x05\x00\x07\x00\x03+\xb8\x00\x05\x10\xb8\x00\x0b\xd0\xba\x00\r\x00\x07\x00\x05\x11\x12901\x01\x17\x03'
+    b"\x06\x07'7\x03!&'73\x05\x137\x17\x07\x01?\x01\x16\x17\x03\x07\x01\xc1\x12\x1c\x0e)\x16\x15\x13\xfe"
+    b"\xd4'\x06S\xf0\xfe\xbf\x1a\x166\x13\x01%\x15&'\x06\x1c\x16\x01^\x14\xfe\xe8(\nP\xd2\xfe\xde\n("
+    b'\x1e\n\x01\x04\x14<\xbe\x01J\xd2P\n(\xfe\xe8\x14\x00\x05\x00\x13\x00\x00\x01\xf6\x02\xd0\x00\x05\x00\x0c\x00\x12'
+    b'\x00\x19\x00 \x00\x1b\x00\xb8\x00\x0e/\xb8\x00\x1e/\xb8\x00\n/\xb8\x00\x15/\xba\x00\x00\x00\x02\x00\x03+0'
+    b"1\x01\x17\x07!'7\x05\x17\x03\x06\x07'7'%2\x17\x01#\x0f\x02&'\x13?\x01'\x1367\x17"
+    b"\x07\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\xdd\x01\x08<\x10\xfe\xe2<!\x15&'\x06\x1c\x16"
+    b'\x02\x12\x1c\x0e)\x16\x15\x01\x90((((2\x14\xfe\xe8(\nP\xd2\xbe\xf0(\xfe\xfc\x82\xd2P\n(\x01'
+    b'\x18\x14\x14\x14\x01\x18(\nP\xd2\x00\x00\x00\x03\x00\x13\x00\x00\x01\xb7\x02\xd0\x00\x06\x00\x0c\x00\x13\x00\x17\x00\xb8'
+    b"\x00\x11/\xba\x00\x01\x00\x0c\x00\x03+\xb8\x00\x01\x10\xb8\x00\x08\xd001\x13\x0f\x01&'\x137\x133\x17\x06"
+    b'\x07!\x03\'\x1367\x17\x07{\x15&\'\x06\x1c\x165\xf0M\x0e)\xfe\xd4\r\x12\x1c\x0e)\x16\x15\x01"'
+    b'\xd2P\n(\x01\x18\x14\xfe\xf2\x1e(\n\x01r\x14\x01\x18(\nP\xd2\x00\x00\x00\x00\x06\x00\x13\x00\x00\x01\xf5'
+    b'\x02\xd0\x00\x04\x00\x0b\x00\x11\x00\x16\x00\x1d\x00$\x00%\x00\xb8\x00\t/\xb8\x00 /\xba\x00\x11\x00\x18\x00\x03'
+    b"+\xb8\x00\x18\x10\xb8\x00\r\xd0\xba\x00\x16\x00\x18\x00\x11\x11\x12901\x01\x07'73\x13\x17\x03\x06\x07'"
+    b"7\x13#'67!\x05\x0f\x01'\x13\x05?\x01\x16\x17\x03\x07\x05\x0f\x01&'\x137\x01/,$\x17P"
+    b"{\x12\x1c\x0e)\x16\x15\x0f\xefM\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16\xfe\xb8\x15&"
+    b"'\x06\x1c\x16\x01\x86((\xe6\xfe\xf2\x14\xfe\xe8(\nP\xd2\x01^\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2P"
+    b'\n(\xfe\xe8\x14P\xd2P\n(\x01\x18\x14\x00\x00\x00\x00\x05\x00\x13\x00\x00\x01\xf4\x02\xc6\x00\x06\x00\x0c\x00\x13'
+    b"\x00\x1a\x00!\x00\x13\x00\xb8\x00\x02/\xb8\x00\x11/\xb8\x00\x16/\xb8\x00\x1f/01\x13\x0f\x01&'\x137"
+    b"%#'73\x1f\x02\x03\x06\x07'?\x03\x16\x17\x03\x07!'\x1367\x17\x07{\x15&'\x06\x1c\x16\x01"
+    b'3F\x87\x06<\x90D\x12\x1c\x0e)\x16\x15\r\x15&\'\x06\x1c\x16\xfe\x84\x12\x1c\x0e)\x16\x15\x01"\xd2P'
+    b'\n(\x01\x18\x14F\x96<\xa0x\x14\xfe\xe8(\nP\xd2\x82\xd2P\n(\xfe\xe8\x14\x14\x01\x18(\nP\xd2'
+    b'\x00\x06\x00\x18\x00\x00\x01\xf0\x02\xd0\x00\x05\x00\x0b\x00\x11\x00\x17\x00\x1d\x00#\x00\x13\x00\xba\x00\x1d\x00\x19\x00\x03'
+    b"+\xba\x00\x04\x00\x00\x00\x03+01\x01#'73\x17\x07?\x01\x17\x0f\x02\x17\x0f\x01'7%'?\x01"
+    b"\x17\x07\x13\x07#'73'\x0f\x01'?\x01\x01\x8e\xdc$,\xdc$-\x15!-\x17\x16\x02\x12\x177\x1b"
+    b'\x15\xfe\xc8\x12\x177\x1b\x15\xf1,\xdc$,\xdc\xdb\x15!-\x17\x16\x02\x80(((\xfa\xd2\x1e2\xe6\x14\x14'
+    b'\x14\xe62\x1e\xd2P\x14\xe62\x1e\xd2\xfez(((\xd2\xd2\x1e2\xe6\x14\x00\x00\x00\x05\x00\x13\x00\x00\x01\xf0'
+    b'\x02\xd0\x00\x05\x00\x0b\x00\x10\x00\x16\x00\x1d\x00!\x00\xb8\x00\x19/\xba\x00\n\x00\x06\x00\x03+\xba\x00\x00\x00\x02'
+    b"\x00\x03+\xba\x00\x10\x00\x06\x00\n\x11\x12901\x01\x17\x07!'7%#'7!\x17\x05\x0f\x01'\x13"
+    b"\x05?\x01\x17\x0f\x01\x05\x0f\x01&'\x137\x01\x8a$,\xfe\xfc$,\x01\x08\xf0M\x05\x01@$\xfe\xe2\x13"
+    b"B\x12\x1a\x01>\x15!-\x17\x16\xfe\xb8\x15&'\x06\x1c\x16\x01\x90((((\xf0\x1e2(<\xbe<\x14"
+    b'\x01\x04\xdc\xd2\x1e2\xe6\x14P\xd2P\n(\x01\x18\x14\x00\x07\x00\x13\xff\xf6\x01\xf5\x02\xd0\x00\x04\x00\n\x00\x0f'
+    b"\x00\x15\x00\x1a\x00!\x00'\x003\x00\xb8\x00%/\xba\x00\n\x00\x05\x00\x03+\xba\x00\x15\x00\x1c\x00\x03+\xba"
+    b'\x00\x0b\x00\x05\x00\n\x11\x129\xb8\x00\x1c\x10\xb8\x00\x11\xd0\xba\x00\x1a\x00\x1c\x00\x15\x11\x12901\x01\x17\x07'
+    b"'7\x03!&'73\x07\x137\x17\x07\x01#'67!\x05\x0f\x01'\x13\x05?\x01\x16\x17\x03\x0f\x01"
+    b"3\x17\x07#'\x01\xc1\x12\x18H\x0c'\xfe\xe8'\x06S\xaa\xfb\x1a\x166\x13\x01&\xefM\x0e)\x01+\xfe"
+    b"\xe8\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16\xb3<u\x06<u\x01^\x14\xf0Px\xfe\xde\n(\x1e\n\x01"
+    b'\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14\xbe\x82<\x82\x00\x00\x06\x00\x13'
+    b'\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0b\x00\x12\x00\x18\x00\x1f\x00$\x00-\x00\xb8\x00\n/\xb8\x00\x0e/\xba\x00\x18'
+    b'\x00\x1a\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x1a\x10\xb8\x00\x14\xd0\xba\x00$\x00\x1a\x00\x18\x11\x1290'
+    b"1\x01\x17\x07!'7\x173\x13\x06#/\x01\x0f\x01&'\x137\x01#'67!\x03?\x01\x16\x17\x03"
+    b"\x07%\x0f\x01'\x13\x01\x8a$,\xfe\xfc$,\n<\xea\x18<\xd8\x0f\x15&'\x06\x1c\x16\x01I\xefM\x0e"
+    b")\x01+'\x15&'\x06\x1c\x16\xfe\xd9\x13B\x12\x1a\x01\x90((((d\xfe\xfc(\xf02\xd2P\n("
+    b'\x01\x18\x14\x01"\x1e(\n\xfe\xde\xd2P\n(\xfe\xe8\x14\xfa\xbe<\x14\x01\x04\x00\x00\x05\x00\x13\x00\x00\x01\xf5'
+    b'\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1f\x00-\x00\xba\x00\x0b\x00\r\x00\x03+\xba\x00\x1b\x00\x18\x00\x03+\xba'
+    b"\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd0\xba\x00\x17\x00\x18\x00\x1b\x11\x12901\x01\x17\x07!'"
+    b"7\x05\x17\x03\x06\x07'7\x03!&'73\x03\x0f\x01'\x13\x17'67!\x16\x17\x07\x01\x8a$,\xfe"
+    b"\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0\xba\x13B\x12\x1aPM\x0e)\x01?'\x06S"
+    b'\x01\x90((((2\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\x02\x1c\xbe<\x14\x01\x04\n\x1e(\n\n('
+    b'\x1e\x00\x00\x00\x00\x03\x00Q\x00\x00\x01\xf4\x02\xd0\x00\x06\x00\x0b\x00\x13\x00\x0f\x00\xb8\x00\x04/\xba\x00\x0f\x00\x0c'
+    b"\x00\x03+01\x01\x17\x03\x06\x07'?\x023\x0f\x01\x03'67!\x16\x17\x07\x01\x02$\x1a\x0e)\x16\x17"
+    b"\n\x15P\x15,fM\x0e)\x01?'\x06S\x01^(\xfe\xfc(\nP\xe6d\xd2\xd2(\x01\x0e\x1e(\n"
+    b'\n(\x1e\x00\x00\x05\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x06\x00\x0c\x00\x11\x00\x18\x00\x1f\x00!\x00\xb8\x00\x14/\xba'
+    b'\x00\x05\x00\x07\x00\x03+\xb8\x00\x05\x10\xb8\x00\x0b\xd0\xba\x00\r\x00\x07\x00\x05\x11\x12901\x01\x17\x03\x06\x07'
+    b"'7\x03!&'73\x05\x137\x17\x07\x01?\x01\x16\x17\x03\x07\x05'\x1367\x17\x07\x01\xc1\x12\x1c\x0e"
+    b")\x16\x15\x13\xfe\xd4'\x06S\xf0\xfe\xbf\x1a\x166\x13\x01%\x15&'\x06\x1c\x16\xfe\x83\x12\x1c\x0e)\x16\x15"
+    b'\x01^\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x01J\xd2P\n(\xfe\xe8\x14\n\x14\x01'
+    b'\x18(\nP\xd2\x00\x00\x00\x00\x04\x00(\x00\x00\x01\xf4\x02\xc6\x00\x06\x00\r\x00\x13\x00\x19\x00\x13\x00\xb8\x00\x04'
+    b"/\xb8\x00\t/\xb8\x00\x0f/\xb8\x00\x18/01\x13'\x1367\x17\x07!?\x01\x16\x17\x03\x0f\x02\x03?"
+    b"\x01\x17!7\x17\x07\x037F\x12\x1c\x0e)\x16\x15\x01\x04\x15&'\x06\x1c\x16\xe0\x0c\xae\x06\x166\x01\x04B"
+    b'\x12\x06\xe2\x0c\x01h\x14\x01\x18(\nP\xd2\xd2P\n(\xfe\xe8\x14\xf0x\x01\x04<\x14<<\x14<\xfe\xfc'
+    b'x\x00\x00\x00\x00\x06\x00\x14\x00\x00\x01\xf5\x02\xd0\x00\x04\x00\x0b\x00\x11\x00\x16\x00\x1d\x00$\x00%\x00\xb8\x00\x07'
+    b'/\xb8\x00"/\xba\x00\x1c\x00\x0c\x00\x03+\xb8\x00\x1c\x10\xb8\x00\x10\xd0\xba\x00\x12\x00\x0c\x00\x1c\x11\x1290'
+    b"1%#?\x01\x17?\x02\x16\x17\x03\x07\x03!&'73\x05\x137\x17\x07%\x17\x03\x06\x07'7%'"
+    b"\x1367\x17\x07\x01\x12P\x17,$d\x15&'\x06\x1c\x16W\xfe\xd5'\x06S\xef\xfe\xbf\x1a\x166\x13\x01"
+    b'Y\x12\x1c\x0e)\x16\x15\xfe\xc8\x12\x1c\x0e)\x16\x15d\xe6((d\xd2P\n(\xfe\xe8\x14\xfe\x8e\n(\x1e'
+    b'\n\x01\x04\x14<\xbe\xfa\x14\xfe\xe8(\nP\xd2P\x14\x01\x18(\nP\xd2\x00\x00\x00\x04\x00\x12\x00\x00\x01\xf6'
+    b'\x02\xd0\x00\x05\x00\x0b\x00\x11\x00\x17\x00\x13\x00\xb8\x00\x04/\xb8\x00\r/\xb8\x00\x07/\xb8\x00\x16/01\x01'
+    b'3\x13\x06#\'?\x012\x17\x03#\x0f\x01"\'\x1337#\x0363\x17\x01\r-{\x18<_\x19\x8f'
+    b'<\x10\xb9-#\x8f<\x10\xb9-\x03-{\x18<_\x01^\xfe\xca(\xf2\xec\xf2(\xfe\xca\x80\xf2(\x016'
+    b'\x14\x016(\xf3\x00\x00\x00\x00\x05\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1e\x00\x1f\x00\xb8'
+    b'\x00\x1a/\xba\x00\x0b\x00\r\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd001\x01\x17\x07'
+    b"!'7\x05\x17\x03\x06\x07'7\x03!&'73\x03\x0f\x01'\x13\x05?\x01\x16\x17\x03\x07\x01\x8a$,"
+    b"\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0\xb7\x16B\x12\x1d\x01;\x15&'\x06\x1c\x16"
+    b'\x01\x90((((2\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\x02:\xdc<\x14\x01"\xfa\xd2P\n(\xfe'
+    b'\xe8\x14\x00\x00\x00\x04\x00\x12\x00\x00\x01\xf6\x02\xd0\x00\x03\x00\t\x00\x0f\x00\x15\x00#\x00\xba\x00\x03\x00\x00\x00\x03'
+    b'+\xba\x00\t\x00\x04\x00\x03+\xb8\x00\t\x10\xb8\x00\x0b\xd0\xb8\x00\x00\x10\xb8\x00\x11\xd001)\x0173\x03'
+    b'#\'67!\x03\x132\x17\x03#\x17\x03"\'\x133\x01\x8a\xfe\xe80\xd2\x0e\xc7M\x0e)\x01\r\x8b\x9f'
+    b'<\x10\xb5<\x02\xa9<\x10\xbf<P\x020\x1e(\n\xfe\xde\x01"(\xfe\xcaP\xfe\xde(\x016\x00\x00\x00'
+    b"\x00\x04\x00\x14\x00\x00\x01&\x02\xd0\x00\x04\x00\x0b\x00\x10\x00\x17\x00'\x00\xba\x00\x17\x00\x12\x00\x03+\xba\x00\n"
+    b'\x00\x05\x00\x03+\xba\x00\x00\x00\x12\x00\x17\x11\x129\xba\x00\x10\x00\x05\x00\n\x11\x129017\x137\x17\x07'
+    b"\x13#'673\x17\x0f\x02'\x1b\x01\x07#&'73\x15\x1a\x166\x13|EM\x0e)\x8b\x12\x8a\x13"
+    b"B\x12\x1a\x93\x16\x8b'\x06SEF\x01\x04\x14<\xbe\x02\x1c\x1e(\n\x14P\xbe<\x14\x01\x04\xfd\x8a\x14\n"
+    b'(\x1e\x00\x00\x00\x02\x00R\x00\x00\x01\xb4\x02\xd0\x00\x05\x00\x0b\x00\x0b\x00\xb8\x00\x04/\xb8\x00\n/01\x01'
+    b'3\x13\x06#/\x01#\x0363\x17\x01\x0c-{\x18<_\x07-{\x18<_\x01^\xfe\xca(\xf2\x80\x01'
+    b'6(\xf3\x00\x00\x04\x00\x10\x00\x00\x01#\x02\xd0\x00\x06\x00\x0b\x00\x12\x00\x17\x00\x13\x00\xb8\x00\n/\xb8\x00\x0e'
+    b"/\xb8\x00\x04/\xb8\x00\x13/01\x13\x17\x03\x06\x07'7\x13#'73\x03?\x01\x16\x17\x03\x07\x03#"
+    b"'73\xef\x12\x1c\x0e)\x16\x15\x0f26\x16x'\x15&'\x06\x1c\x16Wx\x12B2\x01^\x14\xfe\xe8"
+    b'(\nP\xd2\x01^<\x14\xfe\xde\xd2P\n(\xfe\xe8\x14\xfe\x8e\x14<\x00\x00\x00\x00\x02\x00>\x01\xc2\x01\xe5'
+    b'\x02\xd0\x00\x04\x00\t\x00\x13\x00\xb8\x00\x04/\xb8\x00\x05/\xb8\x00\x01/\xb8\x00\x08/01\x017\x17\x0f\x01'
+    b"!'?\x01\x07\x01&\x0b\xb4\x04*\xfe\xab$\x04\xdc\x0c\x02bn\xc8(\x1e\x1e(\xc8n\x00\x00\x01\x00\x13"
+    b"\x00\x00\x01\xb6\x00P\x00\x07\x00\x0b\x00\xba\x00\x00\x00\x03\x00\x03+01%\x17\x06\x07!&'7\x01iM"
+    b"\x0e)\xfe\xc1'\x06SP\x1e(\n\n(\x1e\x00\x00\x00\x01\x00T\x020\x00\xff\x02\xe4\x00\x05\x00\x0b\x00\xb8"
+    b"\x00\x02/\xb8\x00\x04/01\x13\x0f\x01'73\xff\x04)~\x0e(\x02b(\n\x8c(\x00\x00\x06\x00\x13"
+    b'\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1e\x00%\x00-\x00\xb8\x00\n/\xb8\x00!/\xba\x00\x12'
+    b'\x00\x19\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x19\x10\xb8\x00\x0e\xd0\xba\x00\x17\x00\x19\x00\x12\x11\x1290'
+    b"1\x01\x17\x07!'7\x05\x17\x03\x06\x07'7\x13#'67!\x05\x0f\x01'\x13\x05?\x01\x16\x17\x03\x07"
+    b"\x05\x0f\x01&'\x137\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x0f\xefM\x0e)\x01+\xfe\xe8"
+    b"\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16\xfe\xb8\x15&'\x06\x1c\x16\x01\x90((((2\x14\xfe\xe8(\n"
+    b'P\xd2\x01^\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14P\xd2P\n(\x01\x18\x14\x00\x00\x00'
+    b"\x00\x07\x00\x0e\x00\x00\x01\xf0\x02\xd0\x00\x05\x00\n\x00\x10\x00\x15\x00\x1b\x00!\x00'\x00/\x00\xba\x00'\x00#"
+    b"\x00\x03+\xba\x00\x0f\x00\x0b\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xba\x00\x06\x00#\x00'\x11\x129\xba\x00\x15"
+    b"\x00\x0b\x00\x0f\x11\x12901\x01\x17\x07!'7\x03\x137\x17\x07\x01#'7!\x17\x05\x0f\x01'\x13\x05"
+    b"?\x01\x17\x0f\x02\x17\x0f\x01'7\x0f\x01!?\x013\x01\x8a$,\xfe\xfc$,q\x1a\x166\x13\x01&\xf0"
+    b'M\x05\x01@$\xfe\xe2\x13B\x12\x1a\x01>\x15!-\x17\x16\x02\x12\x177\x1b\x15\x06,\xfe\xc1\x05S\xef\x01'
+    b'\x90((((\xfe\xb6\x01\x04\x14<\xbe\x02\x1c\x1e2(<\xbe<\x14\x01\x04\xdc\xd2\x1e2\xe6\x14\x14\x14\xe6'
+    b"2\x1e\xd2\xfa(2\x1e\x00\x00\x04\x00\x13\x00\x00\x01\xd2\x02\xd0\x00\x05\x00\n\x00\x10\x00\x15\x00'\x00\xba\x00\x05"
+    b'\x00\x00\x00\x03+\xba\x00\x10\x00\x0b\x00\x03+\xba\x00\x06\x00\x00\x00\x05\x11\x129\xba\x00\x15\x00\x0b\x00\x10\x11\x12'
+    b"901)\x01&'7!\x05\x137\x17\x07\x01!'67!\x05\x0f\x01'\x13\x01\x8a\xfe\xb6'\x06S"
+    b'\x01\x0e\xfe\xa1\x1a\x166\x13\x01D\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a\n(\x1e\n\x01\x04\x14<\xbe'
+    b'\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\x00\x00\x06\x00\x0e\x00\x00\x01\xf0\x02\xd0\x00\x04\x00\n\x00\x0f\x00\x15\x00\x1b'
+    b"\x00!\x00'\x00\xba\x00!\x00\x1d\x00\x03+\xba\x00\t\x00\x05\x00\x03+\xba\x00\x00\x00\x1d\x00!\x11\x129\xba"
+    b"\x00\x0f\x00\x05\x00\t\x11\x129017\x137\x17\x07\x01#'7!\x17\x05\x0f\x01'\x13\x05?\x01\x17\x0f"
+    b"\x02\x17\x0f\x01'7\x0f\x01!?\x013\x15\x1a\x166\x13\x01&\xf0M\x05\x01@$\xfe\xe2\x13B\x12\x1a\x01"
+    b'>\x15!-\x17\x16\x02\x12\x177\x1b\x15\x06,\xfe\xc1\x05S\xefF\x01\x04\x14<\xbe\x02\x1c\x1e2(<\xbe'
+    b'<\x14\x01\x04\xdc\xd2\x1e2\xe6\x14\x14\x14\xe62\x1e\xd2\xfa(2\x1e\x00\x05\x00\x13\x00\x00\x01\xd2\x02\xd0\x00\x05'
+    b'\x00\x0b\x00\x10\x00\x16\x00\x1b\x00/\x00\xba\x00\x0b\x00\x06\x00\x03+\xba\x00\x16\x00\x11\x00\x03+\xba\x00\x00\x00\x02'
+    b"\x00\x03+\xba\x00\x0c\x00\x06\x00\x0b\x11\x129\xba\x00\x1b\x00\x11\x00\x16\x11\x12901\x01\x17\x07!'7\x01"
+    b"!&'7!\x05\x137\x17\x07\x01!'67!\x05\x0f\x01'\x13\x01\x8a$,\xfe\xfc$,\x01\x04\xfe"
+    b"\xb6'\x06S\x01\x0e\xfe\xa1\x1a\x166\x13\x01D\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a\x01\x90((("
+    b'(\xfep\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\x00\x00\x04\x00\x13\x00\x00\x01\xd2'
+    b'\x02\xd0\x00\x05\x00\x0b\x00\x10\x00\x17\x00!\x00\xb8\x00\x13/\xba\x00\x0b\x00\x06\x00\x03+\xba\x00\x00\x00\x02\x00\x03'
+    b"+\xba\x00\x10\x00\x06\x00\x0b\x11\x12901\x01\x17\x07!'7%!'67!\x05\x0f\x01'\x1b\x01\x0f"
+    b"\x01&'\x137\x01\x8a$,\xfe\xfc$,\x01&\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a,\x15&'"
+    b'\x06\x1c\x16\x01\x90((((\xf0\x1e(\nd\xbe<\x14\x01\x04\xfe\x98\xd2P\n(\x01\x18\x14\x00\x06\x00\x13'
+    b'\x00\x00\x01\xd3\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1d\x00"\x007\x00\xba\x00\x0b\x00\r\x00\x03+\xba\x00\x1d'
+    b'\x00\x18\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd0\xba\x00\x13\x00\r\x00\x0b\x11\x129\xba'
+    b'\x00"\x00\x18\x00\x1d\x11\x12901\x01\x17\x07#\'7\x1f\x01\x03\x06\x07\'7\x03!&\'73\x05\x13'
+    b"7\x17\x07\x01!'67!\x05\x0f\x01'\x13\x01\x8a$,Z$,\x91\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'"
+    b'\x06S\xf0\xfe\xbf\x1a\x166\x13\x01D\xfe\xf3M\x0e)\x01I\xfe\xca\x13B\x12\x1a\x01\x90((((2\x14'
+    b'\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e(\nd\xbe<\x14\x01\x04\x00\x05\x00\x13'
+    b'\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x13\x00\x1a\x00!\x00\x17\x00\xb8\x00\n/\xb8\x00\x16/\xb8\x00\x0f/\xba'
+    b"\x00\x00\x00\x02\x00\x03+01\x01\x17\x07!'7\x05\x17\x03\x06\x07'?\x03\x16\x17\x03\x07\x05\x0f\x01&'"
+    b"\x13?\x01'\x1367\x17\x07\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e)\x16\x15\x0e\x15&'\x06\x1c\x16"
+    b"\xfe\xb8\x15&'\x06\x1c\x16\x01\x12\x1c\x0e)\x16\x15\x01\x90((((2\x14\xfe\xe8(\nP\xd2\x8c\xd2P"
+    b'\n(\xfe\xe8\x14P\xd2P\n(\x01\x18\x14\n\x14\x01\x18(\nP\xd2\x00\x00\x00\x00\x02\x00\x17\x00\n\x00\xa1'
+    b"\x02\xd0\x00\x06\x00\r\x00\x0b\x00\xb8\x00\x02/\xb8\x00\x0b/01\x13?\x01\x16\x17\x03\x0f\x01\x17\x03\x06\x07'"
+    b"79\x15&'\x06\x1c\x16\x01\x12\x1c\x0e)\x16\x15\x01\xae\xd2P\n(\xfe\xe8\x14\n\x14\xfe\xe8(\nP\xd2"
+    b'\x00\x04\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x06\x00\x0c\x00\x11\x00\x18\x00!\x00\xb8\x00\x14/\xba\x00\x05\x00\x07\x00\x03'
+    b"+\xb8\x00\x05\x10\xb8\x00\x0b\xd0\xba\x00\r\x00\x07\x00\x05\x11\x12901\x01\x17\x03\x06\x07'7\x03!&'"
+    b"73\x05\x137\x17\x07\x01?\x01\x16\x17\x03\x07\x01\xc1\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0\xfe\xbf\x1a"
+    b"\x166\x13\x01%\x15&'\x06\x1c\x16\x01^\x14\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x01"
+    b'J\xd2P\n(\xfe\xe8\x14\x00\x05\x00\x13\x00\x00\x01\xf6\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x19\x00 \x00\x1b\x00\xb8'
+    b"\x00\x0e/\xb8\x00\x1e/\xb8\x00\n/\xb8\x00\x15/\xba\x00\x00\x00\x02\x00\x03+01\x01\x17\x07!'7\x05"
+    b"\x17\x03\x06\x07'7'%2\x17\x01#\x0f\x02&'\x13?\x01'\x1367\x17\x07\x01\x8a$,\xfe\xfc$"
+    b",\x01;\x12\x1c\x0e)\x16\x15\xdd\x01\x08<\x10\xfe\xe2<!\x15&'\x06\x1c\x16\x02\x12\x1c\x0e)\x16\x15\x01"
+    b'\x90((((2\x14\xfe\xe8(\nP\xd2\xbe\xf0(\xfe\xfc\x82\xd2P\n(\x01\x18\x14\x14\x14\x01\x18(\n'
+    b'P\xd2\x00\x00\x00\x03\x00\x13\x00\x00\x01\xb7\x02\xd0\x00\x06\x00\x0c\x00\x13\x00\x17\x00\xb8\x00\x11/\xba\x00\x01\x00\x0c'
+    b"\x00\x03+\xb8\x00\x01\x10\xb8\x00\x08\xd001\x13\x0f\x01&'\x137\x133\x17\x06\x07!\x03'\x1367\x17"
+    b'\x07{\x15&\'\x06\x1c\x165\xf0M\x0e)\xfe\xd4\r\x12\x1c\x0e)\x16\x15\x01"\xd2P\n(\x01\x18\x14\xfe'
+    b'\xf2\x1e(\n\x01r\x14\x01\x18(\nP\xd2\x00\x00\x00\x00\x06\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x04\x00\x0b\x00\x11'
+    b'\x00\x16\x00\x1d\x00$\x00%\x00\xb8\x00\t/\xb8\x00 /\xba\x00\x11\x00\x18\x00\x03+\xb8\x00\x18\x10\xb8\x00\r'
+    b"\xd0\xba\x00\x16\x00\x18\x00\x11\x11\x12901\x01\x07'73\x13\x17\x03\x06\x07'7\x13#'67!\x05"
+    b"\x0f\x01'\x13\x05?\x01\x16\x17\x03\x07\x05\x0f\x01&'\x137\x01/,$\x17P{\x12\x1c\x0e)\x16\x15\x0f"
+    b"\xefM\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01>\x15&'\x06\x1c\x16\xfe\xb8\x15&'\x06\x1c\x16\x01\x86(("
+    b'\xe6\xfe\xf2\x14\xfe\xe8(\nP\xd2\x01^\x1e(\nd\xbe<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14P\xd2P'
+    b'\n(\x01\x18\x14\x00\x00\x00\x00\x05\x00\x13\x00\x00\x01\xf4\x02\xc6\x00\x06\x00\x0c\x00\x13\x00\x1a\x00!\x00\x13\x00\xb8'
+    b"\x00\x02/\xb8\x00\x11/\xb8\x00\x16/\xb8\x00\x1f/01\x13\x0f\x01&'\x137%#'73\x1f\x02\x03"
+    b"\x06\x07'?\x03\x16\x17\x03\x07!'\x1367\x17\x07{\x15&'\x06\x1c\x16\x013F\x87\x06<\x90D\x12"
+    b'\x1c\x0e)\x16\x15\r\x15&\'\x06\x1c\x16\xfe\x84\x12\x1c\x0e)\x16\x15\x01"\xd2P\n(\x01\x18\x14F\x96<'
+    b'\xa0x\x14\xfe\xe8(\nP\xd2\x82\xd2P\n(\xfe\xe8\x14\x14\x01\x18(\nP\xd2\x00\x06\x00\x18\x00\x00\x01\xf0'
+    b'\x02\xd0\x00\x05\x00\x0b\x00\x11\x00\x17\x00\x1d\x00#\x00\x13\x00\xba\x00\x1d\x00\x19\x00\x03+\xba\x00\x04\x00\x00\x00\x03'
+    b"+01\x01#'73\x17\x07?\x01\x17\x0f\x02\x17\x0f\x01'7%'?\x01\x17\x07\x13\x07#'73"
+    b"'\x0f\x01'?\x01\x01\x8e\xdc$,\xdc$-\x15!-\x17\x16\x02\x12\x177\x1b\x15\xfe\xc8\x12\x177\x1b\x15"
+    b'\xf1,\xdc$,\xdc\xdb\x15!-\x17\x16\x02\x80(((\xfa\xd2\x1e2\xe6\x14\x14\x14\xe62\x1e\xd2P\x14\xe6'
+    b'2\x1e\xd2\xfez(((\xd2\xd2\x1e2\xe6\x14\x00\x00\x00\x05\x00\x13\x00\x00\x01\xf0\x02\xd0\x00\x05\x00\x0b\x00\x10'
+    b'\x00\x16\x00\x1d\x00!\x00\xb8\x00\x19/\xba\x00\n\x00\x06\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xba\x00\x10\x00\x06'
+    b"\x00\n\x11\x12901\x01\x17\x07!'7%#'7!\x17\x05\x0f\x01'\x13\x05?\x01\x17\x0f\x01\x05\x0f"
+    b"\x01&'\x137\x01\x8a$,\xfe\xfc$,\x01\x08\xf0M\x05\x01@$\xfe\xe2\x13B\x12\x1a\x01>\x15!-"
+    b"\x17\x16\xfe\xb8\x15&'\x06\x1c\x16\x01\x90((((\xf0\x1e2(<\xbe<\x14\x01\x04\xdc\xd2\x1e2\xe6\x14"
+    b"P\xd2P\n(\x01\x18\x14\x00\x07\x00\x13\xff\xf6\x01\xf5\x02\xd0\x00\x04\x00\n\x00\x0f\x00\x15\x00\x1a\x00!\x00'"
+    b'\x003\x00\xb8\x00%/\xba\x00\n\x00\x05\x00\x03+\xba\x00\x15\x00\x1c\x00\x03+\xba\x00\x0b\x00\x05\x00\n\x11\x12'
+    b"9\xb8\x00\x1c\x10\xb8\x00\x11\xd0\xba\x00\x1a\x00\x1c\x00\x15\x11\x12901\x01\x17\x07'7\x03!&'73"
+    b"\x07\x137\x17\x07\x01#'67!\x05\x0f\x01'\x13\x05?\x01\x16\x17\x03\x0f\x013\x17\x07#'\x01\xc1\x12"
+    b"\x18H\x0c'\xfe\xe8'\x06S\xaa\xfb\x1a\x166\x13\x01&\xefM\x0e)\x01+\xfe\xe8\x13B\x12\x1a\x01>\x15"
+    b"&'\x06\x1c\x16\xb3<u\x06<u\x01^\x14\xf0Px\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x02\x1c\x1e("
+    b'\nd\xbe<\x14\x01\x04\xdc\xd2P\n(\xfe\xe8\x14\xbe\x82<\x82\x00\x00\x06\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05'
+    b'\x00\x0b\x00\x12\x00\x18\x00\x1f\x00$\x00-\x00\xb8\x00\n/\xb8\x00\x0e/\xba\x00\x18\x00\x1a\x00\x03+\xba\x00\x00'
+    b"\x00\x02\x00\x03+\xb8\x00\x1a\x10\xb8\x00\x14\xd0\xba\x00$\x00\x1a\x00\x18\x11\x12901\x01\x17\x07!'7\x17"
+    b"3\x13\x06#/\x01\x0f\x01&'\x137\x01#'67!\x03?\x01\x16\x17\x03\x07%\x0f\x01'\x13\x01\x8a"
+    b"$,\xfe\xfc$,\n<\xea\x18<\xd8\x0f\x15&'\x06\x1c\x16\x01I\xefM\x0e)\x01+'\x15&'\x06"
+    b'\x1c\x16\xfe\xd9\x13B\x12\x1a\x01\x90((((d\xfe\xfc(\xf02\xd2P\n(\x01\x18\x14\x01"\x1e(\n'
+    b'\xfe\xde\xd2P\n(\xfe\xe8\x14\xfa\xbe<\x14\x01\x04\x00\x00\x05\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12'
+    b'\x00\x17\x00\x1f\x00-\x00\xba\x00\x0b\x00\r\x00\x03+\xba\x00\x1b\x00\x18\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8'
+    b"\x00\x0b\x10\xb8\x00\x11\xd0\xba\x00\x17\x00\x18\x00\x1b\x11\x12901\x01\x17\x07!'7\x05\x17\x03\x06\x07'7"
+    b"\x03!&'73\x03\x0f\x01'\x13\x17'67!\x16\x17\x07\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c\x0e"
+    b")\x16\x15\x13\xfe\xd4'\x06S\xf0\xba\x13B\x12\x1aPM\x0e)\x01?'\x06S\x01\x90((((2\x14"
+    b'\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\x02\x1c\xbe<\x14\x01\x04\n\x1e(\n\n(\x1e\x00\x00\x00\x00\x03\x00Q'
+    b'\x00\x00\x01\xf4\x02\xd0\x00\x06\x00\x0b\x00\x13\x00\x0f\x00\xb8\x00\x04/\xba\x00\x0f\x00\x0c\x00\x03+01\x01\x17\x03'
+    b"\x06\x07'?\x023\x0f\x01\x03'67!\x16\x17\x07\x01\x02$\x1a\x0e)\x16\x17\n\x15P\x15,fM\x0e"
+    b")\x01?'\x06S\x01^(\xfe\xfc(\nP\xe6d\xd2\xd2(\x01\x0e\x1e(\n\n(\x1e\x00\x00\x05\x00\x13"
+    b'\x00\x00\x01\xf5\x02\xd0\x00\x06\x00\x0c\x00\x11\x00\x18\x00\x1f\x00!\x00\xb8\x00\x14/\xba\x00\x05\x00\x07\x00\x03+\xb8'
+    b"\x00\x05\x10\xb8\x00\x0b\xd0\xba\x00\r\x00\x07\x00\x05\x11\x12901\x01\x17\x03\x06\x07'7\x03!&'73"
+    b"\x05\x137\x17\x07\x01?\x01\x16\x17\x03\x07\x05'\x1367\x17\x07\x01\xc1\x12\x1c\x0e)\x16\x15\x13\xfe\xd4'\x06"
+    b"S\xf0\xfe\xbf\x1a\x166\x13\x01%\x15&'\x06\x1c\x16\xfe\x83\x12\x1c\x0e)\x16\x15\x01^\x14\xfe\xe8(\nP"
+    b'\xd2\xfe\xde\n(\x1e\n\x01\x04\x14<\xbe\x01J\xd2P\n(\xfe\xe8\x14\n\x14\x01\x18(\nP\xd2\x00\x00\x00'
+    b'\x00\x04\x00(\x00\x00\x01\xf4\x02\xc6\x00\x06\x00\r\x00\x13\x00\x19\x00\x13\x00\xb8\x00\x04/\xb8\x00\t/\xb8\x00\x0f'
+    b"/\xb8\x00\x18/01\x13'\x1367\x17\x07!?\x01\x16\x17\x03\x0f\x02\x03?\x01\x17!7\x17\x07\x037"
+    b"F\x12\x1c\x0e)\x16\x15\x01\x04\x15&'\x06\x1c\x16\xe0\x0c\xae\x06\x166\x01\x04B\x12\x06\xe2\x0c\x01h\x14\x01"
+    b'\x18(\nP\xd2\xd2P\n(\xfe\xe8\x14\xf0x\x01\x04<\x14<<\x14<\xfe\xfcx\x00\x00\x00\x00\x06\x00\x14'
+    b'\x00\x00\x01\xf5\x02\xd0\x00\x04\x00\x0b\x00\x11\x00\x16\x00\x1d\x00$\x00%\x00\xb8\x00\x07/\xb8\x00"/\xba\x00\x1c'
+    b'\x00\x0c\x00\x03+\xb8\x00\x1c\x10\xb8\x00\x10\xd0\xba\x00\x12\x00\x0c\x00\x1c\x11\x12901%#?\x01\x17?\x02'
+    b"\x16\x17\x03\x07\x03!&'73\x05\x137\x17\x07%\x17\x03\x06\x07'7%'\x1367\x17\x07\x01\x12P"
+    b"\x17,$d\x15&'\x06\x1c\x16W\xfe\xd5'\x06S\xef\xfe\xbf\x1a\x166\x13\x01Y\x12\x1c\x0e)\x16\x15\xfe"
+    b'\xc8\x12\x1c\x0e)\x16\x15d\xe6((d\xd2P\n(\xfe\xe8\x14\xfe\x8e\n(\x1e\n\x01\x04\x14<\xbe\xfa\x14'
+    b'\xfe\xe8(\nP\xd2P\x14\x01\x18(\nP\xd2\x00\x00\x00\x04\x00\x12\x00\x00\x01\xf6\x02\xd0\x00\x05\x00\x0b\x00\x11'
+    b"\x00\x17\x00\x13\x00\xb8\x00\x04/\xb8\x00\r/\xb8\x00\x07/\xb8\x00\x16/01\x013\x13\x06#'?\x012"
+    b'\x17\x03#\x0f\x01"\'\x1337#\x0363\x17\x01\r-{\x18<_\x19\x8f<\x10\xb9-#\x8f<\x10'
+    b'\xb9-\x03-{\x18<_\x01^\xfe\xca(\xf2\xec\xf2(\xfe\xca\x80\xf2(\x016\x14\x016(\xf3\x00\x00\x00'
+    b'\x00\x05\x00\x13\x00\x00\x01\xf5\x02\xd0\x00\x05\x00\x0c\x00\x12\x00\x17\x00\x1e\x00\x1f\x00\xb8\x00\x1a/\xba\x00\x0b\x00\r'
+    b"\x00\x03+\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x0b\x10\xb8\x00\x11\xd001\x01\x17\x07!'7\x05\x17\x03\x06\x07"
+    b"'7\x03!&'73\x03\x0f\x01'\x13\x05?\x01\x16\x17\x03\x07\x01\x8a$,\xfe\xfc$,\x01;\x12\x1c"
+    b"\x0e)\x16\x15\x13\xfe\xd4'\x06S\xf0\xb7\x16B\x12\x1d\x01;\x15&'\x06\x1c\x16\x01\x90((((2\x14"
+    b'\xfe\xe8(\nP\xd2\xfe\xde\n(\x1e\x02:\xdc<\x14\x01"\xfa\xd2P\n(\xfe\xe8\x14\x00\x00\x00\x04\x00\x12'
+    b'\x00\x00\x01\xf6\x02\xd0\x00\x03\x00\t\x00\x0f\x00\x15\x00#\x00\xba\x00\x03\x00\x00\x00\x03+\xba\x00\t\x00\x04\x00\x03'
+    b"+\xb8\x00\t\x10\xb8\x00\x0b\xd0\xb8\x00\x00\x10\xb8\x00\x11\xd001)\x0173\x03#'67!\x03\x132"
+    b'\x17\x03#\x17\x03"\'\x133\x01\x8a\xfe\xe80\xd2\x0e\xc7M\x0e)\x01\r\x8b\x9f<\x10\xb5<\x02\xa9<\x10'
+    b'\xbf<P\x020\x1e(\n\xfe\xde\x01"(\xfe\xcaP\xfe\xde(\x016\x00\x00\x00\x00\x05\x002\x00\x00\x01\x9e'
+    b'\x02\xd0\x00\x04\x00\x0b\x00\x10\x00\x17\x00\x1d\x00/\x00\xba\x00\x17\x00\x12\x00\x03+\xba\x00\n\x00\x05\x00\x03+\xba'
+    b'\x00\x18\x00\x1a\x00\x03+\xba\x00\x00\x00\x12\x00\x17\x11\x129\xba\x00\x10\x00\x05\x00\n\x11\x12901?\x02\x17'
+    b"\x07\x13#'673\x17\x0f\x02'7\x13\x07#&'73\x03\x17\x07#'7\x8d\x16B\x12\x17|E"
+    b"M\x0e)\x8b\x12\x8a\x17\x166\x16\x93\x16\x8b'\x06SE\x80$,F$,F\xdc<\x14\xe6\x02\x1c\x1e("
+    b'\n\x14P\xe6\x14<\xdc\xfd\x8a\x14\n(\x1e\x01@((((\x00\x00\x01\x00\x16\x00\x00\x00\xa1\x02\xd0\x00\x07'
+    b"\x00\x0b\x00\xb8\x00\x02/\xb8\x00\x05/017\x06\x07'\x137\x16\x17c\x0e)\x168&'\x062(\n"
+    b'P\x020P\n(\x00\x00\x00\x05\x00\x10\x00\x00\x01|\x02\xd0\x00\x04\x00\x0b\x00\x10\x00\x17\x00\x1d\x00/\x00\xba'
+    b'\x00\x12\x00\x15\x00\x03+\xba\x00\x07\x00\n\x00\x03+\xba\x00\x18\x00\x1a\x00\x03+\xba\x00\x04\x00\x15\x00\x12\x11\x12'
+    b"9\xba\x00\x0c\x00\n\x00\x07\x11\x12901?\x02\x17\x07\x0373\x16\x17\x07#7\x0f\x01'7\x033\x17"
+    b"\x06\x07#'\x01\x17\x07#'7\x9a\x17\x166\x16\x93\x16\x8b'\x06SE\x97\x16B\x12\x17|EM\x0e)"
+    b'\x8b\x12\x01H$,F$,d\xe6\x14<\xdc\x02v\x14\n(\x1e\n\xdc<\x14\xe6\xfd\xe4\x1e(\n\x14\x01'
+    b'|((((\x00\x00\x00\x00\x05\x00:\x01J\x01\xf2\x02\x1c\x00\x05\x00\x0b\x00\x11\x00\x17\x00\x1d\x00;\x00\xb8'
+    b'\x00\x1a/\xb8\x00\x12/\xba\x00\x00\x00\x02\x00\x03+\xb8\x00\x00\x10\xb8\x00\x06\xd0\xb8\x00\x06/\xb8\x00\x02\x10\xb8'
+    b"\x00\x08\xd0\xb8\x00\x08/\xb8\x00\x00\x10\xb8\x00\x0c\xd0\xb8\x00\x02\x10\xb8\x00\x0e\xd001\x01\x17\x07#'7\x07"
+    b"\x17\x07#'7%\x17\x07#'7'\x17\x07#'7\x1f\x01\x07#'7\x01.$,($,x$"
+    b',($,\x01h$,($,\xc2$,($,\xbb$,($,\x01\xe0((((\x01(('
+    b'((\x01((((<((((\x82((((\x00\x00\x00\x00\x0e\x00/\xff\xff\x02\x1f\x02\xd0\x00\x05'
+    b'\x00\x0b\x00\x11\x00\x17\x00\x1d\x00#\x00)\x00/\x005\x00;\x00A\x00G\x00M\x00S\x00\x8b\x00\xb8\x00\n'
+    b'/\xb8\x00\x1a/\xb8\x00&/\xb8\x00./\xb8\x00@/\xb8\x00D/\xb8\x00@\x10\xb8\x00M\xdc\xb8\x00\x01'
+    b'\xd0\xba\x00\x11\x00@\x00\n\x11\x129\xba\x00\x17\x00@\x00\n\x11\x129\xba\x00\x1d\x00@\x00\n\x11\x129\xb8'
+    b'\x00M\x10\xb8\x00"\xd0\xba\x00#\x00@\x00\n\x11\x129\xba\x00)\x00@\x00M\x11\x129\xb8\x00@\x10\xb8'
+    b'\x00/\xd0\xb8\x00//\xba\x005\x00@\x00M\x11\x129\xba\x00;\x00@\x00M\x11\x129\xba\x00G\x00@'
+    b"\x00M\x11\x12901\x01\x07\x06?\x013'#'673\x0f\x02&'7\x173\x17\x06\x07#?\x02"
+    b"\x16\x17\x07\x13#'673\x0f\x02&'7\x173\x17\x06\x07#?\x02\x16\x17\x07%?\x01\x16\x17\x07'"
+    b"3\x17\x06\x07#7\x0f\x01&'7\x17#'673\x1376\x0f\x01'\x01\x1b\xb0<\x07\xd0\x1e|\n"
+    b"M\x0e)F2\x06&'\x06\x0c[\nM\x0e)F2\x06&'\x06\x0c\xa1\nM\x0e)F1\x06&'"
+    b"\x06\x0cZ\nM\x0e)F2\x06&'\x06\x0c\xfe\xcd\x06&'\x06\x0cY\nM\x0e)F\x18\x06&'\x06"
+    b'\x0cY\nM\x0e)FO\xb0<\x07\xd0\x1e\x01\x8f\x9f\x01<\xbe\x97\x1e(\nd<P\n(xZ\x1e('
+    b'\nd<P\n(x\xfez\x1e(\nd<P\n(xZ\x1e(\nd<P\n(x\x1e<P\n'
+    b'(x\t\x1e(\n\x8d<P\n(x\n\x1e(\n\x01#\x9f\x01<\xbf\x01\x00\x00\x01\x00B\x02\x08\x00\xa2'
+    b'\x02\xd0\x00\x04\x00\x0b\x00\xb8\x00\x00/\xb8\x00\x03/01\x13#?\x01\x17\x92P\x10,$\x02\x08\xa0(('
+    b"\x00\x01\x00F\x02\x08\x00\xa6\x02\xd0\x00\x04\x00\x0b\x00\xb8\x00\x01/\xb8\x00\x03/01\x13\x07'73\x96,"
+    b'$\x10P\x020((\xa0\x00\x02\x00B\x02\x08\x01B\x02\xd1\x00\x04\x00\t\x00\x13\x00\xb8\x00\x03/\xb8\x00\x08'
+    b'/\xb8\x00\x00/\xb8\x00\x05/01\x13#?\x01\x1f\x01#?\x01\x17\x92P\x10,$\x90P\x10,$\x02'
+    b'\t\xa0((\xa1\xa0((\x00\x02\x00F\x02\x08\x01G\x02\xd1\x00\x04\x00\t\x00\x13\x00\xb8\x00\x03/\xb8\x00\x08'
+    b"/\xb8\x00\x01/\xb8\x00\x06/01\x13\x07'73\x17\x07'73\x96,$\x10P\x91,$\x10P\x02"
+    b'0((\xa0\x9f((\xa0\x00\x01\x00-\x00\xdc\x01[\x01\xfe\x00\x0b\x00\x0b\x00\xb8\x00\x06/\xb8\x00\x00/0'
+    b'17"&7>\x0132\x16\x07\x0e\x01\xb6<M\x06\x06^<<L\x06\x06]\xdcU<<UU<'
+    b'<U\x00\x00\x00\x01\x002\x01@\x01\xea\x01\x90\x00\x05\x00\x0b\x00\xba\x00\x00\x00\x02\x00\x03+01\x01\x17\x07'
+    b"!'7\x01\xc6$,\xfe\x98$,\x01\x90((((\x00\x00\x00\x00\x01\x002\x01@\x02\x12\x01\x90\x00\x05"
+    b"\x00\x0b\x00\xba\x00\x00\x00\x02\x00\x03+01\x01\x17\x07!'7\x01\xee$,\xfep$,\x01\x90((("
+    b'(\x00\x00\x00\x00\x07\x00\x13\x00\x00\x021\x02\xd0\x00\x05\x00\x0b\x00\x0f\x00\x17\x00\x1d\x00#\x00)\x00I\x00\xba'
+    b'\x00\x13\x00\x00\x00\x03+\xba\x00\x0b\x00\x14\x00\x03+\xba\x00\x1d\x00\x18\x00\x03+\xb8\x00\x13\x10\xb8\x00\x04\xd0\xb8'
+    b'\x00\x14\x10\xb8\x00\x07\xd0\xba\x00\r\x00\x00\x00\x13\x11\x129\xba\x00\x0e\x00\x14\x00\x0b\x11\x129\xba\x00#\x00\x18'
+    b"\x00\x1d\x11\x12901)\x01&'7!\x13!'67!\x01\x07\x13\x17\x01\x06\x07'\x137\x16\x17\x07"
+    b"#'673\x0f\x02&'\x13\x173\x17\x06\x07#\x01\xa8\xfe\x98'\x06S\x01,8\xfe\xd5M\x0e)\x01"
+    b"g\xfexS:M\x01W\x0e)\x168&'\x06\xa9\x82M\x0e)\xbe\xaa\x16&'\x06\x1cK<M\x0e)"
+    b'x\n(\x1e\x020\x1e(\n\xfd\x94\x1e\x02D\x1e\xfd\xc6(\nP\x020P\n(\xbe\x1e(\nd\xdcP'
+    b'\n(\x01\x18\xfa\x1e(\n\x00\x00\x00N\x00N\x00N\x00N\x00z\x00\x9a\x01Z\x01\xde\x02j\x02\xe4\x02\xf8'
+    b'\x030\x03h\x03\xb8\x03\xe8\x03\xfc\x04\x14\x04&\x04F\x04\xaa\x04\xce\x05"\x05v\x05\xb8\x06\n\x06l\x06\xb0'
+    b'\x07"\x07\x84\x07\xa2\x07\xc0\x07\xe6\x08\x0c\x082\x08|\t\x10\tr\t\xd6\n\x18\nl\n\xbe\x0b\x00\x0b`'
+    b'\x0b\xae\x0b\xd2\x0c\x16\x0cd\x0c\x9a\x0c\xf6\r>\r\x8a\r\xd6\x0e<\x0e\x9a\x0e\xf0\x0f \x0fr\x0f\xb0\x10\n'
+    b'\x10B\x10\x90\x10\xce\x11\x10\x110\x11j\x11\x8c\x11\xa6\x11\xbc\x12\x1e\x12\x82\x12\xc4\x13\x18\x13j\x13\xac\x14\x0c'
+    b'\x14Z\x14~\x14\xc2\x15\x10\x15F\x15\xa2\x15\xea\x166\x16\x82\x16\xe8\x17F\x17\x9c\x17\xcc\x18\x1e\x18\\\x18\xb6'
+    b'\x18\xee\x19<\x19z\x19\xc8\x19\xe2\x1a2\x1a\x88\x1bZ\x1bn\x1b\x82\x1b\xa2\x1b\xc2\x1b\xe0\x1b\xf8\x1c\x10\x1c\x82'
+    b'\x00\x00\x00 \x01\x86\x00\x00\x00\x00\x00\x00\x00\x00\x00\x84\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x12\x00\x84\x00\x00'
+    b'\x00\x00\x00\x00\x00\x02\x00\x08\x00\x96\x00\x00\x00\x00\x00\x00\x00\x03\x00\x12\x00\x9e\x00\x00\x00\x00\x00\x00\x00\x04\x00\x12'
+    b'\x00\xb0\x00\x00\x00\x00\x00\x00\x00\x05\x006\x00\xc2\x00\x00\x00\x00\x00\x00\x00\x0c\x002\x00\xf8\x00\x00\x00\x00\x00\x00'
+    b'\x00\x13\x00\x14\x01*\x00\x01\x00\x00\x00\x00\x00\x00\x00\\\x01>\x00\x01\x00\x00\x00\x00\x00\x01\x00\x10\x01\x9a\x00\x01'
+    b'\x00\x00\x00\x00\x00\x02\x00\x06\x01\xaa\x00\x01\x00\x00\x00\x00\x00\x03\x00\x10\x01\xb0\x00\x01\x00\x00\x00\x00\x00\x04\x00\x10'
+    b'\x01\xc0\x00\x01\x00\x00\x00\x00\x00\x05\x00\x19\x01\xd0\x00\x01\x00\x00\x00\x00\x00\x06\x00\x0f\x01\xe9\x00\x01\x00\x00\x00\x00'
+    b"\x00\x08\x00\x1e\x01\xf8\x00\x01\x00\x00\x00\x00\x00\t\x00\x11\x02\x16\x00\x01\x00\x00\x00\x00\x00\x0c\x00\x19\x02'\x00\x01"
+    b'\x00\x00\x00\x00\x00\r\x00A\x02@\x00\x01\x00\x00\x00\x00\x00\x13\x00\n\x02\x81\x00\x03\x00\x01\x04\t\x00\x00\x00\xb8'
+    b'\x02\x8b\x00\x03\x00\x01\x04\t\x00\x01\x00 \x03C\x00\x03\x00\x01\x04\t\x00\x02\x00\x0c\x03c\x00\x03\x00\x01\x04\t'
+    b'\x00\x03\x00 \x03o\x00\x03\x00\x01\x04\t\x00\x04\x00 \x03\x8f\x00\x03\x00\x01\x04\t\x00\x05\x002\x03\xaf\x00\x03'
+    b'\x00\x01\x04\t\x00\x06\x00\x1e\x03\xe1\x00\x03\x00\x01\x04\t\x00\x08\x00<\x03\xff\x00\x03\x00\x01\x04\t\x00\t\x00"'
+    b'\x04;\x00\x03\x00\x01\x04\t\x00\x0c\x002\x04]\x00\x03\x00\x01\x04\t\x00\r\x00\x82\x04\x8f\x00\x03\x00\x01\x04\t'
+    b'\x00\x13\x00\x14\x05\x11\x00C\x00r\x00e\x00a\x00t\x00e\x00d\x00 \x00b\x00y\x00 \x00S\x00i'
+    b'\x00z\x00e\x00n\x00k\x00o\x00 \x00A\x00l\x00e\x00x\x00a\x00n\x00d\x00e\x00r\x00.'
+    b'\x00 \x00\xa9\x00 \x002\x000\x000\x008\x00 \x00S\x00t\x00y\x00l\x00e\x00-\x007\x00.'
+    b'\x00 \x00A\x00l\x00l\x00 \x00r\x00i\x00g\x00h\x00t\x00s\x00 \x00r\x00e\x00s\x00e'
+    b'\x00r\x00v\x00e\x00d\x00.\x00D\x00i\x00g\x00i\x00t\x00a\x00l\x00-\x007\x00M\x00o'
+    b'\x00n\x00o\x00D\x00i\x00g\x00i\x00t\x00a\x00l\x00-\x007\x00D\x00i\x00g\x00i\x00t'
+    b'\x00a\x00l\x00-\x007\x00V\x00 \x001\x00.\x000\x000\x00 \x00O\x00c\x00t\x00 \x000'
+    b'\x002\x00 \x001\x003\x00:\x002\x004\x00:\x000\x000\x00 \x002\x000\x000\x008\x00h'
+    b'\x00t\x00t\x00p\x00:\x00/\x00/\x00w\x00w\x00w\x00.\x00s\x00t\x00y\x00l\x00e\x00s'
+    b'\x00e\x00v\x00e\x00n\x00.\x00c\x00o\x00m\x000\x001\x002\x003\x004\x005\x006\x007'
+    b'\x008\x009Created by Sizenko Alexander'
+    b'. \xa9 2008 Style-7. All rights res'
+    b'erved. http://www.styleseven.com'
+    b'Digital-7 ItalicItalicDigital-7 '
+    b'ItalicDigital-7 Italic1.02 Apr 0'
+    b'7 12:15:00 2011Digital-7ItalicCr'
+    b'eated by Sizenko Alexander. Size'
+    b'nko Alexanderhttp://www.stylesev'
+    b'en.comFreeware for personal use.'
+    b'\r\nFor commercial use please cont'
+    b'uct us.0123456789\x00C\x00r\x00e\x00a\x00t\x00e\x00d\x00'
+    b' \x00b\x00y\x00 \x00S\x00i\x00z\x00e\x00n\x00k\x00o\x00 \x00A\x00l\x00e\x00x\x00'
+    b'a\x00n\x00d\x00e\x00r\x00.\x00 \x00\xa9\x00 \x002\x000\x000\x008\x00 \x00S\x00t\x00'
+    b'y\x00l\x00e\x00-\x007\x00.\x00 \x00A\x00l\x00l\x00 \x00r\x00i\x00g\x00h\x00t\x00'
+    b's\x00 \x00r\x00e\x00s\x00e\x00r\x00v\x00e\x00d\x00.\x00 \x00h\x00t\x00t\x00p\x00'
+    b':\x00/\x00/\x00w\x00w\x00w\x00.\x00s\x00t\x00y\x00l\x00e\x00s\x00e\x00v\x00e\x00'
+    b'n\x00.\x00c\x00o\x00m\x00D\x00i\x00g\x00i\x00t\x00a\x00l\x00-\x007\x00 \x00I\x00'
+    b't\x00a\x00l\x00i\x00c\x00I\x00t\x00a\x00l\x00i\x00c\x00D\x00i\x00g\x00i\x00t\x00'
+    b'a\x00l\x00-\x007\x00 \x00I\x00t\x00a\x00l\x00i\x00c\x00D\x00i\x00g\x00i\x00t\x00'
+    b'a\x00l\x00-\x007\x00 \x00I\x00t\x00a\x00l\x00i\x00c\x001\x00.\x000\x002\x00 \x00'
+    b'A\x00p\x00r\x00 \x000\x007\x00 \x001\x002\x00:\x001\x005\x00:\x000\x000\x00 \x00'
+    b'2\x000\x001\x001\x00D\x00i\x00g\x00i\x00t\x00a\x00l\x00-\x007\x00I\x00t\x00a\x00'
+    b'l\x00i\x00c\x00C\x00r\x00e\x00a\x00t\x00e\x00d\x00 \x00b\x00y\x00 \x00S\x00i\x00'
+    b'z\x00e\x00n\x00k\x00o\x00 \x00A\x00l\x00e\x00x\x00a\x00n\x00d\x00e\x00r\x00.\x00'
+    b' \x00S\x00i\x00z\x00e\x00n\x00k\x00o\x00 \x00A\x00l\x00e\x00x\x00a\x00n\x00d\x00'
+    b'e\x00r\x00h\x00t\x00t\x00p\x00:\x00/\x00/\x00w\x00w\x00w\x00.\x00s\x00t\x00y\x00'
+    b'l\x00e\x00s\x00e\x00v\x00e\x00n\x00.\x00c\x00o\x00m\x00F\x00r\x00e\x00e\x00w\x00'
+    b'a\x00r\x00e\x00 \x00f\x00o\x00r\x00 \x00p\x00e\x00r\x00s\x00o\x00n\x00a\x00l\x00'
+    b' \x00u\x00s\x00e\x00.\x00\r\x00\n\x00F\x00o\x00r\x00 \x00c\x00o\x00m\x00m\x00e\x00'
+    b'r\x00c\x00i\x00a\x00l\x00 \x00u\x00s\x00e\x00 \x00p\x00l\x00e\x00a\x00s\x00e\x00'
+    b' \x00c\x00o\x00n\x00t\x00u\x00c\x00t\x00 \x00u\x00s\x00.\x000\x001\x002\x003\x00'
+    b'4\x005\x006\x007\x008\x009\x00\x00\x02\x00\x00\x00\x00\x00\x00\xff\x88\x00F\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00k\x00\x00\x01\x02\x00\x02\x00\x03\x00\x04\x00\x05\x00\x06\x00\x07\x00\x08'
+    b'\x00\t\x00\n\x00\x0b\x00\x0c\x00\r\x00\x0e\x00\x0f\x00\x10\x00\x11\x00\x12\x00\x13\x00\x14\x00\x15\x00\x16\x00\x17\x00\x18'
+    b'\x00\x19\x00\x1a\x00\x1b\x00\x1c\x00\x1d\x00\x1e\x00\x1f\x00 \x00!\x00"\x00#\x00$\x00%\x00&\x00\'\x00('
+    b'\x00)\x00*\x00+\x00,\x00-\x00.\x00/\x000\x001\x002\x003\x004\x005\x006\x007\x008'
+    b'\x009\x00:\x00;\x00<\x00=\x00>\x00?\x00@\x00A\x00B\x00C\x00D\x00E\x00F\x00G\x00H'
+    b'\x00I\x00J\x00K\x00L\x00M\x00N\x00O\x00P\x00Q\x00R\x00S\x00T\x00U\x00V\x00W\x00X'
+    b'\x00Y\x00Z\x00[\x00\\\x00]\x00^\x00_\x00`\x00a\x00\xc6\x00\xb6\x00\xb7\x00\xb4\x00\xb5\x00\x87\x00\xb2'
+    b'\x00\xb3\x00\x8b\x04NULL\x00\x00\x00\x00\x00\x00\x03\x00\x08\x00\x02\x00\x10\x00\x01\xff\xff\x00\x03\x00\x01\x00\x00'
+    b'\x00\x00\x00\x00\x01\x04\x02\xbc\x00\x00o\x1c\x02\xbc\x015Digital-7       '
+    b'\x00\x00\x00\x00\x00\x00\x00\x00Digita\x00\x00\x01\x00\x00\x00\x00\x00\x05\xac<?xml ve'
+    b'rsion="1.0" encoding="utf-8"?>\n<'
+    b'!-- Generator: Adobe Illustrator'
+    b' 27.9.0, SVG Export Plug-In . SV'
+    b'G Version: 6.00 Build 0)  -->\n<s'
+    b'vg version="1.1" id="a" xmlns="h'
+    b'ttp://www.w3.org/2000/svg" xmlns'
+    b':xlink="http://www.w3.org/1999/x'
+    b'link" x="0px" y="0px"\n\t viewBox='
+    b'"0 0 500 200" style="enable-back'
+    b'ground:new 0 0 500 200;" xml:spa'
+    b'ce="preserve">\n<style type="text'
+    b'/css">\n\t.st0{fill:#FAAA32;}\n\t.st'
+    b'1{fill:none;}\n</style>\n<path cla'
+    b'ss="st0" d="M202.3,159.9h-13.9V8'
+    b'9.2c-2.5,1.7-5.4,3.2-8.5,4.6c-3.'
+    b'1,1.4-6.1,2.5-9.3,3.5l-3.6-11.6\n'
+    b'\tc4.9-1.4,9.6-3.3,14.2-5.9c4.7-2'
+    b'.5,8.8-5.3,12.1-8.5h8.9v88.5H202'
+    b'.3z"/>\n<path class="st0" d="M249'
+    b'.1,161.4c-9.5,0-16.6-3.6-21.3-11'
+    b's-7.1-18-7.1-32c0-15,2.5-26.5,7.'
+    b'7-34.3c5.2-7.9,12.4-11.8,21.9-11'
+    b'.8\n\tc9.9,0,17.1,3.6,21.7,11c4.6,'
+    b'7.4,6.8,18.4,6.8,33.2s-2.5,25.8-'
+    b'7.5,33.4C266,157.5,258.8,161.4,2'
+    b'49.1,161.4L249.1,161.4z M250,83.'
+    b'2\n\tc-5.2,0-8.9,2.9-11.3,8.6c-2.4'
+    b',5.7-3.6,14.3-3.6,25.9c0,10.9,1.'
+    b'3,18.9,3.6,24.2c2.4,5.4,6.1,8.1,'
+    b'11.1,8.1s8.9-2.8,11.1-8.2\n\tc2.4-'
+    b'5.6,3.5-13.8,3.5-24.9s-1.3-19.6-'
+    b'3.6-25.2C258.5,86.2,255,83.2,250'
+    b',83.2L250,83.2z"/>\n<path class="'
+    b'st0" d="M335.8,43l-16.1,25.2l16.'
+    b'1,24.6h-12.4l-8.7-14.1c-0.4-0.6-'
+    b'0.6-1.2-1-1.7c-0.4-0.6-0.8-1.4-1'
+    b'.2-2.3h-0.2\n\tc-0.2,0.4-0.4,1-0.8'
+    b',1.6c-0.4,0.6-0.8,1.4-1.4,2.3l-8'
+    b'.9,14.3h-12l16.5-24.6L289.8,43h1'
+    b'2.2l8.7,14.7c0.4,0.8,0.8,1.4,1.2'
+    b',2.1\n\tc0.4,0.8,0.6,1.4,1,1.9h0.2'
+    b'c0.4-0.8,0.6-1.4,1-2.1c0.4-0.6,0'
+    b'.8-1.4,1.2-2.1l9.1-14.7L335.8,43'
+    b'L335.8,43z"/>\n<rect class="st1" '
+    b'width="500" height="199.2"/>\n</s'
+    b'vg>\n\x00\x00\x07\xb1<?xml version="1.0" enco'
+    b'ding="utf-8"?>\n<!-- Generator: A'
+    b'dobe Illustrator 27.9.0, SVG Exp'
+    b'ort Plug-In . SVG Version: 6.00 '
+    b'Build 0)  -->\n<svg version="1.1"'
+    b'\n\t id="svg3049" xmlns:rdf="http:'
+    b'//www.w3.org/1999/02/22-rdf-synt'
+    b'ax-ns#" xmlns:dc="http://purl.or'
+    b'g/dc/elements/1.1/" xmlns:sodipo'
+    b'di="http://sodipodi.sourceforge.'
+    b'net/DTD/sodipodi-0.dtd" xmlns:in'
+    b'kscape="http://www.inkscape.org/'
+    b'namespaces/inkscape" xmlns:cc="h'
+    b'ttp://creativecommons.org/ns#" x'
+    b'mlns:svg="http://www.w3.org/2000'
+    b'/svg" inkscape:version="0.48.2 r'
+    b'9819" sodipodi:docname="Novo doc'
+    b'umento 3"\n\t xmlns="http://www.w3'
+    b'.org/2000/svg" xmlns:xlink="http'
+    b'://www.w3.org/1999/xlink" x="0px'
+    b'" y="0px" viewBox="0 0 500 300"\n'
+    b'\t style="enable-background:new 0'
+    b' 0 500 300;" xml:space="preserve'
+    b'">\n<style type="text/css">\n\t.st0'
+    b'{fill:#FFFFFF;}\n\t.st1{fill:none;'
+    b'}\n</style>\n<sodipodi:namedview  '
+    b'bordercolor="#666666" borderopac'
+    b'ity="1.0" id="base" inkscape:cur'
+    b'rent-layer="layer1" inkscape:cx='
+    b'"653.59618" inkscape:cy="454.342'
+    b'48" inkscape:document-units="px"'
+    b' inkscape:guide-bbox="true" inks'
+    b'cape:pageopacity="0.0" inkscape:'
+    b'pageshadow="2" inkscape:window-h'
+    b'eight="935" inkscape:window-maxi'
+    b'mized="1" inkscape:window-width='
+    b'"1280" inkscape:window-x="0" ink'
+    b'scape:window-y="33" inkscape:zoo'
+    b'm="0.49497475" pagecolor="#fffff'
+    b'f" showgrid="false" showguides="'
+    b'true">\n\t</sodipodi:namedview>\n<g'
+    b' id="layer1" inkscape:groupmode='
+    b'"layer" inkscape:label="Camada 1'
+    b'">\n\t\n\t\t<path id="path15823" inks'
+    b'cape:connector-curvature="0" ink'
+    b'scape:export-filename="/home/pro'
+    b'fessor/Imagens/png/formula.png" '
+    b'inkscape:export-xdpi="200" inksc'
+    b'ape:export-ydpi="200" sodipodi:n'
+    b'odetypes="cccccccccccccccccc" cl'
+    b'ass="st0" d="\n\t\tM219.6,103.7c-7.'
+    b'1,36.8-4.6,65.2-31.8,113.1c-7.1,'
+    b'17.7,13.3,24.4,21.9,10.5c10.3-21'
+    b'.7,16.2-66,19.6-123.8h44.8l-6.1,'
+    b'96.3\n\t\tc-1.1,51.3,52.6,42,65.6-5'
+    b'.7h-4.2c-25.2,47.7-48.4,20.6-46-'
+    b'15.4l5.3-74.8l45.2-0.6V86H222.7c'
+    b'-29.2,1.1-36.8,3.2-44.4,17.7\n\t\tl'
+    b'-12.2,23.6l4.2,0.4c8.8-16.4,17.7'
+    b'-24.4,33.8-24.4L219.6,103.7z"/>\n'
+    b'</g>\n<rect class="st1" width="50'
+    b'0" height="300"/>\n</svg>\n\x00\x00\x03\x1e<?x'
+    b'ml version="1.0" encoding="utf-8'
+    b'"?>\n<!-- Generator: Adobe Illust'
+    b'rator 27.9.0, SVG Export Plug-In'
+    b' . SVG Version: 6.00 Build 0)  -'
+    b'->\n<svg version="1.1" id="glyphi'
+    b'cons-basic" xmlns="http://www.w3'
+    b'.org/2000/svg" xmlns:xlink="http'
+    b'://www.w3.org/1999/xlink" x="0px'
+    b'"\n\t y="0px" viewBox="0 0 500 500'
+    b'" style="enable-background:new 0'
+    b' 0 500 500;" xml:space="preserve'
+    b'">\n<style type="text/css">\n\t.st0'
+    b'{fill:#FA4B4B;}\n\t.st1{fill:none;'
+    b'}\n</style>\n<path id="arrow-left"'
+    b' class="st0" d="M383.6,222.4v45.'
+    b'5c0,6.3-5.1,11.4-11.4,11.4H258.6'
+    b'v39.6c0,6.3-5.1,11.4-11.4,11.4\n\t'
+    b'c-2.3,0-4.6-0.7-6.5-2.1l-105.2-7'
+    b'3.7c-5.1-3.6-6.4-10.7-2.8-15.8c0'
+    b'.8-1.1,1.7-2,2.8-2.8l105.2-73.7c'
+    b'5.1-3.6,12.2-2.4,15.8,2.8\n\tc1.3,'
+    b'1.9,2.1,4.2,2.1,6.5v39.6h113.7C3'
+    b'78.5,211.1,383.6,216.1,383.6,222'
+    b'.4z"/>\n<rect class="st1" width="'
+    b'500" height="500"/>\n</svg>\n\x00\x00\x02\xb7<'
+    b'svg id="glyphicons-basic" xmlns='
+    b'"http://www.w3.org/2000/svg" vie'
+    b'wBox="0 0 32 32">\n  <path id="li'
+    b'st" d="M28,24v1a1,1,0,0,1-1,1H11'
+    b'a1,1,0,0,1-1-1V24a1,1,0,0,1,1-1H'
+    b'27A1,1,0,0,1,28,24Zm-1-7H11a1,1,'
+    b'0,0,0-1,1v1a1,1,0,0,0,1,1H27a1,1'
+    b',0,0,0,1-1V18A1,1,0,0,0,27,17Zm0'
+    b'-6H11a1,1,0,0,0-1,1v1a1,1,0,0,0,'
+    b'1,1H27a1,1,0,0,0,1-1V12A1,1,0,0,'
+    b'0,27,11Zm0-6H11a1,1,0,0,0-1,1V7a'
+    b'1,1,0,0,0,1,1H27a1,1,0,0,0,1-1V6'
+    b'A1,1,0,0,0,27,5ZM6,23H5a1,1,0,0,'
+    b'0-1,1v1a1,1,0,0,0,1,1H6a1,1,0,0,'
+    b'0,1-1V24A1,1,0,0,0,6,23Zm0-6H5a1'
+    b',1,0,0,0-1,1v1a1,1,0,0,0,1,1H6a1'
+    b',1,0,0,0,1-1V18A1,1,0,0,0,6,17Zm'
+    b'0-6H5a1,1,0,0,0-1,1v1a1,1,0,0,0,'
+    b'1,1H6a1,1,0,0,0,1-1V12A1,1,0,0,0'
+    b',6,11ZM6,5H5A1,1,0,0,0,4,6V7A1,1'
+    b',0,0,0,5,8H6A1,1,0,0,0,7,7V6A1,1'
+    b',0,0,0,6,5Z"/>\n</svg>\n\x00\x00\x12\x89<svg c'
+    b'lass="svg-icon" style="width: 1e'
+    b'm; height: 1em;vertical-align: m'
+    b'iddle;fill: currentColor;overflo'
+    b'w: hidden;" viewBox="0 0 1024 10'
+    b'24" version="1.1" xmlns="http://'
+    b'www.w3.org/2000/svg"><path d="M8'
+    b'53.333333 341.333333H170.666667v'
+    b'512c0 46.933333 38.4 85.333333 8'
+    b'5.333333 85.333334h512c46.933333'
+    b' 0 85.333333-38.4 85.333333-85.3'
+    b'33334V341.333333z" fill="#616161'
+    b'" /><path d="M768 85.333333H256C'
+    b'209.066667 85.333333 170.666667 '
+    b'123.733333 170.666667 170.666667'
+    b'v192h682.666666V170.666667c0-46.'
+    b'933333-38.4-85.333333-85.333333-'
+    b'85.333334z" fill="#424242" /><pa'
+    b'th d="M768 298.666667H256c-12.8 '
+    b'0-21.333333-8.533333-21.333333-2'
+    b'1.333334V170.666667c0-12.8 8.533'
+    b'333-21.333333 21.333333-21.33333'
+    b'4h512c12.8 0 21.333333 8.533333 '
+    b'21.333333 21.333334v106.666666c0'
+    b' 12.8-8.533333 21.333333-21.3333'
+    b'33 21.333334z" fill="#9CCC65" />'
+    b'<path d="M704 213.333333h42.6666'
+    b'67v42.666667h-42.666667zM618.666'
+    b'667 213.333333h42.666666v42.6666'
+    b'67h-42.666666z" fill="#33691E" /'
+    b'><path d="M768 490.666667h-64c-1'
+    b'2.8 0-21.333333-8.533333-21.3333'
+    b'33-21.333334v-42.666666c0-12.8 8'
+    b'.533333-21.333333 21.333333-21.3'
+    b'33334h64c12.8 0 21.333333 8.5333'
+    b'33 21.333333 21.333334v42.666666'
+    b'c0 12.8-8.533333 21.333333-21.33'
+    b'3333 21.333334z" fill="#FF5252" '
+    b'/><path d="M320 490.666667h-64c-'
+    b'12.8 0-21.333333-8.533333-21.333'
+    b'333-21.333334v-42.666666c0-12.8 '
+    b'8.533333-21.333333 21.333333-21.'
+    b'333334h64c12.8 0 21.333333 8.533'
+    b'333 21.333333 21.333334v42.66666'
+    b'6c0 12.8-8.533333 21.333333-21.3'
+    b'33333 21.333334zM469.333333 490.'
+    b'666667h-64c-12.8 0-21.333333-8.5'
+    b'33333-21.333333-21.333334v-42.66'
+    b'6666c0-12.8 8.533333-21.333333 2'
+    b'1.333333-21.333334h64c12.8 0 21.'
+    b'333333 8.533333 21.333334 21.333'
+    b'334v42.666666c0 12.8-8.533333 21'
+    b'.333333-21.333334 21.333334zM618'
+    b'.666667 490.666667h-64c-12.8 0-2'
+    b'1.333333-8.533333-21.333334-21.3'
+    b'33334v-42.666666c0-12.8 8.533333'
+    b'-21.333333 21.333334-21.333334h6'
+    b'4c12.8 0 21.333333 8.533333 21.3'
+    b'33333 21.333334v42.666666c0 12.8'
+    b'-8.533333 21.333333-21.333333 21'
+    b'.333334zM320 618.666667h-64c-12.'
+    b'8 0-21.333333-8.533333-21.333333'
+    b'-21.333334v-42.666666c0-12.8 8.5'
+    b'33333-21.333333 21.333333-21.333'
+    b'334h64c12.8 0 21.333333 8.533333'
+    b' 21.333333 21.333334v42.666666c0'
+    b' 12.8-8.533333 21.333333-21.3333'
+    b'33 21.333334zM469.333333 618.666'
+    b'667h-64c-12.8 0-21.333333-8.5333'
+    b'33-21.333333-21.333334v-42.66666'
+    b'6c0-12.8 8.533333-21.333333 21.3'
+    b'33333-21.333334h64c12.8 0 21.333'
+    b'333 8.533333 21.333334 21.333334'
+    b'v42.666666c0 12.8-8.533333 21.33'
+    b'3333-21.333334 21.333334zM618.66'
+    b'6667 618.666667h-64c-12.8 0-21.3'
+    b'33333-8.533333-21.333334-21.3333'
+    b'34v-42.666666c0-12.8 8.533333-21'
+    b'.333333 21.333334-21.333334h64c1'
+    b'2.8 0 21.333333 8.533333 21.3333'
+    b'33 21.333334v42.666666c0 12.8-8.'
+    b'533333 21.333333-21.333333 21.33'
+    b'3334zM320 746.666667h-64c-12.8 0'
+    b'-21.333333-8.533333-21.333333-21'
+    b'.333334v-42.666666c0-12.8 8.5333'
+    b'33-21.333333 21.333333-21.333334'
+    b'h64c12.8 0 21.333333 8.533333 21'
+    b'.333333 21.333334v42.666666c0 12'
+    b'.8-8.533333 21.333333-21.333333 '
+    b'21.333334zM469.333333 746.666667'
+    b'h-64c-12.8 0-21.333333-8.533333-'
+    b'21.333333-21.333334v-42.666666c0'
+    b'-12.8 8.533333-21.333333 21.3333'
+    b'33-21.333334h64c12.8 0 21.333333'
+    b' 8.533333 21.333334 21.333334v42'
+    b'.666666c0 12.8-8.533333 21.33333'
+    b'3-21.333334 21.333334zM618.66666'
+    b'7 746.666667h-64c-12.8 0-21.3333'
+    b'33-8.533333-21.333334-21.333334v'
+    b'-42.666666c0-12.8 8.533333-21.33'
+    b'3333 21.333334-21.333334h64c12.8'
+    b' 0 21.333333 8.533333 21.333333 '
+    b'21.333334v42.666666c0 12.8-8.533'
+    b'333 21.333333-21.333333 21.33333'
+    b'4zM320 874.666667h-64c-12.8 0-21'
+    b'.333333-8.533333-21.333333-21.33'
+    b'3334v-42.666666c0-12.8 8.533333-'
+    b'21.333333 21.333333-21.333334h64'
+    b'c12.8 0 21.333333 8.533333 21.33'
+    b'3333 21.333334v42.666666c0 12.8-'
+    b'8.533333 21.333333-21.333333 21.'
+    b'333334zM469.333333 874.666667h-6'
+    b'4c-12.8 0-21.333333-8.533333-21.'
+    b'333333-21.333334v-42.666666c0-12'
+    b'.8 8.533333-21.333333 21.333333-'
+    b'21.333334h64c12.8 0 21.333333 8.'
+    b'533333 21.333334 21.333334v42.66'
+    b'6666c0 12.8-8.533333 21.333333-2'
+    b'1.333334 21.333334zM618.666667 8'
+    b'74.666667h-64c-12.8 0-21.333333-'
+    b'8.533333-21.333334-21.333334v-42'
+    b'.666666c0-12.8 8.533333-21.33333'
+    b'3 21.333334-21.333334h64c12.8 0 '
+    b'21.333333 8.533333 21.333333 21.'
+    b'333334v42.666666c0 12.8-8.533333'
+    b' 21.333333-21.333333 21.333334z"'
+    b' fill="#E0E0E0" /><path d="M768 '
+    b'618.666667h-64c-12.8 0-21.333333'
+    b'-8.533333-21.333333-21.333334v-4'
+    b'2.666666c0-12.8 8.533333-21.3333'
+    b'33 21.333333-21.333334h64c12.8 0'
+    b' 21.333333 8.533333 21.333333 21'
+    b'.333334v42.666666c0 12.8-8.53333'
+    b'3 21.333333-21.333333 21.333334z'
+    b'M768 746.666667h-64c-12.8 0-21.3'
+    b'33333-8.533333-21.333333-21.3333'
+    b'34v-42.666666c0-12.8 8.533333-21'
+    b'.333333 21.333333-21.333334h64c1'
+    b'2.8 0 21.333333 8.533333 21.3333'
+    b'33 21.333334v42.666666c0 12.8-8.'
+    b'533333 21.333333-21.333333 21.33'
+    b'3334zM768 874.666667h-64c-12.8 0'
+    b'-21.333333-8.533333-21.333333-21'
+    b'.333334v-42.666666c0-12.8 8.5333'
+    b'33-21.333333 21.333333-21.333334'
+    b'h64c12.8 0 21.333333 8.533333 21'
+    b'.333333 21.333334v42.666666c0 12'
+    b'.8-8.533333 21.333333-21.333333 '
+    b'21.333334z" fill="#BDBDBD" /></s'
+    b'vg>\x00\x00\x05\\<?xml version="1.0" encod'
+    b'ing="utf-8"?>\n<!-- Generator: Ad'
+    b'obe Illustrator 27.9.0, SVG Expo'
+    b'rt Plug-In . SVG Version: 6.00 B'
+    b'uild 0)  -->\n<svg version="1.1" '
+    b'id="a" xmlns="http://www.w3.org/'
+    b'2000/svg" xmlns:xlink="http://ww'
+    b'w.w3.org/1999/xlink" x="0px" y="'
+    b'0px"\n\t viewBox="0 0 500 200" sty'
+    b'le="enable-background:new 0 0 50'
+    b'0 200;" xml:space="preserve">\n<s'
+    b'tyle type="text/css">\n\t.st0{fill'
+    b':none;stroke:#FAAA32;stroke-widt'
+    b'h:11;stroke-miterlimit:10;}\n\t.st'
+    b'1{fill:#FAAA32;}\n\t.st2{fill:none'
+    b';}\n</style>\n<polyline class="st0'
+    b'" points="393.5,52.2 216.7,52.2 '
+    b'218,157.2 169.6,109 153.3,114.5 '
+    b'"/>\n<path class="st1" d="M321.2,'
+    b'77.3l-28.4,73.4c-2.1,5.5-5,9.6-8'
+    b'.5,12.4s-7.9,4.2-13,4.2c-2.5,0-4'
+    b'.8-0.3-7-0.8\n\tc-2.2-0.5-4.2-1.4-'
+    b'6.2-2.5l6-9.8c1.2,0.7,2.4,1.2,3.'
+    b'3,1.5c1,0.3,2,0.4,3.1,0.4c1.9,0,'
+    b'3.5-0.5,4.8-1.4c1.3-0.9,2.5-2.6,'
+    b'3.6-5.1\n\tl4.5-10.4l-24-61.9h15.2'
+    b'l14,40.6c0.4,1.2,0.8,2.3,1,3.3c0'
+    b'.2,1,0.5,2.1,0.8,3.5h0.3c0.3-1.4'
+    b',0.6-2.6,0.9-3.5c0.3-0.9,0.6-2,1'
+    b'-3.2\n\tL307,77.3L321.2,77.3L321.2'
+    b',77.3z"/>\n<path class="st1" d="M'
+    b'186.9,41.6l-16.2,25.2l16.2,24.8h'
+    b'-12.4l-8.8-14.3c-0.3-0.5-0.6-1.1'
+    b'-0.9-1.7c-0.3-0.6-0.7-1.4-1.2-2.'
+    b'2h-0.2\n\tc-0.2,0.4-0.4,0.9-0.8,1.'
+    b'5c-0.3,0.6-0.8,1.4-1.4,2.4l-8.9,'
+    b'14.3H140l16.4-24.7l-15.9-25.3h12'
+    b'.3l8.7,14.8c0.4,0.7,0.8,1.4,1.1,'
+    b'2.1\n\tc0.3,0.7,0.6,1.3,1,2h0.2c0.'
+    b'3-0.7,0.7-1.4,1-2.1c0.3-0.7,0.7-'
+    b'1.4,1.2-2.1l9.1-14.8L186.9,41.6L'
+    b'186.9,41.6z"/>\n<rect class="st2"'
+    b' width="500" height="200"/>\n</sv'
+    b'g>\n\x00\x00\x03\xd7<?xml version="1.0" encod'
+    b'ing="utf-8"?>\n<!-- Generator: Ad'
+    b'obe Illustrator 27.9.0, SVG Expo'
+    b'rt Plug-In . SVG Version: 6.00 B'
+    b'uild 0)  -->\n<svg version="1.1" '
+    b'id="a" xmlns="http://www.w3.org/'
+    b'2000/svg" xmlns:xlink="http://ww'
+    b'w.w3.org/1999/xlink" x="0px" y="'
+    b'0px"\n\t viewBox="0 0 500 300" sty'
+    b'le="enable-background:new 0 0 50'
+    b'0 300;" xml:space="preserve">\n<s'
+    b'tyle type="text/css">\n\t.st0{fill'
+    b':none;stroke:#FFFFFF;stroke-widt'
+    b'h:14;stroke-miterlimit:10;}\n\t.st'
+    b'1{fill:#FFFFFF;}\n\t.st2{fill:none'
+    b';}\n</style>\n<polyline class="st0'
+    b'" points="427.3,63.6 187.4,63.6 '
+    b'189.1,253.4 94.4,136.6 72.3,145.'
+    b'5 "/>\n<path class="st1" d="M377.'
+    b'6,120.7l-44.3,71.8l44.1,70.7h-33'
+    b'.9l-24.1-40.8c-0.8-1.5-1.7-3.1-2'
+    b'.6-4.9c-0.9-1.8-2-3.9-3.3-6.4h-0'
+    b'.5\n\tc-0.5,1.1-1.2,2.6-2.1,4.4c-0'
+    b'.9,1.8-2.2,4.1-3.9,6.8l-24.4,40.'
+    b'9h-33.1l44.9-70.5l-43.5-72.1h33.'
+    b'6l23.7,42.3c1.2,2,2.2,4,3.1,6\n\tc'
+    b'0.9,1.9,1.8,3.8,2.7,5.7h0.5c0.9-'
+    b'2,1.8-4,2.8-5.9c1-1.9,2-3.9,3.2-'
+    b'5.9l24.8-42.2L377.6,120.7L377.6,'
+    b'120.7z"/>\n<rect class="st2" widt'
+    b'h="500" height="300"/>\n</svg>\n\x00\x00'
+    b'\x04\xcc<?xml version="1.0" encoding="'
+    b'utf-8"?>\n<!-- Generator: Adobe I'
+    b'llustrator 27.9.0, SVG Export Pl'
+    b'ug-In . SVG Version: 6.00 Build '
+    b'0)  -->\n<svg version="1.1" id="a'
+    b'" xmlns="http://www.w3.org/2000/'
+    b'svg" xmlns:xlink="http://www.w3.'
+    b'org/1999/xlink" x="0px" y="0px"\n'
+    b'\t viewBox="0 0 500 300" style="e'
+    b'nable-background:new 0 0 500 300'
+    b';" xml:space="preserve">\n<style '
+    b'type="text/css">\n\t.st0{fill:#FFF'
+    b'FFF;}\n\t.st1{fill:none;}\n</style>'
+    b'\n<path class="st0" d="M272.1,93.'
+    b'2l-58.4,150.7c-4.3,11.2-10.2,19.'
+    b'7-17.5,25.5c-7.3,5.8-16.2,8.7-26'
+    b'.7,8.7c-5.1,0-9.8-0.6-14.3-1.7\n\t'
+    b'c-4.5-1.1-8.7-2.8-12.7-5.2l12.4-'
+    b'20.1c2.5,1.5,4.8,2.5,6.9,3.1s4.2'
+    b',0.9,6.4,0.9c3.8,0,7.1-1,9.9-2.9'
+    b'c2.7-1.9,5.2-5.4,7.4-10.5\n\tl9.2-'
+    b'21.3L145.3,93.2h31.2l28.8,83.3c0'
+    b'.9,2.5,1.6,4.8,2.1,6.7s1.1,4.4,1'
+    b'.7,7.2h0.6c0.6-2.9,1.2-5.2,1.8-7'
+    b'.1c0.6-1.9,1.3-4.1,2.2-6.6\n\tl29.'
+    b'1-83.6L272.1,93.2L272.1,93.2z"/>'
+    b'\n<path class="st0" d="M370,38.5l'
+    b'-29.1,45.2l29,44.5h-22.3l-15.9-2'
+    b'5.7c-0.5-0.9-1.1-2-1.7-3.1s-1.3-'
+    b'2.5-2.2-4h-0.4\n\tc-0.4,0.7-0.8,1.'
+    b'6-1.4,2.8c-0.6,1.1-1.4,2.5-2.5,4'
+    b'.3l-16,25.8h-21.7l29.5-44.4l-28.'
+    b'6-45.4h22.1l15.6,26.6c0.8,1.3,1.'
+    b'4,2.5,2,3.8\n\tc0.6,1.2,1.2,2.4,1.'
+    b'8,3.6h0.4c0.6-1.3,1.2-2.5,1.8-3.'
+    b'7c0.6-1.2,1.3-2.4,2.1-3.7l16.3-2'
+    b'6.5L370,38.5L370,38.5z"/>\n<rect '
+    b'class="st1" width="500" height="'
+    b'300"/>\n</svg>\n\x00\x00\x05 <?xml version='
+    b'"1.0" encoding="utf-8"?>\n<!-- Ge'
+    b'nerator: Adobe Illustrator 27.9.'
+    b'0, SVG Export Plug-In . SVG Vers'
+    b'ion: 6.00 Build 0)  -->\n<svg ver'
+    b'sion="1.1" id="a" xmlns="http://'
+    b'www.w3.org/2000/svg" xmlns:xlink'
+    b'="http://www.w3.org/1999/xlink" '
+    b'x="0px" y="0px"\n\t viewBox="0 0 5'
+    b'00 200" style="enable-background'
+    b':new 0 0 500 200;" xml:space="pr'
+    b'eserve">\n<style type="text/css">'
+    b'\n\t.st0{fill:#FAAA32;}\n\t.st1{fill'
+    b':none;}\n</style>\n<path class="st'
+    b'0" d="M267.6,121.6h-59.4c0.2,8.3'
+    b',2.5,14.6,6.8,18.7c4.3,4.2,9.6,6'
+    b'.2,16.1,6.2c4.5,0,8.5-1.1,11.9-3'
+    b'.2\n\tc3.4-2.1,6.4-5.3,8.9-9.3l14.'
+    b'9,8.1c-4,6.2-8.9,11.2-14.9,14.6c'
+    b'-6.1,3.4-13.2,5.1-21.4,5.1c-12.7'
+    b',0-22.7-3.8-30.4-11.3\n\tc-7.8-7.6'
+    b'-11.3-18.5-11.3-32.9s4-24.6,11.7'
+    b'-33.1c7.8-8.5,17.6-12.7,29.3-12.'
+    b'7s21.4,3.6,28,10.8c6.6,7.2,10,17'
+    b'.6,10,31.4L267.6,121.6\n\tL267.6,1'
+    b'21.6z M248.6,107.8c0-6.8-1.7-11.'
+    b'9-5.1-15.7c-3.4-3.8-7.9-5.5-13.8'
+    b'-5.5c-5.9,0-11,2.1-14.9,6.1c-3.8'
+    b',4-6.1,9.1-6.8,15.1\n\tH248.6z"/>\n'
+    b'<path class="st0" d="M317.6,45.6'
+    b'l-16,25.1l16,24.7h-12.4l-8.7-14.'
+    b'3c-0.4-0.6-0.6-1.2-1-1.7c-0.4-0.'
+    b'6-0.8-1.4-1.2-2.3h-0.2\n\tc-0.2,0.'
+    b'4-0.4,1-0.8,1.5c-0.4,0.6-0.8,1.4'
+    b'-1.4,2.3l-8.9,14.3h-12l16.4-24.5'
+    b'l-15.8-25.1H284l8.7,14.7c0.4,0.8'
+    b',0.8,1.4,1.2,2.1\n\tc0.4,0.8,0.6,1'
+    b'.4,1,1.9h0.2c0.4-0.8,0.6-1.4,1-2'
+    b'.1c0.4-0.6,0.8-1.4,1.2-2.1l9.1-1'
+    b'4.7L317.6,45.6L317.6,45.6z"/>\n<r'
+    b'ect class="st1" width="500" heig'
+    b'ht="200"/>\n</svg>\n'
+)
+
+qt_resource_name = (
+    b'\x00\x05\x00me\xb3\x00f\x00o\x00n\x00t\x00s\x00\x05\x00o\xa6S\x00i\x00c\x00o\x00n\x00s'
+    b'\x00\x16\x08\x13\xae\xa6\x00d\x00i\x00g\x00i\x00t\x00a\x00l\x00-\x007\x00 \x00(\x00i\x00t'
+    b"\x00a\x00l\x00i\x00c\x00)\x00.\x00t\x00t\x00f\x00\x10\x02\xfd\x8e'\x00b\x00t\x00n\x00_"
+    b'\x001\x000\x00_\x00e\x00x\x00p\x00_\x00x\x00.\x00s\x00v\x00g\x00\n\x06ilG\x00b'
+    b'\x00t\x00n\x00_\x00p\x00i\x00.\x00s\x00v\x00g\x00\x08\x07\x9eW\xc7\x00b\x00a\x00c\x00k'
+    b'\x00.\x00s\x00v\x00g\x00\t\x07\x9e\xaf\x87\x00s\x00t\x00a\x00c\x00k\x00.\x00s\x00v\x00g'
+    b'\x00\x08\x08&W\xe7\x00c\x00a\x00l\x00c\x00.\x00s\x00v\x00g\x00\x0e\n\xe6@\xa7\x00b\x00t'
+    b'\x00n\x00_\x00r\x00a\x00i\x00z\x00_\x00x\x00.\x00s\x00v\x00g\x00\x15\x0b\x19\xe3g\x00b'
+    b'\x00t\x00n\x00_\x00r\x00a\x00i\x00z\x00_\x00q\x00u\x00a\x00d\x00r\x00a\x00d\x00a'
+    b'\x00.\x00s\x00v\x00g\x00\x0f\x0e\xb4E\xe7\x00b\x00t\x00n\x00_\x00y\x00_\x00e\x00x\x00p'
+    b'\x00_\x00x\x00.\x00s\x00v\x00g\x00\x0f\x0e\xdcE\xe7\x00b\x00t\x00n\x00_\x00e\x00_\x00e'
+    b'\x00x\x00p\x00_\x00x\x00.\x00s\x00v\x00g'
+)
+
+qt_resource_struct = (
+    b'\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\x00\x00\x00\x10'
+    b'\x00\x02\x00\x00\x00\t\x00\x00\x00\x04\x00\x00\x00 \x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00R\x00\x00\x00\x00'
+    b'\x00\x01\x00\x00[4\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x00`\xe4\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x00'
+    b'h\x99\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x00k\xbb\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00nv\x00\x00'
+    b'\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x00\x81\x03\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x86c\x00\x00\x01(\x00\x00'
+    b'\x00\x00\x00\x01\x00\x00\x8a>\x00\x00\x01L\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x0e'
+)
+
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+
+qInitResources()
@@ -9,77 +9,170 @@ hgf777@gmail.com
 
 """
 
+import logging
+import logging.handlers
 import os
+import queue
 import sys
-import locale
-import math
-import re
-from functools import partial
+from functools import cache, partial
+from time import perf_counter
 
-import PyQt6.QtCore as qtc
-import PyQt6.QtGui as qtg
-import PyQt6.QtWidgets as qtw
-from PyQt6 import uic
+from rpn_profile import startup_profile
 
-locale.setlocale(locale.LC_ALL, ("pt-BR", ""))
-basedir = os.path.dirname(__file__)
+if __name__ == "__main__" and "--batch" in sys.argv[1:]:
+    # batch mode only needs the engine, so it exits before Qt is imported.
+    # The worker processes of --jobs import the main module again where they
+    # are spawned (Windows, macOS), as __mp_main__: rpn_engine takes its
+    # place, so they do not import Qt either
+    import rpn_engine
 
+    sys.modules["__main__"] = rpn_engine
+    sys.exit(rpn_engine.batch_main())
 
-class Stack:
-    """HGF Stack implementation for python"""
+if __name__ == "__main__" and "--serve" in sys.argv[1:]:
+    # the calculation service does not use Qt either, see rpn_server
+    from rpn_server import main as serve_main
 
-    def __init__(self) -> None:
-        self._items = []
+    sys.exit(serve_main())
 
-    def __str__(self) -> str:
-        return str(self._items)
+with startup_profile.phase("import PyQt6.QtCore"):
+    import PyQt6.QtCore as qtc
+with startup_profile.phase("import PyQt6.QtGui"):
+    import PyQt6.QtGui as qtg
+with startup_profile.phase("import PyQt6.QtWidgets"):
+    import PyQt6.QtWidgets as qtw
+with startup_profile.phase("import rpn_engine"):
+    from rpn_engine import AGGREGATES, UNDO_MEMORY, NumericStack, RpnEngine, RpnObserver, Stack  # noqa: F401
+    from rpn_locale import NUMBER_FORMATS, get_number_format
+    from rpn_operations import OPERATIONS
+    from rpn_storage import EXACT_SUFFIX, MappedStack
+with startup_profile.phase("import ui_calculator"):
+    from ui_calculator import Ui_main_window
 
-    def items(self):
-        return self._items
 
-    def push(self, value) -> None:
-        self._items.append(value)
+# display updates are traced here at DEBUG level, see enable_trace
+logger = logging.getLogger("pyrpn")
+MAX_REPLAY = 1000000  # most runs of a macro asked by the replay dialog
+BAD_SUFFIX = ".bad"  # a stack file that can not be opened is renamed with it
 
-    def pop(self) -> str:
-        if self._items:
-            return self._items.pop()
-        else:
-            return ""
 
-    def peek_x(self) -> str | None:
-        if self._items:
-            return self._items[-1]
-        else:
-            return None
+def open_stack(stack_file, number_format):
+    """Open the stack file, or a fresh one if it can not be read
 
-    def peek_y(self) -> str | None:
-        if len(self._items) > 1:
-            return self._items[-2]
-        else:
-            return None
+    A file that is not a PyRPN stack file of this machine (corrupt, of an
+    other program or of an other byte order) is renamed to FILE.bad, with its
+    FILE.exact log, so the calculator starts and the file is not lost.
+
+    Returns:
+        MappedStack: the stack kept in stack_file
+    """
+    try:
+        return MappedStack(stack_file, number_format=number_format)
+    except ValueError as exc:
+        logger.warning("%s, renamed to %s and a new stack is opened", exc, stack_file + BAD_SUFFIX)
+    for path in (stack_file, stack_file + EXACT_SUFFIX):
+        if os.path.exists(path):
+            os.replace(path, path + BAD_SUFFIX)
+    return MappedStack(stack_file, number_format=number_format)
 
-    def peek_z(self) -> str | None:
-        if len(self._items) > 2:
-            return self._items[-3]
-        else:
-            return None
 
-    def is_empty(self) -> bool:
-        return not self._items
+def enable_trace(stream=None):
+    """Trace every display update without blocking the GUI thread
 
-    def size(self) -> int:
-        return len(self._items)
+    Records are only queued by the GUI thread; a QueueListener thread writes
+    them to 'stream' (stderr by default).
 
-    def swap(self) -> None:
-        self._items[-1], self._items[-2] = self._items[-2], self._items[-1]
+    Returns:
+        QueueListener: the running listener, stop it to flush the trace
+    """
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, logging.StreamHandler(stream))
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    logger.setLevel(logging.DEBUG)
+    listener.start()
+    return listener
+
+
+@cache
+def load_resources():
+    """Registers the compiled Qt resources (icons and display font), once"""
+    with startup_profile.phase("import resources_rc"):
+        import resources_rc  # noqa: F401
+    with startup_profile.phase("load display font"):
+        qtg.QFontDatabase.addApplicationFont(":/fonts/digital-7 (italic).ttf")
+
+
+@cache
+def load_icon(name):
+    """Returns the icon 'name' from the compiled resources, created only once
+
+    Args:
+        name (str): file name of the icon in the icons folder
+    """
+    load_resources()
+    return qtg.QIcon(f":/icons/{name}")
 
-    def cls(self):
-        self._items = []
+
+class StackModel(qtc.QAbstractTableModel):
+    """Table model reading the entries straight from a Stack
+
+    Column 0 is the position of the entry (1 is the bottom of the stack) and
+    column 1 its number. Nothing is copied: the view only asks for the rows it
+    shows, so the model costs the same for any stack depth.
+
+    Args:
+        stack: Stack object with the rpn calculator stack
+        parent: Qt object who is the parent of the model
+    """
+
+    POSITION_COLOR = qtg.QColor("#8AF")
+
+    def __init__(self, stack, parent=None):
+        super().__init__(parent)
+        self._stack = stack
+
+    def rowCount(self, parent=qtc.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._stack.size()
+
+    def columnCount(self, parent=qtc.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 2
+
+    def data(self, index, role=qtc.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == qtc.Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return f"{index.row() + 1}:"
+            return self._stack.item(index.row())
+        if role == qtc.Qt.ItemDataRole.ForegroundRole and index.column() == 0:
+            return self.POSITION_COLOR
+        return None
+
+    def find(self, text, start=0):
+        """Row of the first entry containing 'text', searching from 'start' and
+        wrapping around. Returns -1 if there is none.
+        """
+        size = self._stack.size()
+        for offset in range(size):
+            row = (start + offset) % size
+            if text in self._stack.item(row):
+                return row
+        return -1
 
 
 class StackModal(qtw.QDialog):
     """Modal dialog to show all stack items
 
+    The entries are shown in a view over a StackModel that only draws the
+    visible rows, so the dialog opens in the same time for any stack depth.
+    It is a QTableView with fixed row heights because QListView lays out
+    every row when shown. A position can be typed to jump to it and a text to
+    search.
+
     Args:
         parent: Qt Widget who is the parent of the dialog
         stack: Stack object with the rpn calculator stack
@@ -88,46 +181,207 @@ class StackModal(qtw.QDialog):
     def __init__(self, parent, stack):
         super().__init__(parent)
         self.setWindowTitle("STACK")
-        self.setWindowIcon(qtg.QIcon(os.path.join(basedir, "./icons/stack.svg")))
+        self.setWindowIcon(load_icon("stack.svg"))
         self.setModal(True)
-        self.setFixedWidth(150)
+        self.setFixedWidth(200)
         self.setStyleSheet("color: white")
 
-        self.scroll = qtw.QScrollArea(self)  # type: ignore
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setHorizontalScrollBarPolicy(
+        self.layout = qtw.QVBoxLayout(self)  # type: ignore
+
+        if stack.is_empty():
+            self.layout.addWidget(qtw.QLabel("Empty"))
+            return
+        if stack.size() > 10:
+            self.setFixedHeight(300)
+
+        self.model = StackModel(stack, self)
+        self.view = qtw.QTableView(self)
+        self.view.setModel(self.model)
+        self.view.setShowGrid(False)
+        self.view.setSelectionBehavior(qtw.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setSelectionMode(qtw.QAbstractItemView.SelectionMode.SingleSelection)
+        self.view.setHorizontalScrollBarPolicy(
             qtc.Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
-        self.scroll_content = qtw.QWidget(self.scroll)
-        self.scroll.setWidget(self.scroll_content)
+        rows = self.view.verticalHeader()
+        rows.hide()
+        rows.setSectionResizeMode(qtw.QHeaderView.ResizeMode.Fixed)
+        rows.setDefaultSectionSize(self.view.fontMetrics().height() + 4)
+        columns = self.view.horizontalHeader()
+        columns.hide()
+        columns.setStretchLastSection(True)
+        self.view.setColumnWidth(
+            0, self.view.fontMetrics().horizontalAdvance(f"{stack.size()}: ") + 8
+        )
+        self.layout.addWidget(self.view)
+
+        self.jump = qtw.QSpinBox(self)
+        self.jump.setRange(1, stack.size())
+        self.jump.setPrefix("Go to: ")
+        self.jump.setKeyboardTracking(False)
+        self.jump.valueChanged.connect(self.jump_to)
+        self.layout.addWidget(self.jump)
+
+        self.search = qtw.QLineEdit(self)
+        self.search.setPlaceholderText("Search")
+        self.search.returnPressed.connect(self.search_next)
+        self.layout.addWidget(self.search)
+
+    def jump_to(self, position):
+        """Select and show the entry at 'position' (1 is the bottom)"""
+        index = self.model.index(position - 1, 1)
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, qtw.QAbstractItemView.ScrollHint.PositionAtCenter)
+
+    def search_next(self):
+        """Jump to the next entry containing the search text"""
+        text = self.search.text().strip()
+        if not text:
+            return
+        row = self.model.find(text, self.view.currentIndex().row() + 1)
+        if row >= 0:
+            self.jump_to(row + 1)
+
+
+class SummaryDialog(qtw.QDialog):
+    """Window with the aggregates of every stack entry and the results of the
+    statistics registers (F4), kept up to date while it is open, as the
+    numbers are typed
 
-        self.layout = qtw.QVBoxLayout(self)  # type: ignore
-        self.layout.addWidget(self.scroll)
+    Args:
+        parent: Qt Widget who is the parent of the dialog
+    """
 
-        self.scroll_layout = qtw.QVBoxLayout(self.scroll_content)  # type: ignore
+    LABELS = {"sum": "Sum", "mean": "Mean", "std": "Std dev", "min": "Min", "max": "Max", "prod": "Product"}
+    STATISTICS_LABELS = {
+        "n": "Σ+ pairs",
+        "mean_x": "Mean x",
+        "mean_y": "Mean y",
+        "std_x": "Std dev x",
+        "std_y": "Std dev y",
+        "slope": "Slope",
+        "intercept": "Intercept",
+        "r": "Correlation",
+    }
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setWindowTitle("SUMMARY")
+        self.setWindowIcon(load_icon("stack.svg"))
+        self.setFixedWidth(260)
+        self.setStyleSheet("color: white")
+        layout = qtw.QFormLayout(self)
+        self.values = {}
+        self.statistics = {}
+        for labels, values in ((self.LABELS, self.values), (self.STATISTICS_LABELS, self.statistics)):
+            for name, label in labels.items():
+                values[name] = qtw.QLabel(self)
+                values[name].setTextInteractionFlags(qtc.Qt.TextInteractionFlag.TextSelectableByMouse)
+                layout.addRow(label, values[name])
+
+    def show_summary(self, stack, statistics):
+        """Show the aggregates of a NumericStack and the results of
+        StatisticsRegisters, in O(1) after a key
+        """
+        for name, value in stack.aggregates().items():
+            self.values[name].setText("--" if value is None else stack.format_value(value))
+        for name, value in statistics.results().items():
+            self.statistics[name].setText("--" if value is None else stack.format_value(value))
 
-        if stack.is_eempty():
-            self.scroll_layout.addWidget(qtw.QLabel("Empty"))
-        else:
-            if stack.size() > 10:
-                self.setFixedHeight(250)
-            for idx, number in enumerate(stack.items(), 1):
-                self.scroll_layout.addWidget(
-                    qtw.QLabel(f'<font color="#8AF">{idx}:</font> {number}')
-                )
 
+class MetricsDialog(qtw.QDialog):
+    """Debug panel with the call counts and latencies of the engine keys
+    (Ctrl+Shift+D, not shown anywhere else), refreshed while it is open
+
+    Args:
+        parent: Qt Widget who is the parent of the dialog
+        metrics: EngineMetrics attached to the engine, see rpn_metrics
+    """
+
+    COLUMNS = ("Entry", "Operation", "Calls", "Mean µs", "p50 µs", "p99 µs")
+    REFRESH_MS = 500
 
-class PyRpnWindow(qtw.QMainWindow):
+    def __init__(self, parent, metrics):
+        super().__init__(parent)
+        self.setWindowTitle("METRICS")
+        self.setWindowIcon(load_icon("stack.svg"))
+        self.setStyleSheet("color: white")
+        self.resize(560, 320)
+        self.metrics = metrics
+        layout = qtw.QVBoxLayout(self)
+        self.table = qtw.QTableWidget(0, len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(qtw.QAbstractItemView.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table)
+        buttons = qtw.QHBoxLayout()
+        for text, slot in (("Reset", self.reset), ("Save...", self.save)):
+            button = qtw.QPushButton(text, self)
+            button.clicked.connect(slot)
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+        self._timer = qtc.QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        """Show the current counters, the most called first"""
+        histograms = sorted(self.metrics.histograms.items(), key=lambda item: (-item[1].count, item[0]))
+        self.table.setRowCount(len(histograms))
+        for row, ((entry, operation), histogram) in enumerate(histograms):
+            texts = (
+                entry,
+                operation,
+                str(histogram.count),
+                f"{histogram.total / histogram.count * 1e6:.1f}",
+                f"{histogram.quantile(0.5) * 1e6:g}",
+                f"{histogram.quantile(0.99) * 1e6:g}",
+            )
+            for column, text in enumerate(texts):
+                self.table.setItem(row, column, qtw.QTableWidgetItem(text))
+
+    def reset(self):
+        self.metrics.reset()
+        self.refresh()
+
+    def save(self, path=None):
+        """Write the counters to a file (see EngineMetrics.dump), asking for
+        it if 'path' is None
+        """
+        if not path:
+            path, _ = qtw.QFileDialog.getSaveFileName(
+                self, "Save metrics", "metrics.json", "JSON (*.json);;Prometheus text (*.prom)"
+            )
+            if not path:
+                return
+        try:
+            self.metrics.dump(path)
+        except OSError as exc:
+            qtw.QMessageBox.warning(self, "PyRPN", str(exc))
+
+
+class PyRpnWindow(qtw.QMainWindow, Ui_main_window):
     """PyRPN's view class -  main window (GUI)
 
     description:
-        Loads a UI file
+        Builds the UI compiled from ui/calculator.ui (see build_resources.py)
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        uic.loadUi(os.path.join(basedir, "./ui/calculator.ui"), self)  # type: ignore
-        self.setWindowIcon(qtg.QIcon(os.path.join(basedir, "./icons/calc.svg")))
+        load_resources()
+        with startup_profile.phase("PyRpnWindow.setupUi"):
+            self.setupUi(self)
+        self.setWindowIcon(load_icon("calc.svg"))
 
     key_signal = qtc.pyqtSignal(int)
 
@@ -135,49 +389,117 @@ class PyRpnWindow(qtw.QMainWindow):
         self.key_signal.emit(event.key())
 
 
-class PyRpnEvaluate:
+class PyRpnEvaluate(RpnObserver):
     """PyRPN's model class
 
+    description:
+        Wraps an RpnEngine and draws what it reports in the view widgets.
+        Display updates are coalesced: the latest one is drawn once per event
+        loop iteration, and a label is only set when its text changed.
+
     args:
         view: View object -> PyRpnWindow
+        precision (int): significant digits of the results, see
+            RpnEngine.precision
+        stack_file (str): file the stack is kept in between sessions (see
+            rpn_storage), None to start from an empty stack
+        number_format: NumberFormat or locale name of the numbers, see
+            rpn_locale
     """
 
-    def __init__(self, view):
+    def __init__(self, view, precision=12, stack_file=None, number_format="pt-BR"):
         self._view = view
-        self._stack = Stack()
-        self._stack.push("0")
-        self._after_enter = True
-        self._new_x = False
-        self._shift = False
-        self._angle_mesurement = "DEG"
-        self.update_display()
-
-    def update_display(self):
-        """Draws stack and other information in the display area"""
-
-        print("update ->", self._stack)
-        self._view.x_display.setText(self._stack.peek_x())
-        if self._stack.peek_y():
-            self._view.y_display.setText(self._stack.peek_y())
+        self._shown = {}  # label -> text it shows
+        self._pending = None  # display update waiting to be drawn
+        self._macro = None  # last recorded Macro
+        self._summary = None  # SummaryDialog, once opened
+        self._metrics = None  # EngineMetrics, once enabled
+        self._metrics_panel = None  # MetricsDialog, once opened
+        self._display_timer = qtc.QTimer()
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(0)
+        self._display_timer.timeout.connect(self.flush_display)
+        number_format = get_number_format(number_format)
+        if stack_file is None:
+            stack = NumericStack(number_format=number_format)
         else:
-            self._view.y_display.setText("")
-        if self._stack.peek_z():
-            self._view.z_display.setText(self._stack.peek_z())
+            stack = open_stack(stack_file, number_format)
+        self._engine = RpnEngine(precision=precision, stack=stack, undo_memory=UNDO_MEMORY)
+        self._view.btn_decimal.setText(number_format.decimal_point)
+        self._engine.observer = self
+        self.flush_display()
+
+    @property
+    def engine(self):
+        return self._engine
+
+    @property
+    def _stack(self):
+        return self._engine.stack
+
+    @property
+    def _shift(self):
+        return self._engine.shift
+
+    @_shift.setter
+    def _shift(self, shift):
+        self._engine.shift = shift
+
+    def _set_text(self, label, text):
+        """Set the text of a label, only if it changed"""
+        if self._shown.get(label) != text:
+            self._shown[label] = text
+            label.setText(text)
+
+    def display_changed(self, x, y, z, angle, size):
+        """Keeps the update and draws it when control returns to the event loop"""
+        self._pending = (x, y, z, angle, size)
+        if not self._display_timer.isActive():
+            self._display_timer.start()
+
+    def flush_display(self):
+        """Draws the pending stack and other information in the display area"""
+        if self._pending is None:
+            return
+        start = perf_counter() if self._metrics is not None else None
+        x, y, z, angle, size = self._pending
+        self._pending = None
+        self._display_timer.stop()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("update -> size=%d x=%r y=%r z=%r %s", size, x, y, z, angle)
+        self._set_text(self._view.x_display, x)
+        self._set_text(self._view.y_display, y)
+        self._set_text(self._view.z_display, z)
+        self._set_text(self._view.angle_label, angle)
+        self._set_text(self._view.stack_label, f"STACK: {size}")
+        if self._summary is not None and self._summary.isVisible():
+            self._summary.show_summary(self._stack, self._engine.statistics)
+        if start is not None:  # the redraw, update_display only queues it
+            self._metrics.record("flush_display", "", perf_counter() - start)
+
+    def shift_changed(self, shift):
+        self._set_text(self._view.shift_label, " ".join(self._modes()))
+
+    def map_changed(self, map_mode):
+        self._set_text(self._view.shift_label, " ".join(self._modes()))
+
+    def _modes(self):
+        if self._engine.shift:
+            yield "SHIFT"
+        if self._engine.map_mode:
+            yield "MAP"
+
+    def show_message(self, register, text):
+        # drawn right away, after any pending update it must replace
+        self.flush_display()
+        if register == "x":
+            self._set_text(self._view.x_display, text)
         else:
-            self._view.z_display.setText("")
-        self._view.angle_label.setText(self._angle_mesurement)
-        self._view.stack_label.setText(f"STACK: {self._stack.size()}")
+            self._set_text(self._view.y_display, text)
 
-    def no_arg(self, arg):
-        """Shows '--' if the stack is empty for a given argument
-
-        Args:
-            arg (str): x or y
-        """
-        if arg == "x":
-            self._view.x_display.setText("--")
-        else:
-            self._view.y_display.setText("--")
+    def show_stack(self, stack):
+        stack_modal = StackModal(parent=self._view, stack=stack)
+        stack_modal.exec()
 
     def key_pressed(self, key):
         """Capture aditional keys used in the calculator not directly associated with the buttons
@@ -187,385 +509,147 @@ class PyRpnEvaluate:
         """
         match key:
             case qtc.Qt.Key.Key_Period:
-                self.btn_number(",")
+                self._engine.btn_number(",")
             case qtc.Qt.Key.Key_Return:
-                self.btn_enter()
+                self._engine.btn_enter()
             case qtc.Qt.Key.Key_Shift:
-                self.btn_shift()
+                self._engine.btn_shift()
+            case qtc.Qt.Key.Key_F2:
+                self.btn_record()
+            case qtc.Qt.Key.Key_F3:
+                self.btn_replay()
+            case qtc.Qt.Key.Key_F4:
+                self.btn_summary()
+            case qtc.Qt.Key.Key_F5:
+                self._engine.btn_sigma()
+
+    def update_display(self):
+        self._engine.update_display()
 
     def btn_number(self, key):
-        """Function for all numbers and decimal point(comma) buttons
-            Insert a digit in the stack last entrie
+        self._engine.btn_number(key)
 
-        Args:
-            key (str): one of these caracters -> '0123456789,.'
-        """
-        if self._new_x:
-            self._stack.push("")
-            self.update_display()
-            self._new_x = False
-            self._after_enter = True
-        x_value = self._stack.peek_x()
-        if not x_value or self._after_enter:
-            if key in "0123456789,":
-                self._add_digit(key)
-        elif len(x_value.replace(".", "").replace(",", "")) < 12:
-            self._add_digit(key)
-
-    def _add_digit(self, key):
-        """Function to enter a new digit to the number in the stack last entrie
+    def btn_operation_one_arg(self, operation):
+        self._engine.btn_operation_one_arg(operation)
 
-        Args:
-            key (str): one of these caracters -> '0123456789,'
-        """
-        if not self._stack.peek_x() or self._after_enter:
-            if self._after_enter:
-                self._stack.pop()
-                self._after_enter = False
-            if key == ",":
-                self._stack.push("0,")
-            else:
-                self._stack.push(key)
-        else:
-            x_value = self._stack.pop()
-            if key in "0123456789":
-                if "," in x_value:  # type: ignore
-                    x_value += key
-                else:
-                    x_value = x_value.replace(".", "") + key  # type: ignore
-                    for i in range(len(x_value)):
-                        if i != 0 and not i % 3:
-                            x_value = (
-                                x_value[: -i - (i // 3 - 1)]
-                                + "."
-                                + x_value[-i - (i // 3 - 1):]
-                            )
-                x_value = self.format_number(x_value)
-            elif key == "," and "," not in x_value:  # type: ignore
-                x_value += key
-            self._stack.push(x_value)
-
-        self.update_display()
-
-    def convert_to_radian(self, angle):
-        """Convert an angle from Degrees or Gradians to Radians
+    def btn_operation_two_arg(self, operation):
+        self._engine.btn_operation_two_arg(operation)
 
-        Args:
-            angle (float): angle in degree or gradian
+    def btn_drop(self):
+        self._engine.btn_drop()
 
-        Returns:
-            float: angle in radian
-        """
-        if self._angle_mesurement == "DEG":
-            angle = math.radians(angle)
-        elif self._angle_mesurement == "GRAD":
-            angle = angle * 360 / 400
-            angle = math.radians(angle)
-        return angle
+    def btn_swap(self):
+        self._engine.btn_swap()
 
-    def convert_from_radian(self, angle):
-        """Convert an angle from Radians to Degrees or Gradians
+    def btn_enter(self):
+        self._engine.btn_enter()
 
-        Args:
-            angle (float): angle in radian
+    def btn_back(self):
+        self._engine.btn_back()
 
-        Returns:
-            float: angle in degree or gradian
-        """
-        if self._angle_mesurement == "DEG":
-            angle = math.degrees(angle)
-        elif self._angle_mesurement == "GRAD":
-            angle = math.degrees(angle)
-            angle = angle * 400 / 360
-        return angle
+    def btn_shift(self):
+        self._engine.btn_shift()
 
-    def btn_operation_one_arg(self, operation):
-        """Function to connect all one argument buttons
+    def btn_pi(self):
+        self._engine.btn_pi()
 
-        Args:
-            operation (str): one arg button label -> +/-, 1/x, sqrt, sin, cos, tan, log, ln
-        """
-        result = 0
-        x_value = ""
-        if self._stack.peek_x():
-            x_value = self._stack.pop()
-            _error = False
-            try:
-                match operation:
-                    case "+/-":
-                        result = locale.atof(x_value) * -1.0
-                    case "1/x":
-                        if self._shift:
-                            result = math.factorial(locale.atoi(x_value))
-                            self.btn_shift()
-                        else:
-                            result = 1 / locale.atof(x_value)
-                    case "sqrt":
-                        if self._shift:
-                            result = locale.atof(x_value) ** 2.0
-                            self.btn_shift()
-                        else:
-                            result = locale.atof(x_value) ** 0.5
-                    case "sin":
-                        if self._shift:
-                            result = math.asin(locale.atof(x_value))
-                            result = self.convert_from_radian(result)
-                            self.btn_shift()
-                        else:
-                            angle = self.convert_to_radian(locale.atof(x_value))
-                            result = math.sin(angle)
-                    case "cos":
-                        if self._shift:
-                            result = math.acos(locale.atof(x_value))
-                            result = self.convert_from_radian(result)
-                            self.btn_shift()
-                        else:
-                            angle = self.convert_to_radian(locale.atof(x_value))
-                            result = math.cos(angle)
-                    case "tan":
-                        if self._shift:
-                            result = math.atan(locale.atof(x_value))
-                            result = self.convert_from_radian(result)
-                            self.btn_shift()
-                        else:
-                            angle = self.convert_to_radian(locale.atof(x_value))
-                            if angle % (math.pi / 2) != 0:
-                                result = math.tan(angle)
-                            else:
-                                _error = True
-                    case "log":
-                        if self._shift:
-                            result = 10 ** locale.atof(x_value)
-                            self.btn_shift()
-                        else:
-                            result = math.log10(locale.atof(x_value))
-                    case "ln":
-                        if self._shift:
-                            result = math.e ** locale.atof(x_value)
-                            self.btn_shift()
-                        else:
-                            result = math.log(locale.atof(x_value))
-                    case _:
-                        _error = True
-            except Exception:
-                _error = True
-            if not _error:
-                if result > 999999999999.0:
-                    result = locale.format_string("%.8e", result, grouping=True)
-                else:
-                    result = locale.format_string("%.12g", result, grouping=True)
-                self._stack.push(result)
-                self._new_x = True
-                self.update_display()
-            else:
-                self._new_x = True
-                self.error()
-        else:
-            self.no_arg("x")
+    def btn_e(self):
+        self._engine.btn_e()
 
-    def btn_operation_two_arg(self, operation):
-        """Function to connect all two argumnts buttons
+    def btn_drg(self):
+        self._engine.btn_drg()
 
-        Args:
-            operation (str): two args button label -> +, -, *, /, %, y^x, mod
-        """
-        _error = False
-        result = 0
-        x_value = ""
-        y_value = ""
-        if not self._stack.peek_x():
-            self.no_arg("x")
-        elif self._stack.peek_y():
-            x_value = self._stack.pop()
-            y_value = self._stack.pop()
-            try:
-                match operation:
-                    case "+":
-                        result = locale.atof(y_value) + locale.atof(x_value)
-                    case "-":
-                        result = locale.atof(y_value) - locale.atof(x_value)
-                    case "*":
-                        result = locale.atof(y_value) * locale.atof(x_value)
-                    case "/":
-                        result = locale.atof(y_value) / locale.atof(x_value)
-                    case "%":
-                        result = locale.atof(y_value) * (locale.atof(x_value) / 100)
-                    case "y^x":
-                        if self._shift:
-                            result = locale.atof(y_value) ** (
-                                1.0 / locale.atof(x_value)
-                            )
-                            self.btn_shift()
-                        else:
-                            result = locale.atof(y_value) ** locale.atof(x_value)
-                    case "mod":
-                        result = locale.atof(y_value) % locale.atof(x_value)
-                    case _:
-                        _error = True
-            except Exception:
-                _error = True
-            if not _error:
-                if result > 999999999999:
-                    result = locale.format_string("%.8e", result, grouping=True)
-                else:
-                    result = locale.format_string("%.12g", result, grouping=True)
-                self._stack.push(result)
-                self.update_display()
-            else:
-                self._view.y_display.setText("")
-                self.error()
-        else:
-            self.no_arg("y")
-        self._new_x = True
+    def btn_undo(self):
+        self._engine.btn_undo()
 
-    def btn_drop(self):
-        """Function to connect the DROP button
-        Remove the last entrie from the stack
-        """
-        if self._shift:
-            self._stack.cls()
-            self.btn_shift()
+    def btn_record(self):
+        """Start recording a macro of keys, or stop and keep it (F2)"""
+        if self._engine.recording:
+            self._macro = self._engine.stop_recording()
+            self._view.setWindowTitle(self._title)
         else:
-            self._stack.pop()
-        if self._stack.is_empty():
-            self._stack.push("0")
-        self._new_x = False
-        self.update_display()
+            self._title = self._view.windowTitle()
+            self._engine.start_recording()
+            self._view.setWindowTitle(f"{self._title} - REC")
 
-    def btn_swap(self):
-        """Function to connect the SWAP button
-        Invert the position of the two last entries in the stack
+    def btn_replay(self, times=None):
+        """Replay the recorded macro (F3), asking how many times if 'times' is
+        None. Only the final state is drawn.
         """
-        if self._shift:
-            stack_modal = StackModal(parent=self._view, stack=self._stack)
-            stack_modal.exec()
-            self.btn_shift()
+        if self._macro is None or self._engine.recording:
+            return
+        if times is None:
+            times, accepted = qtw.QInputDialog.getInt(self._view, "Replay macro", "Times:", 1, 1, MAX_REPLAY)
+            if not accepted:
+                return
+        if not self._engine.replay(self._macro, times):
+            self._engine.error()
+
+    def btn_redo(self):
+        self._engine.btn_redo()
+
+    def btn_summary(self):
+        """Show or hide the summary of the stack (F4)"""
+        if self._summary is None:
+            self._summary = SummaryDialog(self._view)
+        if self._summary.isVisible():
+            self._summary.hide()
         else:
-            if self._stack.peek_y():
-                self._stack.swap()
-                self.update_display()
-            else:
-                self.no_arg("y")
-            self._new_x = True
+            self._summary.show_summary(self._stack, self._engine.statistics)
+            self._summary.show()
 
-    def btn_enter(self):
-        """Function to connect the ENTER buttton
-        Enter a number to the stack, duplicates it and waits for a new number
-        """
-        self._stack.push(self._stack.peek_x())
-        self.update_display()
-        self._after_enter = True
+    def enable_metrics(self):
+        """Start counting the calls of the engine keys, see rpn_metrics
 
-    def btn_back(self):
-        """Function to connect the BACKSPACE button
-        Remove the last caracter from the last entrie in the stack
+        Returns:
+            EngineMetrics: the counters
         """
-        if self._stack.peek_x():
-            x_value = self._stack.pop()[:-1]
-            if x_value == "":
-                self._stack.push("0")
-            elif x_value:
-                if x_value.endswith((".", ",")):
-                    x_value = x_value[:-1]
-                x_value = self.format_number(x_value)
-                self._stack.push(x_value)
-            self.update_display()
+        if self._metrics is None:
+            from rpn_metrics import EngineMetrics
 
-    def btn_shift(self):
-        """Function to connect the SHIFT button
-        Toggle (on/off) the shift button
+            self._metrics = EngineMetrics()
+            self._metrics.attach(self._engine)
+        return self._metrics
+
+    def btn_metrics(self):
+        """Show or hide the debug panel of the key latencies (Ctrl+Shift+D),
+        the keys are only timed from its first opening or with --metrics
         """
-        self._shift = False if self._shift else True
-        if self._shift:
-            self._view.shift_label.setText("SHIFT")
+        if self._metrics_panel is None:
+            self._metrics_panel = MetricsDialog(self._view, self.enable_metrics())
+        if self._metrics_panel.isVisible():
+            self._metrics_panel.hide()
         else:
-            self._view.shift_label.setText("")
+            self._metrics_panel.show()
 
-    def btn_pi(self):
-        """Function to connect the PI button
-        Insert the pi number in the stack
-        """
-        number = round(math.pi, 12)
-        self._stack.push(locale.format_string("%.12g", number, grouping=True))
-        self._new_x = True
-        self.update_display()
+    def btn_paste(self):
+        """Push the numbers copied to the clipboard (Ctrl+V)"""
+        self._push_numbers(self._engine.paste, qtw.QApplication.clipboard().text())
 
-    def btn_e(self):
-        """Function to connect the E button
-        Insert the e number in the stack
+    def btn_paste_array(self):
+        """Push the table of numbers copied to the clipboard as a matrix, or
+        a vector (Ctrl+Shift+V)
         """
-        number = round(math.e, 12)
-        self._stack.push(locale.format_string("%.12g", number, grouping=True))
-        self._new_x = True
-        self.update_display()
+        self._push_numbers(self._engine.paste_array, qtw.QApplication.clipboard().text())
 
-    def btn_drg(self):
-        """Function to connect the DRG button
-        Change or convert degrees units (DEG/GRAD/RAD)
-        """
-        if self._shift:
-            x_value = self._stack.pop()
-        else:
-            x_value = None
-        match self._angle_mesurement:
-            case "DEG":
-                self._angle_mesurement = "RAD"
-                if x_value:
-                    self.btn_shift()
-                    self._stack.push(
-                        locale.format_string(
-                            "%.12g", math.radians(locale.atof(x_value)), grouping=True
-                        )
-                    )
-            case "RAD":
-                self._angle_mesurement = "GRAD"
-                if x_value:
-                    self.btn_shift()
-                    self._stack.push(
-                        locale.format_string(
-                            "%.12g",
-                            math.degrees(locale.atof(x_value) * 400 / 360),
-                            grouping=True,
-                        )
-                    )
-            case _:
-                self._angle_mesurement = "DEG"
-                if x_value:
-                    self.btn_shift()
-                    self._stack.push(
-                        locale.format_string(
-                            "%.12g", locale.atof(x_value) * 360 / 400, grouping=True
-                        )
-                    )
-        self.update_display()
-
-    def error(self):
-        """Show 'ERROR' in the display"""
-        self._view.x_display.setText("ERROR")
-
-    def format_number(self, number):
-        """Format a number string according to locale settings with proper grouping.
-        
-        This function takes a number string and formats it using locale-specific
-        formatting rules. It handles special cases like zero with decimal places
-        and applies grouping separators for better readability.
-        
-        Args:
-            number (str): A string representation of a number that may contain
-                        locale-specific decimal separators (like comma) and
-                        grouping separators (like dots).
-        
-        Returns:
-            str: A formatted number string with proper locale-specific grouping
-                and decimal formatting. Returns the original string unchanged
-                if it matches the pattern for zero with trailing decimal zeros.
+    def btn_import(self, path=None):
+        """Push the numbers of a CSV or TXT file (Ctrl+O), asking for it if
+        'path' is None
         """
-        if re.match(r"^-?0,0+$", number):
-            return number
-        number = locale.atof(number)
-        number = locale.format_string("%.12g", number, grouping=True)
-    
-        return number
+        if path is None:
+            path, _ = qtw.QFileDialog.getOpenFileName(
+                self._view, "Import numbers", "", "Numbers (*.csv *.txt);;All files (*)"
+            )
+            if not path:
+                return
+        self._push_numbers(self._engine.import_numbers, path)
+
+    def _push_numbers(self, key, source):
+        try:
+            key(source)
+        except (OSError, ValueError) as exc:
+            self._engine.error()
+            qtw.QMessageBox.warning(self._view, "PyRPN", str(exc))
 
 
 class PyRpn:
@@ -586,6 +670,31 @@ class PyRpn:
         self._view.key_signal.connect(
             self._model.key_pressed
         )  # using personalized signal key_signal
+        self._undo_shortcut = qtg.QShortcut(qtg.QKeySequence.StandardKey.Undo, self._view)
+        self._undo_shortcut.activated.connect(self._model.btn_undo)
+        self._redo_shortcut = qtg.QShortcut(qtg.QKeySequence.StandardKey.Redo, self._view)
+        self._redo_shortcut.activated.connect(self._model.btn_redo)
+        self._paste_shortcut = qtg.QShortcut(qtg.QKeySequence.StandardKey.Paste, self._view)
+        self._paste_shortcut.activated.connect(self._model.btn_paste)
+        self._paste_array_shortcut = qtg.QShortcut(qtg.QKeySequence("Ctrl+Shift+V"), self._view)
+        self._paste_array_shortcut.activated.connect(self._model.btn_paste_array)
+        self._metrics_shortcut = qtg.QShortcut(qtg.QKeySequence("Ctrl+Shift+D"), self._view)
+        self._metrics_shortcut.activated.connect(self._model.btn_metrics)
+        # keys without a button, behind Alt so a stray letter does nothing
+        self._alt_shortcuts = {}
+        for sequence, key in (
+            ("Alt+A", self._model._engine.btn_map),
+            ("Alt+V", self._model._engine.btn_to_array),
+            ("Alt+X", self._model._engine.btn_from_array),
+            ("Alt+T", partial(self._model.btn_operation_one_arg, "trn")),
+            ("Alt+I", partial(self._model.btn_operation_one_arg, "inv")),
+            ("Alt+D", partial(self._model.btn_operation_one_arg, "det")),
+            ("Alt+M", partial(self._model.btn_operation_two_arg, "matmul")),
+        ):
+            self._alt_shortcuts[sequence] = qtg.QShortcut(qtg.QKeySequence(sequence), self._view)
+            self._alt_shortcuts[sequence].activated.connect(key)
+        self._import_shortcut = qtg.QShortcut(qtg.QKeySequence.StandardKey.Open, self._view)
+        self._import_shortcut.activated.connect(partial(self._model.btn_import, None))
 
         # Numbers buttons
         self._view.btn_zero.clicked.connect(partial(self._model.btn_number, "0"))
@@ -610,62 +719,91 @@ class PyRpn:
         self._view.btn_e.clicked.connect(self._model.btn_e)
         self._view.btn_drg.clicked.connect(self._model.btn_drg)
 
-        # Two args operation buttons
-        self._view.btn_add.clicked.connect(
-            partial(self._model.btn_operation_two_arg, "+")
-        )
-        self._view.btn_minus.clicked.connect(
-            partial(self._model.btn_operation_two_arg, "-")
-        )
-        self._view.btn_multiply.clicked.connect(
-            partial(self._model.btn_operation_two_arg, "*")
-        )
-        self._view.btn_divide.clicked.connect(
-            partial(self._model.btn_operation_two_arg, "/")
-        )
-        self._view.btn_percent.clicked.connect(
-            partial(self._model.btn_operation_two_arg, "%")
-        )
-        self._view.btn_y_exp_x.clicked.connect(
-            partial(self._model.btn_operation_two_arg, "y^x")
-        )
-        self._view.btn_mod.clicked.connect(
-            partial(self._model.btn_operation_two_arg, "mod")
-        )
+        # Operation buttons, from the operation registry
+        slots = {1: self._model.btn_operation_one_arg, 2: self._model.btn_operation_two_arg}
+        for operation in OPERATIONS.values():
+            button = getattr(self._view, operation.button, None) if operation.button else None
+            if button is not None:
+                button.clicked.connect(partial(slots[operation.arity], operation.name))
 
-        # One arg operation buttons
-        self._view.btn_change_sign.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "+/-")
-        )
-        self._view.btn_x_inv.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "1/x")
-        )
-        self._view.btn_sqrt.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "sqrt")
-        )
-        self._view.btn_sin.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "sin")
-        )
-        self._view.btn_cos.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "cos")
-        )
-        self._view.btn_tan.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "tan")
-        )
-        self._view.btn_log.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "log")
-        )
-        self._view.btn_ln.clicked.connect(
-            partial(self._model.btn_operation_one_arg, "ln")
-        )
+
+class FirstPaintProfiler(qtc.QObject):
+    """Event filter that ends a --profile-startup run on the window's first paint
+
+    Args:
+        app: the QApplication, quit once the timeline is written
+    """
+
+    def __init__(self, app):
+        super().__init__()
+        self._app = app
+
+    def eventFilter(self, obj, event):
+        if event.type() == qtc.QEvent.Type.Paint and startup_profile.enabled:
+            startup_profile.mark("first paint")
+            startup_profile.enabled = False
+            startup_profile.dump()
+            qtc.QTimer.singleShot(0, self._app.quit)
+        return False
 
 
 def main():
-    """PyRPN's main function"""
-    pyrpn_app = qtw.QApplication([])
-    pyrpn_window = PyRpnWindow()
-    pyrpn_window.show()
-    PyRpn(pyrpn_window, PyRpnEvaluate(pyrpn_window))
+    """PyRPN's main function
+
+    Options:
+        --trace: log every display update to stderr
+        --profile-startup[=FILE]: see rpn_profile
+        --precision=DIGITS: significant digits of the results (default 12),
+            decimal arithmetic above 15
+        --stack=FILE: file the stack is kept in between sessions, by default
+            stack.bin in the application data folder
+        --locale=NAME: separators of the numbers, pt-BR (default), en-US...
+            (see rpn_locale.NUMBER_FORMATS)
+        --metrics[=FILE]: time every key and write the counters when the
+            calculator exits, see rpn_metrics
+    """
+    if "--trace" in sys.argv[1:]:
+        enable_trace()
+    precision = 12
+    stack_file = None
+    number_format = "pt-BR"
+    metrics_file = False  # None for stderr
+    for arg in sys.argv[1:]:
+        if arg.startswith("--precision="):
+            precision = int(arg.split("=", 1)[1])
+        elif arg.startswith("--stack="):
+            stack_file = arg.split("=", 1)[1]
+        elif arg == "--metrics":
+            metrics_file = None
+        elif arg.startswith("--metrics="):
+            metrics_file = arg.split("=", 1)[1]
+        elif arg.startswith("--locale="):
+            number_format = arg.split("=", 1)[1]
+            if number_format not in NUMBER_FORMATS:
+                sys.exit(f"rpn: unknown locale {number_format!r}, one of {', '.join(NUMBER_FORMATS)}")
+    with startup_profile.phase("QApplication"):
+        pyrpn_app = qtw.QApplication([])
+        pyrpn_app.setApplicationName("PyRPN")
+    if stack_file is None:
+        data_dir = qtc.QStandardPaths.writableLocation(
+            qtc.QStandardPaths.StandardLocation.AppDataLocation
+        )
+        os.makedirs(data_dir, exist_ok=True)
+        stack_file = os.path.join(data_dir, "stack.bin")
+    with startup_profile.phase("PyRpnWindow"):
+        pyrpn_window = PyRpnWindow()
+    if startup_profile.enabled:
+        first_paint = FirstPaintProfiler(pyrpn_app)
+        pyrpn_window.installEventFilter(first_paint)
+    with startup_profile.phase("PyRpnWindow.show"):
+        pyrpn_window.show()
+    with startup_profile.phase("PyRpnEvaluate (first update_display)"):
+        pyrpn_model = PyRpnEvaluate(pyrpn_window, precision, stack_file, number_format)
+    pyrpn_app.aboutToQuit.connect(pyrpn_model.engine.stack.flush)
+    if metrics_file is not False:
+        pyrpn_app.aboutToQuit.connect(partial(pyrpn_model.enable_metrics().dump, metrics_file))
+    with startup_profile.phase("PyRpn._connectSignalsAndSlots"):
+        PyRpn(pyrpn_window, pyrpn_model)
     sys.exit(pyrpn_app.exec())
 
 
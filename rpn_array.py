@@ -0,0 +1,134 @@
+"""
+Vector and matrix stack entries of PyRPN, as NumPy arrays.
+
+A stack entry can be a 1-D (vector) or 2-D (matrix) float array. The keys
+work on them as on numbers: the one argument operations element by element,
+in the angle mode, and the two arguments ones element by element with NumPy
+broadcasting (a number with an array, a vector with each row of a matrix...),
+through the vectorized implementations of rpn_vector. If the calculator would
+show ERROR for any element, the result is ERROR.
+
+The matrix operations trn (transpose), inv (inverse), det (determinant) and
+matmul (Y @ X) are an operation pack (see rpn_operations), so NumPy is only
+imported when they or an array are used. On numbers they work as on 1x1
+matrices.
+
+Arrays are shown in a compact form, never with all their elements: '[1 2 3]'
+up to MAX_SHOWN elements, 'vector(1000)' or 'matrix(3×3)' above.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import operator
+
+import numpy as np
+
+from rpn_operations import Operation
+from rpn_vector import one_arg_operation, two_arg_operation
+
+MAX_SHOWN = 4  # elements of the arrays shown
+
+
+def is_array(value) -> bool:
+    """True for a vector or matrix stack entry"""
+    return type(value) is np.ndarray
+
+
+def make_array(values, shape=None):
+    """Float vector or matrix of numbers (or of rows of numbers)
+
+    Raises:
+        ValueError: if the values do not make a vector or a matrix
+    """
+    try:
+        array = np.array(values, dtype=float)
+        if shape is not None:
+            array = array.reshape(shape)
+    except (TypeError, ValueError):
+        raise ValueError("not a vector or a matrix of numbers") from None
+    if array.ndim not in (1, 2):
+        raise ValueError("not a vector or a matrix of numbers")
+    return array
+
+
+def format_array(value, formatter) -> str:
+    """Compact display text of an array
+
+    Args:
+        value (ndarray): vector or matrix
+        formatter: function that turns a float into its display text
+    """
+    if value.size <= MAX_SHOWN:
+        if value.ndim == 1:
+            return "[" + " ".join(formatter(element) for element in value.tolist()) + "]"
+        rows = ("[" + " ".join(formatter(element) for element in row) + "]" for row in value.tolist())
+        return "[" + " ".join(rows) + "]"
+    if value.ndim == 1:
+        return f"vector({value.shape[0]})"
+    return f"matrix({value.shape[0]}×{value.shape[1]})"
+
+
+def _matmul(y_value, x_value):
+    if np.ndim(y_value) == 0 or np.ndim(x_value) == 0:
+        return y_value * x_value
+    return y_value @ x_value
+
+
+# operation name -> function of whole arrays (and numbers)
+MATRIX_FUNCTIONS = {
+    "trn": np.transpose,
+    "inv": lambda x_value: 1 / x_value if np.ndim(x_value) == 0 else np.linalg.inv(x_value),
+    "det": lambda x_value: x_value if np.ndim(x_value) == 0 else np.linalg.det(x_value),
+    "matmul": _matmul,
+}
+
+
+def array_operation(operation, args, mode="DEG"):
+    """Result of an operation of rpn_operations with array arguments
+
+    Args:
+        operation (Operation): the operation
+        args: its arguments, numbers or arrays (Y before X)
+        mode (str): angle mode, DEG, RAD or GRAD
+
+    Raises:
+        ValueError: where the calculator shows ERROR, e.g. for the log of an
+            array with a negative element, shapes that do not broadcast or
+            the inverse of a singular matrix
+
+    Returns:
+        ndarray: a vector or matrix, or a float for a result of a single number
+    """
+    args = [arg if is_array(arg) else float(arg) for arg in args]
+    function = MATRIX_FUNCTIONS.get(operation.name)
+    with np.errstate(all="ignore"):
+        if function is not None:
+            try:
+                result = function(*args)
+            except np.linalg.LinAlgError as exc:
+                raise ValueError(str(exc)) from None
+            if not np.all(np.isfinite(result)):
+                raise ValueError(f"{operation.name} has no finite result")
+        else:
+            if operation.arity == 1:
+                result, error = one_arg_operation(operation.name, args[0], mode)
+            else:
+                result, error = two_arg_operation(operation.name, *args)
+            if np.any(error):
+                raise ValueError(f"{operation.name} fails for an element")
+    if np.ndim(result) == 0:
+        return float(result)
+    return result
+
+
+def register(operations):
+    """Operation pack of the matrix operations, loaded by rpn_operations"""
+    operations.register(Operation("trn", 1, lambda x: x))
+    operations.register(Operation("inv", 1, lambda x: 1 / x))
+    operations.register(Operation("det", 1, lambda x: x))
+    operations.register(Operation("matmul", 2, operator.mul))
@@ -0,0 +1,168 @@
+"""
+Compiler from RPN programs to Python functions.
+
+A program is turned into the source of one Python function where every stack
+entry is a local variable, so running it does no parsing, no dispatch and no
+stack handling. Compiled programs are cached by program text and angle mode.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import math
+from functools import lru_cache
+
+from rpn_engine import CONSTANTS, STACK_OPERATIONS, parse_program
+from rpn_operations import OPERATIONS, as_integer, factorial, tangent
+
+
+def _real(value):
+    """Reject the complex results of powers, shown as ERROR by the calculator"""
+    if isinstance(value, complex):
+        raise ValueError("complex result")
+    return value
+
+
+# names the generated code can use, see rpn_operations.Operation.template
+NAMESPACE = {
+    "_real": _real,
+    "_tan": tangent,
+    "_as_integer": as_integer,
+    "_factorial": factorial,
+    "_sin": math.sin,
+    "_cos": math.cos,
+    "_asin": math.asin,
+    "_acos": math.acos,
+    "_atan": math.atan,
+    "_log10": math.log10,
+    "_log": math.log,
+    "_radians": math.radians,
+    "_degrees": math.degrees,
+    "_e": math.e,
+}
+
+# angle mode -> templates of RpnEngine.convert_to_radian/convert_from_radian
+TO_RADIAN = {"DEG": "_radians({})", "RAD": "{}", "GRAD": "_radians({} * 360 / 400)"}
+FROM_RADIAN = {"DEG": "_degrees({})", "RAD": "{}", "GRAD": "_degrees({}) * 400 / 360"}
+
+
+def program_inputs(program):
+    """Names used as inputs in a program, in order of first use"""
+    names = []
+    for word in program.split():
+        if word.isidentifier() and word not in STACK_OPERATIONS and word not in names:
+            if word not in CONSTANTS and not _is_number(word) and OPERATIONS.find(word) is None:
+                names.append(word)
+    return names
+
+
+def _is_number(word):
+    try:
+        float(word)
+    except ValueError:
+        return False
+    return True
+
+
+def generate_source(program, angle="DEG"):
+    """Python source of the function that evaluates a program
+
+    Args:
+        program (str): RPN program, see rpn_engine.parse_program
+        angle (str): angle mode, DEG, RAD or GRAD
+
+    Returns:
+        tuple: (source, input names, constants used by the source)
+    """
+    if angle not in TO_RADIAN:
+        raise ValueError(f"unknown angle mode {angle!r}")
+    inputs = program_inputs(program)
+    tokens = parse_program(program, inputs)
+    parameters = {name: f"a{idx}" for idx, name in enumerate(inputs)}
+    constants = {}
+    lines = []
+    stack = []  # expression of each stack entry, at compile time
+
+    def template(operation):
+        """Template of an operation, a call of its function if it has none"""
+        if operation.template is not None:
+            return operation.template
+        constants[f"_k{len(constants)}"] = operation.function
+        function = f"_k{len(constants) - 1}"
+        return f"_real({function}({{x}}))" if operation.arity == 1 else f"_real({function}({{y}}, {{x}}))"
+
+    def assign(expression):
+        local = f"t{len(lines)}"
+        lines.append(f"    {local} = {expression}")
+        stack.append(local)
+
+    for kind, value in tokens:
+        match kind:
+            case "number":
+                if math.isfinite(value):
+                    stack.append(repr(value) if value >= 0 else f"({value!r})")
+                else:
+                    constants[f"_k{len(constants)}"] = value
+                    stack.append(f"_k{len(constants) - 1}")
+            case "input":
+                stack.append(parameters[value])
+            case "one_arg":
+                operation = OPERATIONS[value]
+                x_value = stack.pop()
+                if operation.angle == "argument":
+                    x_value = TO_RADIAN[angle].format(x_value)
+                expression = template(operation).format(x=x_value)
+                if operation.angle == "result":
+                    expression = FROM_RADIAN[angle].format(expression)
+                assign(expression)
+            case "two_arg":
+                x_value = stack.pop()
+                assign(template(OPERATIONS[value]).format(x=x_value, y=stack.pop()))
+            case "stack":
+                if value == "enter":
+                    stack.append(stack[-1])
+                elif value == "swap":
+                    stack[-1], stack[-2] = stack[-2], stack[-1]
+                else:
+                    stack.pop()
+    lines.append(f"    return {stack[-1]}")
+    header = f"def program({', '.join(parameters.values())}):"
+    return "\n".join([header] + lines), inputs, constants
+
+
+@lru_cache(maxsize=1024)
+def compile_program(program, angle="DEG"):
+    """Compile an RPN program to a Python function
+
+    The function takes the program inputs as positional arguments, in order of
+    first use (also listed in its 'inputs' attribute), and returns the X
+    register at the end of the program. Where the calculator would show ERROR
+    it raises ArithmeticError or ValueError. Compiled programs are kept in an
+    LRU cache keyed by program text and angle mode.
+
+    Args:
+        program (str): RPN program, see rpn_engine.parse_program
+        angle (str): angle mode, DEG, RAD or GRAD
+
+    Raises:
+        ValueError: if the program is not valid
+
+    Returns:
+        function: the compiled program
+
+    Example:
+        >>> area = compile_program("r x^2 pi *")
+        >>> area(2.0)
+        12.56637061436
+    """
+    source, inputs, constants = generate_source(program, angle)
+    namespace = dict(NAMESPACE, **constants)
+    exec(compile(source, f"<rpn program {program!r}>", "exec"), namespace)
+    function = namespace["program"]
+    function.inputs = tuple(inputs)
+    function.source = source
+    return function
@@ -0,0 +1,343 @@
+"""
+Arbitrary precision arithmetic for PyRPN.
+
+DecimalMath runs the calculator keys on decimal.Decimal numbers, with every
+result correctly rounded to a given number of significant digits. The
+transcendental functions missing from the decimal module (sin, cos, tan and
+their inverses) are evaluated with guard digits, and the guard is widened
+until the rounded result is certain.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import math
+from decimal import ROUND_HALF_EVEN, Context, Decimal, localcontext
+from functools import lru_cache
+
+from rpn_locale import PT_BR
+
+# angle mode -> size of a full turn, angles are reduced in that unit so that
+# e.g. sin(180) is exactly 0 in DEG mode
+FULL_TURN = {"DEG": Decimal(360), "GRAD": Decimal(400)}
+
+
+@lru_cache(maxsize=16)
+def compute_pi(digits):
+    """pi with 'digits' significant digits (recipe of the decimal module docs)"""
+    with localcontext(Context(prec=digits + 2)):
+        three = Decimal(3)
+        lasts, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = (t * n) / d
+            s += t
+    return Context(prec=digits).plus(s)
+
+
+def _sin_series(x):
+    """sin(x) in the current context, for |x| <= pi"""
+    x_squared = x * x
+    term = total = x
+    idx = 1
+    while True:
+        term = -term * x_squared / ((idx + 1) * (idx + 2))
+        idx += 2
+        previous, total = total, total + term
+        if total == previous:
+            return total
+
+
+def _cos_series(x):
+    """cos(x) in the current context, for |x| <= pi"""
+    x_squared = x * x
+    term = total = Decimal(1)
+    idx = 0
+    while True:
+        term = -term * x_squared / ((idx + 1) * (idx + 2))
+        idx += 2
+        previous, total = total, total + term
+        if total == previous:
+            return total
+
+
+def _atan_series(x, digits):
+    """atan(x) in the current context, for any finite x"""
+    pi = compute_pi(digits)
+    if abs(x) > 1:
+        result = pi / 2 - _atan_series(1 / abs(x), digits)
+        return result if x > 0 else -result
+    # atan(x) = 2 * atan(x / (1 + sqrt(1 + x**2))) until the series is short
+    halvings = 0
+    while abs(x) > Decimal("1e-3") and halvings < 3 * digits.bit_length():
+        x = x / (1 + (1 + x * x).sqrt())
+        halvings += 1
+    x_squared = x * x
+    power = total = x
+    idx = 1
+    while True:
+        power = -power * x_squared
+        idx += 2
+        previous, total = total, total + power / idx
+        if total == previous:
+            return total * 2**halvings
+
+
+class DecimalMath:
+    """Calculator keys on Decimal numbers rounded to 'digits' significant digits
+
+    Args:
+        digits (int): significant digits of every result
+        number_format (NumberFormat): separators of the display texts, see
+            rpn_locale
+    """
+
+    def __init__(self, digits, number_format=PT_BR) -> None:
+        if digits < 1:
+            raise ValueError("digits must be positive")
+        self.digits = digits
+        self.number_format = number_format
+        self.context = Context(prec=digits, rounding=ROUND_HALF_EVEN)
+
+    def number(self, value) -> Decimal:
+        """Decimal of a str, int, Decimal or float (by its shortest repr)"""
+        if isinstance(value, float):
+            value = repr(value)
+        return Decimal(value)
+
+    @property
+    def pi(self) -> Decimal:
+        return compute_pi(self.digits)
+
+    @property
+    def e(self) -> Decimal:
+        return self.context.exp(1)
+
+    def _rounded(self, function, *args) -> Decimal:
+        """Correctly rounded result of function(*args, working digits)
+
+        The function is evaluated with guard digits, so its error is a few
+        units of its last digit (or of 1 for results smaller than 1, which may
+        come from a cancellation). When both ends of that error interval round
+        to the same number, that is the correctly rounded result; otherwise it
+        is evaluated again with twice the guard.
+        """
+        guard = 10
+        while True:
+            working = self.digits + guard
+            with localcontext(Context(prec=working + 5)):
+                value = function(*args, working)
+                if not value:
+                    return Decimal(0)
+                error = Decimal(1).scaleb(max(value.adjusted(), 0) - working + 3)
+                low = self.context.plus(value - error)
+                high = self.context.plus(value + error)
+            if low == high:
+                return low
+            guard *= 2
+
+    def convert_angle(self, angle, mode, new_mode) -> Decimal:
+        """Angle in the unit of 'mode' converted to the unit of 'new_mode'
+        (DEG, RAD or GRAD), as the DRG key does with SHIFT
+        """
+        def converted(angle, working):
+            if mode in FULL_TURN:
+                angle = angle * 2 * compute_pi(working) / FULL_TURN[mode]
+            return self._in_unit(angle, new_mode, working)
+
+        return self._rounded(converted, angle)
+
+    def _reduce(self, angle, mode, working):
+        """Angle in radian, reduced to [-pi, pi]"""
+        if mode in FULL_TURN:
+            turn = FULL_TURN[mode]
+            angle = angle.remainder_near(turn, Context(prec=max(working, angle.adjusted() + 3)))
+            return angle * 2 * compute_pi(working) / turn
+        pi = compute_pi(working + max(angle.adjusted(), 0))
+        with localcontext() as context:
+            context.prec = working + max(angle.adjusted(), 0)
+            return +angle.remainder_near(2 * pi)
+
+    def _quarter_turns(self, angle, mode):
+        """Number of quarter turns in an angle, None if it is not a multiple
+        of one (only decided in DEG and GRAD, where they are exact)
+        """
+        if mode == "RAD":
+            return 0 if angle == 0 else None
+        if angle != angle.to_integral_value():
+            return None
+        quarters, remainder = divmod(int(angle), int(FULL_TURN[mode]) // 4)
+        return None if remainder else quarters % 4
+
+    def sin(self, angle, mode="RAD") -> Decimal:
+        quarters = self._quarter_turns(angle, mode)
+        if quarters is not None:
+            return Decimal((0, 1, 0, -1)[quarters])
+        return self._rounded(lambda x, working: _sin_series(self._reduce(x, mode, working)), angle)
+
+    def cos(self, angle, mode="RAD") -> Decimal:
+        quarters = self._quarter_turns(angle, mode)
+        if quarters is not None:
+            return Decimal((1, 0, -1, 0)[quarters])
+        return self._rounded(lambda x, working: _cos_series(self._reduce(x, mode, working)), angle)
+
+    def tan(self, angle, mode="RAD") -> Decimal:
+        """tan, with the calculator's ERROR for multiples of a quarter turn"""
+        if self._quarter_turns(angle, mode) is not None:
+            raise ValueError("tangent of a multiple of pi/2")
+
+        def tangent(x, working):
+            x = self._reduce(x, mode, working)
+            return _sin_series(x) / _cos_series(x)
+
+        return self._rounded(tangent, angle)
+
+    def _in_unit(self, radian, mode, working):
+        """Angle in radian converted to the angle mode, in working digits"""
+        if mode in FULL_TURN:
+            return radian * FULL_TURN[mode] / (2 * compute_pi(working))
+        return radian
+
+    def atan(self, x, mode="RAD") -> Decimal:
+        return self._rounded(
+            lambda x, working: self._in_unit(_atan_series(x, working), mode, working), x
+        )
+
+    def asin(self, x, mode="RAD") -> Decimal:
+        if abs(x) > 1:
+            raise ValueError("math domain error")
+
+        def arc_sine(x, working):
+            if abs(x) == 1:
+                radian = (compute_pi(working) / 2).copy_sign(x)
+            else:
+                radian = _atan_series(x / (1 - x * x).sqrt(), working)
+            return self._in_unit(radian, mode, working)
+
+        return self._rounded(arc_sine, x)
+
+    def acos(self, x, mode="RAD") -> Decimal:
+        if abs(x) > 1:
+            raise ValueError("math domain error")
+
+        def arc_cosine(x, working):
+            if abs(x) == 1:
+                radian = compute_pi(working) if x < 0 else Decimal(0)
+            else:
+                radian = compute_pi(working) / 2 - _atan_series(x / (1 - x * x).sqrt(), working)
+            return self._in_unit(radian, mode, working)
+
+        return self._rounded(arc_cosine, x)
+
+    def one_arg_operation(self, operation, x_value, mode="DEG") -> Decimal:
+        """Result of a one argument key
+
+        Args:
+            operation (str): one of rpn_engine.ONE_ARG_OPERATIONS
+            x_value (Decimal): X register
+            mode (str): angle mode, DEG, RAD or GRAD
+
+        Raises:
+            ArithmeticError, ValueError: where the calculator shows ERROR
+        """
+        return self._finite(self._one_arg_operation(operation, x_value, mode))
+
+    def _one_arg_operation(self, operation, x_value, mode):
+        context = self.context
+        match operation:
+            case "+/-":
+                return context.minus(x_value)
+            case "1/x":
+                return context.divide(1, x_value)
+            case "n!":
+                integer = int(x_value)
+                if integer != x_value or integer < 0:
+                    raise ValueError(f"{x_value} is not a natural number")
+                if math.lgamma(integer + 1) / math.log(10) > context.Emax:
+                    raise OverflowError("factorial out of range")
+                return context.plus(Decimal(math.factorial(integer)))
+            case "sqrt":
+                return context.sqrt(x_value)
+            case "x^2":
+                return context.multiply(x_value, x_value)
+            case "sin" | "cos" | "tan" | "asin" | "acos" | "atan":
+                return getattr(self, operation)(x_value, mode)
+            case "log":
+                return context.log10(x_value)
+            case "10^x":
+                return context.power(10, x_value)
+            case "ln":
+                return context.ln(x_value)
+            case "e^x":
+                return context.exp(x_value)
+        raise ValueError(f"unknown operation {operation!r}")
+
+    def two_arg_operation(self, operation, y_value, x_value) -> Decimal:
+        """Result of a two arguments key
+
+        Args:
+            operation (str): one of rpn_engine.TWO_ARG_OPERATIONS
+            y_value (Decimal): Y register
+            x_value (Decimal): X register
+
+        Raises:
+            ArithmeticError, ValueError: where the calculator shows ERROR
+        """
+        return self._finite(self._two_arg_operation(operation, y_value, x_value))
+
+    def _two_arg_operation(self, operation, y_value, x_value):
+        context = self.context
+        match operation:
+            case "+":
+                return context.add(y_value, x_value)
+            case "-":
+                return context.subtract(y_value, x_value)
+            case "*":
+                return context.multiply(y_value, x_value)
+            case "/":
+                return context.divide(y_value, x_value)
+            case "%":
+                return context.multiply(y_value, context.divide(x_value, 100))
+            case "y^x":
+                return context.power(y_value, x_value)
+            case "root":
+                exponent = Context(prec=self.digits + 10).divide(1, x_value)
+                return context.power(y_value, exponent)
+            case "mod":
+                # sign of the divisor, as float %
+                result = context.remainder(y_value, x_value)
+                if result and (result < 0) != (x_value < 0):
+                    result = context.add(result, x_value)
+                return result
+        raise ValueError(f"unknown operation {operation!r}")
+
+    @staticmethod
+    def _finite(result):
+        """Infinite results (like 0 ** -1 or ln(0)) are errors, as with floats"""
+        if not result.is_finite():
+            raise ArithmeticError(f"{result} result")
+        return result
+
+    def format(self, value) -> str:
+        """Display text of a number: its significant digits, grouped with the
+        number format separators, in scientific notation where '%g' would use it
+        """
+        if not value.is_finite():
+            return str(value).lower().replace("infinity", "inf")
+        value = self.context.plus(value)
+        if not value:
+            return "-0" if value.is_signed() else "0"
+        value = value.normalize(self.context)
+        if -5 <= value.adjusted() < self.digits:
+            text = format(value, ",f")
+        else:
+            text = format(value, "e")
+        return text.translate(
+            {ord(","): self.number_format.thousands_sep, ord("."): self.number_format.decimal_point}
+        )
@@ -0,0 +1,2108 @@
+"""
+PyRPN's calculation engine, with no dependency on Qt.
+
+The engine holds the stack, the shift and angle states and the semantics of
+every calculator key. A view follows it through an RpnObserver.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import argparse
+import math
+import os
+import sys
+from collections import deque
+from functools import partial, wraps
+from itertools import islice, repeat
+
+from rpn_locale import NUMBER_FORMATS, PT_BR, get_number_format
+from rpn_operations import BUILTIN_OPERATIONS, OPERATIONS, as_integer  # noqa: F401
+from rpn_statistics import StatisticsRegisters
+
+# Names of the calculator's own operations (see rpn_operations for all the
+# operations, including the ones of operation packs)
+SHIFTED_OPERATIONS = {operation.name: operation.shifted for operation in BUILTIN_OPERATIONS if operation.shifted}
+ONE_ARG_OPERATIONS = tuple(operation.name for operation in BUILTIN_OPERATIONS if operation.arity == 1)
+TWO_ARG_OPERATIONS = tuple(operation.name for operation in BUILTIN_OPERATIONS if operation.arity == 2)
+# operation name in programs -> key pressed with SHIFT
+UNSHIFTED_KEYS = {name: key for key, name in SHIFTED_OPERATIONS.items()}
+# operation arity -> kind of its tokens in parsed programs
+OPERATION_TOKENS = {1: "one_arg", 2: "two_arg"}
+# stack keys -> (entries needed, entries left in their place)
+STACK_OPERATIONS = {"enter": (1, 2), "swap": (2, 2), "drop": (1, 0)}
+# values pushed by the PI and E keys
+CONSTANTS = {"pi": round(math.pi, 12), "e": round(math.e, 12)}
+AGGREGATES = ("sum", "mean", "min", "max", "std", "prod")  # of every stack entry
+# estimated memory kept for undo/redo by the calculator, see UndoHistory
+UNDO_MEMORY = 64 * 2**20
+BATCH_CHUNK = 2000  # lines sent to a worker at a time by 'rpn.py --batch --jobs'
+# largest precision (significant digits) computed with floats, above it the
+# engine switches to decimal arithmetic (see rpn_decimal)
+FLOAT_DIGITS = 15
+
+
+class Stack:
+    """HGF Stack implementation for python"""
+
+    def __init__(self) -> None:
+        self._items = []
+
+    def __str__(self) -> str:
+        return str(self._items)
+
+    def items(self):
+        return self._items
+
+    def item(self, idx) -> str:
+        """Text of the entry at position idx, 0 being the bottom of the stack"""
+        return self._items[idx]
+
+    def push(self, value) -> None:
+        self._items.append(value)
+
+    def pop(self) -> str:
+        if self._items:
+            return self._items.pop()
+        else:
+            return ""
+
+    def peek_x(self) -> str | None:
+        if self._items:
+            return self._items[-1]
+        else:
+            return None
+
+    def peek_y(self) -> str | None:
+        if len(self._items) > 1:
+            return self._items[-2]
+        else:
+            return None
+
+    def peek_z(self) -> str | None:
+        if len(self._items) > 2:
+            return self._items[-3]
+        else:
+            return None
+
+    def is_empty(self) -> bool:
+        return not self._items
+
+    def size(self) -> int:
+        return len(self._items)
+
+    def swap(self) -> None:
+        self._items[-1], self._items[-2] = self._items[-2], self._items[-1]
+
+    def cls(self):
+        self._items = []
+
+    def dup(self) -> None:
+        if not self._items:
+            self._items.append("0")
+        self._items.append(self._items[-1])
+
+    def has_x(self) -> bool:
+        return bool(self.peek_x())
+
+    def has_y(self) -> bool:
+        return bool(self.peek_y())
+
+
+def format_result(value, digits=12, number_format=PT_BR) -> str:
+    """Format a calculation result the way the display shows it
+
+    Args:
+        value (float): number to be formatted
+        digits (int): significant digits shown
+        number_format (NumberFormat): separators, see rpn_locale
+
+    Returns:
+        str: '%.8e' for results above 999999999999, '%.12g' otherwise (for
+            the default 12 digits)
+    """
+    if value > 10**digits - 1:
+        return number_format.localize("%.*e" % (digits - 4, value))
+    return number_format.localize("%.*g" % (digits, value))
+
+
+def read_numbers(lines, number_format=PT_BR, number=float):
+    """Numbers of a column or a table of texts, as copied from a spreadsheet
+    or saved in a CSV/TXT file, row by row
+
+    Numbers are separated by tabs, spaces, semicolons or line breaks and may
+    be quoted; they are parsed with the separators of the number format,
+    the thousands separator only between groups of 3 digits (so '1,2,3' is
+    an error in en-US, not 123). The lines are read one at a time, so a
+    file is never read whole.
+
+    Args:
+        lines: iterable of texts, e.g. an open file or text.splitlines()
+        number_format (NumberFormat): separators of the numbers
+        number: numeric type of the results
+
+    Raises:
+        ValueError: for a text that is not a number, with its line number
+    """
+    parse = number_format.parse
+    for line_number, line in enumerate(lines, 1):
+        if ";" in line or '"' in line:
+            line = line.replace(";", " ").replace('"', " ")
+        for text in line.split():
+            try:
+                yield parse(text, number, strict=True)
+            except ValueError:
+                raise ValueError(f"line {line_number}: {text!r} is not a number") from None
+
+
+class EntryBuffer:
+    """Number being typed in the X register
+
+    The typed digits are kept apart from the grouping separators, and the
+    integer digits are also kept grouped for each of the three possible
+    positions of the separators (the number of digits modulo 3). Typing or
+    deleting a digit only appends to or cuts the end of these texts, so
+    neither a key nor the display regroups the whole number, whatever its
+    length.
+
+    Args:
+        text (str): text to continue typing on, '' for a new entry
+        number_format (NumberFormat): separators of the text, see rpn_locale
+    """
+
+    POINT_KEYS = ",."  # keys typing the decimal point, whatever the locale
+
+    def __init__(self, text="", number_format=PT_BR) -> None:
+        match = number_format.plain_number(text)
+        if not match:
+            raise ValueError(f"{text!r} can not be edited")
+        self._format = number_format
+        self._negative = bool(match.group(1))
+        self._int = ""
+        self._groups = ["", "", ""]  # the integer digits grouped for len(self._int) % 3 == 0, 1, 2
+        for digit in match.group(2).replace(number_format.thousands_sep, ""):
+            self._push_int(digit)
+        self._point = match.group(3) is not None
+        self._frac = match.group(4) or ""
+        self._text = None
+
+    @classmethod
+    def from_text(cls, text, number_format=PT_BR):
+        """EntryBuffer to continue typing on 'text', None if it is not a plain
+        number (e.g. '1,5e+13' or 'inf')
+        """
+        if number_format.plain_number(text):
+            return cls(text, number_format)
+        return None
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def text(self) -> str:
+        """Text of the entry, with grouping separators"""
+        if self._text is None:
+            text = self._groups[len(self._int) % 3]
+            if self._point:
+                text = (text or "0") + self._format.decimal_point + self._frac
+            self._text = "-" + text if self._negative else text
+        return self._text
+
+    def _push_int(self, digit):
+        # with n digits the separators go before the digits whose index is
+        # n modulo 3, so the new digit follows one in the grouping of its index
+        idx = len(self._int)
+        self._int += digit
+        groups = self._groups
+        for phase in range(3):
+            if idx and idx % 3 == phase:
+                groups[phase] += self._format.thousands_sep + digit
+            else:
+                groups[phase] += digit
+
+    def _pop_int(self):
+        idx = len(self._int) - 1
+        self._int = self._int[:-1]
+        groups = self._groups
+        for phase in range(3):
+            if idx and idx % 3 == phase:
+                groups[phase] = groups[phase][:-1 - len(self._format.thousands_sep)]
+            else:
+                groups[phase] = groups[phase][:-1]
+
+    def digit_count(self) -> int:
+        return len(self._int) + len(self._frac)
+
+    def append(self, key) -> None:
+        """Type a digit or the decimal point
+
+        Args:
+            key (str): one of these caracters -> '0123456789,.' (',' and '.'
+                both type the decimal point of the locale)
+        """
+        if key in self.POINT_KEYS:
+            if self._point:
+                return
+            self._point = True
+            if not self._int:
+                self._push_int("0")
+        elif self._point:
+            self._frac += key
+        elif self._int == "0":
+            self._groups = [key, key, key]
+            self._int = key
+        else:
+            self._push_int(key)
+        self._text = None
+
+    def backspace(self) -> None:
+        """Delete the last digit, with the decimal point if no decimal is left.
+        Deleting the only digit leaves 0.
+        """
+        if self._frac:
+            self._frac = self._frac[:-1]
+            if not self._frac:
+                self._point = False
+        elif self._point:
+            self._point = False
+        elif self._int:
+            self._pop_int()
+        if not self._int and not self._point:
+            self._push_int("0")
+            self._negative = False
+        self._text = None
+
+    def copy(self):
+        """Independent EntryBuffer with the same digits"""
+        entry = EntryBuffer.__new__(EntryBuffer)
+        entry._format = self._format
+        entry._negative = self._negative
+        entry._int = self._int
+        entry._groups = self._groups.copy()
+        entry._point = self._point
+        entry._frac = self._frac
+        entry._text = self._text
+        return entry
+
+    def to_number(self, number=float):
+        """Value of the entry
+
+        Args:
+            number: numeric type to be returned, called on a '123.45' string
+        """
+        text = self._int or "0"
+        if self._frac:
+            text = text + "." + self._frac
+        return number("-" + text if self._negative else text)
+
+
+def _aggregate(previous, value):
+    """Aggregates of the entries below and of a new entry, see
+    NumericStack.aggregates: Neumaier's compensated sum and Welford's mean
+    and sum of squared deviations.
+    """
+    count, total, compensation, mean, m2, low, high, product = previous
+    count += 1
+    new_total = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - new_total) + value
+    else:
+        compensation += (value - new_total) + total
+    delta = value - mean
+    mean += delta / count
+    m2 += delta * (value - mean)
+    if count == 1:
+        low = high = value
+    elif value < low:
+        low = value
+    elif value > high:
+        high = value
+    return count, new_total, compensation, mean, m2, low, high, product * value
+
+
+NO_AGGREGATES = (0, 0, 0, 0, 0, None, None, 1)
+AGGREGATES_STEP = 64  # entries between two positions whose aggregates are kept
+
+
+class NumericStack(Stack):
+    """Stack that keeps its entries as native numbers
+
+    Results are stored as numbers and only turned into text when an entry is
+    read through peek/pop, so a chain of operations never parses or formats
+    the intermediate values. The text of an entry is cached once built.
+    Strings and EntryBuffers pushed by the digit entry are kept as typed and
+    parsed on demand.
+
+    While a journal (a list) is set, every change appends the record that
+    undoes it, see UndoHistory.
+
+    The aggregates of the entries (see aggregates) are kept every
+    AGGREGATES_STEP positions, as those of the entries below it plus their
+    own, and for each of the last positions (up to 2 * AGGREGATES_STEP). A
+    push adds one position and a pop drops one; only a pop below the last
+    positions recomputes them from the kept one below, up to AGGREGATES_STEP
+    entries. So they stay up to date in O(1) per key instead of O(n) per
+    call, keeping a tuple per AGGREGATES_STEP entries instead of per entry.
+
+    Args:
+        number: numeric type used to parse string entries (float by default)
+        formatter: function used to turn a number into its display text,
+            format_result in the number format by default
+        number_format (NumberFormat): separators of the display texts, see
+            rpn_locale
+    """
+
+    def __init__(self, number=float, formatter=None, number_format=PT_BR) -> None:
+        super().__init__()
+        if formatter is None:
+            formatter = format_result if number_format is PT_BR else partial(format_result, number_format=number_format)
+        self.number_format = number_format
+        self._number = number
+        self._formatter = formatter
+        self._display = {}  # index -> cached display text
+        self._journal = None  # undo records of the running key
+        self._aggregates = []  # j -> aggregates of the first (j + 1) * AGGREGATES_STEP entries
+        self._recent = []  # i -> aggregates of the first self._recent_start + i + 1 entries
+        self._recent_start = 0
+        self._context = None  # decimal context of the aggregates
+
+    def __str__(self) -> str:
+        return str(self.items())
+
+    def items(self):
+        return [self._text(idx) for idx in range(len(self._items))]
+
+    def item(self, idx) -> str:
+        """Text of the entry at position idx, 0 being the bottom of the stack
+
+        Unlike peek, the text is not cached, so browsing a deep stack does not
+        grow the display cache.
+        """
+        text = self._display.get(idx)
+        if text is None:
+            text = self._format(self._items[idx])
+        elif type(text) is EntryBuffer:
+            text = text.text
+        return text
+
+    def format_value(self, value) -> str:
+        """Display text of a number, converted to the type of the entries"""
+        return self._formatter(self._number(value))
+
+    def _format(self, value) -> str:
+        if type(value) is not float and hasattr(value, "shape"):
+            from rpn_array import format_array  # a vector or a matrix
+
+            return format_array(value, self.format_value)
+        return self._formatter(value)
+
+    def _text(self, idx) -> str:
+        text = self._display.get(idx)
+        if text is None:
+            text = self._format(self._items[idx])
+            self._display[idx] = text
+        elif type(text) is EntryBuffer:
+            text = text.text
+        return text
+
+    def _parse(self, text):
+        if type(text) is EntryBuffer:
+            return text.to_number(self._number)
+        return self.number_format.parse(text, self._number)
+
+    def _value(self, idx):
+        value = self._items[idx]
+        if value is None:
+            value = self._parse(self._display[idx])
+            if type(self._display[idx]) is str:
+                self._items[idx] = value
+        return value
+
+    def push(self, value) -> None:
+        """Push a number, or a display string or EntryBuffer to be parsed only
+        when needed
+        """
+        if isinstance(value, (str, EntryBuffer)):
+            self._display[len(self._items)] = value
+            self._items.append(None)
+        else:
+            self._items.append(value)
+        if self._journal is not None:
+            self._journal.append(("pushed",))
+
+    def _push_entry(self, value, display):
+        """Push a number and its display (text, EntryBuffer or None) as kept"""
+        if display is not None:
+            self._display[len(self._items)] = display
+        self._items.append(value)
+        if self._journal is not None:
+            self._journal.append(("pushed",))
+
+    def _pop_entry(self):
+        """Remove the last entry and return it as kept: (number, display)"""
+        value = self._items.pop()
+        self._drop_aggregates(len(self._items))
+        display = self._display.pop(len(self._items), None)
+        if self._journal is not None:
+            self._journal.append(("popped", value, display))
+        return value, display
+
+    def _edit(self, idx, value, display):
+        """Replace the number and display of the entry at position idx"""
+        if self._journal is not None:
+            self._journal.append(("edited", idx, self._items[idx], self._display.get(idx)))
+        self._items[idx] = value
+        self._drop_aggregates(idx)
+        if display is None:
+            self._display.pop(idx, None)
+        else:
+            self._display[idx] = display
+
+    def extend(self, values) -> int:
+        """Push the numbers of an iterable as a single change
+
+        If reading them raises, the stack is left as it was.
+
+        Returns:
+            int: number of entries pushed
+        """
+        start = len(self._items)
+        try:
+            self._items.extend(values)
+        except BaseException:
+            del self._items[start:]
+            raise
+        count = len(self._items) - start
+        if count and self._journal is not None:
+            self._journal.append(("extended", count))
+        return count
+
+    def _truncate(self, count):
+        """Remove the last count entries as a single change"""
+        start = len(self._items) - count
+        values = self._items[start:]
+        del self._items[start:]
+        self._drop_aggregates(start)
+        display = {idx - start: self._display.pop(idx) for idx in range(start, start + count) if idx in self._display}
+        if self._journal is not None:
+            self._journal.append(("truncated", values, display))
+
+    def _extend_entries(self, values, display):
+        start = len(self._items)
+        self._items.extend(values)
+        self._display.update((start + idx, text) for idx, text in display.items())
+        if self._journal is not None:
+            self._journal.append(("extended", len(values)))
+
+    def _replace(self, items, display, number, formatter):
+        """Replace every entry, in O(1) as the lists are not copied"""
+        if self._journal is not None:
+            self._journal.append(("replaced", self._items, self._display, self._number, self._formatter))
+        self._items = items
+        self._aggregates = []
+        self._recent = []
+        self._display = display
+        self._number = number
+        self._formatter = formatter
+
+    def apply(self, journal) -> None:
+        """Undo the changes recorded in a journal, last change first"""
+        for record in reversed(journal):
+            match record[0]:
+                case "pushed":
+                    self._pop_entry()
+                case "popped":
+                    self._push_entry(record[1], record[2])
+                case "swapped":
+                    self.swap()
+                case "edited":
+                    self._edit(*record[1:])
+                case "replaced":
+                    self._replace(*record[1:])
+                case "extended":
+                    self._truncate(record[1])
+                case "truncated":
+                    self._extend_entries(*record[1:])
+
+    def entry_x(self):
+        """The EntryBuffer in X if a number is being typed there, else None"""
+        if self._items:
+            entry = self._display.get(len(self._items) - 1)
+            if type(entry) is EntryBuffer:
+                return entry
+        return None
+
+    def pop(self) -> str:
+        if self._items:
+            text = self._text(len(self._items) - 1)
+            self._pop_entry()
+            return text
+        else:
+            return ""
+
+    def pop_value(self):
+        """Remove the last entry and return it as a number
+
+        Raises:
+            IndexError: if the stack is empty
+            ValueError: if the entry is a string that is not a number
+        """
+        value, text = self._pop_entry()
+        if value is None:
+            value = self._parse(text)
+        return value
+
+    def peek_value(self):
+        """Return the last entry as a number without removing it"""
+        return self._value(len(self._items) - 1)
+
+    def value(self, idx):
+        """Number of the entry at position idx, 0 being the bottom of the stack"""
+        return self._value(idx)
+
+    def peek_x(self) -> str | None:
+        if self._items:
+            return self._text(len(self._items) - 1)
+        else:
+            return None
+
+    def peek_y(self) -> str | None:
+        if len(self._items) > 1:
+            return self._text(len(self._items) - 2)
+        else:
+            return None
+
+    def peek_z(self) -> str | None:
+        if len(self._items) > 2:
+            return self._text(len(self._items) - 3)
+        else:
+            return None
+
+    def has_x(self) -> bool:
+        idx = len(self._items) - 1
+        return idx >= 0 and (self._items[idx] is not None or self._display[idx] != "")
+
+    def has_y(self) -> bool:
+        idx = len(self._items) - 2
+        return idx >= 0 and (self._items[idx] is not None or self._display[idx] != "")
+
+    def swap(self) -> None:
+        top = len(self._items) - 1
+        self._items[top], self._items[top - 1] = self._items[top - 1], self._items[top]
+        self._drop_aggregates(top - 1)
+        text_x = self._display.pop(top, None)
+        text_y = self._display.pop(top - 1, None)
+        if text_x is not None:
+            self._display[top - 1] = text_x
+        if text_y is not None:
+            self._display[top] = text_y
+        if self._journal is not None:
+            self._journal.append(("swapped",))
+
+    def cls(self):
+        self._replace([], {}, self._number, self._formatter)
+
+    def aggregates(self) -> dict:
+        """Sum, mean, min, max, std (sample standard deviation) and prod of
+        every entry, None for the ones of an empty stack (std needs 2 entries)
+
+        Only the aggregates of the entries added since the last call are
+        computed, so it costs O(1) after a key. An X being typed is included
+        as it is now; entries that are not numbers (an empty X, vectors and
+        matrices) are left out.
+        """
+        if self._context is not None:
+            from decimal import localcontext
+
+            with localcontext(self._context) as context:
+                context.prec += 10  # guard digits, the results are rounded
+                aggregates = self._compute_aggregates()
+            plus = self._context.plus
+            return {name: value if value is None else plus(value) for name, value in aggregates.items()}
+        return self._compute_aggregates()
+
+    def _drop_aggregates(self, idx):
+        """Forget the aggregates of the positions from idx up, changed"""
+        del self._aggregates[idx // AGGREGATES_STEP:]
+        del self._recent[max(idx - self._recent_start, 0):]
+
+    def _compute_aggregates(self):
+        aggregates = self._aggregates
+        size = len(self._items)
+        recent = self._recent
+        if recent:
+            start, last = self._recent_start + len(recent), recent[-1]
+        else:
+            start = self._recent_start = len(aggregates) * AGGREGATES_STEP
+            last = aggregates[-1] if aggregates else NO_AGGREGATES
+        keep = True
+        for idx in range(start, size):
+            try:
+                value = self._value(idx)
+            except ValueError:  # not a number, as an empty X
+                value = None
+            if value is not None and not hasattr(value, "shape"):  # arrays are left out
+                last = _aggregate(last, value)
+            # an EntryBuffer changes with the keys, it is not kept
+            keep = keep and self._items[idx] is not None
+            if keep:
+                recent.append(last)
+                if (idx + 1) % AGGREGATES_STEP == 0:
+                    aggregates.append(last)
+                    if len(recent) >= 2 * AGGREGATES_STEP:
+                        del recent[:AGGREGATES_STEP]
+                        self._recent_start += AGGREGATES_STEP
+        count, total, compensation, mean, m2, low, high, product = last
+        if count == 0:
+            return dict.fromkeys(AGGREGATES)
+        total += compensation if compensation == compensation else 0  # nan after an inf
+        std = None
+        if count > 1:
+            variance = m2 / (count - 1)
+            std = variance.sqrt() if hasattr(variance, "sqrt") else math.sqrt(variance)
+        return {"sum": total, "mean": mean, "min": low, "max": high, "std": std, "prod": product}
+
+    def convert(self, number, formatter, context=None) -> None:
+        """Switch the stack to another numeric type
+
+        Args:
+            number: new numeric type, called on each parsed value
+            formatter: new function that turns a value into its display text
+            context (decimal.Context): context of the aggregates of decimal
+                numbers, the current one if None
+        """
+        items = [value if value is None or hasattr(value, "shape") else number(value) for value in self._items]
+        display = {idx: text for idx, text in self._display.items() if items[idx] is None}
+        self._replace(items, display, number, formatter)
+        self._context = context
+
+    def sync(self) -> None:
+        """Save the stack, called after every key (see rpn_storage.MappedStack)"""
+
+    def dup(self) -> None:
+        idx = len(self._items) - 1
+        if idx < 0:  # emptied by an ERROR, ENTER works on a 0 as on a cleared stack
+            self.push("0")
+            idx = 0
+        entry = self._display.get(idx)
+        if type(entry) is EntryBuffer:
+            # the number typed is done: Y keeps its value and text, not the
+            # EntryBuffer, so the aggregates below X are kept (see aggregates)
+            self._edit(idx, entry.to_number(self._number), entry.text)
+        if idx in self._display:
+            self._display[idx + 1] = self._text(idx)  # an entry is not shared
+        self._items.append(self._items[idx])
+        if self._journal is not None:
+            self._journal.append(("pushed",))
+
+
+class UndoHistory:
+    """Undo and redo of the calculator keys
+
+    A version is the journal a key left on the stack (see NumericStack) with
+    the engine state before it. A key usually changes one or two entries, so
+    saving a version costs O(1) time and memory whatever the stack depth; even
+    clearing the stack only keeps a reference to the old entries. Undoing a
+    version applies its journal, which records the redo version as it goes.
+
+    Args:
+        max_memory (int): estimated bytes kept for undo and redo, the oldest
+            versions are dropped above it
+    """
+
+    RECORD_BYTES = 200  # estimated size of a journal record
+    ENTRY_BYTES = 50  # estimated size of an entry kept by a 'replaced' record
+
+    def __init__(self, max_memory=UNDO_MEMORY) -> None:
+        self.max_memory = max_memory
+        self._undo = deque()  # (journal, engine state, bytes), oldest first
+        self._redo = []
+        self._memory = 0
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    @property
+    def memory(self) -> int:
+        """Estimated bytes used by the saved versions"""
+        return self._memory
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._memory = 0
+
+    def _version(self, journal, state):
+        size = len(journal) * self.RECORD_BYTES
+        for record in journal:
+            if record[0] in ("replaced", "truncated"):
+                size += len(record[1]) * self.ENTRY_BYTES
+        self._memory += size
+        return journal, state, size
+
+    def _evict(self):
+        while self._memory > self.max_memory and (self._undo or self._redo):
+            if self._undo:
+                self._memory -= self._undo.popleft()[2]
+            else:
+                self._memory -= self._redo.pop(0)[2]
+
+    def begin(self, stack) -> None:
+        """Start recording a key on the stack"""
+        stack._journal = journal = []
+        entry = stack.entry_x()
+        if entry is not None:  # the key may type in X in place
+            journal.append(("edited", stack.size() - 1, None, entry.copy()))
+
+    def commit(self, stack, state) -> None:
+        """Save the version recorded since begin, if the key changed something
+
+        Args:
+            stack: NumericStack the key ran on
+            state: engine state before the key
+        """
+        journal, stack._journal = stack._journal, None
+        if len(journal) == 1 and journal[0][0] == "edited":
+            if stack.entry_x() is not None and stack.entry_x().text == journal[0][3].text:
+                journal.clear()  # X not changed by the key
+        if journal:
+            self.save(journal, state)
+
+    def snapshot(self, stack):
+        """Journal that restores the whole stack, for changes too long to be
+        recorded one by one (like a macro replay). It costs O(stack depth).
+        """
+        display = {
+            idx: text.copy() if type(text) is EntryBuffer else text
+            for idx, text in stack._display.items()
+        }
+        return [("replaced", list(stack._items), display, stack._number, stack._formatter)]
+
+    def save(self, journal, state) -> None:
+        """Save a version, dropping the ones that could be redone"""
+        for _, _, size in self._redo:
+            self._memory -= size
+        self._redo.clear()
+        self._undo.append(self._version(journal, state))
+        self._evict()
+
+    def undo(self, stack, state):
+        """Undo the last version
+
+        Returns:
+            the engine state before it, None if there is nothing to undo
+        """
+        return self._move(self._undo, self._redo, stack, state)
+
+    def redo(self, stack, state):
+        """Redo the last undone version
+
+        Returns:
+            the engine state after it, None if there is nothing to redo
+        """
+        return self._move(self._redo, self._undo, stack, state)
+
+    def _move(self, source, target, stack, state):
+        if not source:
+            return None
+        journal, previous_state, size = source.pop()
+        self._memory -= size
+        stack._journal = []
+        stack.apply(journal)
+        target.append(self._version(stack._journal, state))
+        stack._journal = None
+        self._evict()
+        return previous_state
+
+
+class Macro:
+    """Keys recorded from an RpnEngine, see RpnEngine.start_recording
+
+    Args:
+        keys (list): (key method name, arguments) in the order they ran
+    """
+
+    def __init__(self, keys=()) -> None:
+        self.keys = list(keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return f"Macro({self.keys!r})"
+
+
+def engine_key(key):
+    """Decorator for the RpnEngine keys: they are recorded in macros and can
+    be undone. Keys called by another key are part of it.
+    """
+
+    @wraps(key)
+    def engine_key_call(self, *args):
+        if self._running_key:
+            return key(self, *args)
+        self._running_key = True
+        if self._macro is not None:
+            self._macro.keys.append((key.__name__, args))
+        history = self._history
+        if history is not None:
+            state = self._state()
+            history.begin(self._stack)
+        try:
+            return key(self, *args)
+        finally:
+            self._running_key = False
+            if history is not None:
+                history.commit(self._stack, state)
+
+    return engine_key_call
+
+
+class RpnObserver:
+    """Interface used by RpnEngine to report what should be shown
+
+    Every method does nothing here, so a view only overrides what it draws.
+    """
+
+    def display_changed(self, x, y, z, angle, size):
+        """The stack or the angle mode changed
+
+        Args:
+            x (str): text of the X register
+            y (str): text of the Y register, '' if there is none
+            z (str): text of the Z register, '' if there is none
+            angle (str): DEG, RAD or GRAD
+            size (int): number of stack entries
+        """
+
+    def shift_changed(self, shift):
+        """The SHIFT state was toggled
+
+        Args:
+            shift (bool): new SHIFT state
+        """
+
+    def map_changed(self, map_mode):
+        """The MAP state was toggled
+
+        Args:
+            map_mode (bool): new MAP state, the next one argument key works
+                on every stack entry
+        """
+
+    def show_message(self, register, text):
+        """Show a message ('--', 'ERROR', ...) in place of a register
+
+        Args:
+            register (str): x or y
+            text (str): message to be shown
+        """
+
+    def show_stack(self, stack):
+        """Show every stack entry (SHIFT + SWAP)
+
+        Args:
+            stack: Stack object with the rpn calculator stack
+        """
+
+
+class RpnEngine:
+    """PyRPN's calculation engine
+
+    Holds the stack, the shift and angle states and runs every calculator key
+    without any dependency on Qt.
+
+    args:
+        observer: RpnObserver notified of everything that should be shown,
+            None to run headless
+        precision (int): significant digits of the results, see precision
+        stack: NumericStack to start from (e.g. a saved one), a new stack
+            holding 0 when None
+        undo_memory (int): estimated bytes kept for undo/redo (see
+            UndoHistory), None to run without undo
+        number_format: NumberFormat or locale name ('pt-BR', 'en-US'...) of
+            the numbers shown and typed, see rpn_locale. By default the one of
+            the given stack, or pt-BR.
+    """
+
+    def __init__(self, observer=None, precision=12, stack=None, undo_memory=None, number_format=None):
+        self._observer = observer
+        if number_format is not None:
+            number_format = get_number_format(number_format)
+        if stack is None:
+            stack = NumericStack(number_format=number_format or PT_BR)
+        elif number_format not in (None, stack.number_format):
+            raise ValueError("the stack has another number format")
+        self._stack = stack
+        self._number_format = stack.number_format
+        if self._stack.is_empty():
+            self._stack.push("0")
+        self._after_enter = True
+        self._new_x = False
+        self._shift = False
+        self._map = False  # the next one argument key works on the whole stack
+        self._angle_mesurement = "DEG"
+        self._decimal = None
+        self._precision = 12
+        self._max_digits = 12
+        self._error = False
+        self._history = None if undo_memory is None else UndoHistory(undo_memory)
+        self._macro = None  # Macro being recorded
+        self.statistics = StatisticsRegisters()  # pairs accumulated by Σ+
+        self._running_key = False
+        self._display_enabled = True
+        if precision != 12:
+            self.precision = precision
+        self.update_display()
+
+    @property
+    def observer(self):
+        return self._observer
+
+    @observer.setter
+    def observer(self, observer):
+        self._observer = observer
+        self.update_display()
+
+    @property
+    def stack(self):
+        return self._stack
+
+    @property
+    def number_format(self):
+        """NumberFormat of the numbers shown and typed"""
+        return self._number_format
+
+    @property
+    def shift(self) -> bool:
+        return self._shift
+
+    @shift.setter
+    def shift(self, shift):
+        if shift != self._shift:
+            self.btn_shift()
+
+    @property
+    def map_mode(self) -> bool:
+        return self._map
+
+    @map_mode.setter
+    def map_mode(self, map_mode):
+        if map_mode != self._map:
+            self.btn_map()
+
+    @property
+    def precision(self) -> int:
+        """Significant digits of the results
+
+        Up to FLOAT_DIGITS the keys compute with floats, above it with
+        correctly rounded decimals (rpn_decimal.DecimalMath), which are slower.
+        The stack entries are converted when it changes.
+        """
+        return self._precision
+
+    @precision.setter
+    def precision(self, digits):
+        if digits < 1:
+            raise ValueError("precision must be at least 1 digit")
+        if digits > FLOAT_DIGITS:
+            from rpn_decimal import DecimalMath
+
+            self._decimal = DecimalMath(digits, self._number_format)
+            self._stack.convert(self._decimal.number, self._decimal.format, self._decimal.context)
+        else:
+            self._decimal = None
+            if digits == 12 and self._number_format is PT_BR:
+                formatter = format_result
+            else:
+                formatter = partial(format_result, digits=digits, number_format=self._number_format)
+            self._stack.convert(float, formatter)
+        self._precision = digits
+        self._max_digits = max(12, digits)
+        if self._history is not None:
+            self._history.clear()  # the versions hold numbers of the old type
+        self.update_display()
+
+    def _operation(self, key, arity):
+        """Operation a key runs with the current SHIFT, None if there is no
+        such operation of that arity
+        """
+        try:
+            operation = OPERATIONS[key]
+            if self._shift and operation.shifted:
+                operation = OPERATIONS[operation.shifted]
+        except KeyError:
+            return None
+        return operation if operation.arity == arity else None
+
+    def _calculate(self, operation, *args):
+        """Result of an operation on numbers of the engine's precision mode
+
+        Operations without a decimal version are computed with floats in the
+        decimal mode, and so are the vectors and matrices (see rpn_array).
+
+        Raises:
+            ArithmeticError, ValueError: where the calculator shows ERROR
+        """
+        if any(hasattr(arg, "shape") for arg in args):
+            from rpn_array import array_operation
+
+            return array_operation(operation, args, self._angle_mesurement)
+        if self._decimal is not None and operation.decimal is not None:
+            if operation.arity == 1:
+                return operation.decimal(self._decimal, *args, self._angle_mesurement)
+            return operation.decimal(self._decimal, *args)
+        if self._decimal is not None:
+            args = [float(arg) for arg in args]
+        if operation.angle == "argument":
+            result = operation.function(self.convert_to_radian(args[0]))
+        elif operation.angle == "result":
+            result = self.convert_from_radian(operation.function(*args))
+        else:
+            result = operation.function(*args)
+        if isinstance(result, complex):
+            raise ValueError("complex result")
+        if self._decimal is not None:
+            return self._decimal.number(result)
+        return result
+
+    @property
+    def angle(self) -> str:
+        return self._angle_mesurement
+
+    @angle.setter
+    def angle(self, angle):
+        if angle not in ("DEG", "RAD", "GRAD"):
+            raise ValueError(f"unknown angle mode {angle!r}")
+        self._angle_mesurement = angle
+        self.update_display()
+
+    def update_display(self):
+        """Send the stack and other information to the observer"""
+        if not self._display_enabled:
+            return
+        self._stack.sync()
+        if self._observer is None:
+            return
+        self._observer.display_changed(
+            self._stack.peek_x(),
+            self._stack.peek_y() or "",
+            self._stack.peek_z() or "",
+            self._angle_mesurement,
+            self._stack.size(),
+        )
+
+    def no_arg(self, arg):
+        """Shows '--' if the stack is empty for a given argument
+
+        Args:
+            arg (str): x or y
+        """
+        if self._observer is not None:
+            self._observer.show_message(arg, "--")
+
+    @engine_key
+    def btn_number(self, key):
+        """Function for all numbers and decimal point(comma) buttons
+            Insert a digit in the stack last entrie
+
+        Args:
+            key (str): one of these caracters -> '0123456789,.'
+        """
+        entry = self._stack.entry_x()
+        if entry is not None and not self._new_x and not self._after_enter:
+            # next digit of the number being typed
+            if entry.digit_count() < self._max_digits:
+                entry.append(key)
+                self.update_display()
+            return
+        if self._new_x:
+            self._stack.push("")
+            self.update_display()
+            self._new_x = False
+            self._after_enter = True
+        if not self._stack.has_x() or self._after_enter:
+            if key in "0123456789,":
+                self._add_digit(key)
+        else:
+            entry = self._entry_x()
+            if entry is not None and entry.digit_count() < self._max_digits:
+                self._add_digit(key)
+
+    def _entry_x(self):
+        """EntryBuffer of the X register, made from its text if X is not being
+        typed. None if X can not be edited (e.g. '1,5e+13').
+        """
+        entry = self._stack.entry_x()
+        if entry is None:
+            entry = EntryBuffer.from_text(self._stack.peek_x(), self._number_format)
+            if entry is not None:
+                self._stack.pop()
+                self._stack.push(entry)
+        return entry
+
+    def _add_digit(self, key):
+        """Function to enter a new digit to the number in the stack last entrie
+
+        Args:
+            key (str): one of these caracters -> '0123456789,'
+        """
+        if not self._stack.has_x() or self._after_enter:
+            if self._after_enter:
+                self._stack.pop()
+                self._after_enter = False
+            entry = EntryBuffer(number_format=self._number_format)
+            entry.append(key)
+            self._stack.push(entry)
+        else:
+            entry = self._entry_x()
+            if entry is not None:
+                entry.append(key)
+
+        self.update_display()
+
+    def convert_to_radian(self, angle):
+        """Convert an angle from Degrees or Gradians to Radians
+
+        Args:
+            angle (float): angle in degree or gradian
+
+        Returns:
+            float: angle in radian
+        """
+        if self._angle_mesurement == "DEG":
+            angle = math.radians(angle)
+        elif self._angle_mesurement == "GRAD":
+            angle = angle * 360 / 400
+            angle = math.radians(angle)
+        return angle
+
+    def convert_from_radian(self, angle):
+        """Convert an angle from Radians to Degrees or Gradians
+
+        Args:
+            angle (float): angle in radian
+
+        Returns:
+            float: angle in degree or gradian
+        """
+        if self._angle_mesurement == "DEG":
+            angle = math.degrees(angle)
+        elif self._angle_mesurement == "GRAD":
+            angle = math.degrees(angle)
+            angle = angle * 400 / 360
+        return angle
+
+    @engine_key
+    def btn_operation_one_arg(self, operation):
+        """Function to connect all one argument buttons
+
+        Args:
+            operation (str): one arg button label -> +/-, 1/x, sqrt, sin, cos, tan, log, ln
+                (or any one argument operation of rpn_operations.OPERATIONS)
+
+        With MAP on (see btn_map) every stack entry is replaced, not only X.
+        """
+        if self._stack.has_x():
+            key = operation
+            operation = self._operation(key, 1)
+            if self._map:
+                self.btn_map()
+                done = self._map_stack(operation)
+            else:
+                done = self._one_arg(operation)
+            if done and operation.name != key:
+                self.btn_shift()
+        else:
+            self.no_arg("x")
+
+    def _one_arg(self, operation):
+        """Replace X by the result of an operation, ERROR for None
+
+        Returns:
+            bool: False if the calculator shows ERROR
+        """
+        self._new_x = True
+        try:
+            x_value = self._stack.pop_value()
+            if operation is None:
+                raise ValueError("unknown operation")
+            if self._decimal is None and operation.angle is None and type(x_value) is float:
+                result = operation.function(x_value)  # the common case, inlined
+                if type(result) is complex:
+                    raise ValueError("complex result")
+            else:
+                result = self._calculate(operation, x_value)
+        except Exception:
+            self.error()
+            return False
+        self._stack.push(result)
+        self.update_display()
+        return True
+
+    def _map_stack(self, operation):
+        """Replace every stack entry by the result of an operation, as a
+        single change drawn once (MAP)
+
+        A stack of floats is computed in one vectorized pass (see rpn_vector),
+        the decimals and arrays entry by entry. If the calculator would show
+        ERROR for any entry, it shows ERROR and the stack is kept.
+
+        Returns:
+            bool: False if the calculator shows ERROR
+        """
+        self._new_x = True
+        stack = self._stack
+        try:
+            if operation is None:
+                raise ValueError("unknown operation")
+            values = [stack.value(idx) for idx in range(stack.size())]
+            if self._decimal is None and all(type(value) is float for value in values):
+                import numpy as np
+
+                from rpn_vector import one_arg_operation
+
+                with np.errstate(all="ignore"):
+                    result, error = one_arg_operation(operation.name, np.array(values), self._angle_mesurement)
+                if error.any():
+                    raise ValueError(f"{operation.name} fails for an entry")
+                results = result.tolist()
+            else:
+                results = [self._calculate(operation, value) for value in values]
+        except Exception:
+            self.error()
+            return False
+        stack._replace(results, {}, stack._number, stack._formatter)
+        self.update_display()
+        return True
+
+    @engine_key
+    def btn_operation_two_arg(self, operation):
+        """Function to connect all two argumnts buttons
+
+        Args:
+            operation (str): two args button label -> +, -, *, /, %, y^x, mod
+                (or any two arguments operation of rpn_operations.OPERATIONS)
+        """
+        if not self._stack.has_x():
+            self.no_arg("x")
+        elif self._stack.has_y():
+            key = operation
+            operation = self._operation(key, 2)
+            if self._two_arg(operation) and operation.name != key:
+                self.btn_shift()
+        else:
+            self.no_arg("y")
+        self._new_x = True
+
+    def _two_arg(self, operation):
+        """Replace Y and X by the result of an operation, ERROR for None
+
+        Returns:
+            bool: False if the calculator shows ERROR
+        """
+        try:
+            x_value = self._stack.pop_value()
+            y_value = self._stack.pop_value()
+            if operation is None:
+                raise ValueError("unknown operation")
+            if self._decimal is None and operation.angle is None and type(x_value) is type(y_value) is float:
+                result = operation.function(y_value, x_value)
+                if type(result) is complex:
+                    raise ValueError("complex result")
+            else:
+                result = self._calculate(operation, y_value, x_value)
+        except Exception:
+            if self._observer is not None:
+                self._observer.show_message("y", "")
+            self.error()
+            return False
+        self._stack.push(result)
+        self.update_display()
+        return True
+
+    @engine_key
+    def btn_drop(self):
+        """Function to connect the DROP button
+        Remove the last entrie from the stack
+        """
+        if self._shift:
+            self._stack.cls()
+            self.btn_shift()
+        else:
+            self._stack.pop()
+        if self._stack.is_empty():
+            self._stack.push("0")
+        self._new_x = False
+        self.update_display()
+
+    @engine_key
+    def btn_swap(self):
+        """Function to connect the SWAP button
+        Invert the position of the two last entries in the stack
+        """
+        if self._shift:
+            if self._observer is not None:
+                self._observer.show_stack(self._stack)
+            self.btn_shift()
+        else:
+            if self._stack.has_y():
+                self._stack.swap()
+                self.update_display()
+            else:
+                self.no_arg("y")
+            self._new_x = True
+
+    @engine_key
+    def btn_enter(self):
+        """Function to connect the ENTER buttton
+        Enter a number to the stack, duplicates it and waits for a new number
+        """
+        self._stack.dup()
+        self.update_display()
+        self._after_enter = True
+
+    @engine_key
+    def btn_back(self):
+        """Function to connect the BACKSPACE button
+        Remove the last caracter from the last entrie in the stack
+        """
+        if self._stack.has_x():
+            entry = self._entry_x()
+            if entry is not None:
+                entry.backspace()
+            elif hasattr(self._stack.peek_value(), "shape"):
+                self.error()  # a vector or matrix has no digits to remove
+                return
+            else:
+                x_value = self._stack.pop()[:-1]
+                if x_value.endswith((".", ",")):
+                    x_value = x_value[:-1]
+                self._stack.push(self.format_number(x_value))
+            self.update_display()
+
+    @engine_key
+    def btn_shift(self):
+        """Function to connect the SHIFT button
+        Toggle (on/off) the shift button
+        """
+        self._shift = False if self._shift else True
+        if self._observer is not None:
+            self._observer.shift_changed(self._shift)
+
+    @engine_key
+    def btn_map(self):
+        """Function to connect the MAP key
+        Toggle (on/off) the MAP mode: the next one argument key replaces
+        every stack entry by its result, not only X
+        """
+        self._map = not self._map
+        if self._observer is not None:
+            self._observer.map_changed(self._map)
+
+    @engine_key
+    def btn_pi(self):
+        """Function to connect the PI button
+        Insert the pi number in the stack
+        """
+        self._stack.push(round(math.pi, 12) if self._decimal is None else self._decimal.pi)
+        self._new_x = True
+        self.update_display()
+
+    @engine_key
+    def btn_e(self):
+        """Function to connect the E button
+        Insert the e number in the stack
+        """
+        self._stack.push(round(math.e, 12) if self._decimal is None else self._decimal.e)
+        self._new_x = True
+        self.update_display()
+
+    @engine_key
+    def btn_aggregate(self, name):
+        """Push an aggregate of every stack entry, see NumericStack.aggregates
+
+        Args:
+            name (str): one of AGGREGATES
+        """
+        value = self._stack.aggregates()[name]
+        if value is None:
+            self.error()
+            return
+        self._stack.push(value)
+        self._new_x = True
+        self.update_display()
+
+    @engine_key
+    def btn_sigma(self):
+        """Σ+ key: accumulate the pair (x, y) of the X and Y registers in the
+        statistics registers, Σ- with SHIFT: take it back. X is replaced by
+        the number of pairs, to be overwritten by the next number typed.
+        """
+        if not self._stack.has_y():
+            self.no_arg("y")
+            return
+        size = self._stack.size()
+        x_value = self._stack.value(size - 1)
+        y_value = self._stack.value(size - 2)
+        if hasattr(x_value, "shape") or hasattr(y_value, "shape"):
+            self.error()  # a pair is two numbers, not vectors or matrices
+            return
+        x_value, y_value = float(x_value), float(y_value)
+        if self._shift:
+            self.btn_shift()
+            if self.statistics.n == 0:
+                self.error()
+                return
+            self.statistics.remove(x_value, y_value)
+        else:
+            self.statistics.add(x_value, y_value)
+        number = float if self._decimal is None else self._decimal.number
+        self._stack.pop()
+        self._stack.push(number(self.statistics.n))
+        self._new_x = False
+        self._after_enter = True
+        self.update_display()
+
+    @engine_key
+    def btn_statistic(self, name):
+        """Push a result of the statistics registers
+
+        Args:
+            name (str): one of rpn_statistics.RESULTS, e.g. 'mean_x' or 'slope'
+        """
+        value = self.statistics.results()[name]
+        if value is None:
+            self.error()
+            return
+        self._stack.push(value if self._decimal is None else self._decimal.number(value))
+        self._new_x = True
+        self.update_display()
+
+    @engine_key
+    def btn_to_array(self):
+        """Make a vector of the n entries below X = n, or with SHIFT a matrix
+        of the rows * columns entries below Y = rows and X = columns, filled
+        row by row from the oldest entry. See rpn_array.
+        """
+        stack = self._stack
+        size = stack.size()
+        counts = 2 if self._shift else 1
+        if self._shift:
+            self.btn_shift()
+        try:
+            from rpn_array import make_array
+
+            if size < counts:
+                raise ValueError("no size")
+            shape = tuple(as_integer(stack.value(idx)) for idx in range(size - counts, size))
+            count = math.prod(shape)
+            if min(shape) < 1 or size < count + counts:
+                raise ValueError("not enough entries")
+            array = make_array([stack.value(idx) for idx in range(size - counts - count, size - counts)], shape)
+        except (TypeError, ValueError, OverflowError):
+            self.error()
+            return
+        stack._truncate(count + counts)
+        stack.push(array)
+        self._new_x = True
+        self.update_display()
+
+    @engine_key
+    def btn_from_array(self):
+        """Replace a vector or matrix in X by its elements, row by row"""
+        value = self._stack.peek_value()
+        if not hasattr(value, "shape"):
+            self.error()
+            return
+        self._stack.pop()
+        number = float if self._decimal is None else self._decimal.number
+        self._stack.extend(number(element) for element in value.ravel().tolist())
+        self._new_x = True
+        self.update_display()
+
+    @engine_key
+    def paste_array(self, text):
+        """Push a table of numbers (e.g. copied from a spreadsheet) as a
+        matrix, or as a vector if it has a single row or column. See
+        read_numbers.
+
+        Raises:
+            ValueError: if a text is not a number or the rows have different
+                lengths
+        """
+        from rpn_array import make_array
+
+        rows = [list(read_numbers([line], self._number_format)) for line in text.splitlines() if line.strip()]
+        array = make_array(rows)
+        if 1 in array.shape:
+            array = array.ravel()
+        if self._after_enter and not self._new_x and self._stack.has_x():
+            self._stack.pop()  # X is replaced, as by paste
+        self._stack.push(array)
+        self._new_x = True
+        self.update_display()
+
+    @engine_key
+    def paste(self, text) -> int:
+        """Push the numbers of a text, e.g. a column pasted from a spreadsheet,
+        in order (the last one in X). See read_numbers.
+
+        All of them are a single key for undo and the display is updated once.
+
+        Raises:
+            ValueError: if a text is not a number, nothing is pushed then
+
+        Returns:
+            int: number of values pushed
+        """
+        return self._push_numbers(text.splitlines())
+
+    @engine_key
+    def import_numbers(self, path) -> int:
+        """Push the numbers of a CSV or TXT file, as paste does, reading it
+        line by line
+
+        Raises:
+            OSError: if the file can not be read
+            ValueError: if a text is not a number, nothing is pushed then
+
+        Returns:
+            int: number of values pushed
+        """
+        with open(path, encoding="utf-8-sig") as lines:
+            return self._push_numbers(lines)
+
+    def _push_numbers(self, lines):
+        number = float if self._decimal is None else self._decimal.number
+        stack = self._stack
+        replaced = None
+        if self._after_enter and not self._new_x and stack.has_x():
+            # X is replaced, as by a typed number (e.g. the 0 of a cleared stack)
+            replaced = stack._pop_entry()
+        count = 0
+        try:
+            count = stack.extend(read_numbers(lines, self._number_format, number))
+        finally:
+            if replaced is not None and not count:
+                stack._push_entry(*replaced)
+        if count:
+            self._new_x = True
+            self.update_display()
+        return count
+
+    @engine_key
+    def btn_drg(self):
+        """Function to connect the DRG button
+        Change or convert degrees units (DEG/GRAD/RAD)
+        """
+        if self._shift and self._stack.has_x():
+            if hasattr(self._stack.peek_value(), "shape"):
+                self.error()  # see rpn_array, angles are converted by the operations
+                return
+            x_value = self._stack.pop_value()
+        else:
+            x_value = None
+        mode = self._angle_mesurement
+        self._angle_mesurement = {"DEG": "RAD", "RAD": "GRAD"}.get(mode, "DEG")
+        if x_value is not None:
+            self.btn_shift()
+            if self._decimal is not None:
+                x_value = self._decimal.convert_angle(x_value, mode, self._angle_mesurement)
+            elif mode == "DEG":
+                x_value = math.radians(x_value)
+            elif mode == "RAD":
+                x_value = math.degrees(x_value * 400 / 360)
+            else:
+                x_value = x_value * 360 / 400
+            self._stack.push(x_value)
+        self.update_display()
+
+    @engine_key
+    def run(self, tokens, inputs=None):
+        """Run the tokens of a program as key presses on the stack
+
+        Args:
+            tokens (list): tokens returned by parse_program
+            inputs (dict): values of the program inputs
+
+        Returns:
+            bool: False if a key showed ERROR, the remaining tokens are skipped
+        """
+        self._error = False
+        number = float if self._decimal is None else self._decimal.number
+        for kind, value in tokens:
+            match kind:
+                case "number":
+                    self._stack.push(number(value))
+                case "input":
+                    self._stack.push(number(inputs[value]))
+                case "one_arg":
+                    self._one_arg(OPERATIONS[value])
+                case "two_arg":
+                    self._two_arg(OPERATIONS[value])
+                case "stack":
+                    if value == "enter":
+                        self._stack.dup()
+                    elif value == "swap":
+                        self._stack.swap()
+                    else:
+                        self._stack.pop()
+            if self._error:
+                break
+        self._new_x = True
+        self.update_display()
+        return not self._error
+
+    @property
+    def history(self):
+        """UndoHistory of the keys, None when running without undo"""
+        return self._history
+
+    def btn_undo(self):
+        """Undo the last key that changed the stack (Ctrl+Z)"""
+        if self._history is not None:
+            self._restore(self._history.undo(self._stack, self._state()))
+
+    def btn_redo(self):
+        """Redo the last undone key (Ctrl+Y)"""
+        if self._history is not None:
+            self._restore(self._history.redo(self._stack, self._state()))
+
+    def start_recording(self):
+        """Record the next keys in a macro, see stop_recording"""
+        self._macro = Macro()
+
+    def stop_recording(self):
+        """Stop recording keys
+
+        Returns:
+            Macro: the keys pressed since start_recording, None if not recording
+        """
+        macro, self._macro = self._macro, None
+        return macro
+
+    @property
+    def recording(self) -> bool:
+        return self._macro is not None
+
+    def _replay(self, macro, runs, last_only=False):
+        """Run the keys of a macro once for each value of 'runs'
+
+        Nothing is shown and nothing is recorded while it runs: the keys are
+        called directly, without the engine_key wrapper. The whole replay is
+        a single undo version.
+
+        Args:
+            macro (Macro): keys to run
+            runs: iterable, a value to push before each run, or None
+            last_only (bool): keep the result of the last run only
+
+        Returns:
+            list: for each run (or the last one), X after it (popped when a
+                value was pushed) or None if a key showed ERROR
+        """
+        steps = [(getattr(type(self), name).__wrapped__, args) for name, args in macro.keys]
+        observer, history = self._observer, self._history
+        if history is not None:
+            journal, state = history.snapshot(self._stack), self._state()
+        self._observer = self._history = None
+        self._display_enabled = False
+        self._running_key = True
+        stack = self._stack
+        results = deque(maxlen=1) if last_only else []
+        try:
+            for value in runs:
+                self._error = False
+                if value is not None:
+                    stack.push(value)
+                    self._new_x = True
+                for key, args in steps:
+                    key(self, *args)
+                if self._error or not stack.has_x():
+                    results.append(None)
+                elif value is not None:
+                    results.append(stack.pop_value())
+                    self._new_x = True
+                else:
+                    results.append(stack.peek_value())
+        finally:
+            self._observer, self._history = observer, history
+            self._display_enabled = True
+            self._running_key = False
+            if history is not None:
+                history.save(journal, state)
+            if observer is not None:
+                observer.shift_changed(self._shift)
+            if stack.is_empty():
+                stack.push("0")
+            self.update_display()
+        return list(results)
+
+    def replay(self, macro, times=1) -> bool:
+        """Run a macro 'times' times in a row, showing only the final state
+
+        Returns:
+            bool: False if a key showed ERROR in the last run
+        """
+        results = self._replay(macro, repeat(None, times), last_only=True)
+        return bool(results) and results[-1] is not None
+
+    def replay_over(self, macro, values) -> list:
+        """Run a macro once for each value: the value is pushed in X, the
+        macro runs and its X is popped as the result
+
+        Args:
+            macro (Macro): keys to run, e.g. recorded from 'x ENTER * 1 +'
+            values: iterable of numbers
+
+        Returns:
+            list: X after each run, None where a key showed ERROR
+        """
+        return self._replay(macro, values)
+
+    def _state(self):
+        return self._angle_mesurement, self._after_enter, self._new_x, self.statistics.state()
+
+    def _restore(self, state):
+        if state is None:
+            return
+        self._angle_mesurement, self._after_enter, self._new_x, statistics = state
+        self.statistics.restore(statistics)
+        self.update_display()
+
+    def error(self):
+        """Show 'ERROR' in the display"""
+        self._error = True
+        if self._observer is not None:
+            self._observer.show_message("x", "ERROR")
+
+    def format_number(self, number):
+        """Format a number string according to locale settings with proper grouping.
+        
+        This function takes a number string and formats it using locale-specific
+        formatting rules. It handles special cases like zero with decimal places
+        and applies grouping separators for better readability.
+        
+        Args:
+            number (str): A string representation of a number that may contain
+                        locale-specific decimal separators (like comma) and
+                        grouping separators (like dots).
+        
+        Returns:
+            str: A formatted number string with proper locale-specific grouping
+                and decimal formatting. Returns the original string unchanged
+                if it matches the pattern for zero with trailing decimal zeros.
+        """
+        integer, point, fraction = number.removeprefix("-").partition(self._number_format.decimal_point)
+        if integer == "0" and point and fraction and not fraction.strip("0"):
+            return number
+        number = self._number_format.parse(number)
+        number = self._number_format.format(number)
+    
+        return number
+
+
+def parse_program(program, inputs=(), depth=0):
+    """Split an RPN program into tokens and check its stack usage
+
+    A program is a whitespace separated sequence of numbers (written as in
+    Python, with '.' as decimal point), constants (pi, e), input names and
+    operation names (see rpn_operations and STACK_OPERATIONS). For example
+    "x 2 y^x 3 * sin". An input name hides a constant with the same name, and
+    an operation of a pack that is not loaded yet.
+
+    Args:
+        program (str): the RPN program
+        inputs (iterable): names that may be used as inputs
+        depth (int): entries already on the stack the program runs on
+
+    Raises:
+        ValueError: for an unknown token, a missing argument or an empty program
+
+    Returns:
+        list: (kind, value) tuples, kind being one of number, input, one_arg,
+            two_arg or stack
+    """
+    inputs = set(inputs)
+    tokens = []
+    for word in program.split():
+        operation = OPERATIONS.get(word)
+        if operation is not None:
+            needed, produced, token = operation.arity, 1, (OPERATION_TOKENS[operation.arity], word)
+        elif word in STACK_OPERATIONS:
+            needed, produced = STACK_OPERATIONS[word]
+            token = ("stack", word)
+        elif word in inputs:
+            needed, produced, token = 0, 1, ("input", word)
+        elif word in CONSTANTS:
+            needed, produced, token = 0, 1, ("number", CONSTANTS[word])
+        else:
+            try:
+                token = ("number", float(word))
+                needed, produced = 0, 1
+            except ValueError:
+                operation = OPERATIONS.find(word)  # maybe in an operation pack
+                if operation is None:
+                    raise ValueError(f"unknown token {word!r}") from None
+                needed, produced, token = operation.arity, 1, (OPERATION_TOKENS[operation.arity], word)
+        if depth < needed:
+            raise ValueError(f"{word!r} needs {needed} argument(s)")
+        depth += produced - needed
+        tokens.append(token)
+    if not tokens or depth < 1:
+        raise ValueError(f"program {program!r} leaves no result")
+    return tokens
+
+
+def evaluate_program(program, angle="DEG", **inputs):
+    """Evaluate an RPN program with the calculator keys
+
+    Args:
+        program (str): RPN program, see parse_program
+        angle (str): angle mode, DEG, RAD or GRAD
+        inputs: numbers bound to the input names of the program
+
+    Raises:
+        ValueError: if the program is not valid
+
+    Returns:
+        number: X register at the end of the program, None where the
+            calculator would show ERROR
+    """
+    engine = RpnEngine()
+    engine.angle = angle
+    engine.stack.cls()
+    if engine.run(parse_program(program, inputs), inputs):
+        return engine.stack.peek_value()
+    return None
+
+
+class BatchEvaluator:
+    """Evaluates batch lines, every one on an empty stack
+
+    Args:
+        angle (str): angle mode, DEG, RAD or GRAD
+        number_format: NumberFormat or locale name of the results, None for
+            Python float syntax
+    """
+
+    def __init__(self, angle="DEG", number_format=None) -> None:
+        self.engine = RpnEngine()
+        self.engine.angle = angle
+        if number_format is None:
+            self.formatter = repr
+        else:
+            self.formatter = partial(format_result, number_format=get_number_format(number_format))
+
+    def evaluate(self, line):
+        """Answer of a line
+
+        Returns:
+            tuple: (answer without newline, error message or None); the
+                answer is '' for an empty line and 'ERROR' for an invalid
+                program (with a message) or one that ends in ERROR
+        """
+        if not line.strip():
+            return "", None
+        engine = self.engine
+        engine.stack.cls()
+        try:
+            if engine.run(parse_program(line)):
+                return self.formatter(engine.stack.peek_value()), None
+        except ValueError as exc:
+            return "ERROR", str(exc)
+        return "ERROR", None
+
+    def evaluate_chunk(self, lines):
+        """Answers of several lines at once
+
+        Returns:
+            tuple: (answers, one per line ending in a newline, as one text,
+                error messages, number of ERROR answers)
+        """
+        answers = []
+        messages = []
+        errors = 0
+        for line in lines:
+            answer, message = self.evaluate(line)
+            answers.append(answer)
+            if message is not None:
+                messages.append(message)
+            if answer == "ERROR":
+                errors += 1
+        answers.append("")
+        return "\n".join(answers), messages, errors
+
+
+_batch_worker = None  # BatchEvaluator of a worker process of batch_main
+_batch_metrics = None  # its EngineMetrics, with --metrics
+
+
+def _start_batch_worker(angle, number_format, metrics=False):
+    global _batch_worker, _batch_metrics
+    _batch_worker = BatchEvaluator(angle, number_format)
+    if metrics:
+        from rpn_metrics import EngineMetrics
+
+        _batch_metrics = EngineMetrics()
+        _batch_metrics.attach(_batch_worker.engine)
+
+
+def _evaluate_batch_chunk(lines):
+    result = _batch_worker.evaluate_chunk(lines)
+    if _batch_metrics is None:
+        return result, None
+    snapshot = _batch_metrics.snapshot()
+    _batch_metrics.reset()
+    return result, snapshot
+
+
+def _read_lines(paths, errors):
+    """Lines of the files in turn, up to one that can not be opened: its
+    OSError is appended to 'errors'
+    """
+    for path in paths:
+        try:
+            stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        except OSError as exc:
+            errors.append(exc)
+            return
+        with stream:
+            yield from stream
+
+
+def _parallel_batch(lines, jobs, angle, number_format, flush, metrics=None):
+    """Answer the lines in worker processes, written in input order
+
+    The lines are sent in chunks of BATCH_CHUNK, at most two per worker at a
+    time, so the memory use does not depend on the input size either. The
+    counters of the workers are merged into 'metrics', an EngineMetrics, if
+    it is given.
+
+    Returns:
+        int: number of ERROR answers
+    """
+    import multiprocessing
+
+    errors = 0
+    pending = deque()
+    chunks = iter(lambda: list(islice(lines, BATCH_CHUNK)), [])
+    with multiprocessing.Pool(jobs, _start_batch_worker, (angle, number_format, metrics is not None)) as pool:
+        for chunk in chunks:
+            pending.append(pool.apply_async(_evaluate_batch_chunk, (chunk,)))
+            if len(pending) < 2 * jobs:
+                continue
+            errors += _write_chunk(pending.popleft().get(), flush, metrics)
+        while pending:
+            errors += _write_chunk(pending.popleft().get(), flush, metrics)
+    return errors
+
+
+def _write_chunk(result, flush, metrics):
+    (text, messages, errors), snapshot = result
+    if snapshot is not None:
+        metrics.merge(snapshot)
+    for message in messages:
+        print(f"rpn: {message}", file=sys.stderr)
+    sys.stdout.write(text)
+    if flush:
+        sys.stdout.flush()
+    return errors
+
+
+def batch_main(argv=None):
+    """Evaluate RPN programs read line by line, writing one result per line
+
+    Used by 'python rpn.py --batch'. Lines are read and answered one at a
+    time, so memory use does not depend on the input size. With --jobs the
+    lines are answered in chunks by a pool of processes, still in the input
+    order, to use every core. Invalid programs and programs that end in ERROR
+    are answered with 'ERROR'; empty lines are answered with empty lines.
+
+    Args:
+        argv (list): command line arguments, sys.argv[1:] by default
+
+    Returns:
+        int: exit status, 1 if any line was answered with ERROR, 2 if a file
+            can not be read
+    """
+    parser = argparse.ArgumentParser(
+        prog="rpn.py --batch",
+        description="Evaluate one RPN program per line, e.g. '3 4 + 2 y^x'.",
+    )
+    parser.add_argument(
+        "files", nargs="*", default=["-"], help="files with programs, - for stdin"
+    )
+    parser.add_argument("--angle", choices=("DEG", "RAD", "GRAD"), default="DEG")
+    parser.add_argument(
+        "--format",
+        choices=("plain", "locale"),
+        default="plain",
+        help="plain: Python float syntax, locale: as shown in the display",
+    )
+    parser.add_argument(
+        "--locale", choices=tuple(NUMBER_FORMATS), default="pt-BR", help="separators of --format locale"
+    )
+    parser.add_argument(
+        "--line-buffered", action="store_true", help="flush after every result (every chunk with --jobs)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="worker processes evaluating chunks of lines, 0 for one per CPU (1)",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="write the call counts and latencies of the engine to FILE, in the Prometheus text format "
+        "if it ends with .prom, as JSON otherwise (see rpn_metrics)",
+    )
+    args = parser.parse_args(
+        [arg for arg in (sys.argv[1:] if argv is None else argv) if arg != "--batch"]
+    )
+
+    number_format = args.locale if args.format == "locale" else None
+    jobs = args.jobs or os.cpu_count() or 1
+    open_errors = []
+    lines = _read_lines(args.files, open_errors)
+    metrics = None
+    if args.metrics:
+        from rpn_metrics import EngineMetrics
+
+        metrics = EngineMetrics()
+    status = 0
+    try:
+        if jobs > 1:
+            status = int(_parallel_batch(lines, jobs, args.angle, number_format, args.line_buffered, metrics) > 0)
+        else:
+            evaluator = BatchEvaluator(args.angle, number_format)
+            if metrics is not None:
+                metrics.attach(evaluator.engine)
+            write = sys.stdout.write
+            for line in lines:
+                answer, message = evaluator.evaluate(line)
+                if message is not None:
+                    print(f"rpn: {message}", file=sys.stderr)
+                if answer == "ERROR":
+                    status = 1
+                write(answer + "\n")
+                if args.line_buffered:
+                    sys.stdout.flush()
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # the reader went away (e.g. '| head'): stop quietly, without a second
+        # BrokenPipeError when the interpreter flushes stdout on exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    for exc in open_errors:
+        print(f"rpn: cannot open {exc.filename}: {exc.strerror}", file=sys.stderr)
+        status = 2  # as the command line errors of argparse
+    if metrics is not None:
+        metrics.dump(args.metrics)
+    return status
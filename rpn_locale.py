@@ -0,0 +1,153 @@
+"""
+Locale number formats of PyRPN, independent of the C locale.
+
+A NumberFormat holds the decimal point and thousands separator of a locale
+and formats and parses numbers with them, with the same output as
+locale.format_string(..., grouping=True) and locale.atof under that locale.
+It reads no global state, so it works where the locale is not installed, is
+safe to use from several threads and is faster than the locale module, which
+calls localeconv() for every number.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import re
+
+
+class NumberFormat:
+    """Decimal point and thousands separator of a locale, digits grouped by 3
+
+    Args:
+        decimal_point (str): e.g. ',' for pt-BR
+        thousands_sep (str): e.g. '.' for pt-BR, '' for no grouping
+    """
+
+    __slots__ = ("decimal_point", "thousands_sep", "_plain_number", "_grouped_number")
+
+    def __init__(self, decimal_point, thousands_sep) -> None:
+        if not decimal_point or decimal_point == thousands_sep:
+            raise ValueError("the decimal point must be set and differ from the thousands separator")
+        self.decimal_point = decimal_point
+        self.thousands_sep = thousands_sep
+        self._plain_number = re.compile(
+            f"^(-?)([0-9{re.escape(thousands_sep)}]*)({re.escape(decimal_point)}([0-9]*))?$"
+        )
+        self._grouped_number = re.compile(
+            f"^[-+]?[0-9]{{1,3}}({re.escape(thousands_sep)}[0-9]{{3}})*"
+            f"({re.escape(decimal_point)}[0-9]*)?([eE][-+]?[0-9]+)?$"
+        )
+
+    def __repr__(self) -> str:
+        return f"NumberFormat({self.decimal_point!r}, {self.thousands_sep!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, NumberFormat):
+            return NotImplemented
+        return (self.decimal_point, self.thousands_sep) == (other.decimal_point, other.thousands_sep)
+
+    def __hash__(self) -> int:
+        return hash((self.decimal_point, self.thousands_sep))
+
+    @classmethod
+    def from_localeconv(cls, conventions=None):
+        """NumberFormat of the current C locale (or of a localeconv() dict)
+
+        Raises:
+            ValueError: if the locale groups digits other than by 3
+        """
+        if conventions is None:
+            import locale
+
+            conventions = locale.localeconv()
+        grouping = list(conventions["grouping"])
+        thousands_sep = conventions["thousands_sep"]
+        if not grouping or grouping[0] in (0, 127):  # 127 is CHAR_MAX, no grouping
+            thousands_sep = ""
+        elif any(interval not in (3, 0) for interval in grouping):
+            raise ValueError(f"grouping {grouping} is not supported")
+        return cls(conventions["decimal_point"], thousands_sep)
+
+    def localize(self, text) -> str:
+        """Group and localize a number formatted with '%', as
+        locale.format_string does with grouping=True
+
+        Args:
+            text (str): e.g. '%.12g' % value, with '.' as decimal point
+        """
+        integer, point, fraction = text.partition(".")
+        end = len(integer)
+        if end > 3 and self.thousands_sep:
+            sign = 1 if integer[0] == "-" else 0
+            if integer[sign:].isdigit():
+                cut = sign + ((end - sign) % 3 or 3)
+                grouped = integer[:cut]
+                while cut < end:
+                    grouped += self.thousands_sep + integer[cut:cut + 3]
+                    cut += 3
+                integer = grouped
+        if point:
+            return integer + self.decimal_point + fraction
+        return integer
+
+    def format(self, value, digits=12) -> str:
+        """'%.{digits}g' of a number, grouped with the locale separators"""
+        return self.localize("%.*g" % (digits, value))
+
+    def parse(self, text, number=float, strict=False):
+        """Number of a text in this format, as locale.atof
+
+        Args:
+            text (str): e.g. '1.234,5' for pt-BR
+            number: numeric type called on the delocalized text
+            strict (bool): only accept thousands separators between groups
+                of 3 digits of the integer part, so '1,2,3' is not 123 in
+                en-US (locale.atof accepts them anywhere)
+
+        Raises:
+            ValueError: if the text is not a number
+        """
+        if self.thousands_sep and self.thousands_sep in text:
+            if strict and not self._grouped_number.match(text):
+                raise ValueError(f"{text!r} is not a number")
+            text = text.replace(self.thousands_sep, "")
+        return number(text.replace(self.decimal_point, "."))
+
+    def plain_number(self, text):
+        """Match of a number as typed: (sign, grouped integer, decimal point
+        and fraction, fraction), None for other texts like '1,5e+13' or 'inf'
+        """
+        return self._plain_number.match(text)
+
+
+PT_BR = NumberFormat(",", ".")
+EN_US = NumberFormat(".", ",")
+
+# locale name -> NumberFormat, for the --locale option
+NUMBER_FORMATS = {
+    "pt-BR": PT_BR,
+    "de-DE": PT_BR,
+    "es-ES": PT_BR,
+    "it-IT": PT_BR,
+    "en-US": EN_US,
+    "en-GB": EN_US,
+    "ja-JP": EN_US,
+}
+
+
+def get_number_format(name_or_format):
+    """NumberFormat of a locale name (see NUMBER_FORMATS), or the given one
+
+    Raises:
+        ValueError: for an unknown locale name
+    """
+    if isinstance(name_or_format, NumberFormat):
+        return name_or_format
+    try:
+        return NUMBER_FORMATS[name_or_format.replace("_", "-")]
+    except KeyError:
+        raise ValueError(f"unknown locale {name_or_format!r}, one of {', '.join(NUMBER_FORMATS)}") from None
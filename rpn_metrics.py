@@ -0,0 +1,248 @@
+"""
+Performance counters of the PyRPN engine.
+
+EngineMetrics counts the calls of the engine entry points and keeps a
+latency histogram of each one, the operation keys one per operation:
+
+    metrics = EngineMetrics()
+    metrics.attach(engine)      # from now on every key is timed
+    ...
+    print(metrics.to_prometheus())
+    metrics.detach(engine)
+
+attach wraps the entry points of that engine object only, as instance
+attributes, and detach removes them, so an engine that was never attached
+runs exactly the code it runs without this module: the counters cost
+nothing while they are off. Only the standard library is used.
+
+The engine's update_display only hands the registers to the window, which
+draws them once control returns to the Qt event loop; the calculator counts
+that redraw as 'flush_display' (see PyRpnEvaluate.flush_display).
+
+The counters are shown by the hidden debug panel of the calculator
+(Ctrl+Shift+D), and dumped as JSON or in the Prometheus text format by
+'python rpn.py --metrics[=FILE]' and 'python rpn.py --batch --metrics FILE'.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import json
+import math
+import sys
+from bisect import bisect_left
+from time import perf_counter
+
+# upper bounds of the histogram buckets, in seconds, as Prometheus 'le'
+BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+)
+# RpnEngine methods timed by attach -> True for the keys of an operation,
+# counted per operation
+ENTRY_POINTS = {
+    "btn_number": False,
+    "_add_digit": False,
+    "btn_operation_one_arg": True,
+    "btn_operation_two_arg": True,
+    "_one_arg": True,  # also run by programs and the batch mode
+    "_two_arg": True,
+    "format_number": False,
+    "update_display": False,
+}
+
+
+class Histogram:
+    """Number of calls, total time and calls per latency bucket
+
+    Attributes:
+        count (int): number of calls
+        total (float): seconds of all the calls
+        buckets (list): calls per bucket of BUCKETS, and above the last one
+    """
+
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, total={self.total!r})"
+
+    def add(self, seconds) -> None:
+        """Count a call that took 'seconds'"""
+        self.count += 1
+        self.total += seconds
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def merge(self, count, total, buckets) -> None:
+        """Add the calls of another histogram (see EngineMetrics.snapshot)"""
+        self.count += count
+        self.total += total
+        self.buckets = [mine + theirs for mine, theirs in zip(self.buckets, buckets)]
+
+    def quantile(self, fraction) -> float:
+        """Upper bound of the bucket holding the given fraction of the calls,
+        e.g. 0.99 for the 99th percentile (inf above the last bucket, nan
+        without calls)
+        """
+        if not self.count:
+            return math.nan
+        rank = fraction * self.count
+        calls = 0
+        for bound, bucket in zip(BUCKETS, self.buckets):
+            calls += bucket
+            if calls >= rank:
+                return bound
+        return math.inf
+
+
+class EngineMetrics:
+    """Histograms of the entry points of the engines attached to it
+
+    The histograms are keyed by (entry point, operation), the operation
+    being '' for the entry points that are not an operation key.
+    """
+
+    def __init__(self) -> None:
+        self.histograms = {}
+        self._attached = []  # (engine, names wrapped)
+
+    def __repr__(self) -> str:
+        return f"EngineMetrics({len(self.histograms)} histograms)"
+
+    @property
+    def enabled(self) -> bool:
+        """True while an engine is attached"""
+        return bool(self._attached)
+
+    def record(self, entry, operation, seconds) -> None:
+        """Count a call of an entry point"""
+        histogram = self.histograms.get((entry, operation))
+        if histogram is None:
+            histogram = self.histograms[(entry, operation)] = Histogram()
+        histogram.add(seconds)
+
+    def attach(self, engine, entry_points=None) -> None:
+        """Time the entry points of an engine
+
+        Args:
+            engine: RpnEngine (or any object with the methods)
+            entry_points (dict): method name -> True if it is counted per
+                operation (its first argument, an operation name or
+                Operation), ENTRY_POINTS by default
+        """
+        if entry_points is None:
+            entry_points = ENTRY_POINTS
+        names = []
+        for name, per_operation in entry_points.items():
+            if name in vars(engine):
+                continue  # already timed
+            setattr(engine, name, self._timed(name, getattr(engine, name), per_operation))
+            names.append(name)
+        self._attached.append((engine, names))
+
+    def detach(self, engine) -> None:
+        """Stop timing an engine, it runs its own methods again"""
+        for attached in list(self._attached):
+            if attached[0] is engine:
+                for name in attached[1]:
+                    delattr(engine, name)
+                self._attached.remove(attached)
+
+    def _timed(self, entry, method, per_operation):
+        record = self.record
+        if per_operation:
+            def timed(operation, *args):
+                start = perf_counter()
+                try:
+                    return method(operation, *args)
+                finally:
+                    record(entry, getattr(operation, "name", operation) or "", perf_counter() - start)
+        else:
+            def timed(*args):
+                start = perf_counter()
+                try:
+                    return method(*args)
+                finally:
+                    record(entry, "", perf_counter() - start)
+        return timed
+
+    def reset(self) -> None:
+        """Forget every call counted"""
+        self.histograms.clear()
+
+    def snapshot(self) -> list:
+        """The counters as JSON serializable data, see merge
+
+        Returns:
+            list: a dict per histogram with entry, operation, count,
+                seconds (total) and buckets (calls per bucket of BUCKETS, the
+                last one above them), the most called first
+        """
+        return [
+            {
+                "entry": entry,
+                "operation": operation,
+                "count": histogram.count,
+                "seconds": histogram.total,
+                "buckets": list(histogram.buckets),
+            }
+            for (entry, operation), histogram in sorted(
+                self.histograms.items(), key=lambda item: (-item[1].count, item[0])
+            )
+        ]
+
+    def merge(self, snapshot) -> None:
+        """Add the counters of a snapshot, e.g. of another process"""
+        for item in snapshot:
+            key = (item["entry"], item["operation"])
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.merge(item["count"], item["seconds"], item["buckets"])
+
+    def to_json(self) -> str:
+        """The counters as a JSON document"""
+        return json.dumps({"version": 1, "buckets": list(BUCKETS), "histograms": self.snapshot()}, indent=2)
+
+    def to_prometheus(self) -> str:
+        """The counters in the Prometheus text exposition format, as the
+        histogram pyrpn_call_seconds with the labels entry and operation
+        """
+        lines = [
+            "# HELP pyrpn_call_seconds Latency of the calculator engine entry points.",
+            "# TYPE pyrpn_call_seconds histogram",
+        ]
+        for item in self.snapshot():
+            labels = f'entry="{item["entry"]}",operation="{_escape(item["operation"])}"'
+            calls = 0
+            for bound, bucket in zip(BUCKETS + (math.inf,), item["buckets"]):
+                calls += bucket
+                le = "+Inf" if bound == math.inf else repr(bound)
+                lines.append(f'pyrpn_call_seconds_bucket{{{labels},le="{le}"}} {calls}')
+            lines.append(f"pyrpn_call_seconds_sum{{{labels}}} {item['seconds']!r}")
+            lines.append(f"pyrpn_call_seconds_count{{{labels}}} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path=None) -> None:
+        """Write the counters to a file, in the Prometheus text format if its
+        name ends with '.prom', as JSON otherwise, or as JSON to stderr if
+        path is None
+        """
+        if path is None:
+            print(self.to_json(), file=sys.stderr)
+            return
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json() + "\n"
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(text)
+
+
+def _escape(label):
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
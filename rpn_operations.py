@@ -0,0 +1,241 @@
+"""
+Registry of the operations of PyRPN.
+
+Every operation a key or an RPN program can run is an Operation in the
+OPERATIONS registry: its arity, its float implementation, the operation its
+key runs with SHIFT and, when it has them, its decimal, vectorized and
+compiled versions and the button it is on. The engine, the program compiler,
+the vectorized evaluator and the window all dispatch through this one table,
+with a dict lookup.
+
+Operation packs add operations to it. A pack is a function that takes the
+registry and registers its operations; it is registered with add_pack or
+published by an installed distribution under the 'pyrpn.operations' entry
+point group. Packs are only imported the first time a name is not found, so
+they cost nothing to the startup:
+
+    # setup.cfg of a pack
+    [options.entry_points]
+    pyrpn.operations =
+        hyperbolic = pyrpn_hyperbolic:register
+
+    # pyrpn_hyperbolic.py
+    def register(operations):
+        operations.register(Operation("sinh", 1, math.sinh, shifted="asinh"))
+        operations.register(Operation("asinh", 1, math.asinh))
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import math
+import operator
+
+ENTRY_POINT_GROUP = "pyrpn.operations"
+MAX_FACTORIAL = 170  # the largest n whose n! fits in a float
+
+
+def as_integer(value) -> int:
+    """Convert an integral number to int, raising ValueError otherwise"""
+    integer = int(value)
+    if integer != value:
+        raise ValueError(f"{value} is not an integer")
+    return integer
+
+
+def factorial(value) -> float:
+    """n! as a float, raising OverflowError for n above MAX_FACTORIAL before
+    computing it (math.factorial of a huge n runs for minutes)
+    """
+    integer = as_integer(value)
+    if integer > MAX_FACTORIAL:
+        raise OverflowError(f"{integer}! is too large")
+    return float(math.factorial(integer))
+
+
+def tangent(angle):
+    """math.tan with the calculator's ERROR for multiples of pi/2"""
+    if angle % (math.pi / 2) == 0:
+        raise ValueError("tangent of a multiple of pi/2")
+    return math.tan(angle)
+
+
+class Operation:
+    """An operation of the calculator
+
+    Args:
+        name (str): name in RPN programs, the button label for unshifted keys
+        arity (int): 1 for an operation on X, 2 for an operation on Y and X
+        function: float implementation, function(x) or function(y, x), raising
+            ArithmeticError or ValueError where the calculator shows ERROR
+            (complex results are ERROR too)
+        shifted (str): name of the operation the same key runs with SHIFT
+        angle (str): 'argument' if X is an angle (converted to radian before
+            calling the function), 'result' if the result is an angle in
+            radian (converted to the angle mode), None otherwise
+        decimal: implementation for the decimal precision mode,
+            decimal(decimal_math, x, mode) or decimal(decimal_math, y, x),
+            None to compute with the float function
+        vectorized: NumPy implementation, vectorized(x, mode) or
+            vectorized(y, x), returning (result, error mask); None to call the
+            float function row by row (see rpn_vector)
+        template: Python expression compiled by rpn_compiler, of {x} (already
+            converted to radian for angle='argument') and {y}; None to call
+            the float function
+        button (str): name of the window's button running it, if any
+    """
+
+    __slots__ = ("name", "arity", "function", "shifted", "angle", "decimal", "vectorized", "template", "button")
+
+    def __init__(
+        self, name, arity, function, shifted=None, angle=None, decimal=None, vectorized=None, template=None, button=None
+    ) -> None:
+        if arity not in (1, 2):
+            raise ValueError(f"arity of {name!r} must be 1 or 2")
+        if angle not in (None, "argument", "result"):
+            raise ValueError(f"unknown angle handling {angle!r}")
+        self.name = name
+        self.arity = arity
+        self.function = function
+        self.shifted = shifted
+        self.angle = angle
+        self.decimal = decimal
+        self.vectorized = vectorized
+        self.template = template
+        self.button = button
+
+    def __repr__(self) -> str:
+        return f"Operation({self.name!r}, {self.arity})"
+
+
+class OperationRegistry(dict):
+    """Operations by name, with operation packs loaded on the first miss
+
+    registry[name] is a plain dict lookup; only when the name is missing are
+    the pending packs loaded (KeyError if it is still missing). get, 'in' and
+    iteration only see the operations registered so far.
+
+    Args:
+        entry_points (bool): also load the packs published under
+            ENTRY_POINT_GROUP by the installed distributions
+    """
+
+    def __init__(self, entry_points=True) -> None:
+        super().__init__()
+        self._packs = []  # packs not loaded yet
+        self._entry_points = entry_points
+
+    def __missing__(self, name):
+        if not (self._packs or self._entry_points):
+            raise KeyError(name)
+        self.load_packs()
+        if name not in self:
+            raise KeyError(name)
+        return self.get(name)
+
+    def find(self, name):
+        """Operation called 'name', loading the pending packs if it is not
+        registered yet, None if there is none
+        """
+        try:
+            return self[name]
+        except KeyError:
+            return None
+
+    def register(self, operation, replace=False) -> Operation:
+        """Add an operation
+
+        Raises:
+            ValueError: if the name is taken and replace is False
+        """
+        if operation.name in self and not replace:
+            raise ValueError(f"operation {operation.name!r} is already registered")
+        self[operation.name] = operation
+        return operation
+
+    def add_pack(self, pack) -> None:
+        """Register a pack, loaded the first time a name is not found
+
+        Args:
+            pack: function(registry) registering operations, or its
+                'module:function' path, imported only when it is loaded
+        """
+        self._packs.append(pack)
+
+    def load_packs(self) -> None:
+        """Load the pending packs, and the entry point packs the first time"""
+        if self._entry_points:
+            self._entry_points = False
+            from importlib.metadata import entry_points
+
+            self._packs.extend(entry_points(group=ENTRY_POINT_GROUP))
+        while self._packs:
+            pack = self._packs.pop(0)
+            if isinstance(pack, str):
+                from importlib import import_module
+
+                module, _, function = pack.partition(":")
+                pack = getattr(import_module(module), function)
+            elif hasattr(pack, "load"):  # an importlib.metadata.EntryPoint
+                pack = pack.load()
+            pack(self)
+
+    def names(self, arity=None) -> tuple:
+        """Names of the registered operations, of an arity if given"""
+        return tuple(name for name, operation in self.items() if arity in (None, operation.arity))
+
+
+def _decimal_one_arg(name):
+    def decimal(decimal_math, x_value, mode):
+        return decimal_math.one_arg_operation(name, x_value, mode)
+    return decimal
+
+
+def _decimal_two_arg(name):
+    def decimal(decimal_math, y_value, x_value):
+        return decimal_math.two_arg_operation(name, y_value, x_value)
+    return decimal
+
+
+def _builtin(name, arity, function, **kwargs):
+    decimal = _decimal_one_arg(name) if arity == 1 else _decimal_two_arg(name)
+    return Operation(name, arity, function, decimal=decimal, **kwargs)
+
+
+# the calculator keys, the templates use the names of rpn_compiler.NAMESPACE
+BUILTIN_OPERATIONS = (
+    _builtin("+/-", 1, lambda x: x * -1.0, template="{x} * -1.0", button="btn_change_sign"),
+    _builtin("1/x", 1, lambda x: 1 / x, shifted="n!", template="1 / {x}", button="btn_x_inv"),
+    _builtin("sqrt", 1, lambda x: x ** 0.5, shifted="x^2", template="_real({x} ** 0.5)", button="btn_sqrt"),
+    _builtin("sin", 1, math.sin, shifted="asin", angle="argument", template="_sin({x})", button="btn_sin"),
+    _builtin("cos", 1, math.cos, shifted="acos", angle="argument", template="_cos({x})", button="btn_cos"),
+    _builtin("tan", 1, tangent, shifted="atan", angle="argument", template="_tan({x})", button="btn_tan"),
+    _builtin("log", 1, math.log10, shifted="10^x", template="_log10({x})", button="btn_log"),
+    _builtin("ln", 1, math.log, shifted="e^x", template="_log({x})", button="btn_ln"),
+    _builtin("n!", 1, factorial, template="_factorial({x})"),
+    _builtin("x^2", 1, lambda x: x ** 2.0, template="{x} ** 2.0"),
+    _builtin("asin", 1, math.asin, angle="result", template="_asin({x})"),
+    _builtin("acos", 1, math.acos, angle="result", template="_acos({x})"),
+    _builtin("atan", 1, math.atan, angle="result", template="_atan({x})"),
+    _builtin("10^x", 1, lambda x: 10 ** x, template="10 ** {x}"),
+    _builtin("e^x", 1, lambda x: math.e ** x, template="_e ** {x}"),
+    _builtin("+", 2, operator.add, template="{y} + {x}", button="btn_add"),
+    _builtin("-", 2, operator.sub, template="{y} - {x}", button="btn_minus"),
+    _builtin("*", 2, operator.mul, template="{y} * {x}", button="btn_multiply"),
+    _builtin("/", 2, operator.truediv, template="{y} / {x}", button="btn_divide"),
+    _builtin("%", 2, lambda y, x: y * (x / 100), template="{y} * ({x} / 100)", button="btn_percent"),
+    _builtin("y^x", 2, operator.pow, shifted="root", template="_real({y} ** {x})", button="btn_y_exp_x"),
+    _builtin("mod", 2, operator.mod, template="{y} % {x}", button="btn_mod"),
+    _builtin("root", 2, lambda y, x: y ** (1.0 / x), template="_real({y} ** (1.0 / {x}))"),
+)
+
+# the operations of this process: the calculator keys and the loaded packs
+OPERATIONS = OperationRegistry()
+for _operation in BUILTIN_OPERATIONS:
+    OPERATIONS.register(_operation)
+del _operation
+OPERATIONS.add_pack("rpn_array:register")  # matrix operations, they import NumPy
@@ -0,0 +1,94 @@
+"""
+Startup profiling for PyRPN.
+
+'python rpn.py --profile-startup' times every launch phase (imports, UI
+loading, signal wiring, first display and first paint), writes the
+timeline as JSON to stderr and exits. Use '--profile-startup=FILE' to write
+it to a file. Only the standard library is imported here, so the profile can
+start before Qt is imported.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+
+PROFILE_OPTION = "--profile-startup"
+
+
+class StartupProfile:
+    """Timeline of named launch phases, in milliseconds from its creation
+
+    Args:
+        enabled (bool): record phases, when False every method does nothing
+        output (str): file the timeline is written to, None for stderr
+    """
+
+    def __init__(self, enabled=False, output=None):
+        self.enabled = enabled
+        self.output = output
+        self._origin = time.perf_counter()
+        self._events = []
+
+    def _now(self):
+        return (time.perf_counter() - self._origin) * 1000.0
+
+    @contextmanager
+    def phase(self, name):
+        """Time the code run inside the 'with' block as the phase 'name'"""
+        if not self.enabled:
+            yield
+            return
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._events.append(
+                {"name": name, "start_ms": start, "duration_ms": self._now() - start}
+            )
+
+    def mark(self, name):
+        """Record an instant of the launch, like the first paint"""
+        if self.enabled:
+            self._events.append({"name": name, "start_ms": self._now(), "duration_ms": 0.0})
+
+    def timeline(self):
+        """Returns the recorded launch as a JSON serializable dict"""
+        return {
+            "version": 1,
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "total_ms": self._now(),
+            "events": sorted(self._events, key=lambda event: event["start_ms"]),
+        }
+
+    def dump(self):
+        """Write the timeline as JSON to the output file or stderr"""
+        text = json.dumps(self.timeline(), indent=2)
+        if self.output:
+            with open(self.output, "w", encoding="utf-8") as output:
+                output.write(text + "\n")
+        else:
+            print(text, file=sys.stderr)
+
+
+def from_argv(argv):
+    """StartupProfile enabled by --profile-startup[=FILE] in argv"""
+    for arg in argv:
+        if arg == PROFILE_OPTION:
+            return StartupProfile(enabled=True)
+        if arg.startswith(PROFILE_OPTION + "="):
+            return StartupProfile(enabled=True, output=arg.split("=", 1)[1])
+    return StartupProfile()
+
+
+# the profile of this process, enabled from the command line
+startup_profile = from_argv(sys.argv[1:])
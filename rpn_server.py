@@ -0,0 +1,306 @@
+"""
+Calculation service for PyRPN over a local socket.
+
+'python rpn.py --serve' runs an asyncio server, on a Unix socket or a
+localhost TCP port, where every connection is a session with its own stack
+and angle mode, as a calculator window. A client sends one command per line
+and gets one line back per command, in order, so commands can be pipelined:
+
+    3 4 +               RPN program run on the session's stack (see
+                        rpn_engine.parse_program), answered with X, Y and Z
+                        separated by tabs: '7<TAB>0<TAB>'
+    DEG, RAD or GRAD    angle mode, answered with X, Y and Z
+    clear               empty the stack (it holds 0), answered with X, Y and Z
+    quit                close the session
+
+A command that shows ERROR on the calculator, or that can not be parsed, is
+answered with 'ERROR' and a reason. Only the standard library and the engine
+are used, no Qt.
+
+The commands run in a pool of threads, the lines a client sent together in
+one batch, so a slow command does not hold up the other sessions. A command
+running for longer than the command timeout is answered with 'ERROR timeout'
+and its session is closed (its thread finishes the command, its stack is
+dropped).
+
+A client that does not read its answers is not read any more once its
+unsent answers pass HIGH_WATER bytes, so a fast writer can not make the
+server buffer without limit. Sessions idle for longer than the idle timeout
+are closed.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rpn_engine import RpnEngine, parse_program
+from rpn_locale import NUMBER_FORMATS
+
+HIGH_WATER = 64 * 1024  # bytes of answers buffered for a client before it is not read
+LINE_LIMIT = 64 * 1024  # longest command, in bytes, and most bytes read at once
+BACKLOG = 1024  # connections waiting to be accepted, for bursts of clients
+ANGLE_COMMANDS = {"DEG", "RAD", "GRAD"}
+
+
+class Session:
+    """Stack and angle mode of a connection, running its commands
+
+    Args:
+        precision (int): significant digits of the results
+        number_format (str): locale of the answers if plain is False, see
+            rpn_locale
+        plain (bool): answer numbers in Python syntax ('1234.5') instead of
+            as the display shows them ('1.234,5')
+    """
+
+    def __init__(self, precision=12, number_format="pt-BR", plain=True) -> None:
+        self.engine = RpnEngine(precision=precision, number_format=number_format)
+        self.plain = plain
+        self.last_active = 0.0  # event loop time of the last command
+        self.started = None  # time.monotonic() when the running command started
+        self.timed_out = False  # the session is closed, run no more commands
+
+    def registers(self) -> str:
+        """X, Y and Z, separated by tabs ('' for the missing ones)"""
+        stack = self.engine.stack
+        size = stack.size()
+        texts = []
+        for idx in range(size - 1, size - 4, -1):
+            if idx < 0:
+                texts.append("")
+            elif self.plain:
+                texts.append(str(stack.value(idx)))
+            else:
+                texts.append(stack.item(idx))
+        return "\t".join(texts)
+
+    def execute(self, command) -> str:
+        """Run a command line and return its answer, without a newline"""
+        words = command.split()
+        if len(words) == 1 and words[0].upper() in ANGLE_COMMANDS:
+            self.engine.angle = words[0].upper()
+        elif len(words) == 1 and words[0] == "clear":
+            self.engine.stack.cls()
+            self.engine.stack.push("0")
+        elif words:
+            try:
+                tokens = parse_program(command, depth=self.engine.stack.size())
+            except ValueError as exc:
+                return f"ERROR {exc}"
+            try:
+                if not self.engine.run(tokens):
+                    return "ERROR"
+            except ValueError as exc:  # e.g. a number that can not be typed
+                return f"ERROR {exc}"
+        return self.registers()
+
+    def execute_lines(self, lines, answers) -> None:
+        """Run command lines, in a thread of the server, appending their
+        answers to 'answers' as they finish, until the session times out
+        """
+        for line in lines:
+            if self.timed_out:
+                break
+            self.started = time.monotonic()
+            answers.append(self.execute(line.decode("utf-8", "replace")))
+        self.started = None
+
+
+class RpnServer:
+    """asyncio server running a Session for every connection
+
+    Args:
+        idle_timeout (float): seconds without a command before a session is
+            closed
+        max_sessions (int): connections beyond it are answered with an ERROR
+            and closed
+        command_timeout (float): seconds a command may run before its session
+            is answered with 'ERROR timeout' and closed
+        workers (int): threads running the commands, None for the default of
+            ThreadPoolExecutor
+        session_options: arguments of every Session
+    """
+
+    def __init__(
+        self, idle_timeout=300.0, max_sessions=10000, command_timeout=10.0, workers=None, **session_options
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.command_timeout = command_timeout
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="rpn-session")
+        self._session_options = session_options
+        self._sessions = {}  # Session -> its StreamWriter
+        self._tasks = set()  # tasks serving the sessions
+        self._server = None
+        self._evictor = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def start(self, path=None, host="127.0.0.1", port=0):
+        """Listen on the Unix socket 'path', or on host:port if it is None
+
+        Returns:
+            asyncio.Server: the listening server (port 0 picks a free port)
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._serve, path, limit=LINE_LIMIT, backlog=BACKLOG)
+        else:
+            self._server = await asyncio.start_server(
+                self._serve, host, port, limit=LINE_LIMIT, backlog=BACKLOG
+            )
+        self._evictor = asyncio.create_task(self._evict_idle())
+        return self._server
+
+    async def close(self) -> None:
+        """Stop listening and close every session"""
+        if self._evictor is not None:
+            self._evictor.cancel()
+        self._server.close()
+        for writer in list(self._sessions.values()):
+            writer.close()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _serve(self, reader, writer):
+        if len(self._sessions) >= self.max_sessions:
+            writer.write(b"ERROR too many sessions\n")
+            writer.close()
+            return
+        loop = asyncio.get_running_loop()
+        transport = writer.transport
+        session = Session(**self._session_options)
+        session.last_active = loop.time()
+        self._sessions[session] = writer
+        self._tasks.add(asyncio.current_task())
+        pending = b""  # the start of a line not received yet
+        try:
+            while True:
+                data = await reader.read(LINE_LIMIT)
+                if data:
+                    lines = (pending + data).split(b"\n")
+                    pending = lines.pop()
+                else:  # the end of the stream ends the last line
+                    lines = [pending] if pending else []
+                if len(pending) > LINE_LIMIT:
+                    writer.write(b"ERROR command too long\n")
+                    break
+                end = next((idx for idx, line in enumerate(lines) if line.strip() == b"quit"), None)
+                if end is not None:
+                    del lines[end:]
+                session.last_active = loop.time()
+                if lines and not await self._execute(session, lines, writer):
+                    break
+                if end is not None or not data:
+                    break
+                if transport.get_write_buffer_size() > HIGH_WATER:
+                    await writer.drain()  # backpressure: wait for the client to read
+        except ConnectionError:
+            pass
+        finally:
+            del self._sessions[session]
+            self._tasks.discard(asyncio.current_task())
+            writer.close()
+
+    async def _execute(self, session, lines, writer):
+        """Run command lines in the executor and write their answers
+
+        Returns:
+            bool: False if a command timed out, the session is to be closed
+        """
+        answers = []
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, session.execute_lines, lines, answers
+        )
+        while not future.done():
+            started = session.started  # None until the thread starts the first command
+            left = self.command_timeout
+            if started is not None:
+                left += started - time.monotonic()
+            if left <= 0:
+                session.timed_out = True
+                answers = answers + ["ERROR timeout"]  # a copy, the thread may still append
+                break
+            await asyncio.wait((future,), timeout=left)
+        writer.write("".join(answer + "\n" for answer in answers).encode())
+        return not session.timed_out
+
+    async def _evict_idle(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(min(self.idle_timeout / 4, 60))
+            deadline = loop.time() - self.idle_timeout
+            for session, writer in list(self._sessions.items()):
+                if session.last_active < deadline:
+                    writer.close()  # the session ends when its reader sees the EOF
+
+
+def main(argv=None):
+    """Run the server until interrupted
+
+    Used by 'python rpn.py --serve'.
+
+    Args:
+        argv (list): command line arguments, sys.argv[1:] by default
+
+    Returns:
+        int: exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog="rpn.py --serve",
+        description="Serve calculator sessions, one per connection, one command per line.",
+    )
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--idle-timeout", type=float, default=300.0, help="seconds (300)")
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds a command may run (10)")
+    parser.add_argument("--precision", type=int, default=12)
+    parser.add_argument(
+        "--format",
+        choices=("plain", "locale"),
+        default="plain",
+        help="plain: Python float syntax, locale: as shown in the display",
+    )
+    parser.add_argument("--locale", choices=tuple(NUMBER_FORMATS), default="pt-BR")
+    args = parser.parse_args(
+        [arg for arg in (sys.argv[1:] if argv is None else argv) if arg != "--serve"]
+    )
+    server = RpnServer(
+        args.idle_timeout,
+        args.max_sessions,
+        args.timeout,
+        precision=args.precision,
+        number_format=args.locale,
+        plain=args.format == "plain",
+    )
+
+    async def serve():
+        if args.unix and os.path.exists(args.unix):
+            os.unlink(args.unix)
+        listening = await server.start(args.unix, args.host, args.port)
+        where = args.unix or "{}:{}".format(*listening.sockets[0].getsockname()[:2])
+        print(f"rpn: serving on {where}", file=sys.stderr)
+        await listening.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
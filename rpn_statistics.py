@@ -0,0 +1,189 @@
+"""
+Statistics registers of PyRPN.
+
+Σ+ accumulates an (x, y) pair and Σ- removes one, as the statistics keys of
+the HP calculators. Instead of the plain sums (Σx, Σx², Σxy...), which
+cancel catastrophically for data far from 0, the registers keep the count,
+the means and the sums of squared deviations and of products of deviations,
+updated as in Welford's algorithm. That is O(1) memory for any number of
+pairs, and from them come the means, the standard deviations and the linear
+regression y = slope * x + intercept with its correlation coefficient.
+
+Pairs can be fed in bulk from arrays or from a file: every chunk is reduced
+with NumPy in one pass and merged into the registers with Chan's formula.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import math
+from itertools import islice
+
+from rpn_locale import PT_BR
+
+CHUNK = 65536  # pairs of a file reduced at a time
+RESULTS = ("n", "mean_x", "mean_y", "std_x", "std_y", "slope", "intercept", "r")
+
+
+class StatisticsRegisters:
+    """Accumulated (x, y) pairs, as float
+
+    Attributes:
+        n (int): number of pairs
+        mean_x, mean_y (float): means of x and y
+        sxx, syy (float): sums of the squared deviations of x and y
+        sxy (float): sum of the products of the deviations of x and y
+    """
+
+    __slots__ = ("n", "mean_x", "mean_y", "sxx", "syy", "sxy")
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def __repr__(self) -> str:
+        return f"StatisticsRegisters(n={self.n})"
+
+    def clear(self) -> None:
+        """Forget every pair"""
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.sxx = self.syy = self.sxy = 0.0
+
+    def state(self) -> tuple:
+        """Values of the registers, see restore"""
+        return self.n, self.mean_x, self.mean_y, self.sxx, self.syy, self.sxy
+
+    def restore(self, state) -> None:
+        """Set the registers to values returned by state"""
+        self.n, self.mean_x, self.mean_y, self.sxx, self.syy, self.sxy = state
+
+    def add(self, x, y) -> None:
+        """Σ+: accumulate a pair"""
+        n = self.n + 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / n
+        self.mean_y += dy / n
+        self.sxx += dx * (x - self.mean_x)
+        self.syy += dy * (y - self.mean_y)
+        self.sxy += dx * (y - self.mean_y)
+        self.n = n
+
+    def remove(self, x, y) -> None:
+        """Σ-: take back a pair that was added
+
+        Raises:
+            ValueError: if there is no pair
+        """
+        if self.n == 0:
+            raise ValueError("no pair to remove")
+        if self.n == 1:
+            self.clear()
+            return
+        n = self.n - 1
+        mean_x = self.mean_x - (x - self.mean_x) / n
+        mean_y = self.mean_y - (y - self.mean_y) / n
+        self.sxx = max(self.sxx - (x - mean_x) * (x - self.mean_x), 0.0)
+        self.syy = max(self.syy - (y - mean_y) * (y - self.mean_y), 0.0)
+        self.sxy -= (x - mean_x) * (y - self.mean_y)
+        self.mean_x, self.mean_y, self.n = mean_x, mean_y, n
+
+    def merge(self, n, mean_x, mean_y, sxx, syy, sxy) -> None:
+        """Accumulate the registers of another group of pairs (Chan's formula)"""
+        if n == 0:
+            return
+        total = self.n + n
+        dx = mean_x - self.mean_x
+        dy = mean_y - self.mean_y
+        weight = self.n * n / total
+        self.mean_x += dx * n / total
+        self.mean_y += dy * n / total
+        self.sxx += sxx + dx * dx * weight
+        self.syy += syy + dy * dy * weight
+        self.sxy += sxy + dx * dy * weight
+        self.n = total
+
+    def add_arrays(self, x, y) -> None:
+        """Accumulate every pair of two arrays of the same length at once"""
+        import numpy as np
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("x and y must be 1-D arrays of the same length")
+        if not len(x):
+            return
+        mean_x, mean_y = x.mean(), y.mean()
+        dx, dy = x - mean_x, y - mean_y
+        self.merge(len(x), float(mean_x), float(mean_y), float(dx @ dx), float(dy @ dy), float(dx @ dy))
+
+    def feed(self, lines, number_format=PT_BR) -> int:
+        """Accumulate the pairs of a text, one 'x y' pair per line, reading
+        CHUNK lines at a time
+
+        x and y are separated by tabs, spaces or a semicolon, as in a CSV or
+        TXT file saved by a spreadsheet, and parsed with the separators of the
+        number format. Empty lines are skipped.
+
+        Raises:
+            ValueError: for a line that is not a pair of numbers, the pairs of
+                the chunks before it are kept
+
+        Returns:
+            int: number of pairs accumulated
+        """
+        import numpy as np
+
+        parse = number_format.parse
+        lines = enumerate(lines, 1)
+        count = 0
+        while True:
+            values = []
+            for line_number, line in islice(lines, CHUNK):
+                fields = line.replace(";", " ").replace('"', " ").split()
+                if not fields:
+                    continue
+                try:
+                    x, y = fields
+                    values.append(parse(x))
+                    values.append(parse(y))
+                except ValueError:
+                    raise ValueError(f"line {line_number}: {line.strip()!r} is not a pair of numbers") from None
+            if not values:
+                return count
+            pairs = np.array(values).reshape(-1, 2)
+            self.add_arrays(pairs[:, 0], pairs[:, 1])
+            count += len(pairs)
+
+    def feed_file(self, path, number_format=PT_BR) -> int:
+        """Accumulate the pairs of a CSV or TXT file, see feed"""
+        with open(path, encoding="utf-8-sig") as lines:
+            return self.feed(lines, number_format)
+
+    def results(self) -> dict:
+        """n, means, sample standard deviations and linear regression
+
+        Returns:
+            dict: n, mean_x, mean_y, std_x, std_y, slope, intercept and r
+                (correlation coefficient), None where they are not defined
+                (no pair, a single pair, or all x or all y equal)
+        """
+        results = dict.fromkeys(RESULTS)
+        results["n"] = self.n
+        if self.n == 0:
+            return results
+        results["mean_x"], results["mean_y"] = self.mean_x, self.mean_y
+        if self.n == 1:
+            return results
+        results["std_x"] = math.sqrt(self.sxx / (self.n - 1))
+        results["std_y"] = math.sqrt(self.syy / (self.n - 1))
+        if self.sxx > 0:
+            results["slope"] = self.sxy / self.sxx
+            results["intercept"] = self.mean_y - results["slope"] * self.mean_x
+            if self.syy > 0:
+                results["r"] = max(-1.0, min(1.0, self.sxy / math.sqrt(self.sxx * self.syy)))
+        return results
@@ -0,0 +1,295 @@
+"""
+Persistent stack for PyRPN.
+
+MappedStack keeps the stack values in a binary file that is memory-mapped
+when it is opened, so a stack of millions of entries is restored without
+parsing or formatting a single number. The file is a header followed by
+the values as native float64:
+
+    magic (8 bytes) | entry count (uint64) | value 0 | value 1 | ...
+
+The file has room for more values than the count, it grows by doubling.
+
+Only the entries that changed since the last key are written, and the entry
+count never covers an entry being written: it is first cut to the entries
+that did not change, then set to the new size once they are written. So the
+file always holds a valid stack. If the calculator is killed between two keys
+or during one, it opens on the stack of the last finished key. Only if it is
+killed during the few microseconds of the write does the file hold just the
+entries that key left untouched.
+
+A float64 can not hold the entries of the decimal precision mode (see
+rpn_decimal) nor the vectors and matrices (see rpn_array), so their exact
+text or their rows are also appended to a log next to the stack file,
+'FILE.exact', one JSON record per line:
+
+    {"i": index, "v": value in the stack file, "text": "1.4142135623730950488"}
+    {"i": index, "v": NaN, "array": [[1.0, 2.0], [3.0, 4.0]]}
+    {"i": index}        the entry at index is a float again
+
+A record is only used if the stack file still holds its value, so a log that
+is behind the stack file (the calculator was killed between the two writes)
+never restores a wrong entry. The entries are opened as floats and become
+their exact decimals again when the stack is converted to the decimal mode
+(see RpnEngine.precision), unless they were changed in between. The arrays
+are opened as arrays, or as NaN if NumPy is not installed. The log is
+rewritten once most of its records are outdated.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+from array import array
+
+from rpn_engine import NumericStack
+from rpn_locale import PT_BR
+
+MAGIC = b"PYRPN\x00\x01" + (b"L" if struct.pack("=H", 1) == b"\x01\x00" else b"B")
+HEADER = struct.Struct("=8sQ")
+MIN_CAPACITY = 4096  # values, the file grows by doubling
+EXACT_SUFFIX = ".exact"  # log of the exact texts of the decimal entries
+MIN_LOG_RECORDS = 1024  # records of the log before it is rewritten
+
+
+class MappedStack(NumericStack):
+    """NumericStack saved to a memory-mapped file after every key
+
+    Args:
+        path (str): stack file, created if it does not exist
+        number: numeric type of the values, see NumericStack
+        formatter: function that turns a value into its display text
+        number_format (NumberFormat): separators of the display texts
+
+    Raises:
+        ValueError: if the file is not a PyRPN stack file of this machine
+    """
+
+    def __init__(self, path, number=float, formatter=None, number_format=PT_BR) -> None:
+        super().__init__(number, formatter, number_format)
+        self.path = path
+        self._file = open(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), "r+b")
+        if os.fstat(self._file.fileno()).st_size < HEADER.size:
+            self._file.write(HEADER.pack(MAGIC, 0))
+            self._file.truncate(HEADER.size + 8 * MIN_CAPACITY)
+            self._file.flush()
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, count = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"{path} is not a PyRPN stack file")
+        self._values = memoryview(self._map)[HEADER.size:].cast("d")
+        count = min(count, len(self._values))  # a truncated copy of the file
+        if number is float:
+            self._items = self._values[:count].tolist()
+        else:
+            self._items = [number(value) for value in self._values[:count].tolist()]
+        self._count = count  # entry count in the file
+        self._synced = count  # entries known to be the same in the file
+        self._log = None  # the log of the exact texts, open for appending
+        self._log_records = 0  # records in the log
+        self._logged = set()  # indexes whose last record in the log has a text
+        self._exact = {}  # index -> exact text (or array rows) of an entry opened as a float
+        self._read_log(count)
+
+    def _read_log(self, count):
+        records = {}
+        try:
+            with open(self.path + EXACT_SUFFIX, encoding="utf-8") as log:
+                for line in log:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:  # the last line of a killed write
+                        continue
+                    records[record["i"]] = record
+                    self._log_records += 1
+        except FileNotFoundError:
+            return
+        values = self._values
+        for idx, record in records.items():
+            value = record.get("v")
+            if idx >= count or not (values[idx] == value or math.isnan(values[idx]) and math.isnan(value)):
+                continue
+            if "text" in record:
+                self._exact[idx] = record["text"]
+            elif "array" in record:
+                try:
+                    from rpn_array import make_array
+                except ImportError:  # kept in the log until the entry changes
+                    self._exact[idx] = record["array"]
+                else:
+                    self._items[idx] = make_array(record["array"])
+            else:
+                continue
+            self._logged.add(idx)
+        if self._log_records > len(self._logged):
+            self._rewrite_log()  # without the outdated records
+
+    def _changed(self, idx):
+        """The entries from idx up changed since the last sync"""
+        self._synced = min(self._synced, idx)
+        if self._exact:
+            for changed in [changed for changed in self._exact if changed >= idx]:
+                del self._exact[changed]
+
+    def _pop_entry(self):
+        self._changed(max(len(self._items) - 1, 0))
+        return super()._pop_entry()
+
+    def _edit(self, idx, value, display):
+        self._changed(idx)
+        super()._edit(idx, value, display)
+
+    def _truncate(self, count):
+        self._changed(len(self._items) - count)
+        super()._truncate(count)
+
+    def swap(self) -> None:
+        self._changed(max(len(self._items) - 2, 0))
+        super().swap()
+
+    def _replace(self, items, display, number, formatter):
+        self._changed(0)
+        super()._replace(items, display, number, formatter)
+
+    def convert(self, number, formatter, context=None) -> None:
+        """Switch the stack to another numeric type, the entries opened as
+        floats are made from their exact text (see the module docstring)
+        """
+        if self._exact:
+            items = self._items
+            for idx, text in self._exact.items():
+                if isinstance(text, str):
+                    items[idx] = number(text)
+            self._exact = {}
+        super().convert(number, formatter, context)
+
+    def _record(self, idx):
+        """Log record of an entry that a float64 can not hold, else None"""
+        exact = self._exact.get(idx)
+        if exact is None:
+            try:
+                value = self._value(idx)
+            except (ArithmeticError, ValueError):  # e.g. the empty X after ENTER
+                return None
+            if hasattr(value, "shape"):
+                exact = value.tolist()
+            elif type(value) is not float:
+                exact = str(value)
+            else:
+                return None
+        return {"i": idx, "v": self._values[idx], "text" if isinstance(exact, str) else "array": exact}
+
+    def _write_log(self, start, size):
+        """Append the records of the entries from start to size, and clear
+        those of the entries above size
+        """
+        records = []
+        for idx in range(start, size):
+            record = self._record(idx) if type(self._items[idx]) is not float or idx in self._exact else None
+            if record is not None:
+                records.append(record)
+                self._logged.add(idx)
+            elif idx in self._logged:
+                records.append({"i": idx})
+                self._logged.discard(idx)
+        for idx in [idx for idx in self._logged if idx >= size]:
+            records.append({"i": idx})
+            self._logged.discard(idx)
+        if not records:
+            return
+        if self._log is None:
+            self._log = open(self.path + EXACT_SUFFIX, "a", encoding="utf-8")
+        self._log.writelines(json.dumps(record) + "\n" for record in records)
+        self._log.flush()
+        self._log_records += len(records)
+        if self._log_records > max(MIN_LOG_RECORDS, 2 * len(self._logged)):
+            self._rewrite_log()
+
+    def _rewrite_log(self):
+        """Replace the log by the records of its current entries only"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        path = self.path + EXACT_SUFFIX
+        self._log_records = len(self._logged)
+        if not self._logged:
+            os.remove(path)
+            return
+        with open(path + ".tmp", "w", encoding="utf-8") as log:
+            for idx in sorted(self._logged):
+                log.write(json.dumps(self._record(idx)) + "\n")
+        os.replace(path + ".tmp", path)
+        self._log = open(path, "a", encoding="utf-8")
+
+    def _grow(self, size):
+        capacity = len(self._values)
+        while capacity < size:
+            capacity *= 2
+        self._values.release()
+        self._map.resize(HEADER.size + 8 * capacity)
+        self._values = memoryview(self._map)[HEADER.size:].cast("d")
+
+    def _file_value(self, idx) -> float:
+        try:
+            return float(self._value(idx))
+        except (TypeError, ValueError, ArithmeticError):  # TypeError for arrays, in the log
+            return math.nan
+
+    def sync(self) -> None:
+        """Write the entries changed since the last sync, then the count"""
+        size = len(self._items)
+        start = self._synced
+        if start == size and self.entry_x() is not None:
+            start = size - 1  # X typed in place
+        if start == size == self._count:
+            return
+        changed = start
+        if size > len(self._values):
+            self._grow(size)
+        if start < self._count:
+            HEADER.pack_into(self._map, 0, MAGIC, start)
+        values, items = self._values, self._items
+        exact = self._number is not float  # entries that a float64 can not hold
+        if size - start > 64 and set(map(type, items[start:size])) <= {float, self._number}:
+            values[start:size] = array("d", items[start:size])  # no texts to convert nor arrays
+            start = size
+        for idx in range(start, size):
+            value = items[idx]
+            if type(value) is float:
+                values[idx] = value
+            else:
+                values[idx] = self._file_value(idx)
+                exact = True
+        if self._logged or exact:
+            self._write_log(changed, size)
+        HEADER.pack_into(self._map, 0, MAGIC, size)
+        self._count = self._synced = size
+
+    def flush(self) -> None:
+        """Sync the stack and wait until it is written to the disk"""
+        self.sync()
+        self._map.flush()
+        if self._log is not None:
+            os.fsync(self._log.fileno())
+
+    def close(self) -> None:
+        """Flush and close the file, the stack is empty afterwards"""
+        if self._map.closed:
+            return
+        self.flush()
+        self._values.release()
+        self._map.close()
+        self._file.close()
+        if self._log is not None:
+            self._log.close()
+        super().cls()
@@ -0,0 +1,265 @@
+"""
+Vectorized evaluation of RPN programs over NumPy arrays.
+
+A program is evaluated once for every row of its inputs, in a single pass per
+operation, with the same semantics as the calculator keys.
+
+copyright by HGF777@2023
+
+for any information send an email to
+
+hgf777@gmail.com
+
+"""
+
+import math
+
+import numpy as np
+
+from rpn_engine import parse_program
+from rpn_operations import MAX_FACTORIAL, OPERATIONS
+
+# n! for every n whose factorial fits in a float
+FACTORIALS = np.array([float(math.factorial(n)) for n in range(MAX_FACTORIAL + 1)])
+
+
+def convert_to_radian(angle, mode):
+    """Vectorized RpnEngine.convert_to_radian
+
+    Args:
+        angle (ndarray): angles in degree, radian or gradian
+        mode (str): DEG, RAD or GRAD
+
+    Returns:
+        ndarray: angles in radian
+    """
+    if mode == "DEG":
+        angle = np.radians(angle)
+    elif mode == "GRAD":
+        angle = angle * 360 / 400
+        angle = np.radians(angle)
+    return angle
+
+
+def convert_from_radian(angle, mode):
+    """Vectorized RpnEngine.convert_from_radian
+
+    Args:
+        angle (ndarray): angles in radian
+        mode (str): DEG, RAD or GRAD
+
+    Returns:
+        ndarray: angles in degree, radian or gradian
+    """
+    if mode == "DEG":
+        angle = np.degrees(angle)
+    elif mode == "GRAD":
+        angle = np.degrees(angle)
+        angle = angle * 400 / 360
+    return angle
+
+
+def _power(base, exponent):
+    """Vectorized float power with the errors Python raises for it
+
+    Returns:
+        tuple: (result, error mask)
+    """
+    result = base**exponent
+    error = (base == 0) & (exponent < 0)  # ZeroDivisionError
+    error |= (base < 0) & (exponent != np.floor(exponent))  # complex result
+    error |= np.isinf(result) & np.isfinite(base) & np.isfinite(exponent)  # OverflowError
+    return result, error
+
+
+def _domain_error(result, x_value):
+    """Rows where a math function returned nan for a number (ValueError)"""
+    return np.isnan(result) & ~np.isnan(x_value)
+
+
+def _no_error(*values):
+    return np.zeros(np.broadcast_shapes(*(np.shape(value) for value in values)), bool)
+
+
+def _factorial(x_value, mode):
+    error = (x_value != np.floor(x_value)) | (x_value < 0) | (x_value > MAX_FACTORIAL)
+    error |= np.isnan(x_value)
+    return FACTORIALS[np.where(error, 0, x_value).astype(int)], error
+
+
+def _trigonometric(function):
+    def trigonometric(x_value, mode):
+        result = function(convert_to_radian(x_value, mode))
+        return result, _domain_error(result, x_value)
+    return trigonometric
+
+
+def _tan(x_value, mode):
+    angle = convert_to_radian(x_value, mode)
+    result = np.tan(angle)
+    return result, (np.remainder(angle, math.pi / 2) == 0) | _domain_error(result, x_value)
+
+
+def _inverse_trigonometric(function):
+    def inverse_trigonometric(x_value, mode):
+        result = function(x_value)
+        return convert_from_radian(result, mode), _domain_error(result, x_value)
+    return inverse_trigonometric
+
+
+def _root(y_value, x_value):
+    result, error = _power(y_value, 1.0 / x_value)
+    return result, error | (x_value == 0)
+
+
+# vectorized versions of the calculator keys, see Operation.vectorized
+VECTORIZED = {
+    "+/-": lambda x_value, mode: (x_value * -1.0, _no_error(x_value)),
+    "1/x": lambda x_value, mode: (1 / x_value, x_value == 0),
+    "n!": _factorial,
+    "sqrt": lambda x_value, mode: _power(x_value, 0.5),
+    "x^2": lambda x_value, mode: _power(x_value, 2.0),
+    "sin": _trigonometric(np.sin),
+    "cos": _trigonometric(np.cos),
+    "tan": _tan,
+    "asin": _inverse_trigonometric(np.arcsin),
+    "acos": _inverse_trigonometric(np.arccos),
+    "atan": _inverse_trigonometric(np.arctan),
+    "log": lambda x_value, mode: (np.log10(x_value), x_value <= 0),
+    "ln": lambda x_value, mode: (np.log(x_value), x_value <= 0),
+    "10^x": lambda x_value, mode: _power(10.0, x_value),
+    "e^x": lambda x_value, mode: _power(math.e, x_value),
+    "+": lambda y_value, x_value: (y_value + x_value, _no_error(y_value, x_value)),
+    "-": lambda y_value, x_value: (y_value - x_value, _no_error(y_value, x_value)),
+    "*": lambda y_value, x_value: (y_value * x_value, _no_error(y_value, x_value)),
+    "/": lambda y_value, x_value: (y_value / x_value, _no_error(y_value, x_value) | (x_value == 0)),
+    "%": lambda y_value, x_value: (y_value * (x_value / 100), _no_error(y_value, x_value)),
+    "y^x": _power,
+    "root": _root,
+    "mod": lambda y_value, x_value: (np.remainder(y_value, x_value), _no_error(y_value, x_value) | (x_value == 0)),
+}
+for _name, _vectorized in VECTORIZED.items():
+    OPERATIONS[_name].vectorized = _vectorized
+del _name, _vectorized
+
+
+def _row_by_row(operation, args, mode):
+    """Operation without a vectorized version, called on every row
+
+    Returns:
+        tuple: (result, error mask)
+    """
+    args = np.broadcast_arrays(*(np.asarray(arg, dtype=float) for arg in args))
+    result = np.empty(args[0].shape)
+    error = np.zeros(args[0].shape, bool)
+    for idx in np.ndindex(result.shape):
+        row = [float(arg[idx]) for arg in args]
+        try:
+            if operation.angle == "argument":
+                value = operation.function(float(convert_to_radian(row[0], mode)))
+            elif operation.angle == "result":
+                value = float(convert_from_radian(operation.function(*row), mode))
+            else:
+                value = operation.function(*row)
+            if isinstance(value, complex):
+                raise ValueError("complex result")
+            result[idx] = value
+        except (ArithmeticError, ValueError):
+            error[idx] = True
+    return result, error
+
+
+def _operation(name, arity):
+    operation = OPERATIONS.find(name)
+    if operation is None or operation.arity != arity:
+        raise ValueError(f"unknown operation {name!r}")
+    return operation
+
+
+def one_arg_operation(operation, x_value, mode="DEG"):
+    """Vectorized version of a one argument key
+
+    Args:
+        operation (str): name of a one argument operation, see rpn_operations
+        x_value (ndarray): X register of every row
+        mode (str): angle mode, DEG, RAD or GRAD
+
+    Returns:
+        tuple: (result, error mask), the mask flags the rows where the
+            calculator would show ERROR
+    """
+    operation = _operation(operation, 1)
+    if operation.vectorized is None:
+        return _row_by_row(operation, (x_value,), mode)
+    return operation.vectorized(x_value, mode)
+
+
+def two_arg_operation(operation, y_value, x_value):
+    """Vectorized version of a two arguments key
+
+    Args:
+        operation (str): name of a two arguments operation, see rpn_operations
+        y_value (ndarray): Y register of every row
+        x_value (ndarray): X register of every row
+
+    Returns:
+        tuple: (result, error mask), the mask flags the rows where the
+            calculator would show ERROR
+    """
+    operation = _operation(operation, 2)
+    if operation.vectorized is None:
+        return _row_by_row(operation, (y_value, x_value), None)
+    return operation.vectorized(y_value, x_value)
+
+
+def evaluate_array(program, angle="DEG", **inputs):
+    """Evaluate an RPN program for every row of its inputs
+
+    Args:
+        program (str): RPN program, see rpn_engine.parse_program
+        angle (str): angle mode, DEG, RAD or GRAD
+        inputs: arrays (or numbers) bound to the input names of the program,
+            broadcast against each other
+
+    Raises:
+        ValueError: if the program is not valid
+
+    Returns:
+        ndarray: X register after running the program on each row, nan where
+            the calculator would show ERROR
+
+    Example:
+        >>> evaluate_array("x 2 y^x 3 * sin", x=np.arange(3.0))
+        array([0.        , 0.05233596, 0.20791169])
+    """
+    tokens = parse_program(program, inputs)
+    values = {name: np.asarray(value, dtype=float) for name, value in inputs.items()}
+    shape = np.broadcast_shapes(*(value.shape for value in values.values()))
+    failed = np.zeros(shape, bool)
+    stack = []
+    with np.errstate(all="ignore"):
+        for kind, value in tokens:
+            match kind:
+                case "number":
+                    stack.append(np.float64(value))
+                case "input":
+                    stack.append(values[value])
+                case "one_arg":
+                    result, error = one_arg_operation(value, stack.pop(), angle)
+                    stack.append(result)
+                    failed |= error
+                case "two_arg":
+                    x_value = stack.pop()
+                    result, error = two_arg_operation(value, stack.pop(), x_value)
+                    stack.append(result)
+                    failed |= error
+                case "stack":
+                    if value == "enter":
+                        stack.append(stack[-1])
+                    elif value == "swap":
+                        stack[-1], stack[-2] = stack[-2], stack[-1]
+                    else:
+                        stack.pop()
+        result = np.broadcast_to(stack[-1], shape).astype(float)
+    result[failed] = np.nan
+    return result
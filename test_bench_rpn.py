@@ -0,0 +1,38 @@
+import json
+
+import bench_rpn
+
+
+def test_compare():
+    baseline = {'stack/push': 1.0, 'stack/swap': 2.0, 'format/atof': 1.0}
+    results = {'stack/push': 1.2, 'stack/swap': 3.0, 'format/atof': 2.0, 'new/bench': 5.0}
+    assert bench_rpn.compare(results, baseline, 0.25) == [
+        ('format/atof', 1.0, 2.0, 2.0),
+        ('stack/swap', 2.0, 3.0, 1.5),
+    ]
+    assert bench_rpn.compare(results, baseline, 1.0) == []
+
+
+def test_over_budget(monkeypatch):
+    results = {'startup/PyRpnWindow + PyRpn': 300000.0, 'stack/push': 1.0}
+    assert bench_rpn.over_budget(results) == [('startup/PyRpnWindow + PyRpn', 250000.0, 300000.0)]
+    assert bench_rpn.over_budget(results, {'startup/PyRpnWindow + PyRpn': 400000.0}) == []
+
+    assert bench_rpn.main(['--quick', '--only', 'startup']) == 0
+    monkeypatch.setitem(bench_rpn.BUDGETS, 'startup/PyRpnWindow + PyRpn', 0.001)
+    assert bench_rpn.main(['--quick', '--only', 'startup']) == 1
+
+
+def test_json_results(tmp_path):
+    path = tmp_path / 'results.json'
+    assert bench_rpn.main(['--quick', '--only', 'format', 'dispatch', '--json', str(path)]) == 0
+    results = json.loads(path.read_text())['results']
+    assert 'format/format_number' in results
+    assert 'dispatch/push + sin' in results
+    assert not any(name.startswith('stack/') for name in results)
+    assert all(time > 0 for time in results.values())
+
+    assert bench_rpn.main(['--only', 'format', '--quick', '--compare', str(path), '--threshold', '100']) == 0
+    slower = {name: time / 1000 for name, time in results.items()}
+    path.write_text(json.dumps({'results': slower}))
+    assert bench_rpn.main(['--only', 'format', '--quick', '--compare', str(path)]) == 1
@@ -1,3 +1,9 @@
+import io
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 import rpn
 
@@ -107,3 +113,383 @@ def test_two_args_float_operations(qtbot):
     rpn_obj._shift = True
     rpn_obj.btn_operation_two_arg('y^x')
     assert rpn_obj._stack.peek_x() == '12,503296'
+
+
+def test_numeric_stack():
+    stack = rpn.NumericStack()
+    stack.push('1.234,5')
+    stack.push(2.5)
+    assert stack.peek_x() == '2,5'
+    assert stack.peek_y() == '1.234,5'
+    assert stack.peek_z() is None
+
+    stack.swap()
+    assert stack.peek_x() == '1.234,5'
+    assert stack.pop_value() == 1234.5
+    assert stack.pop_value() == 2.5
+    assert stack.is_empty()
+
+    stack.push('')
+    assert not stack.has_x()
+    stack.push(1e13)
+    assert stack.peek_x() == '1,00000000e+13'
+
+
+def test_operation_chain_keeps_numbers(qtbot):
+    pyrpn_window = rpn.PyRpnWindow()
+    rpn_obj = rpn.PyRpnEvaluate(pyrpn_window)
+
+    rpn_obj._stack.push('1')
+    rpn_obj._stack.push('3')
+    rpn_obj.btn_operation_two_arg('/')
+    rpn_obj._stack.push('3')
+    rpn_obj.btn_operation_two_arg('*')
+    assert rpn_obj._stack.peek_x() == '1'
+    assert isinstance(rpn_obj._stack.peek_value(), float)
+
+    # square root of a negative number is an error, not a complex number
+    rpn_obj._stack.push('-4')
+    rpn_obj.btn_operation_one_arg('sqrt')
+    assert pyrpn_window.x_display.text() == 'ERROR'
+
+
+def test_startup(qtbot):
+    # built from the generated modules, with the resources registered once;
+    # the startup time is measured by bench_rpn.py (startup)
+    pyrpn_window = rpn.PyRpnWindow()
+    rpn.PyRpn(pyrpn_window, rpn.PyRpnEvaluate(pyrpn_window))
+    loads = rpn.load_resources.cache_info().misses
+    pyrpn_window = rpn.PyRpnWindow()
+    rpn.PyRpn(pyrpn_window, rpn.PyRpnEvaluate(pyrpn_window))
+
+    assert 'PyQt6.uic' not in sys.modules
+    assert rpn.load_resources.cache_info().misses == loads == 1
+    assert pyrpn_window.x_display.text() == '0'
+    assert rpn.load_icon('stack.svg') is rpn.load_icon('stack.svg')
+    assert not rpn.load_icon('calc.svg').isNull()
+
+
+def test_profile_startup(tmp_path):
+    output = tmp_path / 'startup.json'
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    subprocess.run(
+        [sys.executable, rpn.__file__, f'--profile-startup={output}', f'--stack={tmp_path / "stack.bin"}'],
+        env=env, check=True, timeout=60, stdout=subprocess.DEVNULL,
+    )
+    timeline = json.loads(output.read_text())
+    names = [event['name'] for event in timeline['events']]
+
+    assert 'import PyQt6.QtWidgets' in names
+    assert 'PyRpnWindow.setupUi' in names
+    assert 'PyRpn._connectSignalsAndSlots' in names
+    assert names[-1] == 'first paint'
+    assert timeline['total_ms'] >= timeline['events'][-1]['start_ms']
+
+
+def test_batch_workers_do_not_import_qt(tmp_path):
+    programs = tmp_path / 'programs.txt'
+    programs.write_text('3 4 +\n2 sqrt\n')
+    # spawned workers, as on Windows and macOS, import the main module again
+    script = (
+        'import multiprocessing, runpy, sys\n'
+        'multiprocessing.set_start_method("spawn")\n'
+        f'sys.argv = ["rpn.py", "--batch", "--jobs", "2", {str(programs)!r}]\n'
+        f'runpy.run_path({rpn.__file__!r}, run_name="__main__")\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=os.path.dirname(os.path.abspath(rpn.__file__)),
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.stdout == '7.0\n1.4142135623730951\n'
+    assert 'PyQt6' not in result.stderr
+
+
+def test_stack_kept_between_sessions(qtbot, tmp_path):
+    stack_file = str(tmp_path / 'stack.bin')
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window, stack_file=stack_file)
+    for key in '12':
+        pyrpn_model.btn_number(key)
+    pyrpn_model.btn_enter()
+    pyrpn_model.btn_number('3')
+    pyrpn_model.engine.stack.close()
+
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window, stack_file=stack_file)
+
+    assert pyrpn_window.x_display.text() == '3'
+    assert pyrpn_window.y_display.text() == '12'
+    pyrpn_model.engine.stack.close()
+
+
+def test_unreadable_stack_file_set_aside(qtbot, tmp_path, caplog):
+    stack_file = str(tmp_path / 'stack.bin')
+    with open(stack_file, 'wb') as garbage:
+        garbage.write(b'not a stack file' * 8)
+    with open(stack_file + '.exact', 'w') as log:
+        log.write('{"i": 0, "v": 1.0, "text": "1"}\n')
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window, stack_file=stack_file)
+
+    assert pyrpn_window.x_display.text() == '0'
+    with open(stack_file + '.bad', 'rb') as bad:
+        assert bad.read() == b'not a stack file' * 8
+    assert os.path.exists(stack_file + '.exact.bad')
+    assert 'is not a PyRPN stack file' in caplog.text
+    pyrpn_model.btn_number('7')
+    pyrpn_model.engine.stack.close()
+
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window, stack_file=stack_file)
+    assert pyrpn_window.x_display.text() == '7'
+    pyrpn_model.engine.stack.close()
+
+
+def test_stack_modal_deep_stack(qtbot):
+    stack = rpn.NumericStack()
+    for value in range(1_000_000):
+        stack.push(float(value))
+    stack.push('12,5')
+    reads = []
+    item = stack.item
+    stack.item = lambda idx: reads.append(idx) or item(idx)
+
+    stack_modal = rpn.StackModal(parent=None, stack=stack)
+    qtbot.addWidget(stack_modal)
+    stack_modal.show()
+    stack_modal.grab()
+    assert 0 < len(reads) < 1000  # only the rows in view are read
+
+    assert stack_modal.model.rowCount() == 1_000_001
+    assert stack_modal.model.index(1234, 0).data() == '1235:'
+    assert stack_modal.model.index(1234, 1).data() == '1.234'
+    assert len(stack._display) == 1  # browsing does not fill the display cache
+
+    stack_modal.jump_to(999_990)
+    assert stack_modal.view.currentIndex().row() == 999_989
+
+    stack_modal.search.setText('12,5')
+    stack_modal.search_next()
+    assert stack_modal.view.currentIndex().row() == 1_000_000
+
+
+def test_stack_modal_empty(qtbot):
+    stack_modal = rpn.StackModal(parent=None, stack=rpn.NumericStack())
+    qtbot.addWidget(stack_modal)
+    assert not hasattr(stack_modal, 'model')
+
+
+def test_display_updates_are_coalesced(qtbot, capsys):
+    pyrpn_window = rpn.PyRpnWindow()
+    rpn_obj = rpn.PyRpnEvaluate(pyrpn_window)
+    texts = []
+    pyrpn_window.x_display.setText = texts.append
+
+    for key in '1234':
+        rpn_obj.btn_number(key)
+    assert texts == []  # nothing drawn before the event loop runs
+
+    qtbot.waitUntil(lambda: texts == ['1.234'])
+    rpn_obj.btn_drop()
+    rpn_obj.flush_display()
+    rpn_obj.flush_display()
+    assert texts == ['1.234', '0']
+
+    rpn_obj.btn_operation_one_arg('1/x')
+    assert texts[-1] == 'ERROR'
+    assert capsys.readouterr().out == ''
+
+
+def test_keypress_independent_of_stack_depth(qtbot):
+    pyrpn_window = rpn.PyRpnWindow()
+    rpn_obj = rpn.PyRpnEvaluate(pyrpn_window)
+    stack = rpn_obj._stack
+    reads = []  # depth below the top of each entry read, timed by bench_rpn.py (keypress)
+    for name in ('_text', '_value'):
+        method = getattr(stack, name)
+        setattr(stack, name, lambda idx, method=method: reads.append(stack.size() - idx) or method(idx))
+
+    def keypress_reads():
+        for run in range(101):
+            if run == 1:  # after a first key on the new entries
+                reads.clear()
+            rpn_obj.btn_number('1')
+            rpn_obj.btn_back()
+            rpn_obj.flush_display()
+        return sorted(reads)
+
+    for value in range(5):
+        stack.push(float(value))
+    shallow = keypress_reads()
+    for value in range(200_000):
+        stack.push(float(value))
+    assert keypress_reads() == shallow
+    assert max(shallow) <= 3  # X, Y and Z only
+
+
+def test_trace(qtbot):
+    stream = io.StringIO()
+    listener = rpn.enable_trace(stream)
+    try:
+        rpn_obj = rpn.PyRpnEvaluate(rpn.PyRpnWindow())
+        rpn_obj.btn_number('7')
+        rpn_obj.flush_display()
+    finally:
+        listener.stop()
+        rpn.logger.handlers.clear()
+        rpn.logger.setLevel(rpn.logging.NOTSET)
+    assert "update -> size=1 x='7'" in stream.getvalue()
+
+
+def test_undo_shortcut(qtbot):
+    pyrpn_window = rpn.PyRpnWindow()
+    controller = rpn.PyRpn(pyrpn_window, rpn.PyRpnEvaluate(pyrpn_window))
+    pyrpn_window.btn_seven.click()
+    pyrpn_window.btn_enter.click()
+    pyrpn_window.btn_add.click()
+    controller._undo_shortcut.activated.emit()
+    qtbot.waitUntil(lambda: pyrpn_window.y_display.text() == '7')
+    assert pyrpn_window.x_display.text() == '7'
+
+    controller._redo_shortcut.activated.emit()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '14')
+
+
+def test_macro_record_and_replay(qtbot):
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window)
+    rpn.PyRpn(pyrpn_window, pyrpn_model)
+    pyrpn_window.btn_two.click()
+    qtbot.keyClick(pyrpn_window, rpn.qtc.Qt.Key.Key_F2)
+    assert pyrpn_window.windowTitle().endswith('REC')
+    pyrpn_window.btn_enter.click()
+    pyrpn_window.btn_multiply.click()
+    qtbot.keyClick(pyrpn_window, rpn.qtc.Qt.Key.Key_F2)
+
+    pyrpn_model.btn_replay(3)
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '65.536')
+    assert pyrpn_window.windowTitle() == 'RPN Calculator'
+
+
+def test_locale(qtbot):
+    pyrpn_window = rpn.PyRpnWindow()
+    rpn.PyRpn(pyrpn_window, rpn.PyRpnEvaluate(pyrpn_window, number_format='en-US'))
+    assert pyrpn_window.btn_decimal.text() == '.'
+    for button in ('btn_one', 'btn_two', 'btn_three', 'btn_four', 'btn_decimal', 'btn_five'):
+        getattr(pyrpn_window, button).click()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '1,234.5')
+    pyrpn_window.btn_enter.click()
+    pyrpn_window.btn_add.click()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '2,469')
+
+
+def test_paste_and_import(qtbot, tmp_path, monkeypatch):
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window)
+    controller = rpn.PyRpn(pyrpn_window, pyrpn_model)
+    rpn.qtw.QApplication.clipboard().setText('1,5\n2,5\n3\n')
+    controller._paste_shortcut.activated.emit()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '3')
+    assert pyrpn_window.y_display.text() == '2,5'
+    assert pyrpn_window.stack_label.text() == 'STACK: 3'  # the 0 was replaced
+
+    numbers = tmp_path / 'numbers.txt'
+    numbers.write_text('10\n20\n')
+    pyrpn_model.btn_import(str(numbers))
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '20')
+
+    warnings = []
+    monkeypatch.setattr(rpn.qtw.QMessageBox, 'warning', lambda *args: warnings.append(args[2]))
+    numbers.write_text('10\nten\n')
+    pyrpn_model.btn_import(str(numbers))
+    assert pyrpn_window.x_display.text() == 'ERROR'
+    assert warnings == ["line 2: 'ten' is not a number"]
+    assert pyrpn_model._stack.size() == 5
+
+
+def test_summary(qtbot):
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window)
+    rpn.PyRpn(pyrpn_window, pyrpn_model)
+    pyrpn_model._engine.paste('2\n4\n4\n4\n5\n5\n7')
+    qtbot.keyClick(pyrpn_window, rpn.qtc.Qt.Key.Key_F4)
+    summary = pyrpn_model._summary
+    assert summary.isVisible()
+    assert summary.values['mean'].text() == '4,42857142857'
+    assert summary.values['max'].text() == '7'
+
+    pyrpn_window.btn_nine.click()  # the summary follows the typing
+    qtbot.waitUntil(lambda: summary.values['max'].text() == '9')
+    assert summary.values['sum'].text() == '40'
+    assert summary.values['prod'].text() == '201.600'
+    assert summary.statistics['n'].text() == '0'
+    qtbot.keyClick(pyrpn_window, rpn.qtc.Qt.Key.Key_F5)  # Σ+ of (9, 7)
+    qtbot.waitUntil(lambda: summary.statistics['n'].text() == '1')
+    assert summary.statistics['mean_y'].text() == '7'
+    assert summary.statistics['slope'].text() == '--'
+    qtbot.keyClick(pyrpn_window, rpn.qtc.Qt.Key.Key_F4)
+    assert not summary.isVisible()
+
+
+def test_array_keys(qtbot):
+    pytest.importorskip('numpy')
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window)
+    controller = rpn.PyRpn(pyrpn_window, pyrpn_model)
+    qtbot.keyClick(pyrpn_window, rpn.qtc.Qt.Key.Key_V)  # a stray letter does nothing
+    assert pyrpn_model._stack.items() == ['0']
+    rpn.qtw.QApplication.clipboard().setText('1\t2\n3\t4\n')
+    controller._paste_array_shortcut.activated.emit()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '[[1 2] [3 4]]')
+    assert pyrpn_window.stack_label.text() == 'STACK: 1'  # the 0 was replaced
+    controller._alt_shortcuts['Alt+D'].activated.emit()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '-2')
+
+    pyrpn_model._engine.paste('5\n6\n2')
+    controller._alt_shortcuts['Alt+V'].activated.emit()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '[5 6]')
+    assert pyrpn_window.y_display.text() == '-2'
+
+
+def test_map_key(qtbot):
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window)
+    controller = rpn.PyRpn(pyrpn_window, pyrpn_model)
+    pyrpn_model._engine.paste('4\n9\n16')
+    controller._alt_shortcuts['Alt+A'].activated.emit()
+    qtbot.waitUntil(lambda: pyrpn_window.shift_label.text() == 'MAP')
+    pyrpn_window.btn_shift.click()
+    qtbot.waitUntil(lambda: pyrpn_window.shift_label.text() == 'SHIFT MAP')
+    pyrpn_window.btn_shift.click()
+    pyrpn_window.btn_sqrt.click()
+    qtbot.waitUntil(lambda: pyrpn_window.x_display.text() == '4')
+    assert pyrpn_window.y_display.text() == '3'
+    assert pyrpn_window.shift_label.text() == ''
+
+
+def test_metrics_panel(qtbot, tmp_path):
+    pyrpn_window = rpn.PyRpnWindow()
+    pyrpn_model = rpn.PyRpnEvaluate(pyrpn_window)
+    controller = rpn.PyRpn(pyrpn_window, pyrpn_model)
+    assert 'btn_number' not in vars(pyrpn_model.engine)  # not timed until the panel is opened
+    controller._metrics_shortcut.activated.emit()
+    panel = pyrpn_model._metrics_panel
+    assert panel.isVisible()
+    pyrpn_window.btn_nine.click()
+    pyrpn_window.btn_sqrt.click()
+    panel.refresh()
+    rows = {
+        (panel.table.item(row, 0).text(), panel.table.item(row, 1).text()): panel.table.item(row, 2).text()
+        for row in range(panel.table.rowCount())
+    }
+    assert rows[('btn_number', '')] == '1'
+    assert rows[('btn_operation_one_arg', 'sqrt')] == '1'
+    qtbot.waitUntil(lambda: ('flush_display', '') in pyrpn_model._metrics.histograms)  # the redraw
+    path = tmp_path / 'metrics.json'
+    panel.save(str(path))
+    assert json.loads(path.read_text())['histograms']
+    panel.reset()
+    assert panel.table.rowCount() == 0
+    controller._metrics_shortcut.activated.emit()
+    assert not panel.isVisible()
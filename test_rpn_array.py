@@ -0,0 +1,142 @@
+import pytest
+
+import rpn_engine
+import rpn_storage
+
+np = pytest.importorskip('numpy')
+
+
+def make_engine(text, **options):
+    engine = rpn_engine.RpnEngine(undo_memory=rpn_engine.UNDO_MEMORY, **options)
+    engine.paste(text)
+    return engine
+
+
+def test_to_array_and_back():
+    engine = make_engine('1\n2\n3\n3')
+    engine.btn_to_array()
+    assert engine.stack.items() == ['[1 2 3]']
+    np.testing.assert_array_equal(engine.stack.peek_value(), [1, 2, 3])
+    engine.btn_undo()
+    assert engine.stack.items() == ['1', '2', '3', '3']
+
+    engine = make_engine('1\n2\n3\n4\n5\n6\n2\n3')
+    engine.shift = True
+    engine.btn_to_array()
+    assert not engine.shift
+    assert engine.stack.items() == ['matrix(2×3)']
+    np.testing.assert_array_equal(engine.stack.peek_value(), [[1, 2, 3], [4, 5, 6]])
+    engine.btn_from_array()
+    assert engine.stack.items() == ['1', '2', '3', '4', '5', '6']
+
+    for text in ('1\n2\n3', '1\n2\n0', '1\n2\n1,5'):
+        engine = make_engine(text)
+        engine.btn_to_array()
+        assert engine._error
+        assert engine.stack.size() == 3
+
+
+def test_elementwise_operations():
+    engine = make_engine('1\n2\n3\n3')
+    engine.btn_to_array()
+    engine.paste('10')
+    engine.btn_operation_two_arg('*')  # broadcast of a number
+    assert engine.stack.items() == ['[10 20 30]']
+    engine.btn_operation_one_arg('sqrt')
+    np.testing.assert_allclose(engine.stack.peek_value(), np.sqrt([10, 20, 30]))
+
+    engine = make_engine('0\n90\n2\n')
+    engine.btn_to_array()
+    engine.btn_operation_one_arg('sin')  # in the angle mode, DEG
+    np.testing.assert_allclose(engine.stack.peek_value(), [0, 1], atol=1e-15)
+
+    engine.paste_array('1 2\n3 4')
+    engine.btn_operation_two_arg('+')  # the vector is added to each row
+    assert engine.stack.items() == ['[[1 3] [3 5]]']
+
+    engine.paste('-1')
+    engine.btn_operation_two_arg('*')
+    engine.btn_operation_one_arg('log')  # negative elements
+    assert engine._error
+
+    engine = make_engine('')
+    engine.paste_array('1 2 3')
+    engine.paste_array('1\n2')
+    engine.btn_operation_two_arg('+')  # shapes that do not broadcast
+    assert engine._error
+
+
+def test_matrix_operations():
+    engine = make_engine('')
+    engine.paste_array('4\t7\n2\t6')
+    engine.btn_operation_one_arg('det')
+    assert engine.stack.peek_value() == pytest.approx(10)
+    engine.btn_undo()
+    engine.btn_operation_one_arg('inv')
+    np.testing.assert_allclose(engine.stack.peek_value(), [[0.6, -0.7], [-0.2, 0.4]])
+    engine.paste_array('4 7\n2 6')
+    engine.btn_operation_two_arg('matmul')
+    np.testing.assert_allclose(engine.stack.peek_value(), np.eye(2), atol=1e-15)
+    engine.btn_operation_one_arg('trn')
+    engine.paste_array('1 2')
+    engine.btn_operation_two_arg('matmul')
+    np.testing.assert_allclose(engine.stack.peek_value(), [1, 2], atol=1e-15)
+
+    engine.paste_array('1 2\n2 4')
+    engine.btn_operation_one_arg('inv')  # singular
+    assert engine._error
+    with pytest.raises(ValueError, match='line 1'):
+        engine.paste_array('1 2\nx 4')
+    with pytest.raises(ValueError):
+        engine.paste_array('1 2\n3')
+
+    engine = make_engine('4')
+    engine.btn_operation_one_arg('inv')  # of a number, as 1/x
+    assert engine.stack.items() == ['0,25']
+
+
+def test_display_and_aggregates():
+    engine = make_engine('5')
+    engine.paste_array('\n'.join(' '.join(str(i * 10 + j) for j in range(3)) for i in range(3)))
+    engine.paste_array('\n'.join(str(i) for i in range(1000)))
+    assert engine.stack.items() == ['5', 'matrix(3×3)', 'vector(1000)']
+    assert engine.stack.aggregates()['sum'] == 5  # arrays are not numbers of the stack
+
+    engine = rpn_engine.RpnEngine(precision=20)
+    engine.paste_array('0,5 1,25')
+    assert engine.stack.items() == ['[0,5 1,25]']
+
+
+def test_mapped_stack(tmp_path):
+    path = str(tmp_path / 'stack.rpn')
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path))
+    engine.paste('2')
+    engine.paste_array('1 2')
+    assert engine.stack.items() == ['2', '[1 2]']
+    engine.paste_array('3 4\n5 6')
+    engine.btn_operation_one_arg('trn')
+    engine.stack.close()
+    stack = rpn_storage.MappedStack(path)
+    assert stack.items() == ['2', '[1 2]', '[[3 5] [4 6]]']
+    np.testing.assert_array_equal(stack.value(2), [[3, 5], [4, 6]])
+    stack.pop()
+    stack.pop()
+    stack.close()
+    stack = rpn_storage.MappedStack(path)
+    assert stack.items() == ['2']
+
+
+def test_keys_of_numbers():
+    for text, keys in (('5', ('btn_sigma',)), ('', ('btn_shift', 'btn_drg')), ('', ('btn_back',))):
+        engine = make_engine(text)
+        engine.paste_array('1 2')
+        for key in keys:
+            getattr(engine, key)()
+        assert engine._error
+        assert engine._angle_mesurement == 'DEG'
+    engine = make_engine('')
+    engine.paste_array('1 2')
+    engine.paste('5')
+    engine.btn_sigma()  # the array in Y
+    assert engine._error
+    assert engine.statistics.n == 0
@@ -0,0 +1,46 @@
+import math
+
+import pytest
+
+import rpn_compiler
+import rpn_engine
+
+PROGRAMS = [
+    "x 2 y^x 3 * sin",
+    "-2 x y^x",
+    "x enter enter * swap drop 1/x",
+    "x 90 / tan atan",
+    "x n! 3 mod ln e^x",
+    "100 x % x root 10^x log",
+    "x sqrt acos cos x^2 asin",
+    "pi x * 2 / sin +/-",
+]
+
+
+@pytest.mark.parametrize("angle", ["DEG", "RAD", "GRAD"])
+@pytest.mark.parametrize("program", PROGRAMS)
+def test_matches_engine(program, angle):
+    function = rpn_compiler.compile_program(program, angle)
+    assert function.inputs == ("x",)
+    for x in (-2.0, -0.5, 0.0, 0.5, 1.0, 3.0, 45.0, 90.0, 200.0):
+        expected = rpn_engine.evaluate_program(program, angle, x=x)
+        try:
+            result = function(x)
+        except (ArithmeticError, ValueError):
+            result = None
+        if expected is None or result is None:
+            assert result is expected
+        else:
+            assert result == expected or math.isnan(result) and math.isnan(expected)
+
+
+def test_compiled_programs_are_cached():
+    function = rpn_compiler.compile_program("a b + 2 /")
+    assert rpn_compiler.compile_program("a b + 2 /") is function
+    assert rpn_compiler.compile_program("a b + 2 /", "RAD") is not function
+    assert function(1.0, 2.0) == 1.5
+
+    with pytest.raises(ZeroDivisionError):
+        rpn_compiler.compile_program("x 0 /")(1.0)
+    with pytest.raises(ValueError):
+        rpn_compiler.compile_program("x + +")
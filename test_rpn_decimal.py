@@ -0,0 +1,48 @@
+from decimal import Context, Decimal
+
+import pytest
+
+import rpn_decimal
+
+SIN_1 = (
+    "0.841470984807896506652502321630298999622563060798371065672751709991910404391239"
+    "66894863974354305269585434903790792067429325911892099189888119341032772921240948"
+    "079"
+)
+
+
+def test_correct_rounding():
+    for digits in (16, 50, 160):
+        decimal_math = rpn_decimal.DecimalMath(digits)
+        expected = Context(prec=digits).plus(Decimal(SIN_1))
+        assert decimal_math.one_arg_operation("sin", Decimal(1), "RAD") == expected
+    assert str(rpn_decimal.compute_pi(30)) == "3.14159265358979323846264338328"
+
+
+def test_exact_angles():
+    decimal_math = rpn_decimal.DecimalMath(40)
+    assert decimal_math.one_arg_operation("sin", Decimal(180), "DEG") == 0
+    assert decimal_math.one_arg_operation("cos", Decimal(300), "GRAD") == 0
+    assert decimal_math.one_arg_operation("asin", Decimal("0.5"), "DEG") == 30
+    assert decimal_math.convert_angle(Decimal(200), "GRAD", "DEG") == 180
+    with pytest.raises(ValueError):
+        decimal_math.one_arg_operation("tan", Decimal(-90), "DEG")
+
+
+def test_errors_and_mod():
+    decimal_math = rpn_decimal.DecimalMath(20)
+    assert decimal_math.two_arg_operation("mod", Decimal(-7), Decimal(3)) == 2
+    assert decimal_math.two_arg_operation("root", Decimal(8), Decimal(3)) == 2
+    for operation, y_value, x_value in (("y^x", 0, -1), ("y^x", -8, "0.5"), ("/", 1, 0), ("mod", 1, 0)):
+        with pytest.raises((ArithmeticError, ValueError)):
+            decimal_math.two_arg_operation(operation, Decimal(y_value), Decimal(x_value))
+    for operation, x_value in (("ln", 0), ("sqrt", -1), ("acos", 2), ("n!", "1e10"), ("n!", "2.5")):
+        with pytest.raises((ArithmeticError, ValueError)):
+            decimal_math.one_arg_operation(operation, Decimal(x_value))
+
+
+def test_format():
+    decimal_math = rpn_decimal.DecimalMath(20)
+    assert decimal_math.format(Decimal("1234567.50")) == "1.234.567,5"
+    assert decimal_math.format(Decimal("1E+25")) == "1e+25"
+    assert decimal_math.format(Decimal("-0.00012")) == "-0,00012"
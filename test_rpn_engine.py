@@ -0,0 +1,435 @@
+import math
+import statistics
+
+import pytest
+
+import rpn_engine
+from rpn_locale import NUMBER_FORMATS, PT_BR, NumberFormat
+
+
+class RecordingObserver(rpn_engine.RpnObserver):
+    def __init__(self):
+        self.displays = []
+        self.messages = []
+
+    def display_changed(self, x, y, z, angle, size):
+        self.displays.append((x, y, z, angle, size))
+
+    def show_message(self, register, text):
+        self.messages.append((register, text))
+
+
+def test_headless_engine():
+    engine = rpn_engine.RpnEngine()
+    for key in "12":
+        engine.btn_number(key)
+    engine.btn_enter()
+    engine.btn_number("3")
+    engine.btn_operation_two_arg("*")
+    assert engine.stack.peek_x() == "36"
+
+    engine.shift = True
+    engine.btn_operation_one_arg("sqrt")
+    assert engine.stack.peek_x() == "1.296"
+    assert not engine.shift
+
+
+def test_engine_observer():
+    observer = RecordingObserver()
+    engine = rpn_engine.RpnEngine(observer)
+    assert observer.displays == [("0", "", "", "DEG", 1)]
+
+    engine.btn_number("0")
+    engine.btn_operation_one_arg("1/x")
+    assert observer.messages == [("x", "ERROR")]
+
+    engine.btn_drg()
+    assert observer.displays[-1][3] == "RAD"
+
+
+def test_evaluate_program():
+    assert rpn_engine.evaluate_program("3 4 + 2 y^x") == 49
+    assert rpn_engine.evaluate_program("x 2 root", x=16.0) == 4
+    assert rpn_engine.evaluate_program("1 0 /") is None
+    assert rpn_engine.evaluate_program("100 grad_x +", grad_x=100.0) == 200
+    assert round(rpn_engine.evaluate_program("100 sin", angle="GRAD"), 12) == 1
+
+
+def test_batch_main(tmp_path, capsys):
+    programs = tmp_path / "programs.txt"
+    programs.write_text("3 4 +\n1 0 /\n\n10000 2 /\nfoo\n")
+
+    assert rpn_engine.batch_main(["--batch", str(programs)]) == 1
+    assert capsys.readouterr().out == "7.0\nERROR\n\n5000.0\nERROR\n"
+
+    assert rpn_engine.batch_main(["--format", "locale", str(programs)]) == 1
+    assert capsys.readouterr().out == "7\nERROR\n\n5.000\nERROR\n"
+
+    missing = str(tmp_path / "missing.txt")
+    for jobs in ("1", "2"):
+        assert rpn_engine.batch_main(["--jobs", jobs, str(programs), missing]) == 2
+        output = capsys.readouterr()
+        assert output.out == "7.0\nERROR\n\n5000.0\nERROR\n"  # the lines read before
+        assert output.err.endswith(f"rpn: cannot open {missing}: No such file or directory\n")
+
+
+def test_parallel_batch_main(tmp_path, capsys, monkeypatch):
+    programs = tmp_path / "programs.txt"
+    programs.write_text("".join(f"{idx} 2 * sqrt\n" if idx % 7 else "1 foo\n" for idx in range(100)) + "\n1 0 /\n")
+    monkeypatch.setattr(rpn_engine, "BATCH_CHUNK", 3)
+
+    assert rpn_engine.batch_main([str(programs)]) == 1
+    serial = capsys.readouterr()
+    assert rpn_engine.batch_main(["--jobs", "3", str(programs)]) == 1
+    parallel = capsys.readouterr()
+    assert parallel.out == serial.out
+    assert parallel.out.count("\n") == 102
+    assert parallel.err == serial.err
+    assert parallel.err.count("unknown token") == 15
+
+    programs.write_text("3 4 +\n")
+    assert rpn_engine.batch_main(["--jobs", "2", "--format", "locale", str(programs)]) == 0
+    assert capsys.readouterr().out == "7\n"
+
+
+def test_entry_buffer():
+    entry = rpn_engine.EntryBuffer()
+    for key in "01234567,050":
+        entry.append(key)
+    assert entry.text == "1.234.567,050"
+    assert entry.digit_count() == 10
+    assert entry.to_number() == 1234567.05
+
+    for _ in range(3):
+        entry.backspace()
+    assert entry.text == "1.234.567"
+    entry.backspace()
+    assert entry.text == "123.456"
+
+    entry = rpn_engine.EntryBuffer.from_text("-5")
+    entry.backspace()
+    assert entry.text == "0"
+    assert rpn_engine.EntryBuffer.from_text("1,5e+13") is None
+
+    for number_format in (PT_BR, NUMBER_FORMATS["en-US"], NumberFormat(".", "")):
+        entry = rpn_engine.EntryBuffer("", number_format)
+        digits = ""
+        for key in "98765432101234":  # every grouping, then back
+            entry.append(key)
+            digits = (digits + key).lstrip("0") or "0"
+            assert entry.text == number_format.localize(str(int(digits)))
+        for _ in range(13):
+            entry.backspace()
+            digits = digits[:-1]
+            assert entry.text == number_format.localize(str(int(digits)))
+        assert entry.copy().text == "9"
+
+
+def test_digit_entry():
+    engine = rpn_engine.RpnEngine()
+    for key in "1,05":
+        engine.btn_number(key)
+    assert engine.stack.peek_x() == "1,05"
+    for key in "1234567890123":
+        engine.btn_number(key)
+    assert engine.stack.peek_x() == "1,05123456789"  # 12 digits at most
+
+    engine.btn_enter()
+    engine.btn_number("7")
+    engine.btn_back()
+    engine.btn_back()
+    assert engine.stack.peek_x() == "0"
+    engine.btn_operation_two_arg("+")
+    assert engine.stack.pop_value() == 1.05123456789
+
+    engine = rpn_engine.RpnEngine(undo_memory=rpn_engine.UNDO_MEMORY)
+    for key in "1,50":
+        engine.btn_number(key)
+    engine.btn_enter()
+    assert engine.stack._items == [1.5, 1.5]  # Y is no longer an entry being typed
+    assert engine.stack.items() == ["1,50", "1,50"]
+    engine.btn_undo()
+    assert engine.stack.entry_x().text == "1,50"
+    engine.btn_number("5")
+    assert engine.stack.items() == ["1,505"]
+
+
+def test_enter_on_empty_stack():
+    engine = rpn_engine.RpnEngine()
+    for key in ("4", "+/-", "sqrt"):
+        if key.isdigit():
+            engine.btn_number(key)
+        else:
+            engine.btn_operation_one_arg(key)
+    assert engine.stack.is_empty()  # the ERROR popped the operand
+    engine.btn_enter()
+    assert engine.stack.items() == ["0", "0"]  # as ENTER on a cleared stack
+    engine.btn_number("5")
+    assert engine.stack.items() == ["0", "0", "5"]  # lifted, as after ENTER on any result
+
+    stack = rpn_engine.Stack()
+    stack.dup()
+    assert stack.items() == ["0", "0"]
+
+
+def test_precision():
+    engine = rpn_engine.RpnEngine(precision=50)
+    engine.btn_number("2")
+    engine.btn_operation_one_arg("sqrt")
+    assert engine.stack.peek_x() == "1,4142135623730950488016887242096980785696718753769"
+
+    engine.angle = "DEG"
+    for key in "30":
+        engine.btn_number(key)
+    engine.btn_operation_one_arg("sin")
+    assert engine.stack.peek_x() == "0,5"
+    engine.shift = True
+    engine.btn_operation_one_arg("sin")
+    assert engine.stack.peek_x() == "30"
+
+    engine.btn_number("0")
+    engine.btn_operation_one_arg("ln")
+    assert engine.stack.size() == 2  # ERROR, as with floats
+
+    engine.btn_drop()
+    engine.precision = 12
+    assert engine.stack.peek_x() == "1,41421356237"
+    engine.shift = True
+    engine.btn_operation_one_arg("sqrt")
+    assert engine.stack.peek_x() == "2"
+
+
+def test_undo_redo():
+    engine = rpn_engine.RpnEngine(undo_memory=rpn_engine.UNDO_MEMORY)
+    for key in "12":
+        engine.btn_number(key)
+    engine.btn_enter()
+    engine.btn_number("3")
+    engine.btn_operation_two_arg("*")
+    engine.shift = True
+    engine.btn_drop()
+    assert engine.stack.items() == ["0"]
+
+    engine.btn_undo()
+    assert engine.stack.items() == ["36"]
+    engine.btn_undo()
+    assert engine.stack.items() == ["12", "3"]
+    engine.btn_redo()
+    assert engine.stack.items() == ["36"]
+
+    engine.btn_number("4")  # a new key drops the redo versions
+    engine.btn_redo()
+    assert engine.stack.items() == ["36", "4"]
+    for _ in range(10):
+        engine.btn_undo()
+    assert engine.stack.items() == ["0"]
+    assert len(engine.history) == 0
+
+
+def test_paste():
+    assert list(rpn_engine.read_numbers(["1.234,5\t2", "", '"-3";4e2\n'])) == [1234.5, 2.0, -3.0, 400.0]
+    with pytest.raises(ValueError, match="line 2: 'x' is not a number"):
+        list(rpn_engine.read_numbers(["1", "2 x"]))
+    en_us = NUMBER_FORMATS["en-US"]
+    assert list(rpn_engine.read_numbers(["1,234,567.5 -1,000 1e3"], en_us)) == [1234567.5, -1000.0, 1000.0]
+    for text in ("1,2,3", "1,23", "1234,567", ",123", "1,234,5678"):  # separators out of place
+        with pytest.raises(ValueError, match="line 1"):
+            list(rpn_engine.read_numbers([text], en_us))
+    with pytest.raises(ValueError):
+        list(rpn_engine.read_numbers(["1.5"]))  # not 15 in pt-BR
+
+    engine = rpn_engine.RpnEngine(undo_memory=rpn_engine.UNDO_MEMORY)
+    assert engine.paste("1,5\n2\n3\n") == 3
+    assert engine.stack.items() == ["1,5", "2", "3"]  # replacing the 0, as typing
+    engine.btn_operation_two_arg("+")
+    assert engine.stack.items() == ["1,5", "5"]
+    with pytest.raises(ValueError):
+        engine.paste("7\n8\nnine\n")
+    assert engine.stack.items() == ["1,5", "5"]
+    engine.btn_enter()
+    assert engine.paste("7") == 1
+    assert engine.stack.items() == ["1,5", "5", "5", "7"]  # as typing 7 would
+
+    for _ in range(4):
+        engine.btn_undo()
+    engine.btn_undo()
+    assert engine.stack.items() == ["0"]
+    engine.btn_redo()
+    assert engine.stack.items() == ["1,5", "2", "3"]
+
+    engine = rpn_engine.RpnEngine(number_format="en-US", precision=20)
+    assert engine.paste("1,234.5\n0.1") == 2
+    assert engine.stack.items() == ["1,234.5", "0.1"]
+    engine.btn_operation_two_arg("+")
+    assert engine.stack.items() == ["1,234.6"]
+
+
+def test_import_numbers(tmp_path):
+    path = tmp_path / "numbers.csv"
+    path.write_text("\ufeff" + "".join(f"{idx};{idx},5\n" for idx in range(10000)), encoding="utf-8")
+    engine = rpn_engine.RpnEngine()
+    assert engine.import_numbers(str(path)) == 20000
+    assert engine.stack.size() == 20000
+    assert engine.stack.peek_x() == "9.999,5"
+
+
+def expected_aggregates(values):
+    return {
+        "sum": math.fsum(values),
+        "mean": statistics.fmean(values),
+        "min": min(values),
+        "max": max(values),
+        "std": statistics.stdev(values) if len(values) > 1 else None,
+        "prod": math.prod(values),
+    }
+
+
+def assert_aggregates(stack):
+    values = [stack.value(idx) for idx in range(stack.size())]
+    expected = expected_aggregates(values)
+    for name, value in stack.aggregates().items():
+        assert value == pytest.approx(expected[name], rel=1e-12), name
+
+
+def test_aggregates():
+    random = __import__("random").Random(21)
+    engine = rpn_engine.RpnEngine(undo_memory=rpn_engine.UNDO_MEMORY)
+    engine.paste("\n".join(str(random.uniform(0.5, 1.5)).replace(".", ",") for _ in range(10000)))
+    assert_aggregates(engine.stack)
+    engine.btn_operation_two_arg("*")
+    engine.btn_swap()
+    engine.btn_drop()
+    assert_aggregates(engine.stack)
+    engine.btn_undo()
+    engine.btn_undo()
+    assert_aggregates(engine.stack)
+    for _ in range(100):  # below the positions kept every AGGREGATES_STEP entries
+        engine.btn_drop()
+        assert engine.stack.aggregates()["sum"] == pytest.approx(math.fsum(engine.stack._items), rel=1e-12)
+    assert_aggregates(engine.stack)
+    assert len(engine.stack._aggregates) == engine.stack.size() // rpn_engine.AGGREGATES_STEP
+
+    for key in "12,5":  # an X being typed counts as it is
+        engine.btn_number(key)
+        assert_aggregates(engine.stack)
+    engine.btn_aggregate("max")
+    assert engine.stack.peek_value() == 12.5
+
+    stack = rpn_engine.NumericStack()
+    assert stack.aggregates() == dict.fromkeys(rpn_engine.AGGREGATES)
+    for value in (1e16, 1.0, -1e16, 3.0):
+        stack.push(value)
+    assert stack.aggregates()["sum"] == 4.0  # compensated
+    stack.push(float("inf"))
+    assert stack.aggregates()["sum"] == float("inf")
+
+    engine = rpn_engine.RpnEngine(precision=30)
+    engine.paste("1\n2\n4")
+    engine.btn_aggregate("std")
+    assert engine.stack.peek_x() == "1,52752523165194666886268239791"
+    engine.stack.cls()
+    engine.btn_aggregate("mean")
+    assert engine.stack.size() == 0
+
+
+def test_aggregates_of_typed_readings():
+    engine = rpn_engine.RpnEngine()
+    stack = engine.stack
+    for reading in range(1, 301):  # type a reading, ENTER, read the summary
+        for key in f"{reading},5":
+            engine.btn_number(key)
+        engine.btn_enter()
+        aggregates = stack.aggregates()
+        assert stack._recent_start + len(stack._recent) >= stack.size() - 1  # every entry below X is kept
+    assert aggregates["max"] == 300.5
+    assert_aggregates(stack)
+
+    engine.paste("\n".join("1" for _ in range(1000)))
+    stack.aggregates()
+    assert len(stack._aggregates) == stack.size() // rpn_engine.AGGREGATES_STEP
+
+
+def test_undo_memory_cap():
+    engine = rpn_engine.RpnEngine(undo_memory=100 * rpn_engine.UndoHistory.RECORD_BYTES)
+    for _ in range(1000):
+        engine.btn_enter()
+    assert engine.history.memory <= engine.history.max_memory
+    assert 0 < len(engine.history) < 1000
+    for _ in range(1000):
+        engine.btn_undo()
+    assert engine.stack.size() > 1
+
+
+def test_macro():
+    observer = RecordingObserver()
+    engine = rpn_engine.RpnEngine(observer, undo_memory=rpn_engine.UNDO_MEMORY)
+    engine.btn_number("3")
+    engine.start_recording()
+    engine.btn_enter()
+    engine.btn_operation_two_arg("*")
+    engine.btn_number("1")
+    engine.btn_operation_two_arg("+")
+    macro = engine.stop_recording()
+    assert engine.stack.peek_x() == "10"
+    assert len(macro) == 4
+
+    displays = len(observer.displays)
+    assert engine.replay(macro, 2)
+    assert engine.stack.peek_x() == "10.202"
+    assert len(observer.displays) == displays + 1  # only the final state
+    engine.btn_undo()
+    assert engine.stack.peek_x() == "10"
+    assert engine._replay(macro, [None, None], last_only=True) == [10202.0]  # one result kept
+    engine.btn_undo()
+
+    assert engine.replay_over(macro, [0.0, 2.0, 0.5]) == [1.0, 5.0, 1.25]
+    assert engine.stack.items() == ["10"]
+
+    engine.start_recording()
+    engine.btn_operation_one_arg("ln")
+    macro = engine.stop_recording()
+    assert engine.replay_over(macro, [1.0, 0.0, -1.0]) == [0.0, None, None]
+    assert observer.messages == []
+
+
+def test_map():
+    observer = RecordingObserver()
+    engine = rpn_engine.RpnEngine(observer, undo_memory=rpn_engine.UNDO_MEMORY)
+    engine.paste("0\n30\n90\n")
+    engine.btn_number("1")
+    engine.btn_number("8")
+    engine.btn_number("0")  # still being typed
+    engine.btn_map()
+    assert engine.map_mode
+    displays = len(observer.displays)
+    engine.btn_operation_one_arg("sin")
+    assert not engine.map_mode
+    assert engine.stack.items() == ["0", "0,5", "1", "1,22464679915e-16"]  # as the sin key
+    assert len(observer.displays) == displays + 1  # drawn once
+    engine.btn_undo()
+    assert engine.stack.items() == ["0", "30", "90", "180"]
+
+    engine.angle = "RAD"
+    engine.map_mode = True
+    engine.btn_operation_one_arg("ln")  # of 0
+    assert observer.messages[-1] == ("x", "ERROR")
+    assert engine.stack.items() == ["0", "30", "90", "180"]  # kept
+
+    engine = rpn_engine.RpnEngine()
+    engine.paste("0\n3\n10\n12")
+    engine.map_mode = True
+    engine.shift = True
+    engine.btn_operation_one_arg("1/x")  # n! with SHIFT
+    assert not engine.shift
+    for idx, value in enumerate(("0", "3", "10", "12")):
+        single = rpn_engine.RpnEngine()
+        single.paste(value)
+        single.shift = True
+        single.btn_operation_one_arg("1/x")
+        assert engine.stack.item(idx) == single.stack.peek_x()
+
+    engine = rpn_engine.RpnEngine(precision=20)
+    engine.paste("2\n3")
+    engine.map_mode = True
+    engine.btn_operation_one_arg("sqrt")
+    assert engine.stack.items() == ["1,4142135623730950488", "1,7320508075688772935"]
@@ -0,0 +1,99 @@
+import locale
+import math
+import random
+import threading
+
+import pytest
+
+import rpn_engine
+from rpn_locale import EN_US, PT_BR, NumberFormat, get_number_format
+
+CONVENTIONS = {
+    PT_BR: {'decimal_point': ',', 'thousands_sep': '.', 'grouping': [3, 3, 0]},
+    EN_US: {'decimal_point': '.', 'thousands_sep': ',', 'grouping': [3, 3, 0]},
+    NumberFormat('.', ''): {'decimal_point': '.', 'thousands_sep': '', 'grouping': []},
+}
+
+
+def sample_values():
+    generator = random.Random(17)
+    values = [0.0, -0.0, 1.0, -1.0, 999.0, 1000.0, -1000.0, 123456.0, -1234567.5, 0.1, 1e-7,
+              10**12 - 1.0, 10**12, 1e21, -1e21, 1e100, 1.5e-300, math.inf, -math.inf, math.nan]
+    for _ in range(2000):
+        values.append(generator.choice((1, -1)) * 10 ** generator.uniform(-20, 25))
+        values.append(float(generator.randrange(-10**15, 10**15)))
+    return values
+
+
+@pytest.mark.parametrize('number_format', list(CONVENTIONS))
+def test_same_as_locale_module(number_format, monkeypatch):
+    monkeypatch.setattr(locale, 'localeconv', lambda: dict(CONVENTIONS[number_format]))
+    assert NumberFormat.from_localeconv() == number_format
+    for value in sample_values():
+        for digits in (1, 4, 12, 15):
+            for spec in ('%.{}g', '%.{}e'):
+                expected = locale.format_string(spec.format(digits), value, grouping=True)
+                assert number_format.localize(spec.format(digits) % value) == expected
+        text = locale.format_string('%.12g', value, grouping=True)
+        assert rpn_engine.format_result(value, number_format=number_format) == (
+            locale.format_string('%.8e' if value > 10**12 - 1 else '%.12g', value, grouping=True)
+        )
+        if math.isfinite(value):
+            assert number_format.parse(text) == locale.atof(text)
+
+
+def test_number_format():
+    assert get_number_format('en_US') is EN_US
+    assert get_number_format(PT_BR) is PT_BR
+    with pytest.raises(ValueError):
+        get_number_format('xx-XX')
+    with pytest.raises(ValueError):
+        NumberFormat.from_localeconv({'decimal_point': '.', 'thousands_sep': ',', 'grouping': [3, 2, 0]})
+    assert PT_BR.parse('-1.234,5') == -1234.5
+    with pytest.raises(ValueError):
+        EN_US.parse('1.234.5')
+
+
+def test_engine_number_format():
+    engine = rpn_engine.RpnEngine(number_format='en-US')
+    for key in '1234,5':
+        engine.btn_number(key)
+    assert engine.stack.peek_x() == '1,234.5'
+    engine.btn_enter()
+    engine.btn_operation_two_arg('*')
+    assert engine.stack.peek_x() == '1,523,990.25'
+    engine.btn_back()
+    assert engine.stack.peek_x() == '1,523,990.2'
+
+    engine.precision = 20
+    engine.stack.push('1.5')
+    engine.btn_operation_one_arg('+/-')
+    assert engine.stack.peek_x() == '-1.5'
+
+    pt_br = rpn_engine.RpnEngine()
+    pt_br.btn_number('1')
+    pt_br.btn_number('.')
+    pt_br.btn_number('5')
+    assert pt_br.stack.peek_x() == '1,5'
+    with pytest.raises(ValueError):
+        rpn_engine.RpnEngine(stack=rpn_engine.NumericStack(), number_format='en-US')
+
+
+def test_threads():
+    values = sample_values()[:500]
+    expected = {number_format: [rpn_engine.format_result(value, number_format=number_format) for value in values]
+                for number_format in (PT_BR, EN_US)}
+    results = {}
+
+    def run(number_format):
+        for _ in range(20):
+            results[number_format] = [
+                rpn_engine.format_result(value, number_format=number_format) for value in values
+            ]
+
+    threads = [threading.Thread(target=run, args=(number_format,)) for number_format in expected]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == expected
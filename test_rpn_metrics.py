@@ -0,0 +1,99 @@
+import json
+import math
+
+import rpn_engine
+from rpn_metrics import BUCKETS, ENTRY_POINTS, EngineMetrics, Histogram
+
+
+def test_attach_and_detach():
+    engine = rpn_engine.RpnEngine()
+    metrics = EngineMetrics()
+    metrics.attach(engine)
+    assert metrics.enabled
+    for key in '12':
+        engine.btn_number(key)
+    engine.btn_enter()
+    engine.btn_number('3')
+    engine.btn_operation_two_arg('*')
+    engine.btn_operation_one_arg('sqrt')
+    engine.btn_operation_one_arg('sqrt')
+    engine.btn_operation_one_arg('foo')
+    assert engine._error
+
+    counts = {key: histogram.count for key, histogram in metrics.histograms.items()}
+    assert counts[('btn_number', '')] == 3
+    assert counts[('_add_digit', '')] == 2  # the first digit of each number, the next ones are appended
+    assert counts[('btn_operation_one_arg', 'sqrt')] == 2
+    assert counts[('btn_operation_one_arg', 'foo')] == 1
+    assert counts[('btn_operation_two_arg', '*')] == 1
+    assert counts[('_two_arg', '*')] == 1
+    assert counts[('_one_arg', '')] == 1  # the unknown operation
+    assert counts[('update_display', '')] >= 4
+
+    metrics.detach(engine)
+    assert not metrics.enabled
+    assert not set(vars(engine)) & set(ENTRY_POINTS)  # the engine's own methods again
+    engine.btn_number('4')
+    assert counts[('btn_number', '')] == metrics.histograms[('btn_number', '')].count
+
+
+def test_histogram():
+    histogram = Histogram()
+    assert math.isnan(histogram.quantile(0.5))
+    for seconds in (0.5e-6, 1e-6, 3e-6, 3e-6, 2.0):
+        histogram.add(seconds)
+    assert histogram.buckets[:3] == [2, 0, 2]
+    assert histogram.buckets[-1] == 1
+    assert histogram.quantile(0.4) == BUCKETS[0]
+    assert histogram.quantile(0.8) == BUCKETS[2]
+    assert histogram.quantile(0.99) == math.inf
+
+
+def test_dumps(tmp_path):
+    metrics = EngineMetrics()
+    metrics.record('btn_number', '', 2e-6)
+    metrics.record('btn_operation_one_arg', 'sin', 3e-5)
+    metrics.record('btn_operation_one_arg', 'sin', 0.3)
+
+    document = json.loads(metrics.to_json())
+    assert document['buckets'] == list(BUCKETS)
+    first = document['histograms'][0]
+    assert (first['entry'], first['operation'], first['count']) == ('btn_operation_one_arg', 'sin', 2)
+
+    lines = metrics.to_prometheus().splitlines()
+    assert lines[1] == '# TYPE pyrpn_call_seconds histogram'
+    labels = 'entry="btn_operation_one_arg",operation="sin"'
+    assert f'pyrpn_call_seconds_bucket{{{labels},le="2.5e-05"}} 0' in lines
+    assert f'pyrpn_call_seconds_bucket{{{labels},le="5e-05"}} 1' in lines
+    assert f'pyrpn_call_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f'pyrpn_call_seconds_count{{{labels}}} 2' in lines
+
+    merged = EngineMetrics()
+    merged.merge(document['histograms'])
+    merged.merge(metrics.snapshot())
+    assert merged.histograms[('btn_operation_one_arg', 'sin')].count == 4
+    assert merged.histograms[('btn_number', '')].buckets[1] == 2
+
+    path = tmp_path / 'metrics.prom'
+    metrics.dump(str(path))
+    assert path.read_text(encoding='utf-8') == metrics.to_prometheus()
+
+
+def test_batch_metrics(tmp_path, capsys, monkeypatch):
+    programs = tmp_path / 'programs.txt'
+    programs.write_text('3 4 + sqrt\n2 sin\n1 0 /\n' * 10)
+    monkeypatch.setattr(rpn_engine, 'BATCH_CHUNK', 4)
+    serial = tmp_path / 'serial.json'
+    assert rpn_engine.batch_main(['--metrics', str(serial), str(programs)]) == 1
+    parallel = tmp_path / 'parallel.json'
+    assert rpn_engine.batch_main(['--jobs', '2', '--metrics', str(parallel), str(programs)]) == 1
+    capsys.readouterr()
+
+    for path in (serial, parallel):
+        counts = {
+            (item['entry'], item['operation']): item['count']
+            for item in json.loads(path.read_text())['histograms']
+        }
+        assert counts[('_two_arg', '+')] == 10
+        assert counts[('_two_arg', '/')] == 10
+        assert counts[('_one_arg', 'sin')] == 10
@@ -0,0 +1,111 @@
+import math
+
+import pytest
+
+import rpn_compiler
+import rpn_engine
+from rpn_operations import OPERATIONS, Operation, OperationRegistry
+
+loads = []
+
+
+def register_pack(operations):
+    """Pack of the tests, loaded by its 'module:function' path"""
+    loads.append(operations)
+    operations.register(Operation('cube', 1, lambda x: x ** 3, shifted='cbrt'))
+    operations.register(Operation('cbrt', 1, lambda x: math.copysign(abs(x) ** (1 / 3), x)))
+    operations.register(Operation('hypot', 2, math.hypot))
+    operations.register(Operation('asec', 1, lambda x: math.acos(1 / x), angle='result'))
+
+
+@pytest.fixture
+def pack():
+    OPERATIONS.add_pack('test_rpn_operations:register_pack')
+    yield
+    OPERATIONS.load_packs()
+    for name in ('cube', 'cbrt', 'hypot', 'asec'):
+        del OPERATIONS[name]
+    loads.clear()
+
+
+def test_registry():
+    operations = OperationRegistry(entry_points=False)
+    operations.register(Operation('neg', 1, lambda x: -x))
+    assert operations['neg'].arity == 1
+    assert operations.find('abs') is None
+    with pytest.raises(KeyError):
+        operations['abs']
+    with pytest.raises(ValueError):
+        operations.register(Operation('neg', 1, abs))
+    with pytest.raises(ValueError):
+        Operation('sum', 3, sum)
+
+    operations.add_pack(lambda registry: registry.register(Operation('abs', 1, abs)))
+    assert 'abs' not in operations
+    assert operations['abs'].function(-2) == 2
+    assert operations.names(1) == ('neg', 'abs')
+
+    assert OPERATIONS['1/x'].shifted == 'n!'
+    builtin = len(rpn_engine.TWO_ARG_OPERATIONS)  # first, before those of packs like rpn_array
+    assert OPERATIONS.names(2)[:builtin] == rpn_engine.TWO_ARG_OPERATIONS
+
+
+def test_factorial_is_capped():
+    assert OPERATIONS['n!'].function(170) == float(math.factorial(170))
+    with pytest.raises(OverflowError):
+        OPERATIONS['n!'].function(1e9)  # at once, without computing it
+    with pytest.raises(OverflowError):
+        rpn_compiler.compile_program('x n!')(1e9)
+    engine = rpn_engine.RpnEngine()
+    engine.paste('1000000')
+    engine.shift = True
+    engine.btn_operation_one_arg('1/x')
+    assert engine._error
+
+
+def test_pack_loaded_on_first_miss(pack):
+    rpn_engine.parse_program('2 x 3 * sin', ['x'])
+    rpn_engine.evaluate_program('3 4 +')
+    assert loads == []
+
+    assert rpn_engine.evaluate_program('3 cube 4 hypot 5 mod') == pytest.approx(27.294688127912362 % 5)
+    assert len(loads) == 1
+    assert rpn_engine.evaluate_program('2 asec', angle='DEG') == pytest.approx(60)
+    assert len(loads) == 1
+
+
+def test_pack_keys(pack):
+    engine = rpn_engine.RpnEngine()
+    engine.btn_number('3')
+    engine.btn_operation_one_arg('cube')
+    assert engine.stack.peek_x() == '27'
+    engine.shift = True
+    engine.btn_operation_one_arg('cube')
+    assert engine.stack.peek_value() == pytest.approx(3)
+    assert not engine.shift
+
+    engine.btn_number('4')
+    engine.btn_operation_two_arg('hypot')
+    assert engine.stack.peek_x() == '5'
+    engine.btn_operation_two_arg('cube')
+    assert engine.error
+
+    engine.precision = 20
+    engine.stack.push('8')
+    engine.btn_operation_one_arg('cbrt')
+    assert engine.stack.peek_value() == 2
+
+
+def test_pack_compiled_and_vectorized(pack):
+    area = rpn_compiler.compile_program('r cube 0 asec +', 'RAD')
+    assert area.inputs == ('r',)
+    with pytest.raises(ZeroDivisionError):
+        area(2.0)
+    assert rpn_compiler.compile_program('r cube s hypot')(2.0, 6.0) == 10
+
+    np = pytest.importorskip('numpy')
+    rpn_vector = pytest.importorskip('rpn_vector')
+    result = rpn_vector.evaluate_array('x cube 0.5 asec', x=np.array([1.0, 2.0]))
+    assert np.isnan(result).all()
+    result = rpn_vector.evaluate_array('x cube 2 asec +', angle='DEG', x=np.array([1.0, 2.0]))
+    np.testing.assert_allclose(result, [61, 68])
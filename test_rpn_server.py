@@ -0,0 +1,147 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import rpn_server
+
+
+def test_session():
+    session = rpn_server.Session()
+    assert session.execute('3 4 +') == '7.0\t0.0\t'
+    assert session.execute('2 *') == '14.0\t0.0\t'
+    assert session.execute('RAD') == '14.0\t0.0\t'
+    assert session.execute('pi 2 / sin') == '1.0\t14.0\t0.0'
+    assert session.execute('0 1/x') == 'ERROR'
+    assert session.execute('clear') == '0.0\t\t'
+    assert session.execute('+').startswith('ERROR')
+    assert session.execute('3 foo').startswith('ERROR unknown token')
+    assert session.execute('') == '0.0\t\t'
+
+    session = rpn_server.Session(number_format='en-US', plain=False)
+    assert session.execute('1234.5 enter +') == '2,469\t0\t'
+
+
+async def exchange(path, lines):
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(''.join(line + '\n' for line in lines).encode())
+    answers = [(await reader.readline()).decode().rstrip('\n') for _ in lines]
+    writer.close()
+    return answers
+
+
+def test_sessions(tmp_path):
+    path = str(tmp_path / 'rpn.sock')
+
+    async def run():
+        server = rpn_server.RpnServer()
+        await server.start(path)
+        programs = [[f'{idx} enter', '*', 'sqrt'] for idx in range(200)]
+        results = await asyncio.gather(*(exchange(path, program) for program in programs))
+        for idx, answers in enumerate(results):
+            assert answers[-1].split('\t')[0] == repr(float(idx))
+        for _ in range(100):  # the sessions end when they read the EOF
+            if not len(server):
+                break
+            await asyncio.sleep(0.01)
+        assert len(server) == 0
+        await server.close()
+
+    asyncio.run(run())
+
+
+def test_idle_sessions_are_evicted(tmp_path):
+    path = str(tmp_path / 'rpn.sock')
+
+    async def run():
+        server = rpn_server.RpnServer(idle_timeout=0.2, max_sessions=1)
+        await server.start(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.write(b'1 2 +\n')
+        assert await reader.readline() == b'3.0\t0.0\t\n'
+        other_reader, other_writer = await asyncio.open_unix_connection(path)
+        assert await other_reader.readline() == b'ERROR too many sessions\n'
+        assert await asyncio.wait_for(reader.readline(), 5) == b''
+        assert len(server) == 0
+        writer.close()
+        await server.close()
+
+    asyncio.run(run())
+
+
+def test_backpressure(tmp_path):
+    path = str(tmp_path / 'rpn.sock')
+
+    async def run():
+        server = rpn_server.RpnServer()
+        await server.start(path)
+        reader, writer = await asyncio.open_unix_connection(path)
+        writer.transport.set_write_buffer_limits(high=2**30)
+        count = 200000
+        writer.write(b'1 +\n' * count)
+        await asyncio.sleep(0.5)
+        # the client reads nothing: the server stops reading once its answers
+        # fill the socket and HIGH_WATER, instead of running every command
+        session = next(iter(server._sessions))
+        assert session.engine.stack.value(0) < count
+        answers = 0
+        while answers < count:
+            answers += (await reader.read(2**20)).count(b'\n')
+        assert session.engine.stack.value(0) == count
+        writer.close()
+        await server.close()
+
+    asyncio.run(run())
+
+
+def test_slow_commands(tmp_path, monkeypatch):
+    path = str(tmp_path / 'rpn.sock')
+    execute = rpn_server.Session.execute
+
+    def slow_execute(self, command):
+        if command.startswith('sleep'):
+            time.sleep(float(command.split()[1]))
+            return self.registers()
+        return execute(self, command)
+
+    monkeypatch.setattr(rpn_server.Session, 'execute', slow_execute)
+
+    async def run():
+        server = rpn_server.RpnServer(command_timeout=0.5)
+        await server.start(path)
+        slow_reader, slow_writer = await asyncio.open_unix_connection(path)
+        slow_writer.write(b'2\n')
+        assert await slow_reader.readline() == b'2.0\t0.0\t\n'
+        slow_writer.write(b'sleep 0.2\nsleep 5\n3\n')
+        slow_session = next(iter(server._sessions))
+        for _ in range(500):
+            if slow_session.started is not None:
+                break
+            await asyncio.sleep(0.01)
+        # the other sessions are served while the slow one runs
+        assert await exchange(path, ['1 2 +']) == ['3.0\t0.0\t']
+        assert slow_session.started is not None
+        answers = [await asyncio.wait_for(slow_reader.readline(), 5) for _ in range(3)]
+        assert answers == [b'2.0\t0.0\t\n', b'ERROR timeout\n', b'']
+        slow_writer.close()
+        await server.close()
+
+    asyncio.run(run())
+
+
+def test_serve_command_line(tmp_path):
+    path = str(tmp_path / 'rpn.sock')
+    server = subprocess.Popen(
+        [sys.executable, 'rpn.py', '--serve', '--unix', path, '--format', 'locale'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert 'serving on' in server.stderr.readline()
+        assert asyncio.run(exchange(path, ['1,5 2 *'])) == ['ERROR unknown token \'1,5\'']
+        assert asyncio.run(exchange(path, ['1.5 2 *'])) == ['3\t0\t']
+    finally:
+        server.terminate()
+        server.wait()
@@ -0,0 +1,113 @@
+import pytest
+
+import rpn_engine
+from rpn_locale import EN_US
+from rpn_statistics import StatisticsRegisters
+
+np = pytest.importorskip('numpy')
+
+
+def expected(x, y):
+    slope, intercept = np.polyfit(x, y, 1)
+    return {
+        'n': len(x),
+        'mean_x': np.mean(x),
+        'mean_y': np.mean(y),
+        'std_x': np.std(x, ddof=1),
+        'std_y': np.std(y, ddof=1),
+        'slope': slope,
+        'intercept': intercept,
+        'r': np.corrcoef(x, y)[0, 1],
+    }
+
+
+def assert_results(registers, x, y):
+    results = registers.results()
+    for name, value in expected(x, y).items():
+        assert results[name] == pytest.approx(value, rel=1e-9, abs=1e-12), name
+
+
+def test_add_and_remove():
+    rng = np.random.default_rng(22)
+    x = rng.uniform(1e6, 1e6 + 10, 1000)  # far from 0, where plain sums cancel
+    y = 3 * x + rng.normal(0, 1, 1000)
+    registers = StatisticsRegisters()
+    for x_value, y_value in zip(x, y):
+        registers.add(x_value, y_value)
+    assert_results(registers, x, y)
+    for x_value, y_value in zip(x[500:], y[500:]):
+        registers.remove(x_value, y_value)
+    assert_results(registers, x[:500], y[:500])
+
+    registers.clear()
+    assert registers.results() == dict.fromkeys(registers.results(), None) | {'n': 0}
+    registers.add(1.0, 2.0)
+    assert registers.results()['mean_y'] == 2.0
+    assert registers.results()['std_x'] is None
+    registers.remove(1.0, 2.0)
+    with pytest.raises(ValueError):
+        registers.remove(1.0, 2.0)
+    registers.add(1.0, 2.0)
+    registers.add(1.0, 3.0)
+    assert registers.results()['slope'] is None  # every x is the same
+
+
+def test_bulk_feed(tmp_path, monkeypatch):
+    rng = np.random.default_rng(7)
+    x = rng.normal(10, 2, 5000)
+    y = -0.5 * x + rng.normal(0, 0.1, 5000)
+    registers = StatisticsRegisters()
+    registers.add(x[0], y[0])
+    registers.add_arrays(x[1:3000], y[1:3000])
+    registers.add_arrays(x[3000:], y[3000:])
+    assert_results(registers, x, y)
+
+    monkeypatch.setattr('rpn_statistics.CHUNK', 700)
+    path = tmp_path / 'pairs.csv'
+    path.write_text(''.join(f'{float(a)!r};{float(b)!r}\n'.replace('.', ',') for a, b in zip(x, y)) + '\n', encoding='utf-8')
+    registers = StatisticsRegisters()
+    assert registers.feed_file(str(path)) == 5000
+    assert_results(registers, x, y)
+
+    registers = StatisticsRegisters()
+    assert registers.feed(['1,000.5\t2', '3 4'], EN_US) == 2
+    assert registers.results()['mean_x'] == 501.75
+    with pytest.raises(ValueError, match="line 2: '3 4 5' is not a pair"):
+        registers.feed(['1 2', '3 4 5'])
+
+
+def test_sigma_keys():
+    engine = rpn_engine.RpnEngine(undo_memory=rpn_engine.UNDO_MEMORY)
+    for y_value, x_value in (('2', '1'), ('4', '2'), ('6,5', '3')):
+        for key in y_value:
+            engine.btn_number(key)
+        engine.btn_enter()
+        for key in x_value:
+            engine.btn_number(key)
+        engine.btn_sigma()
+        assert engine.stack.peek_value() == engine.statistics.n
+    assert engine.stack.items() == ['2', '4', '6,5', '3']  # n replaces each x
+
+    engine.btn_statistic('slope')
+    assert engine.stack.peek_x() == '2,25'
+    engine.btn_undo()
+    engine.btn_undo()  # the last Σ+
+    assert engine.statistics.n == 2
+    assert engine.stack.items() == ['2', '4', '6,5', '3']
+    engine.btn_redo()
+    assert engine.statistics.n == 3
+
+    engine.shift = True
+    engine.btn_sigma()  # Σ- of (3, 6,5)
+    assert engine.statistics.n == 2
+    assert not engine.shift
+    engine.btn_statistic('r')
+    assert engine.stack.peek_value() == pytest.approx(1.0)
+
+    engine.statistics.clear()
+    engine.btn_statistic('mean_x')
+    assert engine._error
+    engine._error = False
+    engine.shift = True
+    engine.btn_sigma()
+    assert engine._error
@@ -0,0 +1,110 @@
+import pytest
+
+import rpn_engine
+import rpn_storage
+
+
+def test_reopen(tmp_path):
+    path = str(tmp_path / "stack.bin")
+    stack = rpn_storage.MappedStack(path)
+    engine = rpn_engine.RpnEngine(stack=stack)
+    for key in "1,5":
+        engine.btn_number(key)
+    engine.btn_enter()
+    engine.btn_operation_two_arg("*")
+    for key in "42":
+        engine.btn_number(key)
+
+    # a second process would see the same file, the first one was not closed
+    assert rpn_storage.MappedStack(path).items() == ["2,25", "42"]
+
+    engine.btn_swap()
+    engine.btn_drop()
+    stack.close()
+    assert rpn_storage.MappedStack(path).items() == ["42"]
+
+
+def test_growth(tmp_path):
+    path = str(tmp_path / "stack.bin")
+    stack = rpn_storage.MappedStack(path)
+    for idx in range(3 * rpn_storage.MIN_CAPACITY):
+        stack.push(float(idx))
+    stack.sync()
+    stack.pop()
+    stack.close()
+
+    stack = rpn_storage.MappedStack(path)
+    assert stack.size() == 3 * rpn_storage.MIN_CAPACITY - 1
+    assert stack.peek_value() == 3 * rpn_storage.MIN_CAPACITY - 2
+
+
+def test_not_a_stack_file(tmp_path):
+    path = tmp_path / "stack.bin"
+    path.write_bytes(b"not a stack file")
+    with pytest.raises(ValueError):
+        rpn_storage.MappedStack(str(path))
+
+
+def test_undo_is_saved(tmp_path):
+    path = str(tmp_path / "stack.bin")
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path), undo_memory=rpn_engine.UNDO_MEMORY)
+    for key in "25":
+        engine.btn_number(key)
+    engine.btn_enter()
+    engine.btn_operation_two_arg("+")
+    engine.btn_undo()
+    engine.btn_undo()
+
+    assert rpn_storage.MappedStack(path).items() == ["25"]
+
+
+def test_paste_is_saved(tmp_path):
+    path = str(tmp_path / "stack.bin")
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path), undo_memory=rpn_engine.UNDO_MEMORY)
+    engine.paste("\n".join(str(idx) for idx in range(1000)))
+    assert rpn_storage.MappedStack(path).size() == 1000
+
+    engine.btn_undo()
+    assert rpn_storage.MappedStack(path).items() == ["0"]
+    engine.btn_redo()
+    assert rpn_storage.MappedStack(path).peek_value() == 999.0
+
+
+def test_decimals_are_kept(tmp_path):
+    path = str(tmp_path / "stack.bin")
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path), precision=40)
+    engine.btn_number("2")
+    engine.btn_operation_one_arg("sqrt")
+    engine.btn_enter()
+    engine.btn_number("3")
+    engine.btn_operation_one_arg("sqrt")
+    items = engine.stack.items()
+    assert items[0] == "1,41421356237309504880168872420969807857"
+    engine.stack.flush()
+
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path), precision=40)
+    assert engine.stack.items() == items
+
+    # opened in the float mode, the decimals come back while they are untouched
+    stack = rpn_storage.MappedStack(path)
+    assert stack.items() == ["1,41421356237", "1,41421356237", "1,73205080757"]
+    engine = rpn_engine.RpnEngine(stack=stack)
+    engine.btn_drop()
+    engine.btn_number("5")
+    stack.close()
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path), precision=40)
+    assert engine.stack.items() == [items[0], "5"]  # the drop and the 5 typed over √2 are floats
+
+
+def test_outdated_exact_log(tmp_path):
+    path = str(tmp_path / "stack.bin")
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path), precision=30)
+    engine.btn_number("2")
+    engine.btn_operation_one_arg("sqrt")
+    engine.stack.close()
+    stack = rpn_storage.MappedStack(path)
+    stack._values[0] = 7.0  # the stack file was written after the log
+    stack.close()
+    engine = rpn_engine.RpnEngine(stack=rpn_storage.MappedStack(path), precision=30)
+    assert engine.stack.items() == ["7"]
+    assert "1.414" not in (tmp_path / "stack.bin.exact").read_text()
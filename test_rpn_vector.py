@@ -0,0 +1,65 @@
+import math
+
+import pytest
+
+import rpn_engine
+
+np = pytest.importorskip("numpy")
+rpn_vector = pytest.importorskip("rpn_vector")
+
+
+class ErrorObserver(rpn_engine.RpnObserver):
+    error = False
+
+    def show_message(self, register, text):
+        self.error = self.error or text == "ERROR"
+
+
+def engine_result(program, angle, x):
+    """Replay a program on the calculator keys, as the GUI would run it"""
+    shifted = {name: key for key, name in rpn_engine.SHIFTED_OPERATIONS.items()}
+    observer = ErrorObserver()
+    engine = rpn_engine.RpnEngine(observer)
+    while engine.angle != angle:
+        engine.btn_drg()
+    engine.btn_drop()
+    for word in program.split():
+        engine.shift = word in shifted
+        key = shifted.get(word, word)
+        if key in rpn_engine.ONE_ARG_OPERATIONS:
+            engine.btn_operation_one_arg(key)
+        elif key in rpn_engine.TWO_ARG_OPERATIONS:
+            engine.btn_operation_two_arg(key)
+        else:
+            engine.stack.push(float(x) if word == "x" else float(word))
+        if observer.error:
+            return math.nan
+    return engine.stack.peek_value()
+
+
+@pytest.mark.parametrize("angle", ["DEG", "RAD", "GRAD"])
+@pytest.mark.parametrize("program", [
+    "x 2 y^x 3 * sin",
+    "x 90 / tan",
+    "x asin",
+    "x 1/x ln 10^x",
+    "x n! 3 mod",
+    "100 x % x root",
+    "x sqrt e^x cos",
+])
+def test_matches_engine(program, angle):
+    x = np.array([-2.0, -0.5, 0.0, 0.5, 1.0, 3.0, 45.0, 90.0, 180.0, 200.0])
+    result = rpn_vector.evaluate_array(program, angle=angle, x=x)
+    expected = [engine_result(program, angle, value) for value in x]
+    np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-300)
+
+
+def test_errors_and_broadcast():
+    result = rpn_vector.evaluate_array("y x /", x=np.array([0.0, 2.0]), y=3.0)
+    assert math.isnan(result[0])
+    assert result[1] == 1.5
+
+    with pytest.raises(ValueError):
+        rpn_vector.evaluate_array("x +", x=1.0)
+    with pytest.raises(ValueError):
+        rpn_vector.evaluate_array("x foo", x=1.0)
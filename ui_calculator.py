@@ -0,0 +1,814 @@
+# Form implementation generated from reading ui file 'ui/calculator.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_main_window(object):
+    def setupUi(self, main_window):
+        main_window.setObjectName("main_window")
+        main_window.resize(310, 540)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(main_window.sizePolicy().hasHeightForWidth())
+        main_window.setSizePolicy(sizePolicy)
+        main_window.setMinimumSize(QtCore.QSize(310, 540))
+        main_window.setMaximumSize(QtCore.QSize(310, 540))
+        font = QtGui.QFont()
+        font.setFamily("Source Code Pro")
+        font.setPointSize(12)
+        main_window.setFont(font)
+        main_window.setStyleSheet("background-color: rgb(80, 80, 75);")
+        self.centralwidget = QtWidgets.QWidget(parent=main_window)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.centralwidget.setObjectName("centralwidget")
+        self.btn_sqrt = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_sqrt.setGeometry(QtCore.QRect(10, 260, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_sqrt.setFont(font)
+        self.btn_sqrt.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_sqrt.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_sqrt.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(":/icons/btn_raiz_quadrada.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.btn_sqrt.setIcon(icon)
+        self.btn_sqrt.setIconSize(QtCore.QSize(32, 32))
+        self.btn_sqrt.setObjectName("btn_sqrt")
+        self.btn_y_exp_x = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_y_exp_x.setGeometry(QtCore.QRect(70, 260, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_y_exp_x.setFont(font)
+        self.btn_y_exp_x.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_y_exp_x.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_y_exp_x.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/icons/btn_y_exp_x.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.btn_y_exp_x.setIcon(icon1)
+        self.btn_y_exp_x.setIconSize(QtCore.QSize(32, 32))
+        self.btn_y_exp_x.setObjectName("btn_y_exp_x")
+        self.btn_x_inv = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_x_inv.setGeometry(QtCore.QRect(130, 260, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_x_inv.setFont(font)
+        self.btn_x_inv.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_x_inv.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_x_inv.setObjectName("btn_x_inv")
+        self.btn_drop = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_drop.setGeometry(QtCore.QRect(190, 260, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        self.btn_drop.setFont(font)
+        self.btn_drop.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_drop.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 75, 75);")
+        self.btn_drop.setObjectName("btn_drop")
+        self.btn_swap = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_swap.setGeometry(QtCore.QRect(250, 260, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        self.btn_swap.setFont(font)
+        self.btn_swap.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_swap.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 75, 75);")
+        self.btn_swap.setObjectName("btn_swap")
+        self.btn_back = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_back.setGeometry(QtCore.QRect(250, 300, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Wingdings 3")
+        font.setPointSize(16)
+        self.btn_back.setFont(font)
+        self.btn_back.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_back.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 75, 75);")
+        self.btn_back.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(":/icons/back.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.btn_back.setIcon(icon2)
+        self.btn_back.setIconSize(QtCore.QSize(36, 36))
+        self.btn_back.setObjectName("btn_back")
+        self.btn_percent = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_percent.setGeometry(QtCore.QRect(190, 300, 50, 50))
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250, 128))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Active, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250, 128))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Inactive, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.ButtonText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(50, 50, 50))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(250, 250, 250, 128))
+        brush.setStyle(QtCore.Qt.BrushStyle.SolidPattern)
+        palette.setBrush(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.PlaceholderText, brush)
+        self.btn_percent.setPalette(palette)
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(14)
+        self.btn_percent.setFont(font)
+        self.btn_percent.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_percent.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_percent.setObjectName("btn_percent")
+        self.btn_nine = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_nine.setGeometry(QtCore.QRect(130, 300, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_nine.setFont(font)
+        self.btn_nine.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_nine.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_nine.setObjectName("btn_nine")
+        self.btn_seven = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_seven.setGeometry(QtCore.QRect(10, 300, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_seven.setFont(font)
+        self.btn_seven.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_seven.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_seven.setObjectName("btn_seven")
+        self.btn_eight = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_eight.setGeometry(QtCore.QRect(70, 300, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_eight.setFont(font)
+        self.btn_eight.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_eight.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_eight.setObjectName("btn_eight")
+        self.btn_five = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_five.setGeometry(QtCore.QRect(70, 360, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_five.setFont(font)
+        self.btn_five.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_five.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_five.setObjectName("btn_five")
+        self.btn_divide = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_divide.setGeometry(QtCore.QRect(250, 360, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_divide.setFont(font)
+        self.btn_divide.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_divide.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_divide.setObjectName("btn_divide")
+        self.btn_multiply = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_multiply.setGeometry(QtCore.QRect(190, 360, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_multiply.setFont(font)
+        self.btn_multiply.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_multiply.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_multiply.setObjectName("btn_multiply")
+        self.btn_four = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_four.setGeometry(QtCore.QRect(10, 360, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_four.setFont(font)
+        self.btn_four.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_four.setAutoFillBackground(False)
+        self.btn_four.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_four.setObjectName("btn_four")
+        self.btn_six = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_six.setGeometry(QtCore.QRect(130, 360, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_six.setFont(font)
+        self.btn_six.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_six.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_six.setObjectName("btn_six")
+        self.btn_three = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_three.setGeometry(QtCore.QRect(130, 420, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_three.setFont(font)
+        self.btn_three.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_three.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_three.setObjectName("btn_three")
+        self.btn_minus = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_minus.setGeometry(QtCore.QRect(250, 420, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_minus.setFont(font)
+        self.btn_minus.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_minus.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_minus.setObjectName("btn_minus")
+        self.btn_two = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_two.setGeometry(QtCore.QRect(70, 420, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_two.setFont(font)
+        self.btn_two.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_two.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(255, 255, 255);")
+        self.btn_two.setObjectName("btn_two")
+        self.btn_add = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_add.setGeometry(QtCore.QRect(190, 420, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_add.setFont(font)
+        self.btn_add.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_add.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_add.setObjectName("btn_add")
+        self.btn_one = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_one.setGeometry(QtCore.QRect(10, 420, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_one.setFont(font)
+        self.btn_one.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_one.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(255, 255, 255);")
+        self.btn_one.setObjectName("btn_one")
+        self.btn_change_sign = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_change_sign.setGeometry(QtCore.QRect(10, 480, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_change_sign.setFont(font)
+        self.btn_change_sign.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_change_sign.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(255, 255, 255);")
+        self.btn_change_sign.setObjectName("btn_change_sign")
+        self.btn_decimal = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_decimal.setGeometry(QtCore.QRect(130, 480, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_decimal.setFont(font)
+        self.btn_decimal.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_decimal.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(255, 255, 255);")
+        self.btn_decimal.setObjectName("btn_decimal")
+        self.btn_enter = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_enter.setGeometry(QtCore.QRect(190, 480, 111, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_enter.setFont(font)
+        self.btn_enter.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_enter.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_enter.setObjectName("btn_enter")
+        self.btn_zero = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_zero.setGeometry(QtCore.QRect(70, 480, 50, 50))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(16)
+        self.btn_zero.setFont(font)
+        self.btn_zero.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_zero.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(255, 255, 255);")
+        self.btn_zero.setAutoDefault(False)
+        self.btn_zero.setObjectName("btn_zero")
+        self.btn_log = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_log.setGeometry(QtCore.QRect(250, 210, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_log.setFont(font)
+        self.btn_log.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_log.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_log.setObjectName("btn_log")
+        self.btn_ln = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_ln.setGeometry(QtCore.QRect(190, 210, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_ln.setFont(font)
+        self.btn_ln.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_ln.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_ln.setObjectName("btn_ln")
+        self.btn_tan = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_tan.setGeometry(QtCore.QRect(130, 210, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_tan.setFont(font)
+        self.btn_tan.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_tan.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_tan.setObjectName("btn_tan")
+        self.btn_sin = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_sin.setGeometry(QtCore.QRect(10, 210, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_sin.setFont(font)
+        self.btn_sin.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_sin.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_sin.setObjectName("btn_sin")
+        self.btn_cos = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_cos.setGeometry(QtCore.QRect(70, 210, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_cos.setFont(font)
+        self.btn_cos.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_cos.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_cos.setObjectName("btn_cos")
+        self.btn_pi = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_pi.setGeometry(QtCore.QRect(70, 160, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_pi.setFont(font)
+        self.btn_pi.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_pi.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_pi.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(":/icons/btn_pi.svg"), QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        self.btn_pi.setIcon(icon3)
+        self.btn_pi.setIconSize(QtCore.QSize(32, 32))
+        self.btn_pi.setObjectName("btn_pi")
+        self.btn_e = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_e.setGeometry(QtCore.QRect(130, 160, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        font.setBold(True)
+        self.btn_e.setFont(font)
+        self.btn_e.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_e.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_e.setObjectName("btn_e")
+        self.btn_mod = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_mod.setGeometry(QtCore.QRect(190, 160, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.btn_mod.setFont(font)
+        self.btn_mod.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_mod.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_mod.setObjectName("btn_mod")
+        self.btn_shift = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_shift.setGeometry(QtCore.QRect(10, 160, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.btn_shift.setFont(font)
+        self.btn_shift.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_shift.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 170, 50);")
+        self.btn_shift.setObjectName("btn_shift")
+        self.btn_drg = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.btn_drg.setGeometry(QtCore.QRect(250, 160, 50, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.btn_drg.setFont(font)
+        self.btn_drg.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+        self.btn_drg.setStyleSheet("background-color: rgb(50, 50, 50);\n"
+"color: rgb(250, 250, 250);")
+        self.btn_drg.setObjectName("btn_drg")
+        self.display_frame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.display_frame.setGeometry(QtCore.QRect(10, 10, 290, 125))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(12)
+        self.display_frame.setFont(font)
+        self.display_frame.setStyleSheet("background-color: rgb(190, 240, 210);")
+        self.display_frame.setFrameShape(QtWidgets.QFrame.Shape.Box)
+        self.display_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.display_frame.setObjectName("display_frame")
+        self.x_label = QtWidgets.QLabel(parent=self.display_frame)
+        self.x_label.setGeometry(QtCore.QRect(5, 87, 30, 32))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semilight")
+        font.setPointSize(14)
+        self.x_label.setFont(font)
+        self.x_label.setStyleSheet("color: rgb(0, 0, 0);")
+        self.x_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignBottom|QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.x_label.setObjectName("x_label")
+        self.z_label = QtWidgets.QLabel(parent=self.display_frame)
+        self.z_label.setGeometry(QtCore.QRect(5, 22, 30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semilight")
+        font.setPointSize(14)
+        self.z_label.setFont(font)
+        self.z_label.setStyleSheet("color: rgb(0, 0, 0);")
+        self.z_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignBottom|QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.z_label.setObjectName("z_label")
+        self.y_label = QtWidgets.QLabel(parent=self.display_frame)
+        self.y_label.setGeometry(QtCore.QRect(5, 56, 30, 30))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semilight")
+        font.setPointSize(14)
+        self.y_label.setFont(font)
+        self.y_label.setStyleSheet("color: rgb(0, 0, 0);")
+        self.y_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignBottom|QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.y_label.setObjectName("y_label")
+        self.y_display = QtWidgets.QLabel(parent=self.display_frame)
+        self.y_display.setGeometry(QtCore.QRect(30, 54, 250, 34))
+        font = QtGui.QFont()
+        font.setFamily("Digital-7 Italic")
+        font.setPointSize(24)
+        font.setItalic(False)
+        self.y_display.setFont(font)
+        self.y_display.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.y_display.setStyleSheet("color: rgb(0, 0, 0);")
+        self.y_display.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.y_display.setText("")
+        self.y_display.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.y_display.setObjectName("y_display")
+        self.x_display = QtWidgets.QLabel(parent=self.display_frame)
+        self.x_display.setGeometry(QtCore.QRect(30, 88, 250, 34))
+        font = QtGui.QFont()
+        font.setFamily("Digital-7 Italic")
+        font.setPointSize(24)
+        font.setItalic(False)
+        self.x_display.setFont(font)
+        self.x_display.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.x_display.setStyleSheet("color: rgb(0, 0, 0);")
+        self.x_display.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.x_display.setText("")
+        self.x_display.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.x_display.setObjectName("x_display")
+        self.z_display = QtWidgets.QLabel(parent=self.display_frame)
+        self.z_display.setGeometry(QtCore.QRect(30, 20, 250, 34))
+        font = QtGui.QFont()
+        font.setFamily("Digital-7 Italic")
+        font.setPointSize(24)
+        font.setItalic(False)
+        self.z_display.setFont(font)
+        self.z_display.setLayoutDirection(QtCore.Qt.LayoutDirection.LeftToRight)
+        self.z_display.setStyleSheet("color: rgb(0, 0, 0);")
+        self.z_display.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.z_display.setText("")
+        self.z_display.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.z_display.setObjectName("z_display")
+        self.shift_label = QtWidgets.QLabel(parent=self.display_frame)
+        self.shift_label.setGeometry(QtCore.QRect(5, 5, 40, 15))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semilight")
+        font.setPointSize(8)
+        self.shift_label.setFont(font)
+        self.shift_label.setStyleSheet("color: rgb(0, 0, 0);")
+        self.shift_label.setText("")
+        self.shift_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignBottom|QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.shift_label.setObjectName("shift_label")
+        self.stack_label = QtWidgets.QLabel(parent=self.display_frame)
+        self.stack_label.setGeometry(QtCore.QRect(220, 5, 60, 15))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semilight")
+        font.setPointSize(8)
+        self.stack_label.setFont(font)
+        self.stack_label.setStyleSheet("color: rgb(0, 0, 0);")
+        self.stack_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignBottom|QtCore.Qt.AlignmentFlag.AlignLeading|QtCore.Qt.AlignmentFlag.AlignLeft)
+        self.stack_label.setObjectName("stack_label")
+        self.angle_label = QtWidgets.QLabel(parent=self.display_frame)
+        self.angle_label.setGeometry(QtCore.QRect(150, 5, 60, 15))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semilight")
+        font.setPointSize(8)
+        self.angle_label.setFont(font)
+        self.angle_label.setStyleSheet("color: rgb(0, 0, 0);")
+        self.angle_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignBottom|QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing)
+        self.angle_label.setObjectName("angle_label")
+        self.shift_btn_sin = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_sin.setGeometry(QtCore.QRect(10, 190, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(11)
+        font.setBold(True)
+        self.shift_btn_sin.setFont(font)
+        self.shift_btn_sin.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_sin.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_sin.setObjectName("shift_btn_sin")
+        self.shift_btn_cos = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_cos.setGeometry(QtCore.QRect(70, 190, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(11)
+        font.setBold(True)
+        self.shift_btn_cos.setFont(font)
+        self.shift_btn_cos.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_cos.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_cos.setObjectName("shift_btn_cos")
+        self.shift_btn_tan = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_tan.setGeometry(QtCore.QRect(130, 190, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(11)
+        font.setBold(True)
+        self.shift_btn_tan.setFont(font)
+        self.shift_btn_tan.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_tan.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_tan.setObjectName("shift_btn_tan")
+        self.shift_btn_e_exp_x = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_e_exp_x.setGeometry(QtCore.QRect(190, 190, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.shift_btn_e_exp_x.setFont(font)
+        self.shift_btn_e_exp_x.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_e_exp_x.setText("")
+        self.shift_btn_e_exp_x.setPixmap(QtGui.QPixmap(":/icons/btn_e_exp_x.svg"))
+        self.shift_btn_e_exp_x.setScaledContents(True)
+        self.shift_btn_e_exp_x.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_e_exp_x.setIndent(0)
+        self.shift_btn_e_exp_x.setObjectName("shift_btn_e_exp_x")
+        self.shift_btn_10_exp_x = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_10_exp_x.setGeometry(QtCore.QRect(250, 190, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.shift_btn_10_exp_x.setFont(font)
+        self.shift_btn_10_exp_x.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_10_exp_x.setPixmap(QtGui.QPixmap(":/icons/btn_10_exp_x.svg"))
+        self.shift_btn_10_exp_x.setScaledContents(True)
+        self.shift_btn_10_exp_x.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_10_exp_x.setIndent(0)
+        self.shift_btn_10_exp_x.setObjectName("shift_btn_10_exp_x")
+        self.shift_btn_x_exp_2 = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_x_exp_2.setGeometry(QtCore.QRect(10, 240, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(11)
+        font.setBold(True)
+        self.shift_btn_x_exp_2.setFont(font)
+        self.shift_btn_x_exp_2.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_x_exp_2.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_x_exp_2.setObjectName("shift_btn_x_exp_2")
+        self.shift_btn_y_root_x = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_y_root_x.setGeometry(QtCore.QRect(70, 240, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.shift_btn_y_root_x.setFont(font)
+        self.shift_btn_y_root_x.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_y_root_x.setText("")
+        self.shift_btn_y_root_x.setPixmap(QtGui.QPixmap(":/icons/btn_raiz_x.svg"))
+        self.shift_btn_y_root_x.setScaledContents(True)
+        self.shift_btn_y_root_x.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_y_root_x.setIndent(0)
+        self.shift_btn_y_root_x.setObjectName("shift_btn_y_root_x")
+        self.shift_btn_fatorial = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_fatorial.setGeometry(QtCore.QRect(130, 240, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(11)
+        font.setBold(True)
+        self.shift_btn_fatorial.setFont(font)
+        self.shift_btn_fatorial.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_fatorial.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_fatorial.setObjectName("shift_btn_fatorial")
+        self.shift_btn_cls = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_cls.setGeometry(QtCore.QRect(190, 240, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.shift_btn_cls.setFont(font)
+        self.shift_btn_cls.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_cls.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_cls.setObjectName("shift_btn_cls")
+        self.shift_btn_stack = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_stack.setGeometry(QtCore.QRect(250, 240, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.shift_btn_stack.setFont(font)
+        self.shift_btn_stack.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_stack.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_stack.setObjectName("shift_btn_stack")
+        self.shift_btn_conv_drg = QtWidgets.QLabel(parent=self.centralwidget)
+        self.shift_btn_conv_drg.setGeometry(QtCore.QRect(250, 138, 50, 20))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI Semibold")
+        font.setPointSize(10)
+        font.setBold(True)
+        self.shift_btn_conv_drg.setFont(font)
+        self.shift_btn_conv_drg.setStyleSheet("color: rgb(250, 170, 50);")
+        self.shift_btn_conv_drg.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.shift_btn_conv_drg.setObjectName("shift_btn_conv_drg")
+        self.display_frame.raise_()
+        self.btn_sqrt.raise_()
+        self.btn_y_exp_x.raise_()
+        self.btn_x_inv.raise_()
+        self.btn_drop.raise_()
+        self.btn_swap.raise_()
+        self.btn_back.raise_()
+        self.btn_percent.raise_()
+        self.btn_nine.raise_()
+        self.btn_seven.raise_()
+        self.btn_eight.raise_()
+        self.btn_five.raise_()
+        self.btn_divide.raise_()
+        self.btn_multiply.raise_()
+        self.btn_four.raise_()
+        self.btn_six.raise_()
+        self.btn_three.raise_()
+        self.btn_minus.raise_()
+        self.btn_two.raise_()
+        self.btn_add.raise_()
+        self.btn_one.raise_()
+        self.btn_change_sign.raise_()
+        self.btn_decimal.raise_()
+        self.btn_enter.raise_()
+        self.btn_zero.raise_()
+        self.btn_log.raise_()
+        self.btn_ln.raise_()
+        self.btn_tan.raise_()
+        self.btn_sin.raise_()
+        self.btn_cos.raise_()
+        self.btn_pi.raise_()
+        self.btn_e.raise_()
+        self.btn_mod.raise_()
+        self.btn_shift.raise_()
+        self.btn_drg.raise_()
+        self.shift_btn_sin.raise_()
+        self.shift_btn_cos.raise_()
+        self.shift_btn_tan.raise_()
+        self.shift_btn_e_exp_x.raise_()
+        self.shift_btn_10_exp_x.raise_()
+        self.shift_btn_x_exp_2.raise_()
+        self.shift_btn_y_root_x.raise_()
+        self.shift_btn_fatorial.raise_()
+        self.shift_btn_cls.raise_()
+        self.shift_btn_stack.raise_()
+        self.shift_btn_conv_drg.raise_()
+        main_window.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(main_window)
+        QtCore.QMetaObject.connectSlotsByName(main_window)
+
+    def retranslateUi(self, main_window):
+        _translate = QtCore.QCoreApplication.translate
+        main_window.setWindowTitle(_translate("main_window", "RPN Calculator"))
+        self.btn_x_inv.setText(_translate("main_window", "1/x"))
+        self.btn_drop.setText(_translate("main_window", "DROP"))
+        self.btn_drop.setShortcut(_translate("main_window", "Del"))
+        self.btn_swap.setText(_translate("main_window", "SWAP"))
+        self.btn_back.setShortcut(_translate("main_window", "Backspace"))
+        self.btn_percent.setText(_translate("main_window", "%"))
+        self.btn_nine.setText(_translate("main_window", "9"))
+        self.btn_nine.setShortcut(_translate("main_window", "9"))
+        self.btn_seven.setText(_translate("main_window", "7"))
+        self.btn_seven.setShortcut(_translate("main_window", "7"))
+        self.btn_eight.setText(_translate("main_window", "8"))
+        self.btn_eight.setShortcut(_translate("main_window", "8"))
+        self.btn_five.setText(_translate("main_window", "5"))
+        self.btn_five.setShortcut(_translate("main_window", "5"))
+        self.btn_divide.setText(_translate("main_window", "/"))
+        self.btn_divide.setShortcut(_translate("main_window", "/"))
+        self.btn_multiply.setText(_translate("main_window", "x"))
+        self.btn_multiply.setShortcut(_translate("main_window", "*"))
+        self.btn_four.setText(_translate("main_window", "4"))
+        self.btn_four.setShortcut(_translate("main_window", "4"))
+        self.btn_six.setText(_translate("main_window", "6"))
+        self.btn_six.setShortcut(_translate("main_window", "6"))
+        self.btn_three.setText(_translate("main_window", "3"))
+        self.btn_three.setShortcut(_translate("main_window", "3"))
+        self.btn_minus.setText(_translate("main_window", "-"))
+        self.btn_minus.setShortcut(_translate("main_window", "-"))
+        self.btn_two.setText(_translate("main_window", "2"))
+        self.btn_two.setShortcut(_translate("main_window", "2"))
+        self.btn_add.setText(_translate("main_window", "+"))
+        self.btn_add.setShortcut(_translate("main_window", "+"))
+        self.btn_one.setText(_translate("main_window", "1"))
+        self.btn_one.setShortcut(_translate("main_window", "1"))
+        self.btn_change_sign.setText(_translate("main_window", "±"))
+        self.btn_decimal.setText(_translate("main_window", ","))
+        self.btn_decimal.setShortcut(_translate("main_window", ","))
+        self.btn_enter.setText(_translate("main_window", "ENTER"))
+        self.btn_enter.setShortcut(_translate("main_window", "Enter"))
+        self.btn_zero.setText(_translate("main_window", "0"))
+        self.btn_zero.setShortcut(_translate("main_window", "0"))
+        self.btn_log.setText(_translate("main_window", "log"))
+        self.btn_ln.setText(_translate("main_window", "ln"))
+        self.btn_tan.setText(_translate("main_window", "tan"))
+        self.btn_sin.setText(_translate("main_window", "sin"))
+        self.btn_cos.setText(_translate("main_window", "cos"))
+        self.btn_e.setText(_translate("main_window", "e"))
+        self.btn_mod.setText(_translate("main_window", "MOD"))
+        self.btn_shift.setText(_translate("main_window", "SHIFT"))
+        self.btn_drg.setText(_translate("main_window", "DRG"))
+        self.x_label.setText(_translate("main_window", "X:"))
+        self.z_label.setText(_translate("main_window", "Z:"))
+        self.y_label.setText(_translate("main_window", "Y:"))
+        self.stack_label.setText(_translate("main_window", "STACK: 0"))
+        self.angle_label.setText(_translate("main_window", "DEG"))
+        self.shift_btn_sin.setText(_translate("main_window", "sin-1"))
+        self.shift_btn_cos.setText(_translate("main_window", "cos-1"))
+        self.shift_btn_tan.setText(_translate("main_window", "tan-1"))
+        self.shift_btn_x_exp_2.setText(_translate("main_window", "<html><head/><body><p>x²</p></body></html>"))
+        self.shift_btn_fatorial.setText(_translate("main_window", "n!"))
+        self.shift_btn_cls.setText(_translate("main_window", "CLS"))
+        self.shift_btn_stack.setText(_translate("main_window", "STACK"))
+        self.shift_btn_conv_drg.setText(_translate("main_window", "DRG>"))